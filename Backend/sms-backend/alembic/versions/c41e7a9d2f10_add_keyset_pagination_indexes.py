@@ -0,0 +1,39 @@
+"""
+add_keyset_pagination_indexes
+
+Revision ID: c41e7a9d2f10
+Revises: b4b19a40e0c9
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e7a9d2f10'
+down_revision = 'b4b19a40e0c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (tenant_id, created_at, id) indexes backing cursor pagination."""
+    op.create_index(
+        'idx_activity_logs_tenant_created_id',
+        'activity_logs',
+        ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    op.create_index(
+        'idx_attendances_tenant_created_id',
+        'attendances',
+        ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove cursor pagination indexes."""
+    op.drop_index('idx_attendances_tenant_created_id', table_name='attendances')
+    op.drop_index('idx_activity_logs_tenant_created_id', table_name='activity_logs')
@@ -0,0 +1,74 @@
+"""
+add_grade_aggregates
+
+Revision ID: d7e2b5a1c9f3
+Revises: c41e7a9d2f10
+Create Date: 2026-10-17 14:03:18.552910
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7e2b5a1c9f3'
+down_revision = 'c41e7a9d2f10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create grade_aggregates and backfill it from existing grades."""
+    op.create_table('grade_aggregates',
+        sa.Column('enrollment_id', sa.UUID(), nullable=False),
+        sa.Column('subject_id', sa.UUID(), nullable=True),
+        sa.Column('period_id', sa.UUID(), nullable=True),
+        sa.Column('semester_id', sa.UUID(), nullable=True),
+        sa.Column('grading_category_id', sa.UUID(), nullable=True),
+        sa.Column('assessment_type', sa.String(length=20), nullable=False),
+        sa.Column('score_sum', sa.Float(), nullable=False),
+        sa.Column('max_score_sum', sa.Float(), nullable=False),
+        sa.Column('percentage_sum', sa.Float(), nullable=False),
+        sa.Column('grade_count', sa.Integer(), nullable=False),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('tenant_id', sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(['enrollment_id'], ['enrollments.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['period_id'], ['periods.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['semester_id'], ['semesters.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['grading_category_id'], ['grading_categories.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_grade_aggregates_tenant_id'), 'grade_aggregates', ['tenant_id'], unique=False)
+    op.create_index(
+        'ix_grade_aggregates_tenant_enrollment_subject',
+        'grade_aggregates',
+        ['tenant_id', 'enrollment_id', 'subject_id'],
+        unique=False
+    )
+
+    # Backfill; ids must match aggregate_id() in src/db/models/academics/grade_aggregate.py
+    op.execute("""
+        INSERT INTO grade_aggregates (
+            id, tenant_id, enrollment_id, subject_id, period_id, semester_id, grading_category_id, assessment_type,
+            score_sum, max_score_sum, percentage_sum, grade_count, created_at, updated_at
+        )
+        SELECT md5(concat_ws('|', g.tenant_id::text, g.enrollment_id::text, coalesce(g.subject_id::text, ''),
+                   coalesce(g.period_id::text, ''), coalesce(g.semester_id::text, ''),
+                   coalesce(g.grading_category_id::text, ''), g.assessment_type::text))::uuid,
+               g.tenant_id, g.enrollment_id, g.subject_id, g.period_id, g.semester_id,
+               g.grading_category_id, g.assessment_type::text,
+               sum(g.score), sum(g.max_score), sum(g.percentage), count(*), now(), now()
+        FROM grades g
+        GROUP BY g.tenant_id, g.enrollment_id, g.subject_id, g.period_id, g.semester_id, g.grading_category_id, g.assessment_type
+    """)
+
+
+def downgrade() -> None:
+    """Drop grade_aggregates."""
+    op.drop_index('ix_grade_aggregates_tenant_enrollment_subject', table_name='grade_aggregates')
+    op.drop_index(op.f('ix_grade_aggregates_tenant_id'), table_name='grade_aggregates')
+    op.drop_table('grade_aggregates')
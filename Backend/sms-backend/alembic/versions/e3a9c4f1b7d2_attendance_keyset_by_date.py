@@ -0,0 +1,39 @@
+"""
+attendance_keyset_by_date
+
+Revision ID: e3a9c4f1b7d2
+Revises: d7e2b5a1c9f3
+Create Date: 2026-10-17 16:20:05.731148
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a9c4f1b7d2'
+down_revision = 'd7e2b5a1c9f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Back attendance paging (offset and cursor) with its (date, student_id, id) order."""
+    op.drop_index('idx_attendances_tenant_created_id', table_name='attendances')
+    op.create_index(
+        'idx_attendances_tenant_date_student_id',
+        'attendances',
+        ['tenant_id', 'date', 'student_id', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Restore the created_at keyset index."""
+    op.drop_index('idx_attendances_tenant_date_student_id', table_name='attendances')
+    op.create_index(
+        'idx_attendances_tenant_created_id',
+        'attendances',
+        ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
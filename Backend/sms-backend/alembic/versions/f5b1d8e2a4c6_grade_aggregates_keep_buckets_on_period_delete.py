@@ -0,0 +1,37 @@
+"""
+grade_aggregates_keep_buckets_on_period_delete
+
+Revision ID: f5b1d8e2a4c6
+Revises: e3a9c4f1b7d2
+Create Date: 2026-10-17 17:42:11.208334
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5b1d8e2a4c6'
+down_revision = 'e3a9c4f1b7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Keep aggregate totals when a period/semester is deleted, matching the grades' SET NULL."""
+    for column, table in (('period_id', 'periods'), ('semester_id', 'semesters')):
+        op.drop_constraint(f'grade_aggregates_{column}_fkey', 'grade_aggregates', type_='foreignkey')
+        op.create_foreign_key(
+            f'grade_aggregates_{column}_fkey', 'grade_aggregates', table,
+            [column], ['id'], ondelete='SET NULL'
+        )
+
+
+def downgrade() -> None:
+    """Restore ON DELETE CASCADE."""
+    for column, table in (('period_id', 'periods'), ('semester_id', 'semesters')):
+        op.drop_constraint(f'grade_aggregates_{column}_fkey', 'grade_aggregates', type_='foreignkey')
+        op.create_foreign_key(
+            f'grade_aggregates_{column}_fkey', 'grade_aggregates', table,
+            [column], ['id'], ondelete='CASCADE'
+        )
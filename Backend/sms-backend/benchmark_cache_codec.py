@@ -0,0 +1,63 @@
+"""Compare cache serialization cost and payload size.
+
+Encodes a list of AcademicGrade rows the way @cached stores them:
+  legacy  - json.dumps(cls=RedisEncoder) on the ORM objects, json.loads back to dicts
+  json    - converted to the response schema, stored tagged, rehydrated as schema instances
+  orjson  - same as json, with orjson for untagged values (if installed)
+
+Usage: python benchmark_cache_codec.py [rows] [iterations]
+"""
+import json
+import sys
+import timeit
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.core.cache_codec import CODECS, CacheSerializer, RedisEncoder, to_schema
+from src.db.models.academics.academic_grade import AcademicGrade as AcademicGradeModel
+from src.schemas.academics.academic_grade import AcademicGrade as AcademicGradeSchema
+
+
+def make_rows(count: int):
+    tenant_id = uuid4()
+    now = datetime.now(timezone.utc)
+    return [
+        AcademicGradeModel(
+            id=uuid4(),
+            tenant_id=tenant_id,
+            name=f"Grade {i}",
+            description="Primary division grade level",
+            is_active=True,
+            sequence=i,
+            age_range=f"{i + 5}-{i + 6} years",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def bench(label, encode, decode, iterations):
+    raw = encode()
+    encode_us = timeit.timeit(encode, number=iterations) / iterations * 1e6
+    decode_us = timeit.timeit(lambda: decode(raw), number=iterations) / iterations * 1e6
+    result = decode(raw)
+    kind = type(result[0]).__name__ if isinstance(result, list) and result else type(result).__name__
+    print(f"{label:<8} encode {encode_us:9.1f} us   decode {decode_us:9.1f} us   "
+          f"{len(raw.encode()):8d} bytes   -> {kind}")
+
+
+def main():
+    rows_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rows = make_rows(rows_count)
+    print(f"{rows_count} rows, {iterations} iterations")
+
+    bench("legacy", lambda: json.dumps(rows, cls=RedisEncoder), json.loads, iterations)
+    for name, codec_cls in CODECS.items():
+        serializer = CacheSerializer(codec_cls())
+        bench(name, lambda: serializer.encode(to_schema(rows, AcademicGradeSchema)), serializer.decode, iterations)
+
+
+if __name__ == "__main__":
+    main()
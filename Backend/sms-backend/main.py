@@ -1,3 +1,4 @@
+import asyncio
 import logfire
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +12,8 @@ from src.core.logging import setup_logging
 from src.core.middleware.audit_middleware import AuditLoggingMiddleware
 from src.core.middleware.tenant import tenant_middleware  
 from src.core.middleware.idle_activity import IdleActivityMiddleware
+from src.core.middleware.sql_tracking import SQLTrackingMiddleware
+from src.core.middleware.admission import AdmissionControlMiddleware
 from datetime import datetime
 import traceback
 from fastapi.responses import JSONResponse
@@ -32,12 +35,52 @@ except Exception as e:
 setup_logging()
 
 from src.core.redis import cache
+from src.core.cache import sweep_legacy_keys
+from src.core.tenant_cache import listen_for_tenant_invalidations
+from src.core.local_cache import listen_for_l1_invalidations
+from src.services.academics.grading_context import listen_for_grading_context_invalidations
+from src.services.academics.academic_calendar import listen_for_calendar_invalidations
+from src.db.session import async_engine
+from src.core.security.hashing import PasswordHashingBusyError, password_hasher
+from src.services.auth.token_blacklist import TokenBlacklistService
+from src.services.logging.audit_pipeline import audit_pipeline
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Connect to Redis on startup
     await cache.connect()
+    # Drop cached tenants when another worker publishes an invalidation
+    tenant_invalidation_task = asyncio.create_task(listen_for_tenant_invalidations())
+    # Drop in-process @cached entries when any worker deletes them from Redis
+    l1_invalidation_task = asyncio.create_task(listen_for_l1_invalidations())
+    # Drop resolved grading contexts when another worker commits a schema or criteria change
+    grading_context_task = asyncio.create_task(listen_for_grading_context_invalidations())
+    # Drop academic calendar indexes when another worker commits a semester or period change
+    calendar_task = asyncio.create_task(listen_for_calendar_invalidations())
+    # Write coalesced idle-activity timestamps to Redis in batches
+    activity_flush_task = asyncio.create_task(TokenBlacklistService().run_activity_flusher())
+    # Write queued audit events in batches, after retrying any spilled by the last run
+    audit_task = asyncio.create_task(audit_pipeline.run())
+    # Clear cache keys written before generation namespaces, without blocking startup
+    legacy_sweep_task = asyncio.create_task(sweep_legacy_keys())
     yield
+    legacy_sweep_task.cancel()
+    tenant_invalidation_task.cancel()
+    l1_invalidation_task.cancel()
+    grading_context_task.cancel()
+    calendar_task.cancel()
+    activity_flush_task.cancel()
+    audit_task.cancel()
+    for task in (activity_flush_task, audit_task):
+        try:
+            # Let it write the last buffered batch
+            await task
+        except asyncio.CancelledError:
+            pass
+    password_hasher.shutdown()
+    # Release pooled asyncpg connections on shutdown
+    if async_engine is not None:
+        await async_engine.dispose()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -82,6 +125,17 @@ async def business_logic_exception_handler(request, exc):
         content={"detail": str(exc)}
     )
 
+@app.exception_handler(PasswordHashingBusyError)
+async def password_hashing_busy_handler(request, exc):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy processing logins. Please try again shortly."},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+# Admission control runs just inside tenant_middleware, which resolves the tenant it keys on
+app.add_middleware(AdmissionControlMiddleware)
+
 # Add tenant middleware BEFORE other middlewares
 app.middleware("http")(tenant_middleware)
 
@@ -96,6 +150,7 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*", "X-Tenant-ID"],
+        expose_headers=["Server-Timing"],
     )
 
 print("📢 API prefix:", settings.API_V1_STR)
@@ -176,3 +231,5 @@ async def test_cors():
 
 app.add_middleware(IdleActivityMiddleware)
 app.add_middleware(AuditLoggingMiddleware)
+# Outermost, so queries made by the other middlewares are counted too
+app.add_middleware(SQLTrackingMiddleware)
@@ -0,0 +1,27 @@
+import sys
+
+from src.db.session import SessionLocal
+from src.db.crud.academics.grade_aggregate import grade_aggregate
+
+
+def rebuild_grade_aggregates(tenant_id=None):
+    """Recompute grade_aggregates from raw grades, for one tenant or all of them."""
+    scope = f"tenant {tenant_id}" if tenant_id else "all tenants"
+    print(f"🚀 Rebuilding grade aggregates for {scope}...")
+
+    db = SessionLocal()
+    try:
+        buckets = grade_aggregate.rebuild(db, tenant_id=tenant_id)
+        db.commit()
+        print(f"✅ Rebuilt {buckets} grade aggregate buckets.")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Rebuild failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    # Usage: python rebuild_grade_aggregates.py [tenant_id]
+    rebuild_grade_aggregates(sys.argv[1] if len(sys.argv) > 1 else None)
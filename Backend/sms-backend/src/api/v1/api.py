@@ -1,13 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 # Endpoint imports (core service endpoint etc)
 # from src.api.v1.endpoints import auth
 # from src.api.v1.endpoints.tenant import router as tenant_router
 from src.api.v1.endpoints import tenant, auth, people, super_admin, academics, communication, logging, resources, finance
 from src.api.v1.endpoints.specialized import financial_academic
+from src.services.base.rate_limit import default_rate_limit
 
-# Update the router includes
-api_router = APIRouter()
+# Update the router includes; every route gets the tenant plan's default quota
+api_router = APIRouter(dependencies=[Depends(default_rate_limit)])
 
 
 
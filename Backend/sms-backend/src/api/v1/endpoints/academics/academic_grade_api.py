@@ -1,7 +1,7 @@
 from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -9,6 +9,7 @@ from src.services.academics.academic_grade_service import AcademicGradeService,
 from src.db.session import get_db
 from src.schemas.academics.academic_grade import AcademicGrade, AcademicGradeCreate, AcademicGradeUpdate
 from src.core.middleware.tenant import get_tenant_from_request
+from src.core.http_cache import not_modified
 from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
 from src.schemas.auth import User
 from src.core.exceptions.business import (
@@ -45,6 +46,8 @@ async def create_academic_grade(
 @router.get("/academic-grades", response_model=List[AcademicGrade])
 async def get_academic_grades(
     *,
+    request: Request,
+    response: Response,
     grade_service: AcademicGradeService = Depends(),
     skip: int = 0,
     limit: int = 100,
@@ -52,6 +55,9 @@ async def get_academic_grades(
     current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
 ) -> Any:
     """Get all academic grades for a tenant with optional filtering (requires authentication)."""
+    unchanged = await not_modified(request, response, grade_service.data_version, grade_service.tenant_id)
+    if unchanged:
+        return unchanged
     if is_active is not None and is_active:
         return await grade_service.get_active_grades(skip=skip, limit=limit)
     else:
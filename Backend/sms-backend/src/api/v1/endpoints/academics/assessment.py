@@ -3,8 +3,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from src.services.academics.assessment_service import AssessmentService
 from src.schemas.academics.assessment import Assessment, AssessmentCreate, AssessmentUpdate
-from src.core.auth.dependencies import get_current_user
-from src.schemas.auth import User
+from src.core.auth.dependencies import get_current_principal
+from src.core.security.principal import Principal
 
 router = APIRouter()
 
@@ -21,7 +21,7 @@ async def list_assessments(
     is_published: Optional[bool] = None,
     teacher_id: Optional[UUID] = None,
     service: AssessmentService = Depends(),
-    current_user: User = Depends(get_current_user)
+    principal: Principal = Depends(get_current_principal)
 ):
     filters = {}
     if subject_id:
@@ -41,19 +41,19 @@ async def list_assessments(
     if semester_id:
         filters["semester_id"] = semester_id
         
-    return await service.list_assessments(skip=skip, limit=limit, filters=filters, current_user=current_user)
+    return await service.list_assessments(skip=skip, limit=limit, filters=filters, principal=principal)
 
 @router.post("/assessments", response_model=Assessment, status_code=status.HTTP_201_CREATED)
 async def create_assessment(
     payload: AssessmentCreate,
     service: AssessmentService = Depends(),
-    current_user: User = Depends(get_current_user)
+    principal: Principal = Depends(get_current_principal)
 ):
-    # Ensure teacher_id is set to current_user if not provided or if user is teacher
-    if any(role.name == "teacher" for role in current_user.roles):
-        payload.teacher_id = current_user.id
+    # Ensure teacher_id is set to the current user if not provided or if user is teacher
+    if principal.has_role("teacher"):
+        payload.teacher_id = principal.user_id
     elif not payload.teacher_id:
-        payload.teacher_id = current_user.id
+        payload.teacher_id = principal.user_id
         
     return await service.create(obj_in=payload)
 
@@ -61,9 +61,9 @@ async def create_assessment(
 async def get_assessment(
     id: UUID,
     service: AssessmentService = Depends(),
-    current_user: User = Depends(get_current_user)
+    principal: Principal = Depends(get_current_principal)
 ):
-    item = await service.get_assessment(id=id, current_user=current_user)
+    item = await service.get_assessment(id=id, principal=principal)
     if not item:
         raise HTTPException(status_code=404, detail="Assessment not found")
     return item
@@ -73,15 +73,15 @@ async def update_assessment(
     id: UUID,
     payload: AssessmentUpdate,
     service: AssessmentService = Depends(),
-    current_user: User = Depends(get_current_user)
+    principal: Principal = Depends(get_current_principal)
 ):
-    return await service.update_assessment(id=id, obj_in=payload, current_user=current_user)
+    return await service.update_assessment(id=id, obj_in=payload, principal=principal)
 
 @router.delete("/assessments/{id}")
 async def delete_assessment(
     id: UUID,
     service: AssessmentService = Depends(),
-    current_user: User = Depends(get_current_user)
+    principal: Principal = Depends(get_current_principal)
 ):
-    await service.delete_assessment(id=id, current_user=current_user)
+    await service.delete_assessment(id=id, principal=principal)
     return {"message": "Assessment deleted successfully"}
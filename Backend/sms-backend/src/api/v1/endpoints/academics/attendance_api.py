@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 from uuid import UUID
 from datetime import date, datetime
 
@@ -9,7 +9,8 @@ from src.services.academics.attendance_service import AttendanceService, SuperAd
 from src.db.session import get_db
 from src.schemas.academics.attendance import (
     Attendance, AttendanceCreate, AttendanceUpdate, AttendanceWithDetails,
-    AttendanceSummary, BulkAttendanceCreate, AttendanceReport, AttendanceStatus
+    AttendanceSummary, BulkAttendanceCreate, AttendanceReport, AttendanceStatus,
+    AttendanceListResponse
 )
 from src.core.middleware.tenant import get_tenant_from_request
 from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
@@ -20,6 +21,7 @@ from src.core.exceptions.business import (
     DuplicateEntityError,
     BusinessRuleViolationError
 )
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -40,7 +42,7 @@ async def create_attendance(
             detail=str(e)
         )
 
-@router.get("/attendance", response_model=List[Attendance])
+@router.get("/attendance", response_model=Union[AttendanceListResponse, List[Attendance]])
 async def get_attendance_records(
     *,
     attendance_service: AttendanceService = Depends(),
@@ -53,10 +55,29 @@ async def get_attendance_records(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     status_filter: Optional[AttendanceStatus] = None,
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    use_cursor: bool = Query(False, description="Page by cursor instead of skip/offset"),
     current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
 ) -> Any:
-    """Get attendance records with optional filtering."""
+    """Get attendance records with optional filtering.
+    In cursor mode the response is a page of items with the next page's next_cursor."""
     try:
+        if use_cursor or after:
+            items, next_cursor = attendance_service.get_multi_with_cursor(
+                after=after,
+                limit=limit,
+                student_id=student_id,
+                class_id=class_id,
+                schedule_id=schedule_id,
+                academic_year_id=academic_year_id,
+                start_date=start_date,
+                end_date=end_date,
+                status_filter=status_filter
+            )
+            return {
+                "items": items,
+                "next_cursor": next_cursor
+            }
         return attendance_service.get_multi(
             skip=skip,
             limit=limit,
@@ -93,7 +114,7 @@ async def get_attendance_summary(
         end_date=end_date
     )
 
-@router.get("/attendance/report", response_model=AttendanceReport)
+@router.get("/attendance/report", response_model=AttendanceReport, dependencies=[Depends(heavy_rate_limit)])
 async def generate_attendance_report(
     *,
     attendance_service: AttendanceService = Depends(),
@@ -284,7 +305,7 @@ async def mark_daily_attendance(
             detail=str(e)
         )
 
-@router.post("/attendance/bulk-mark", response_model=List[Attendance], status_code=status.HTTP_201_CREATED)
+@router.post("/attendance/bulk-mark", response_model=List[Attendance], status_code=status.HTTP_201_CREATED, dependencies=[Depends(heavy_rate_limit)])
 async def bulk_mark_attendance(
     *,
     attendance_service: AttendanceService = Depends(),
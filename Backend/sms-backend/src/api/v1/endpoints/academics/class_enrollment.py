@@ -25,6 +25,7 @@ from src.core.exceptions.business import (
 import csv
 import io
 from openpyxl import Workbook
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -108,7 +109,7 @@ async def create_class_enrollment(
             detail=f"Failed to create class enrollment: {str(e)}"
         )
 
-@router.post("/class-enrollments/bulk", response_model=List[ClassEnrollment], status_code=status.HTTP_201_CREATED)
+@router.post("/class-enrollments/bulk", response_model=List[ClassEnrollment], status_code=status.HTTP_201_CREATED, dependencies=[Depends(heavy_rate_limit)])
 async def bulk_create_class_enrollments(
     *,
     class_enrollment_service: ClassEnrollmentService = Depends(),
@@ -444,7 +445,7 @@ async def get_class_enrollment_count_alias(
             detail=f"Failed to get class enrollment count: {str(e)}"
         )
 
-@router.get("/classes/{class_id}/enrollments/export")
+@router.get("/classes/{class_id}/enrollments/export", dependencies=[Depends(heavy_rate_limit)])
 async def export_class_enrollments(
     *,
     class_enrollment_service: ClassEnrollmentService = Depends(),
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 
 from src.services.academics.dashboard_service import AcademicDashboardService
 from src.schemas.academics.dashboard import AcademicDashboardStats
-from src.db.session import get_db
+from src.db.session import SessionLocal, get_db
 from src.core.middleware.tenant import get_tenant_from_request
 from src.db.models.auth import User
 from src.core.auth.dependencies import get_current_user
@@ -14,6 +14,16 @@ from src.core.redis import cache
 
 router = APIRouter()
 
+
+def _compute_shared_stats(tenant_id: Any) -> Any:
+    # Own session: stale values are refreshed in the background, after the request's session is closed
+    db = SessionLocal()
+    try:
+        return AcademicDashboardService(db, tenant_id).get_stats().model_dump()
+    finally:
+        db.close()
+
+
 @router.get("/stats", response_model=AcademicDashboardStats)
 async def get_dashboard_stats(
     db: Session = Depends(get_db),
@@ -30,15 +40,15 @@ async def get_dashboard_stats(
     cache_key = f"academics:stats:{tenant_id}"
     
     if not is_personalized:
-        cached_stats = await cache.get(cache_key)
-        if cached_stats:
-            return cached_stats
+        # Shared admin view: fresh for ~30 seconds, then served stale for up to 90 more
+        # while one worker recomputes; concurrent misses share a single computation
+        return await cache.get_or_compute(
+            cache_key,
+            lambda: run_in_threadpool(_compute_shared_stats, tenant_id),
+            expire=30,
+            stale_ttl=90,
+            jitter=0.1,
+        )
     
     service = AcademicDashboardService(db, tenant_id, current_user=current_user)
-    stats = await run_in_threadpool(service.get_stats)
-    
-    if not is_personalized:
-        # Cache general stats for 30 seconds
-        await cache.set(cache_key, stats.model_dump(), expire=30)
-    
-    return stats
+    return await run_in_threadpool(service.get_stats)
@@ -26,6 +26,7 @@ from src.db.crud.academics.academic_year_crud import academic_year_crud
 from src.db.crud.academics.academic_grade import academic_grade
 from src.db.crud.academics.section import section
 from src.services.academics.promotion_service import PromotionService
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -227,7 +228,7 @@ async def delete_enrollment(
         )
 
 # bulk_create_enrollments
-@router.post("/enrollments/bulk", response_model=Any, status_code=status.HTTP_201_CREATED)
+@router.post("/enrollments/bulk", response_model=Any, status_code=status.HTTP_201_CREATED, dependencies=[Depends(heavy_rate_limit)])
 async def bulk_create_enrollments(
     *,
     enrollment_service: EnrollmentService = Depends(),
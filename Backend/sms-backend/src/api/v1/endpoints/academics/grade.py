@@ -5,13 +5,15 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
 from src.services.academics.grade_calculation import GradeCalculationService
 from src.schemas.academics.grade import Grade as GradeSchema, GradeCreate, GradeUpdate, GradeWithDetails, ReportCardResponse
 from src.db.models.academics.grade import GradeType
-from src.core.auth.dependencies import has_any_role, has_permission
+from src.core.auth.dependencies import has_any_role, has_permission, get_current_principal
+from src.core.security.principal import Principal
 from src.schemas.auth import User
 from src.core.exceptions.business import (
     BusinessLogicError,
     EntityNotFoundError,
     BusinessRuleViolationError
 )
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -24,11 +26,12 @@ async def subject_performance_summary(
     academic_year_id: UUID = Query(..., description="ID of the academic year"),
     period_id: Optional[UUID] = Query(None, description="Optional filter by period"),
     semester_id: Optional[UUID] = Query(None, description="Optional filter by semester"),
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Get a detailed summary of a student's performance in a specific subject."""
     # Security check: Students can only view their own summaries
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
         if student_id != current_user.id:
             raise HTTPException(status_code=403, detail="Students can only view their own performance summaries.")
@@ -50,11 +53,12 @@ async def subject_performance_summary(
 async def get_student_academic_history(
     student_id: UUID,
     grade_service: GradeCalculationService = Depends(),
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Get multi-year academic history for a student."""
     # Security check: Students can only view their own history
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
         if student_id != current_user.id:
             raise HTTPException(status_code=403, detail="Students can only view their own academic history.")
@@ -82,7 +86,7 @@ async def create_grade(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 # Bulk create grades
-@router.post("/grades/bulk", response_model=List[GradeSchema], status_code=status.HTTP_201_CREATED)
+@router.post("/grades/bulk", response_model=List[GradeSchema], status_code=status.HTTP_201_CREATED, dependencies=[Depends(heavy_rate_limit)])
 async def bulk_create_grades(
     *,
     grade_service: GradeCalculationService = Depends(),
@@ -113,13 +117,14 @@ async def list_grades(
     subject_id: Optional[UUID] = None,
     assessment_type: Optional[GradeType] = Query(None),
     assessment_id: Optional[UUID] = Query(None),
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """List grades for the tenant with optional filters."""
     filters: Dict[str, Any] = {}
     
     # Security check: Students can only view their own grades
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
         if student_id and current_user.id != student_id:
             raise HTTPException(status_code=403, detail="Students can only view their own grades.")
@@ -149,11 +154,12 @@ async def subject_average(
     grade_service: GradeCalculationService = Depends(),
     student_id: UUID = Query(...),
     subject_id: UUID = Query(...),
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Calculate average percentage for a student in a subject."""
     # Security check: Students can only view their own averages
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
         if current_user.id != student_id:
             raise HTTPException(status_code=403, detail="Students can only view their own grade averages.")
@@ -168,11 +174,12 @@ async def report_card(
     grade_service: GradeCalculationService = Depends(),
     student_id: UUID = Query(...),
     academic_year: str = Query(...),
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Generate a report card for a student in an academic year."""
     # Security check: Students can only view their own report card
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
         if current_user.id != student_id:
             raise HTTPException(
@@ -187,6 +194,29 @@ async def report_card(
     except BusinessRuleViolationError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+# Analytics: report cards for a whole grade or section
+@router.get("/grades/report-cards", response_model=List[ReportCardResponse], dependencies=[Depends(heavy_rate_limit)])
+async def report_cards(
+    *,
+    grade_service: GradeCalculationService = Depends(),
+    academic_year_id: UUID = Query(...),
+    grade_id: Optional[UUID] = Query(None, description="Grade level to generate report cards for"),
+    section_id: Optional[UUID] = Query(None, description="Section to generate report cards for"),
+    current_user: User = Depends(has_any_role(["admin", "teacher"]))
+) -> Any:
+    """Generate report cards for every student enrolled in a grade or section."""
+    if not grade_id and not section_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either grade_id or section_id is required."
+        )
+    try:
+        return await grade_service.generate_report_cards(
+            academic_year_id=academic_year_id, grade_id=grade_id, section_id=section_id
+        )
+    except EntityNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
 
 # Get a specific grade
 @router.get("/grades/{grade_id}", response_model=GradeSchema)
@@ -194,7 +224,8 @@ async def get_grade(
     *,
     grade_service: GradeCalculationService = Depends(),
     grade_id: UUID,
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Get a grade by ID."""
     grade_obj = await grade_service.get(id=grade_id)
@@ -202,7 +233,7 @@ async def get_grade(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Grade {grade_id} not found")
         
     # Security check: Students can only view their own grades
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
         if grade_obj.student_id != current_user.id:
             raise HTTPException(status_code=403, detail="Students can only view their own grades.")
@@ -215,7 +246,8 @@ async def get_grade_details(
     *,
     grade_service: GradeCalculationService = Depends(),
     grade_id: UUID,
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Get grade details with joined student/subject/teacher names."""
     details = await grade_service.get_with_details(id=grade_id)
@@ -223,7 +255,7 @@ async def get_grade_details(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Grade {grade_id} not found")
         
     # Security check: Students can only view their own grades
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
         # details is a dict if it came from get_with_details in CRUD usually
         sid = details.get("student_id")
@@ -294,14 +326,15 @@ async def weighted_average(
     *,
     grade_service: GradeCalculationService = Depends(),
     payload: Dict[str, Any] = Body(..., description="Student/subject IDs and weights per GradeType"),
-    current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher", "student"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Calculate weighted average for a student in a subject."""
     try:
         student_id = UUID(payload["student_id"])
         
         # Security check: Students can only view their own averages
-        user_roles = {role.name for role in current_user.roles}
+        user_roles = principal.roles
         if "student" in user_roles and "admin" not in user_roles and "teacher" not in user_roles:
             if student_id != current_user.id:
                 raise HTTPException(status_code=403, detail="Students can only view their own weighted averages.")
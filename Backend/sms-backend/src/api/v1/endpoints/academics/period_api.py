@@ -1,18 +1,24 @@
 from typing import Any, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from src.services.academics.period_service import PeriodService
 from src.schemas.academics.period import Period, PeriodCreate, PeriodUpdate
 from src.core.auth.dependencies import has_permission
+from src.core.http_cache import not_modified
 
 router = APIRouter()
 
 @router.get("/periods", response_model=List[Period])
 async def get_periods(
     semester_id: UUID,
+    request: Request,
+    response: Response,
     period_service: PeriodService = Depends()
 ) -> Any:
     """Get all periods for a semester."""
+    unchanged = await not_modified(request, response, period_service.data_version, period_service.tenant_id)
+    if unchanged:
+        return unchanged
     return await period_service.get_by_semester(semester_id)
 
 @router.get("/periods/{period_id}", response_model=Period)
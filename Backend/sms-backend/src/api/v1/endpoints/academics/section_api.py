@@ -1,13 +1,14 @@
 from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from src.services.academics.section_service import SectionService, SuperAdminSectionService
 from src.db.session import get_db
 from src.schemas.academics.section import Section, SectionCreate, SectionUpdate
 from src.core.middleware.tenant import get_tenant_from_request
+from src.core.http_cache import not_modified
 from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
 from src.schemas.auth import User
 from src.core.exceptions.business import (
@@ -44,6 +45,8 @@ async def create_section(
 @router.get("/sections", response_model=List[Section])
 async def get_sections(
     *,
+    request: Request,
+    response: Response,
     section_service: SectionService = Depends(),
     skip: int = 0,
     limit: int = 100,
@@ -52,6 +55,9 @@ async def get_sections(
     current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
 ) -> Any:
     """Get all sections for a tenant with optional filtering (requires authentication)."""
+    unchanged = await not_modified(request, response, section_service.data_version, section_service.tenant_id)
+    if unchanged:
+        return unchanged
     if is_active is not None and is_active:
         return await section_service.get_active_sections(grade_id=grade_id, skip=skip, limit=limit)
     else:
@@ -81,6 +87,8 @@ async def get_section(
 @router.get("/sections/by-grade/{grade_id}", response_model=List[Section])
 async def get_sections_by_grade(
     *,
+    request: Request,
+    response: Response,
     section_service: SectionService = Depends(),
     grade_id: UUID,
     skip: int = 0,
@@ -88,6 +96,9 @@ async def get_sections_by_grade(
     current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
 ) -> Any:
     """Get all active sections for a specific grade."""
+    unchanged = await not_modified(request, response, section_service.data_version, section_service.tenant_id)
+    if unchanged:
+        return unchanged
     return await section_service.get_active_sections(grade_id=grade_id, skip=skip, limit=limit)
 
 @router.put("/sections/{section_id}", response_model=Section)
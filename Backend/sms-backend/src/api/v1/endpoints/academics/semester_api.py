@@ -1,18 +1,24 @@
 from typing import Any, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from src.services.academics.semester_service import SemesterService
 from src.schemas.academics.semester import Semester, SemesterCreate, SemesterUpdate
 from src.core.auth.dependencies import has_permission
+from src.core.http_cache import not_modified
 
 router = APIRouter()
 
 @router.get("/semesters", response_model=List[Semester])
 async def get_semesters(
     academic_year_id: UUID,
+    request: Request,
+    response: Response,
     semester_service: SemesterService = Depends()
 ) -> Any:
     """Get all semesters for an academic year."""
+    unchanged = await not_modified(request, response, semester_service.data_version, semester_service.tenant_id)
+    if unchanged:
+        return unchanged
     return await semester_service.get_by_academic_year(academic_year_id)
 
 @router.get("/semesters/{semester_id}", response_model=Semester)
@@ -1,13 +1,14 @@
 from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from src.services.academics.subject_service import SubjectService, SuperAdminSubjectService
 from src.db.session import get_db
 from src.schemas.academics.subject import Subject, SubjectCreate, SubjectUpdate
 from src.core.middleware.tenant import get_tenant_from_request
+from src.core.http_cache import not_modified
 from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
 from src.schemas.auth import User
 from src.core.exceptions.business import (
@@ -44,6 +45,8 @@ async def create_subject(
 @router.get("/subjects", response_model=List[Subject])
 async def get_subjects(
     *,
+    request: Request,
+    response: Response,
     subject_service: SubjectService = Depends(),
     skip: int = 0,
     limit: int = 100,
@@ -51,6 +54,9 @@ async def get_subjects(
     current_user: User = Depends(has_any_role(["admin", "teacher", "student"]))
 ) -> Any:
     """Get all subjects for a tenant with optional filtering (requires authentication)."""
+    unchanged = await not_modified(request, response, subject_service.data_version, subject_service.tenant_id)
+    if unchanged:
+        return unchanged
     if is_active is not None:
         if is_active:
             return await subject_service.get_active_subjects(skip=skip, limit=limit)
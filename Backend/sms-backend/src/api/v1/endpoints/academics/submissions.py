@@ -4,7 +4,8 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 
 from src.db.session import get_db
-from src.core.auth.dependencies import get_current_user
+from src.core.auth.dependencies import get_current_user, get_current_principal
+from src.core.security.principal import Principal
 from src.schemas.academics.submission import SubmissionCreate, SubmissionResponse, SubmissionUpdate, SubmissionGrade
 from src.services.academics.submission_service import SubmissionService
 from src.services.people.student import StudentService
@@ -61,11 +62,12 @@ async def get_my_submissions(
 def get_assignment_submissions(
     assignment_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Get all submissions for a specific assignment (Teacher/Admin)."""
     # Check both polymorphic type and assigned roles
-    user_roles = {role.name for role in current_user.roles}
+    user_roles = principal.roles
     is_authorized = (
         current_user.role in ["admin", "teacher", "super_admin"] or
         "admin" in user_roles or
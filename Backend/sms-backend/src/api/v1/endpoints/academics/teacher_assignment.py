@@ -11,6 +11,7 @@ from src.schemas.auth import User
 from src.schemas.academics.class_schema import Class, ClassCreate, ClassUpdate, BulkDeleteRequest, BulkReassignRequest
 from src.schemas.academics.class_subject_schema import ClassSubjectWithDetails
 from src.core.exceptions.business import EntityNotFoundError, BusinessRuleViolationError, DuplicateEntityError
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -276,7 +277,7 @@ async def delete_assignment(
     except EntityNotFoundError:
         raise HTTPException(status_code=404, detail="Assignment not found")
 
-@router.post("/bulk-delete")
+@router.post("/bulk-delete", dependencies=[Depends(heavy_rate_limit)])
 async def bulk_delete_assignments(
     *,
     service: TeacherAssignmentService = Depends(get_service),
@@ -291,7 +292,7 @@ async def bulk_delete_assignments(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
-@router.post("/bulk-reassign")
+@router.post("/bulk-reassign", dependencies=[Depends(heavy_rate_limit)])
 async def bulk_reassign_assignments(
     *,
     service: TeacherAssignmentService = Depends(get_service),
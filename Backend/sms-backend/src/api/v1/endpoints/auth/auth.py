@@ -17,17 +17,22 @@ from src.schemas.auth import UserRole, UserRoleCreate, UserRoleUpdate
 from src.schemas.auth.token import Token
 from src.core.config import settings
 from src.core.security.jwt import create_access_token, create_refresh_token, verify_token
-from src.core.security.permissions import has_role, has_any_role, has_permission, admin_with_tenant_check
+from src.core.security.permissions import has_role, has_any_role, has_permission, admin_with_tenant_check, get_current_principal
 from src.core.middleware.tenant import get_tenant_id_from_request, get_optional_tenant_id_from_request
 from src.core.security.auth import get_current_active_user, get_current_user
-from src.core.security.password import verify_password, get_password_hash
+from src.core.security.principal import Principal, invalidate_principals_sync, role_member_ids
+from src.core.security.hashing import (
+    hash_password_sync,
+    verify_password as verify_password_async,
+    verify_password_sync,
+)
 from src.services.notification.email_service import EmailService
 from src.services.auth.password_policy import PasswordPolicy
 from src.services.auth.password_strength import calculate_password_strength
 from src.services.auth.password import generate_default_password
 from src.services.logging import AuditLoggingService
 from src.services.auth.token_blacklist import TokenBlacklistService
-from src.core.redis import cache, REDIS_AVAILABLE
+from src.services.base.rate_limit import RateLimitService, auth_rate_limit
 
 # Define the oauth2_scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -54,7 +59,10 @@ def create_user(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists"
         )
-    new_user = user_crud.create(db, tenant_id=tenant_id, obj_in=user_in)
+    password = user_in.password or generate_default_password()
+    new_user = user_crud.create(db, tenant_id=tenant_id, obj_in=user_in, password_hash=hash_password_sync(password))
+    if password != user_in.password:
+        new_user.generated_password = password
     
     # Send email notification if a password was generated
     if hasattr(new_user, 'generated_password'):
@@ -86,9 +94,10 @@ def get_users(
     sort_by: Optional[str] = "created_at",
     sort_order: str = "asc",
     current_user: User = Depends(get_current_active_user),
+    principal: Principal = Depends(get_current_principal),
 ) -> Any:
     """Get all users for a tenant with optional server-side filters."""
-    is_super_admin = any(role.name == "super-admin" for role in current_user.roles)
+    is_super_admin = principal.has_role("super-admin")
     
     return user_crud.list_with_filters(
         db,
@@ -124,11 +133,11 @@ from src.services.logging import AuditLoggingService
 
 # Update the update_user function
 @router.put("/users/{user_id}", response_model=User)
-def update_user(*, db: Session = Depends(get_db), tenant_id: UUID = Depends(get_tenant_id_from_request), user_id: UUID, user_in: UserUpdate, current_user: User = Depends(get_current_user)) -> Any:
+def update_user(*, db: Session = Depends(get_db), tenant_id: UUID = Depends(get_tenant_id_from_request), user_id: UUID, user_in: UserUpdate, current_user: User = Depends(get_current_user), principal: Principal = Depends(get_current_principal)) -> Any:
     """Update a user."""
     
     # Check if current user is super admin updating their own profile
-    is_super_admin = any(role.name == "super-admin" for role in current_user.roles)
+    is_super_admin = principal.has_role("super-admin")
     is_self_update = current_user.id == user_id
     
     if is_super_admin and is_self_update:
@@ -155,7 +164,12 @@ def update_user(*, db: Session = Depends(get_db), tenant_id: UUID = Depends(get_
     # For super admin self-updates, use the user's actual tenant_id for the update
     update_tenant_id = user.tenant_id if (is_super_admin and is_self_update) else tenant_id
     
-    updated_user = user_crud.update(db, tenant_id=update_tenant_id, db_obj=user, obj_in=user_in)
+    password_hash = hash_password_sync(user_in.password) if user_in.password else None
+    updated_user = user_crud.update(
+        db, tenant_id=update_tenant_id, db_obj=user, obj_in=user_in, password_hash=password_hash
+    )
+    # is_active may have changed
+    invalidate_principals_sync([user_id])
     
     # Log the activity
     try:
@@ -250,51 +264,32 @@ def get_roles(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Get all user roles."""
     roles = user_role_crud.get_multi(db, skip=skip, limit=limit)
-    is_super_admin = any(role.name == "super-admin" for role in current_user.roles)
+    is_super_admin = principal.has_role("super-admin")
     if not is_super_admin:
         roles = [r for r in roles if r.name not in ("super-admin", "superadmin")]
     return roles
 
 
-# Redis-based rate limiter
-async def rate_limit_login(request: Request):
-    if not REDIS_AVAILABLE:
-        return
-
-    # Ensure connection
-    if not cache.client:
-        await cache.connect()
-    
-    if not cache.client:
-        return
+# 5 login attempts per client IP per 15 minutes (in-process fallback if Redis is down)
+login_rate_limiter = RateLimitService(limit=5, period=900)
 
-    ip = request.client.host
-    key = f"login_attempts:{ip}"
-    
-    # Increment count
+async def rate_limit_login(request: Request):
     try:
-        # Use a pipeline to ensure atomic operations
-        async with cache.client.pipeline() as pipe:
-            await pipe.incr(key)
-            await pipe.expire(key, 900) # 15 minutes window
-            result = await pipe.execute()
-            count = result[0]
-            
-        if count > 5:
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many login attempts. Please try again later."
-            )
-    except Exception as e:
-        # Fail open if Redis errors, but log it
-        print(f"Rate limiting error: {e}")
+        await login_rate_limiter.check_rate_limit(request)
+    except HTTPException as e:
+        raise HTTPException(
+            status_code=e.status_code,
+            detail="Too many login attempts. Please try again later.",
+            headers=e.headers
+        )
 
 
-@router.post("/login", response_model=Token, dependencies=[Depends(rate_limit_login)])
+@router.post("/login", response_model=Token, dependencies=[Depends(auth_rate_limit), Depends(rate_limit_login)])
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
@@ -303,23 +298,21 @@ async def login_for_access_token(
     """OAuth2 compatible token login, get an access token for future requests."""
     # tenant_id is now injected properly by FastAPI
     # CRITICAL FIX: Handle None tenant_id properly
-    if tenant_id is None or str(tenant_id).lower() in ['none', 'null', 'undefined']:
-        user = user_crud.authenticate_global(db, email=form_data.username, password=form_data.password)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect username or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        tenant_id = user.tenant_id
+    is_global_login = tenant_id is None or str(tenant_id).lower() in ['none', 'null', 'undefined']
+    if is_global_login:
+        user = user_crud.get_login_candidate_global(db, email=form_data.username)
     else:
-        user = user_crud.authenticate(db, tenant_id=tenant_id, email=form_data.username, password=form_data.password)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Incorrect username or password",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        user = user_crud.get_login_candidate(db, tenant_id=tenant_id, email=form_data.username)
+
+    # Argon2 runs in the hashing process pool so a burst of logins cannot stall the event loop
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if is_global_login:
+        tenant_id = user.tenant_id
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -352,17 +345,14 @@ async def login_for_access_token(
         is_super_admin=is_super_admin
     )
     # Initialize last activity for the new access token
-    issued_payload = await verify_token(access_token)
-    if issued_payload and issued_payload.jti:
-        from src.services.auth.token_blacklist import TokenBlacklistService
-        await TokenBlacklistService().ensure_last_activity(issued_payload.jti, issued_payload.exp)
+    await verify_token(access_token, touch=True)
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
         "token_type": "bearer",
     }
 
-@router.post("/refresh", response_model=Token)
+@router.post("/refresh", response_model=Token, dependencies=[Depends(auth_rate_limit)])
 async def refresh_access_token(
     request: Request,
     refresh_token: Optional[str] = Body(None, embed=True),
@@ -418,10 +408,7 @@ async def refresh_access_token(
             is_super_admin=getattr(user, "is_super_admin", False)
         )
         # Initialize last activity for the refreshed access token
-        issued_payload = await verify_token(new_access_token)
-        if issued_payload and issued_payload.jti:
-            from src.services.auth.token_blacklist import TokenBlacklistService
-            await TokenBlacklistService().ensure_last_activity(issued_payload.jti, issued_payload.exp)
+        await verify_token(new_access_token, touch=True)
         return {
             "access_token": new_access_token,
             "refresh_token": new_refresh_token,
@@ -440,11 +427,10 @@ async def read_users_me(current_user: User = Depends(get_current_active_user)):
     """Get current user profile."""
     user_dict = current_user.__dict__.copy()
     
-    # Add role_name field
-    if hasattr(current_user, "roles") and current_user.roles:
-        user_dict["role"] = current_user.roles[0].name
-    else:
-        user_dict["role"] = None
+    # The response carries the role objects, so /me loads User.roles itself
+    roles = list(current_user.roles)
+    user_dict["roles"] = roles
+    user_dict["role"] = roles[0].name if roles else None
     
     # The tenant_id comes directly from the database user record
     # No hardcoding needed - it's already in current_user.tenant_id
@@ -469,7 +455,7 @@ def change_password(
 ) -> Any:
     """Change user password and clear first login flag."""
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    if not verify_password_sync(password_data.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect password"
@@ -486,7 +472,7 @@ def change_password(
         )
     
     # Update password and clear first login flag
-    current_user.password_hash = get_password_hash(password_data.new_password)
+    current_user.password_hash = hash_password_sync(password_data.new_password)
     current_user.is_first_login = False
     
     db.add(current_user)
@@ -524,7 +510,7 @@ def admin_reset_password(
     new_password = generate_default_password()
     
     # Update user
-    user.password_hash = get_password_hash(new_password)
+    user.password_hash = hash_password_sync(new_password)
     user.is_first_login = True
     
     db.add(user)
@@ -563,6 +549,7 @@ def set_role_permissions(
     db.add(role)
     db.commit()
     db.refresh(role)
+    invalidate_principals_sync(role_member_ids(db, role_id))
     return role
     permission_ids = [perm.id for perm in permissions]
     
@@ -629,7 +616,8 @@ def assign_roles_to_user(
     role_ids: List[UUID] = Body(..., description="List of role IDs to assign"),
     db: Session = Depends(get_db),
     tenant_id: UUID = Depends(get_tenant_id_from_request),
-    current_user: User = Depends(has_permission("manage_users"))
+    current_user: User = Depends(has_permission("manage_users")),
+    principal: Principal = Depends(get_current_principal)
 ):
     """Assign multiple roles to a user."""
     user = user_crud.get_by_id(db, tenant_id=tenant_id, id=user_id)
@@ -641,7 +629,7 @@ def assign_roles_to_user(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No valid roles provided")
 
     # Block super-admin assignment by non–super-admin actors
-    is_super_admin_actor = any(role.name == "super-admin" for role in current_user.roles)
+    is_super_admin_actor = principal.has_role("super-admin")
     if not is_super_admin_actor and any(role.name in ("super-admin", "superadmin") for role in roles):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Cannot assign super-admin role")
 
@@ -652,6 +640,7 @@ def assign_roles_to_user(
     db.add(user)
     db.commit()
     db.refresh(user)
+    invalidate_principals_sync([user_id])
     return user
 
 @router.delete("/users/{user_id}/roles/{role_id}", operation_id="remove_role_from_user")
@@ -677,6 +666,7 @@ def remove_role_from_user(
     db.add(user)
     db.commit()
     db.refresh(user)
+    invalidate_principals_sync([user_id])
     return user
 
 @router.get("/roles/{role_id}/users", response_model=List[User], operation_id="get_users_with_role")
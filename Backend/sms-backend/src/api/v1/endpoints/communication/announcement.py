@@ -9,7 +9,8 @@ from src.services.communication.announcement_service import AnnouncementService,
 from src.db.session import get_db
 from src.schemas.communication.announcement import Announcement, AnnouncementCreate, AnnouncementUpdate, AnnouncementWithDetails
 from src.core.middleware.tenant import get_tenant_from_request
-from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
+from src.core.auth.dependencies import has_any_role, get_current_user, has_permission, get_current_principal
+from src.core.security.principal import Principal
 from src.schemas.auth import User
 from src.core.exceptions.business import EntityNotFoundError
 
@@ -94,7 +95,8 @@ def update_announcement(
     announcement_service: AnnouncementService = Depends(),
     announcement_id: UUID = Path(..., description="The ID of the announcement to update"),
     announcement_in: AnnouncementUpdate,
-    current_user: User = Depends(has_any_role(["admin", "teacher"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Update an announcement (admin or teacher only)."""
     try:
@@ -106,7 +108,7 @@ def update_announcement(
             )
         
         # Check if the current user is the author or an admin
-        if str(announcement.author_id) != str(current_user.id) and "admin" not in current_user.roles:
+        if str(announcement.author_id) != str(current_user.id) and not principal.has_role("admin"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to update this announcement"
@@ -129,7 +131,8 @@ def delete_announcement(
     *,
     announcement_service: AnnouncementService = Depends(),
     announcement_id: UUID = Path(..., description="The ID of the announcement to delete"),
-    current_user: User = Depends(has_any_role(["admin", "teacher"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Delete an announcement (admin or teacher only)."""
     try:
@@ -141,7 +144,7 @@ def delete_announcement(
             )
         
         # Check if the current user is the author or an admin
-        if str(announcement.author_id) != str(current_user.id) and "admin" not in current_user.roles:
+        if str(announcement.author_id) != str(current_user.id) and not principal.has_role("admin"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to delete this announcement"
@@ -9,7 +9,8 @@ from src.services.communication.event_service import EventService, SuperAdminEve
 from src.db.session import get_db
 from src.schemas.communication.event import Event, EventCreate, EventUpdate, EventWithDetails
 from src.core.middleware.tenant import get_tenant_from_request
-from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
+from src.core.auth.dependencies import has_any_role, get_current_user, has_permission, get_current_principal
+from src.core.security.principal import Principal
 from src.schemas.auth import User
 from src.core.exceptions.business import EntityNotFoundError
 
@@ -99,7 +100,8 @@ def update_event(
     event_service: EventService = Depends(),
     event_id: UUID = Path(..., description="The ID of the event to update"),
     event_in: EventUpdate,
-    current_user: User = Depends(has_any_role(["admin", "teacher"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Update an event (admin or teacher only)."""
     try:
@@ -111,7 +113,7 @@ def update_event(
             )
         
         # Check if the current user is the organizer or an admin
-        if str(event.organizer_id) != str(current_user.id) and "admin" not in current_user.roles:
+        if str(event.organizer_id) != str(current_user.id) and not principal.has_role("admin"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to update this event"
@@ -134,7 +136,8 @@ def delete_event(
     *,
     event_service: EventService = Depends(),
     event_id: UUID = Path(..., description="The ID of the event to delete"),
-    current_user: User = Depends(has_any_role(["admin", "teacher"]))
+    current_user: User = Depends(has_any_role(["admin", "teacher"])),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Delete an event (admin or teacher only)."""
     try:
@@ -146,7 +149,7 @@ def delete_event(
             )
         
         # Check if the current user is the organizer or an admin
-        if str(event.organizer_id) != str(current_user.id) and "admin" not in current_user.roles:
+        if str(event.organizer_id) != str(current_user.id) and not principal.has_role("admin"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to delete this event"
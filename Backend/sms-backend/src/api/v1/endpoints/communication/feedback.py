@@ -9,7 +9,8 @@ from src.services.communication.feedback_service import FeedbackService, SuperAd
 from src.db.session import get_db
 from src.schemas.communication.feedback import Feedback, FeedbackCreate, FeedbackUpdate, FeedbackWithDetails
 from src.core.middleware.tenant import get_tenant_from_request
-from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
+from src.core.auth.dependencies import has_any_role, get_current_user, has_permission, get_current_principal
+from src.core.security.principal import Principal
 from src.schemas.auth import User
 from src.core.exceptions.business import EntityNotFoundError
 
@@ -93,7 +94,8 @@ def update_feedback(
     feedback_service: FeedbackService = Depends(),
     feedback_id: UUID = Path(..., description="The ID of the feedback to update"),
     feedback_in: FeedbackUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Update a feedback."""
     try:
@@ -107,7 +109,7 @@ def update_feedback(
         # Check if the current user is the submitter, assignee, or an admin
         is_submitter = str(feedback.submitter_id) == str(current_user.id)
         is_assignee = feedback.assignee_id and str(feedback.assignee_id) == str(current_user.id)
-        is_admin = "admin" in current_user.roles
+        is_admin = principal.has_role("admin")
         
         if not (is_submitter or is_assignee or is_admin):
             raise HTTPException(
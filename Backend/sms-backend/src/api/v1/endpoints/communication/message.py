@@ -9,7 +9,8 @@ from src.services.communication.message_service import MessageService, SuperAdmi
 from src.db.session import get_db
 from src.schemas.communication.message import Message, MessageCreate, MessageUpdate, MessageWithDetails, MessageRecipientUpdate
 from src.core.middleware.tenant import get_tenant_from_request
-from src.core.auth.dependencies import has_any_role, get_current_user, has_permission
+from src.core.auth.dependencies import has_any_role, get_current_user, has_permission, get_current_principal
+from src.core.security.principal import Principal
 from src.schemas.auth import User
 from src.core.exceptions.business import EntityNotFoundError
 
@@ -21,6 +22,7 @@ def get_messages(
     *,
     message_service: MessageService = Depends(),
     current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     sent: bool = Query(False, description="Get messages sent by the current user"),
     received: bool = Query(False, description="Get messages received by the current user"),
     unread: bool = Query(False, description="Get unread messages for the current user")
@@ -36,7 +38,7 @@ def get_messages(
                 return message_service.get_messages_by_recipient(recipient_id=current_user.id)
         else:
             # Default to all messages (admin only)
-            if "admin" not in current_user.roles:
+            if not principal.has_role("admin"):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="You don't have permission to view all messages"
@@ -53,7 +55,8 @@ def get_message(
     *,
     message_service: MessageService = Depends(),
     message_id: UUID = Path(..., description="The ID of the message to get"),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Get a specific message with details."""
     try:
@@ -67,7 +70,7 @@ def get_message(
         # Check if the current user is the sender, a recipient, or an admin
         is_sender = str(message.sender_id) == str(current_user.id)
         is_recipient = current_user.id in [recipient.id for recipient in message.recipients]
-        is_admin = "admin" in current_user.roles
+        is_admin = principal.has_role("admin")
         
         if not (is_sender or is_recipient or is_admin):
             raise HTTPException(
@@ -108,7 +111,8 @@ def update_message(
     message_service: MessageService = Depends(),
     message_id: UUID = Path(..., description="The ID of the message to update"),
     message_in: MessageUpdate,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Update a message."""
     try:
@@ -120,14 +124,14 @@ def update_message(
             )
         
         # Check if the current user is the sender or an admin
-        if str(message.sender_id) != str(current_user.id) and "admin" not in current_user.roles:
+        if str(message.sender_id) != str(current_user.id) and not principal.has_role("admin"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to update this message"
             )
         
         # Only allow updates to draft messages or by admins
-        if not message.is_draft and "admin" not in current_user.roles:
+        if not message.is_draft and not principal.has_role("admin"):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot update a sent message"
@@ -172,7 +176,8 @@ def delete_message(
     *,
     message_service: MessageService = Depends(),
     message_id: UUID = Path(..., description="The ID of the message to delete"),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
     """Delete a message."""
     try:
@@ -184,7 +189,7 @@ def delete_message(
             )
         
         # Check if the current user is the sender or an admin
-        if str(message.sender_id) != str(current_user.id) and "admin" not in current_user.roles:
+        if str(message.sender_id) != str(current_user.id) and not principal.has_role("admin"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to delete this message"
@@ -15,6 +15,7 @@ from src.schemas.finance.fee_payment import FeePayment, FeePaymentCreate
 from src.schemas.finance.fee_installment import FeeInstallment
 from src.db.crud.finance import fee_category, fee_structure, student_fee, fee_payment, fee_installment
 from src.utils.export_utils import generate_xlsx_response, generate_pdf_response
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -155,7 +156,7 @@ def create_student_fee(
 
 from fastapi import Response, HTTPException
 
-@router.get("/student-fees/export/xlsx")
+@router.get("/student-fees/export/xlsx", dependencies=[Depends(heavy_rate_limit)])
 async def export_fees_xlsx(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -182,7 +183,7 @@ async def export_fees_xlsx(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"XLSX Export failed: {str(e)}")
 
-@router.get("/student-fees/export/pdf")
+@router.get("/student-fees/export/pdf", dependencies=[Depends(heavy_rate_limit)])
 async def export_fees_pdf(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -209,7 +210,7 @@ async def export_fees_pdf(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF Export failed: {str(e)}")
 
-@router.post("/student-fees/bulk")
+@router.post("/student-fees/bulk", dependencies=[Depends(heavy_rate_limit)])
 def create_bulk_student_fees(
     *,
     db: Session = Depends(get_db),
@@ -8,10 +8,12 @@ from sqlalchemy import desc
 from src.core.security.permissions import has_permission
 from src.db.models.auth.user import User
 from src.db.session import get_db, get_super_admin_db
+from src.db.crud.base.counting import CountStrategy
 from src.schemas.logging.activity_log import ActivityLog, ActivityLogPaginated
 from src.schemas.logging.super_admin_activity_log import AuditLogResponse, AuditLogPaginated
 from src.services.logging import AuditLoggingService
 from src.services.logging.super_admin_activity_log_service import SuperAdminActivityLogService
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -30,6 +32,7 @@ def get_super_admin_audit_logs(
     target_tenant_id: Optional[str] = Query(None),
     start_date: Optional[str] = Query(None),
     end_date: Optional[str] = Query(None),
+    count: CountStrategy = Query(CountStrategy.EXACT, description="How the total is computed: exact, cached or estimated"),
     audit_service: SuperAdminActivityLogService = Depends(get_super_admin_audit_service),
     current_user: User = Depends(has_permission("view_all_audit_logs"))  # Super-admin permission
 ):
@@ -41,9 +44,7 @@ def get_super_admin_audit_logs(
         parsed_start_date = datetime.fromisoformat(start_date.replace('Z', '+00:00')) if start_date else None
         parsed_end_date = datetime.fromisoformat(end_date.replace('Z', '+00:00')) if end_date else None
         
-        logs, total = audit_service.get_all_logs(
-            skip=skip,
-            limit=limit,
+        log_filters = dict(
             user_id=parsed_user_id,
             action=action,
             entity_type=entity_type,
@@ -51,6 +52,8 @@ def get_super_admin_audit_logs(
             start_date=parsed_start_date,
             end_date=parsed_end_date
         )
+        logs = audit_service.get_all_logs(skip=skip, limit=limit, **log_filters)
+        total = audit_service.get_count(count_strategy=count, **log_filters)
         
         # Transform to match frontend expectations
         items = [
@@ -71,7 +74,8 @@ def get_super_admin_audit_logs(
             skip=skip,
             limit=limit,
             has_next=total > (skip + limit),
-            has_prev=skip > 0
+            has_prev=skip > 0,
+            count_strategy=total.strategy
         )
         
     except ValueError as e:
@@ -92,6 +96,9 @@ async def get_tenant_audit_logs(
     audit_service: AuditLoggingService = Depends(),
     skip: int = 0,
     limit: int = 10,  # Changed from 100 to 10
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    use_cursor: bool = Query(False, description="Page by cursor instead of skip/offset"),
+    count: CountStrategy = Query(CountStrategy.EXACT, description="How the total is computed: exact, cached or estimated"),
     user_id: Optional[UUID] = Query(None, description="Filter by user ID"),
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
     entity_id: Optional[UUID] = Query(None, description="Filter by entity ID"),
@@ -118,7 +125,8 @@ async def get_tenant_audit_logs(
                 start_date=start_date, 
                 end_date=end_date,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                count_strategy=count
             )
             return ActivityLogPaginated(
                 items=items,
@@ -126,17 +134,36 @@ async def get_tenant_audit_logs(
                 skip=skip,
                 limit=limit,
                 has_next=total > (skip + limit),
-                has_prev=skip > 0
+                has_prev=skip > 0,
+                count_strategy=total.strategy
+            )
+        
+        # Cursor mode: seek by (created_at, id) and skip the COUNT(*)
+        if use_cursor or after:
+            items, next_cursor = await audit_service.list_with_cursor(after=after, limit=limit, filters=filters)
+            return ActivityLogPaginated(
+                items=items,
+                skip=0,
+                limit=limit,
+                has_next=next_cursor is not None,
+                has_prev=after is not None,
+                next_cursor=next_cursor
             )
         
-        items, total = await audit_service.list_with_count(skip=skip, limit=limit, filters=filters)
+        items, total = await audit_service.list_with_count(skip=skip, limit=limit, filters=filters, count_strategy=count)
         return ActivityLogPaginated(
             items=items,
             total=total,
             skip=skip,
             limit=limit,
             has_next=total > (skip + limit),
-            has_prev=skip > 0
+            has_prev=skip > 0,
+            count_strategy=total.strategy
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
     except Exception as e:
         raise HTTPException(
@@ -144,7 +171,7 @@ async def get_tenant_audit_logs(
             detail=f"Error retrieving audit logs: {str(e)}"
         )
 
-@router.get("/super-admin/audit-logs/activity-report", response_model=Dict[str, Any])
+@router.get("/super-admin/audit-logs/activity-report", response_model=Dict[str, Any], dependencies=[Depends(heavy_rate_limit)])
 def generate_activity_report(
     *,
     audit_service: SuperAdminActivityLogService = Depends(get_super_admin_audit_service),
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 # WhatsApp service
 # REMOVED: from src.services.notification.whatsapp_service import MultiTenantWhatsAppService
 from src.services.auth.password import generate_default_password
+from src.core.security.hashing import hash_password, hash_passwords
 
 # Replace CRUD imports with service imports
 from src.db.crud.people import student, teacher, parent
@@ -20,7 +21,8 @@ from src.schemas.people import Student, StudentCreate, StudentUpdate, StudentBul
 from src.schemas.people import Teacher, TeacherCreate, TeacherUpdate, TeacherCreateResponse
 from src.schemas.people import Parent, ParentCreate, ParentUpdate
 from src.core.middleware.tenant import get_tenant_id_from_request, get_tenant_from_request 
-from src.core.auth.dependencies import has_any_role, get_current_user, get_current_active_user, has_permission
+from src.core.auth.dependencies import has_any_role, get_current_user, get_current_active_user, has_permission, get_current_principal
+from src.core.security.principal import Principal
 from src.schemas.auth import User
 from src.schemas.auth import User
 from src.db.crud.auth.user import user
@@ -42,6 +44,7 @@ from src.db.models.academics.grade import Grade
 from src.db.models.academics.enrollment import Enrollment as EnrollmentModel
 from src.db.models.academics.class_enrollment import ClassEnrollment as ClassEnrollmentModel
 from src.utils.uuid_utils import ensure_uuid
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -81,7 +84,7 @@ async def create_student(
             detail=str(e)
         )
 
-@router.post("/students/bulk", response_model=List[Dict[str, Any]], status_code=status.HTTP_201_CREATED)
+@router.post("/students/bulk", response_model=List[Dict[str, Any]], status_code=status.HTTP_201_CREATED, dependencies=[Depends(heavy_rate_limit)])
 async def create_students_bulk(
     *,
     student_service: StudentService = Depends(),
@@ -135,12 +138,16 @@ async def get_students(
     student_service: StudentService = Depends(),
     skip: int = 0,
     limit: int = 100,
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    use_cursor: bool = Query(False, description="Page by cursor instead of skip/offset"),
     grade: Optional[str] = None,
     section: Optional[str] = None,
     status: Optional[str] = None,
-    current_user: User = Depends(has_permission("view_students"))
+    current_user: User = Depends(has_permission("view_students")),
+    principal: Principal = Depends(get_current_principal)
 ) -> Any:
-    """Get all students with optional filtering."""
+    """Get all students with optional filtering.
+    Pass use_cursor=true (or an `after` cursor) for keyset pagination without a total count."""
     filters = {}
     if grade:
         filters["grade"] = grade
@@ -150,10 +157,20 @@ async def get_students(
         filters["status"] = status
 
     # For super_admin users, we might need to use SuperAdminStudentService instead
-    if "super_admin" in {role.name for role in current_user.roles}:
+    if "super_admin" in principal.roles:
         # Use SuperAdminStudentService for cross-tenant access
         super_admin_service = SuperAdminStudentService(db=student_service.db) # Assuming student_service has a db attribute
         items, total = await super_admin_service.list_with_count(skip=skip, limit=limit, filters=filters)
+    elif use_cursor or after:
+        # Keyset pagination: constant cost per page, no COUNT(*)
+        try:
+            items, next_cursor = await student_service.list_with_cursor(after=after, limit=limit, filters=filters)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {
+            "items": items,
+            "next_cursor": next_cursor
+        }
     else:
         # Regular tenant-scoped access
         items, total = await student_service.list_with_count(skip=skip, limit=limit, filters=filters)
@@ -223,8 +240,8 @@ async def update_student_status(
             detail=f"An error occurred: {str(e)}"
         )
 
-@router.delete("/students/bulk", status_code=status.HTTP_200_OK)
-@router.post("/students/bulk-delete", status_code=status.HTTP_200_OK)
+@router.delete("/students/bulk", status_code=status.HTTP_200_OK, dependencies=[Depends(heavy_rate_limit)])
+@router.post("/students/bulk-delete", status_code=status.HTTP_200_OK, dependencies=[Depends(heavy_rate_limit)])
 async def bulk_delete_students(
     *,
     student_service: StudentService = Depends(),
@@ -417,7 +434,8 @@ async def create_teacher(*,
     teacher_data.password = password
     
     # Employee ID will be auto-generated in CRUD if not provided
-    new_teacher = teacher.create(db, tenant_id=tenant_id, obj_in=teacher_data)
+    password_hash = await hash_password(password)
+    new_teacher = teacher.create(db, tenant_id=tenant_id, obj_in=teacher_data, password_hash=password_hash)
     
     # Explicitly assign 'teacher' role
     teacher_role = db.query(UserRole).filter(UserRole.name == "teacher").first()
@@ -446,11 +464,15 @@ async def create_teacher(*,
     
     return response
 
-@router.post("/teachers/bulk", response_model=List[TeacherCreateResponse], status_code=status.HTTP_201_CREATED)
+@router.post("/teachers/bulk", response_model=List[TeacherCreateResponse], status_code=status.HTTP_201_CREATED, dependencies=[Depends(heavy_rate_limit)])
 async def create_teachers_bulk(*, db: Session = Depends(get_db), tenant_id: UUID = Depends(get_tenant_id_from_request), teachers_in: List[TeacherCreate]) -> Any:
     """Create multiple teachers with auto-generated employee IDs and return credentials."""
+    # Hash every password up front, in parallel, off the event loop
+    passwords = [teacher_data.password or generate_default_password() for teacher_data in teachers_in]
+    password_hashes = await hash_passwords(passwords)
+
     created_teachers = []
-    for teacher_data in teachers_in:
+    for teacher_data, password, password_hash in zip(teachers_in, passwords, password_hashes):
         # Check for duplicate employee ID only if provided
         if teacher_data.employee_id:
             existing_teacher = teacher.get_by_employee_id(db, tenant_id=tenant_id, employee_id=teacher_data.employee_id)
@@ -468,13 +490,11 @@ async def create_teachers_bulk(*, db: Session = Depends(get_db), tenant_id: UUID
                 detail=f"A user with email '{teacher_data.email}' already exists in the system"
             )
         
-        # Generate password if not provided
-        password = teacher_data.password if teacher_data.password else generate_default_password()
         password_was_generated = not teacher_data.password
         teacher_data.password = password
         
         # Employee ID will be auto-generated in CRUD if not provided
-        created_teacher = teacher.create(db, tenant_id=tenant_id, obj_in=teacher_data)
+        created_teacher = teacher.create(db, tenant_id=tenant_id, obj_in=teacher_data, password_hash=password_hash)
         
         # Explicitly assign 'teacher' role
         teacher_role = db.query(UserRole).filter(UserRole.name == "teacher").first()
@@ -668,7 +688,8 @@ async def create_parent(*,
     password = parent_in.password if parent_in.password else generate_default_password()
     parent_in.password = password
     
-    new_parent = parent.create(db, tenant_id=tenant_id, obj_in=parent_in)
+    password_hash = await hash_password(password)
+    new_parent = parent.create(db, tenant_id=tenant_id, obj_in=parent_in, password_hash=password_hash)
     
     return new_parent
 
@@ -762,6 +783,7 @@ async def get_student_enrollments(
     *,
     student_id: UUID,
     current_user: User = Depends(has_any_role(["admin", "teacher", "student", "parent"])),
+    principal: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
     tenant_id: UUID = Depends(get_tenant_id_from_request),
     skip: int = 0,
@@ -769,7 +791,7 @@ async def get_student_enrollments(
 ) -> Any:
     """List all enrollments for a given student within the tenant."""
     # Security check for students
-    roles = [r.name for r in current_user.roles]
+    roles = principal.roles
     if "student" in roles and "admin" not in roles and "teacher" not in roles:
         if str(current_user.id) != str(student_id):
             raise HTTPException(status_code=403, detail="Students can only view their own enrollments")
@@ -785,12 +807,13 @@ async def get_student_current_enrollment(
     *,
     student_id: UUID,
     current_user: User = Depends(has_any_role(["admin", "teacher", "student", "parent"])),
+    principal: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db),
     tenant_id: UUID = Depends(get_tenant_id_from_request)
 ) -> Any:
     """Get the current active enrollment for a student."""
     # Security check for students
-    roles = [r.name for r in current_user.roles]
+    roles = principal.roles
     if "student" in roles and "admin" not in roles and "teacher" not in roles:
         if str(current_user.id) != str(student_id):
             raise HTTPException(status_code=403, detail="Students can only view their own enrollment")
@@ -802,7 +825,7 @@ async def get_student_current_enrollment(
         # Reliability: never blow up this endpoint; return None on unexpected errors
         return None
 
-@router.post("/students/bulk-enrollments", response_model=Dict[str, Optional[EnrollmentSchema]])
+@router.post("/students/bulk-enrollments", response_model=Dict[str, Optional[EnrollmentSchema]], dependencies=[Depends(heavy_rate_limit)])
 async def get_bulk_current_enrollments(
     *,
     payload: Dict[str, Any] = Body(...),
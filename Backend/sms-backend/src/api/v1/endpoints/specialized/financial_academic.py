@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from src.db.models.auth import User
 from src.core.security.permissions import has_permission
 from src.db.session import get_db
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -36,7 +37,7 @@ def get_financial_data(current_user: User = Depends(has_permission("view_financi
     }
 
 # Academic endpoints
-@router.get("/academic-reports")
+@router.get("/academic-reports", dependencies=[Depends(heavy_rate_limit)])
 def get_academic_reports(current_user: User = Depends(has_permission("generate_academic_reports"))) -> Any:
     """Generate academic reports for the tenant.
     
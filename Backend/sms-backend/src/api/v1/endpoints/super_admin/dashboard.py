@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from src.db.session import get_super_admin_db
 from src.core.security.permissions import require_super_admin
 from src.services.tenant.dashboard import DashboardMetricsService
+from src.core.security.hashing import password_hasher
+from src.services.logging.audit_pipeline import audit_pipeline
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -53,7 +55,9 @@ async def get_system_metrics(db: Session = Depends(get_super_admin_db)):
         "activeConnections": metrics["system_health"]["activeConnections"] if "activeConnections" in metrics["system_health"] else 156,
         "alerts": [],
         "tenantGrowth": metrics["tenant_metrics"].get("history", []), 
-        "revenue_metrics": metrics["revenue_metrics"] 
+        "revenue_metrics": metrics["revenue_metrics"],
+        "passwordHashing": password_hasher.stats(),
+        "auditLog": audit_pipeline.stats()
     }
 
 @router.get("/recent-tenants")
@@ -2,7 +2,7 @@ from typing import Any, List, Optional, Dict
 from uuid import UUID, uuid4
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, text
 from sqlalchemy.exc import IntegrityError
@@ -32,11 +32,14 @@ from src.db.models.tenant.tenant import Tenant as TenantModel
 from src.db.models.tenant.notification_config import TenantNotificationConfig
 
 # Import security and utility functions
-from src.core.security.password import get_password_hash
+from src.core.security.hashing import hash_password_sync
 from src.services.auth.password import generate_default_password
 from src.core.security.permissions import require_super_admin
 from src.services.tenant.dashboard import DashboardMetricsService
 from src.services.email import send_new_user_email
+from src.core.tenant_cache import schedule_tenant_invalidation
+from src.core.security.principal import invalidate_principals_sync, role_member_ids
+from src.services.base.rate_limit import heavy_rate_limit
 
 router = APIRouter()
 
@@ -278,7 +281,7 @@ def create_tenant_with_admin(
             first_name=tenant_data.admin_user.first_name,
             last_name=tenant_data.admin_user.last_name,
             email=tenant_data.admin_user.email,
-            password_hash=get_password_hash(admin_password),
+            password_hash=hash_password_sync(admin_password),
             is_active=True,
             tenant_id=new_tenant.id,
             type="admin"
@@ -376,7 +379,8 @@ def update_tenant(
     db: Session = Depends(get_super_admin_db),
     _: User = Depends(require_super_admin()),
     tenant_id: UUID,
-    tenant_in: TenantUpdate
+    tenant_in: TenantUpdate,
+    background_tasks: BackgroundTasks
 ) -> Any:
     """Update a tenant (super-admin only)."""
     tenant_obj = tenant_crud.get(db, id=tenant_id)
@@ -385,14 +389,17 @@ def update_tenant(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found"
         )
-    return tenant_crud.update(db, db_obj=tenant_obj, obj_in=tenant_in)
+    result = tenant_crud.update(db, db_obj=tenant_obj, obj_in=tenant_in)
+    schedule_tenant_invalidation(background_tasks, tenant_id)
+    return result
 
 @router.delete("/tenants/{tenant_id}", response_model=Tenant)
 def delete_tenant(
     *,
     db: Session = Depends(get_super_admin_db),
     _: User = Depends(require_super_admin()),
-    tenant_id: UUID
+    tenant_id: UUID,
+    background_tasks: BackgroundTasks
 ) -> Any:
     """Delete a tenant (super-admin only)."""
     tenant_obj = tenant_crud.get(db, id=tenant_id)
@@ -401,7 +408,9 @@ def delete_tenant(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found"
         )
-    return tenant_crud.remove(db, id=tenant_id)
+    result = tenant_crud.remove(db, id=tenant_id)
+    schedule_tenant_invalidation(background_tasks, tenant_id)
+    return result
 
 # New endpoints for tenant settings management
 @router.get("/tenants/{tenant_id}/settings", response_model=TenantSettings)
@@ -517,7 +526,7 @@ async def get_all_users(
     )
 
 # Enhanced reports implementation
-@router.get("/reports")
+@router.get("/reports", dependencies=[Depends(heavy_rate_limit)])
 def view_system_reports(
     *,
     db: Session = Depends(get_super_admin_db),
@@ -645,15 +654,16 @@ def create_user_cross_tenant(
     
     if not password or password == '':
         password_was_generated = True
-        print(f"DEBUG: Password will be generated at CRUD level")
+        password = generate_default_password()
     
     # Create user
     try:
-        user = user_crud.create(db, tenant_id=tenant_id, obj_in=user_create_data)
+        user = user_crud.create(
+            db, tenant_id=tenant_id, obj_in=user_create_data, password_hash=hash_password_sync(password)
+        )
         print(f"DEBUG: User created with ID: {user.id}")
         
-        # Get the generated password from the user object if it was generated
-        generated_password = getattr(user, 'generated_password', None)
+        generated_password = password if password_was_generated else None
     except IntegrityError as e:
         db.rollback()
         print(f"[DEBUG] Database integrity error during user creation: {str(e)}")
@@ -727,7 +737,8 @@ def activate_tenant(
     *,
     db: Session = Depends(get_super_admin_db),
     _: User = Depends(require_super_admin()),
-    tenant_id: UUID
+    tenant_id: UUID,
+    background_tasks: BackgroundTasks
 ) -> Any:
     """Activate a tenant (super-admin only)."""
     print(f"Activating tenant with ID: {tenant_id}")
@@ -744,6 +755,7 @@ def activate_tenant(
     print(f"Updating tenant {tenant_id} with data: {update_data}")  # Add logging
     result = tenant_crud.update(db, db_obj=tenant_obj, obj_in=update_data)
     print(f"Tenant updated: {result.is_active}")  # Add logging
+    schedule_tenant_invalidation(background_tasks, tenant_id)
     return result
 
 @router.put("/tenants/{tenant_id}/deactivate", response_model=Tenant)
@@ -751,7 +763,8 @@ def deactivate_tenant(
     *,
     db: Session = Depends(get_super_admin_db),
     _: User = Depends(require_super_admin()),
-    tenant_id: UUID
+    tenant_id: UUID,
+    background_tasks: BackgroundTasks
 ) -> Any:
     """Deactivate a tenant (super-admin only)."""
     tenant_obj = tenant_crud.get(db, id=tenant_id)
@@ -763,7 +776,9 @@ def deactivate_tenant(
     
     # Update the tenant's active status
     update_data = {"is_active": False}
-    return tenant_crud.update(db, db_obj=tenant_obj, obj_in=update_data)
+    result = tenant_crud.update(db, db_obj=tenant_obj, obj_in=update_data)
+    schedule_tenant_invalidation(background_tasks, tenant_id)
+    return result
 
 @router.put("/users/{user_id}", response_model=UserSchema)
 def update_user_cross_tenant(
@@ -783,7 +798,11 @@ def update_user_cross_tenant(
         )
     
     # Update the user using their actual tenant_id
-    updated_user = user_crud.update(db, tenant_id=user.tenant_id, db_obj=user, obj_in=user_in)
+    password_hash = hash_password_sync(user_in.password) if user_in.password else None
+    updated_user = user_crud.update(
+        db, tenant_id=user.tenant_id, db_obj=user, obj_in=user_in, password_hash=password_hash
+    )
+    invalidate_principals_sync([user_id])
     return updated_user
 
 # Add these endpoints after the existing endpoints (around line 640)
@@ -875,7 +894,9 @@ def add_permissions_to_role(
     
     # Add permissions to role
     permission_ids = [p.id for p in permissions]
-    return user_role_crud.set_permissions_to_role(db, role_id=role_id, permission_ids=permission_ids)
+    result = user_role_crud.set_permissions_to_role(db, role_id=role_id, permission_ids=permission_ids)
+    invalidate_principals_sync(role_member_ids(db, role_id))
+    return result
 
 @router.get("/permissions", response_model=List[Permission])
 def get_all_permissions(
@@ -937,6 +958,7 @@ def assign_roles_to_user(
     user.roles = roles
     db.commit()
     db.refresh(user)
+    invalidate_principals_sync([user_id])
     
     return {"message": "Roles assigned successfully"}
 
@@ -946,7 +968,8 @@ def update_tenant_subscription(
     db: Session = Depends(get_super_admin_db),
     _: User = Depends(require_super_admin()),
     tenant_id: UUID,
-    subscription_in: TenantUpdate
+    subscription_in: TenantUpdate,
+    background_tasks: BackgroundTasks
 ) -> Any:
     """Update tenant subscription details (super-admin only)."""
     tenant = tenant_crud.get(db, id=tenant_id)
@@ -965,7 +988,10 @@ def update_tenant_subscription(
             detail="Invalid plan type. Must be 'flat_rate' or 'per_user'"
         )
 
-    return tenant_crud.update(db, db_obj=tenant, obj_in=update_data)
+    result = tenant_crud.update(db, db_obj=tenant, obj_in=update_data)
+    # plan_type is part of the cached tenant snapshot
+    schedule_tenant_invalidation(background_tasks, tenant_id)
+    return result
 
 
 # ─── AI & Predictive Analytics Endpoints ─────────────────────────
@@ -1,9 +1,10 @@
 from typing import Any, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from src.db.session import get_db, get_tenant_id
+from src.db.session import SessionLocal, get_db, get_tenant_id
 from src.core.auth.dependencies import has_permission, has_any_role, get_current_user
 from src.services.tenant.admin_dashboard import TenantAdminDashboardService
 from src.db.models.auth import User
@@ -14,10 +15,18 @@ import json
 
 router = APIRouter()
 
+def _compute_dashboard_stats(tenant_id: str) -> Any:
+    # Own session: stale values are refreshed in the background, after the request's session is closed
+    db = SessionLocal()
+    try:
+        return TenantAdminDashboardService(db, tenant_id).get_dashboard_stats()
+    finally:
+        db.close()
+
+
 @router.get("/dashboard/stats")
 async def get_admin_dashboard_stats(
     *,
-    db: Session = Depends(get_db),
     tenant: Tenant = Depends(get_tenant_from_request),
     current_user: User = Depends(has_any_role(["admin", "superadmin"])),
 ) -> Any:
@@ -25,20 +34,15 @@ async def get_admin_dashboard_stats(
     cache_key = f"tenant:dashboard:stats:{tenant.id}"
     
     try:
-        # 1. Try hitting the cache
-        cached_data = await cache.get(cache_key)
-        if cached_data:
-            return cached_data
-
-        # 2. Cache miss - fetch from DB
-        from fastapi.concurrency import run_in_threadpool
-        dashboard_service = TenantAdminDashboardService(db, str(tenant.id))
-        stats = await run_in_threadpool(dashboard_service.get_dashboard_stats)
-        
-        # 3. Cache for 30 seconds
-        await cache.set(cache_key, stats, expire=30)
-        
-        return stats
+        # Fresh for ~30 seconds, then served stale for up to 90 more while one worker
+        # recomputes; concurrent misses share a single computation
+        return await cache.get_or_compute(
+            cache_key,
+            lambda: run_in_threadpool(_compute_dashboard_stats, str(tenant.id)),
+            expire=30,
+            stale_ttl=90,
+            jitter=0.1,
+        )
     except Exception as e:
         print(f"[Dashboard Stats] ERROR: {str(e)}")
         import traceback
@@ -1,7 +1,7 @@
 from typing import Any, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -13,6 +13,7 @@ from src.schemas.tenant import TenantSettings, TenantSettingsCreate, TenantSetti
 from src.core.auth.dependencies import has_role, has_any_role
 from src.db.models.auth import User
 from src.core.middleware.tenant import get_tenant_id_from_request
+from src.core.tenant_cache import schedule_tenant_invalidation
 
 router = APIRouter()
 
@@ -121,6 +122,7 @@ def update_own_tenant(
     db: Session = Depends(get_db), 
     tenant_id: UUID = Depends(get_tenant_id_from_request), 
     tenant_in: TenantUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(has_role("admin"))
 ) -> Any:
     """Update the current tenant (for tenant admins to update their own school settings)."""
@@ -130,7 +132,9 @@ def update_own_tenant(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found"
         )
-    return tenant_crud.update(db, db_obj=tenant_obj, obj_in=tenant_in)
+    result = tenant_crud.update(db, db_obj=tenant_obj, obj_in=tenant_in)
+    schedule_tenant_invalidation(background_tasks, tenant_id)
+    return result
 
 @router.put("/{tenant_id}", response_model=Tenant)
 def update_tenant(
@@ -138,6 +142,7 @@ def update_tenant(
     db: Session = Depends(get_db), 
     tenant_id: UUID = Depends(get_tenant_id_from_request), 
     tenant_in: TenantUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(has_role("admin"))
 ) -> Any:
     """Update a tenant (requires admin role)."""
@@ -147,10 +152,12 @@ def update_tenant(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found"
         )
-    return tenant_crud.update(db, db_obj=tenant_obj, obj_in=tenant_in)
+    result = tenant_crud.update(db, db_obj=tenant_obj, obj_in=tenant_in)
+    schedule_tenant_invalidation(background_tasks, tenant_id)
+    return result
 
 @router.delete("/{tenant_id}", response_model=Tenant)
-def delete_tenant(*, db: Session = Depends(get_db), tenant_id: UUID = Depends(get_tenant_id_from_request)) -> Any:
+def delete_tenant(*, db: Session = Depends(get_db), tenant_id: UUID = Depends(get_tenant_id_from_request), background_tasks: BackgroundTasks) -> Any:
     """Delete a tenant."""
     tenant_obj = tenant_crud.get(db, id=tenant_id)
     if not tenant_obj:
@@ -158,7 +165,9 @@ def delete_tenant(*, db: Session = Depends(get_db), tenant_id: UUID = Depends(ge
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tenant not found"
         )
-    return tenant_crud.remove(db, id=tenant_id)
+    result = tenant_crud.remove(db, id=tenant_id)
+    schedule_tenant_invalidation(background_tasks, tenant_id)
+    return result
 
 # Tenant Settings endpoints
 @router.post("/{tenant_id}/settings", response_model=TenantSettings)
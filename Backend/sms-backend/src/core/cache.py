@@ -1,16 +1,60 @@
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Optional, Type, TypeVar
+from pydantic import BaseModel
 import json
-from src.core.redis import cache
+from src.core.redis import cache, jittered
+from src.core.local_cache import l1_cache, l1_ttl_for
+from src.core.cache_codec import to_schema
 import inspect
 
 T = TypeVar("T")
 
-def cached(prefix: str, expire: int = 300):
+# Prefixes whose keys moved to generation namespaces; pre-namespace keys
+# (without ":g=") are swept once at startup instead of waiting out their TTL.
+LEGACY_KEY_PATTERNS = ["academic_grades:*"]
+
+
+async def sweep_legacy_keys() -> None:
+    """Remove pre-namespace keys with SCAN/UNLINK; safe to run on every worker."""
+    for pattern in LEGACY_KEY_PATTERNS:
+        try:
+            deleted = await cache.sweep_keys(pattern, skip=":g=")
+            if deleted:
+                print(f"[Redis] Swept {deleted} legacy keys matching pattern: {pattern}")
+        except Exception as e:
+            print(f"Redis legacy key sweep error: {e}")
+
+def cached(
+    prefix: str,
+    expire: int = 300,
+    l1_ttl: Optional[int] = None,
+    namespace: Optional[str] = None,
+    single_flight: bool = False,
+    stale_ttl: int = 0,
+    jitter: float = 0.0,
+    schema: Optional[Type[BaseModel]] = None,
+):
     """
     Decorator to cache function results in Redis.
     The key is generated based on the prefix and the function arguments.
     Works with both sync and async functions.
+
+    Results are also kept in an in-process L1 tier for l1_ttl seconds (by
+    default the L1_POLICIES entry for the prefix), so hot lookups skip Redis.
+    cache.delete/delete_pattern evict L1 entries on every worker.
+
+    With namespace set, keys carry the tenant's generation for that namespace,
+    so cache.invalidate_namespace(namespace, tenant_id) drops them all at once.
+
+    With schema set, results (ORM objects or lists of them) are converted to
+    that Pydantic schema and stored tagged, so hits and misses both return
+    schema instances rather than ORM objects on a miss and dicts on a hit.
+
+    Stampede protection (see RedisCache.get_or_compute): single_flight computes
+    a missing value once across workers; stale_ttl serves expired values for
+    that much longer while one background refresh runs; jitter spreads expire.
+    Background refreshes may outlive the request, so only use stale_ttl on
+    functions that do not rely on a request-scoped DB session.
     """
     def decorator(func: Callable[..., Any]):
         @wraps(func)
@@ -33,25 +77,69 @@ def cached(prefix: str, expire: int = 300):
                     key_parts.append(f"{name}={value}")
             
             # Add tenant_id if available on 'self'
+            tenant_id = getattr(args[0], 'tenant_id', None) if args else None
             if args and hasattr(args[0], 'tenant_id'):
                  key_parts.append(f"tenant={args[0].tenant_id}")
+
+            if namespace:
+                generation = await cache.get_generation(namespace, tenant_id)
+                key_parts.append(f"g={generation}")
             
             cache_key = ":".join(map(str, key_parts))
             
-            # Try to get from cache
-            result = await cache.get(cache_key)
-            if result is not None:
-                return result
+            local_ttl = min(expire, l1_ttl if l1_ttl is not None else l1_ttl_for(cache_key))
+
+            async def call():
+                if inspect.iscoroutinefunction(func):
+                    result = await func(*args, **kwargs)
+                else:
+                    result = func(*args, **kwargs)
+                return to_schema(result, schema) if schema is not None else result
+
+            # Try the in-process tier, then Redis
+            raw = l1_cache.get(cache_key) if local_ttl > 0 else None
+            if raw is not None:
+                return cache.decode(raw)
+
+            if single_flight or stale_ttl:
+                computed = {}
+
+                async def compute_raw():
+                    result = await call()
+                    computed["result"] = result
+                    if result is None:
+                        return None
+                    try:
+                        return cache.encode(result)
+                    except Exception as e:
+                        print(f"Cache encode error for {cache_key}: {e}")
+                        return None
+
+                raw = await cache.get_or_compute_raw(
+                    cache_key, compute_raw, expire=expire, stale_ttl=stale_ttl, jitter=jitter
+                )
+                if raw is None:
+                    return computed["result"] if "result" in computed else await call()
+                l1_cache.set(cache_key, raw, local_ttl)
+                return cache.decode(raw)
+
+            raw = await cache.get_raw(cache_key)
+            if raw is not None:
+                l1_cache.set(cache_key, raw, local_ttl)
+                return cache.decode(raw)
             
             # Execute function
-            if inspect.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
+            result = await call()
             
             # Store in cache
             if result is not None:
-                await cache.set(cache_key, result, expire=expire)
+                try:
+                    raw = cache.encode(result)
+                except Exception as e:
+                    print(f"Cache encode error for {cache_key}: {e}")
+                    return result
+                l1_cache.set(cache_key, raw, local_ttl)
+                await cache.set_raw(cache_key, raw, expire=jittered(expire, jitter))
             
             return result
 
@@ -0,0 +1,175 @@
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+import importlib
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+
+# Schema-tagged values are stored as "~<module>:<class>[]?|<schema JSON>".
+# Plain JSON never starts with "~", so untagged values read back unchanged.
+SCHEMA_TAG_PREFIX = "~"
+# Only schemas from our own package are rehydrated from a stored tag
+SCHEMA_MODULE_PREFIX = "src."
+
+
+def encode_default(obj: Any) -> Any:
+    """Fallback for values the JSON encoders cannot serialize natively."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if hasattr(obj, '__table__'): # SQLAlchemy model
+        data = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
+        # Include loaded relationships to prevent data loss during caching
+        from sqlalchemy import inspect
+        state = inspect(obj)
+        for rel in state.mapper.relationships:
+            if rel.key in state.unloaded:
+                continue
+            value = getattr(obj, rel.key)
+            if value is not None:
+                data[rel.key] = value
+        return data
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class RedisEncoder(json.JSONEncoder):
+    def default(self, obj):
+        try:
+            return encode_default(obj)
+        except TypeError:
+            return super().default(obj)
+
+
+class JSONCodec:
+    """Standard-library JSON; always available."""
+    name = "json"
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, cls=RedisEncoder)
+
+    def loads(self, raw: str) -> Any:
+        return json.loads(raw)
+
+
+class OrjsonCodec:
+    """orjson: several times faster than json, with native UUID/datetime support."""
+    name = "orjson"
+
+    def dumps(self, value: Any) -> str:
+        return orjson.dumps(value, default=encode_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, raw: str) -> Any:
+        return orjson.loads(raw)
+
+
+CODECS: Dict[str, Any] = {JSONCodec.name: JSONCodec}
+if ORJSON_AVAILABLE:
+    CODECS[OrjsonCodec.name] = OrjsonCodec
+
+
+def get_codec(name: str) -> Any:
+    """Codec registered under name, falling back to json when it is unavailable."""
+    codec_cls = CODECS.get(name)
+    if codec_cls is None:
+        print(f"Cache codec '{name}' not available, using json")
+        codec_cls = JSONCodec
+    return codec_cls()
+
+
+_schemas: Dict[str, Type[BaseModel]] = {}
+_adapters: Dict[Tuple[Type[BaseModel], bool], TypeAdapter] = {}
+
+
+def schema_tag(schema: Type[BaseModel]) -> str:
+    tag = f"{schema.__module__}:{schema.__qualname__}"
+    _schemas.setdefault(tag, schema)
+    return tag
+
+
+def resolve_schema(tag: str) -> Optional[Type[BaseModel]]:
+    """Schema class for a stored tag, importing its module on first use in this worker."""
+    schema = _schemas.get(tag)
+    if schema is not None:
+        return schema
+    module_name, _, qualname = tag.partition(":")
+    if not module_name.startswith(SCHEMA_MODULE_PREFIX):
+        return None
+    try:
+        obj: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError):
+        return None
+    if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+        return None
+    _schemas[tag] = obj
+    return obj
+
+
+def _adapter(schema: Type[BaseModel], many: bool) -> TypeAdapter:
+    key = (schema, many)
+    adapter = _adapters.get(key)
+    if adapter is None:
+        adapter = _adapters[key] = TypeAdapter(list[schema] if many else schema)
+    return adapter
+
+
+def to_schema(value: Any, schema: Type[BaseModel]) -> Any:
+    """Convert an ORM object (or list of them) to schema instances; None passes through."""
+    if value is None or isinstance(value, schema):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [to_schema(item, schema) for item in value]
+    return schema.model_validate(value, from_attributes=True)
+
+
+def _tagged_schema(value: Any) -> Optional[Tuple[Type[BaseModel], bool]]:
+    """(schema, many) when value is a schema instance or a non-empty list of one schema."""
+    if isinstance(value, BaseModel):
+        return type(value), False
+    if isinstance(value, list) and value and isinstance(value[0], BaseModel):
+        schema = type(value[0])
+        if all(type(item) is schema for item in value):
+            return schema, True
+    return None
+
+
+class CacheSerializer:
+    """Encodes cached values with a pluggable codec.
+
+    Pydantic schema instances (and lists of one schema) are serialized by
+    pydantic itself and stored with a schema tag, so reads rehydrate the same
+    schema type. Everything else goes through the codec as plain JSON.
+    """
+
+    def __init__(self, codec: Any):
+        self.codec = codec
+
+    def encode(self, value: Any) -> str:
+        tagged = _tagged_schema(value)
+        if tagged is None:
+            return self.codec.dumps(value)
+        schema, many = tagged
+        payload = _adapter(schema, many).dump_json(value).decode()
+        return f"{SCHEMA_TAG_PREFIX}{schema_tag(schema)}{'[]' if many else ''}|{payload}"
+
+    def decode(self, raw: str) -> Any:
+        if not raw.startswith(SCHEMA_TAG_PREFIX):
+            return self.codec.loads(raw)
+        header, _, payload = raw[len(SCHEMA_TAG_PREFIX):].partition("|")
+        many = header.endswith("[]")
+        schema = resolve_schema(header[:-2] if many else header)
+        if schema is None:
+            # Schema renamed or removed since the value was written
+            return self.codec.loads(payload)
+        return _adapter(schema, many).validate_json(payload)
@@ -0,0 +1,59 @@
+import hashlib
+import time
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from src.core.config import settings
+from src.core.redis import cache
+
+# Clients may keep a copy but must revalidate it (cheaply, via If-None-Match) before each use
+REFERENCE_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+async def data_version_etag(namespace: str, tenant_id: Any) -> Optional[str]:
+    """ETag for a tenant's data of one entity type, or None if no shared version is available.
+
+    The version is the namespace generation that service writes bump (see
+    TenantBaseService.data_version). A coarse time bucket is mixed in so writes
+    that bypass the service layer are picked up within HTTP_ETAG_MAX_AGE_SECONDS.
+    """
+    version = await cache.get_generation(namespace, tenant_id, shared_only=True)
+    if version is None:
+        return None
+    bucket = int(time.time() // settings.HTTP_ETAG_MAX_AGE_SECONDS)
+    digest = hashlib.sha1(f"{namespace}:{tenant_id}:{version}:{bucket}".encode()).hexdigest()[:16]
+    return f'W/"{digest}"'
+
+
+async def not_modified(request: Request, response: Response, namespace: str, tenant_id: Any) -> Optional[Response]:
+    """Conditional GET for reference data lists.
+
+    Sets ETag and Cache-Control on response; returns a 304 response for the
+    endpoint to return as-is when the client's copy is current, so the list is
+    never loaded from the database.
+    """
+    etag = await data_version_etag(namespace, tenant_id)
+    if etag is None:
+        return None
+    headers = {"ETag": etag, "Cache-Control": REFERENCE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any, Callable, Iterable, Optional
+
+# Redis is imported inside the functions: src.core.redis itself imports
+# local_cache, which uses this module.
+
+
+async def publish_invalidations(channel: str, messages: Iterable[Any]) -> None:
+    """Publish each message on channel so every worker drops the matching entries."""
+    from src.core.redis import cache, REDIS_AVAILABLE
+    if not REDIS_AVAILABLE:
+        return
+    try:
+        await cache.connect()
+        if cache.client:
+            for message in messages:
+                await cache.client.publish(channel, message)
+    except Exception as e:
+        print(f"Cache invalidation publish error on {channel}: {e}")
+
+
+def publish_invalidations_soon(channel: str, messages: Iterable[Any]) -> None:
+    """publish_invalidations from sync code (e.g. session hooks), without waiting for it."""
+    messages = list(messages)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Sync endpoint in the threadpool
+        import anyio
+        try:
+            anyio.from_thread.run(publish_invalidations, channel, messages)
+        except RuntimeError as e:
+            # Not on an AnyIO worker thread (scripts); other workers expire entries by TTL
+            print(f"Cache invalidation publish on {channel} skipped: {e}")
+        return
+    loop.create_task(publish_invalidations(channel, messages))
+
+
+async def listen_for_invalidations(
+    channel: str,
+    handler: Callable[[Any], None],
+    on_reset: Optional[Callable[[], None]] = None
+) -> None:
+    """Call handler(data) for every message published on channel; runs for the app's lifetime.
+
+    Reconnects after Redis errors and calls on_reset, since anything published
+    while disconnected was missed. Without Redis, entries simply expire by TTL.
+    """
+    from src.core.redis import cache, REDIS_AVAILABLE
+    if not REDIS_AVAILABLE:
+        return
+    while True:
+        pubsub = None
+        try:
+            await cache.connect()
+            if not cache.client:
+                await asyncio.sleep(30)
+                continue
+            pubsub = cache.client.pubsub()
+            await pubsub.subscribe(channel)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    handler(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Cache invalidation listener error on {channel}: {e}")
+            if on_reset is not None:
+                on_reset()
+            await asyncio.sleep(5)
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
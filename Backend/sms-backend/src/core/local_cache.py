@@ -0,0 +1,128 @@
+import fnmatch
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from src.core.config import settings
+from src.core.invalidation import listen_for_invalidations
+
+# Redis pub/sub channel used to tell every worker to drop L1 entries
+L1_INVALIDATION_CHANNEL = "cache:l1:invalidate"
+
+
+@dataclass(frozen=True)
+class L1Policy:
+    """How long entries under a key prefix may live in the in-process tier (0 disables it)."""
+    ttl: int
+
+
+# Per-prefix L1 policies; the longest matching prefix wins. Reference data that
+# rarely changes can sit in L1 for longer, since writes invalidate it over pub/sub.
+L1_POLICIES: Dict[str, L1Policy] = {
+    "academic_grades:": L1Policy(ttl=120),
+    "enrollments:": L1Policy(ttl=15),
+}
+
+
+def configure_l1_policy(prefix: str, ttl: int) -> None:
+    """Set (or with ttl=0 disable) the L1 policy for keys starting with prefix."""
+    L1_POLICIES[prefix] = L1Policy(ttl=ttl)
+
+
+def l1_ttl_for(key: str) -> int:
+    """L1 TTL for key from the longest matching prefix policy, else the default."""
+    best: Optional[Tuple[int, L1Policy]] = None
+    for prefix, policy in L1_POLICIES.items():
+        if key.startswith(prefix) and (best is None or len(prefix) > best[0]):
+            best = (len(prefix), policy)
+    return best[1].ttl if best else settings.CACHE_L1_DEFAULT_TTL_SECONDS
+
+
+class LocalCache:
+    """Bounded TTL/LRU cache of serialized values for this worker.
+
+    Values are stored encoded, exactly as they sit in Redis, so every hit
+    decodes a fresh copy and callers can never mutate a shared object.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, raw = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return raw
+
+    def set(self, key: str, raw: str, ttl: int) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, raw)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> None:
+        """Drop keys matching a Redis-style glob pattern."""
+        with self._lock:
+            for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def apply_invalidation(self, message: str) -> None:
+        """Apply a message published by publish_l1_invalidation."""
+        try:
+            payload = json.loads(message)
+        except (TypeError, ValueError):
+            self.clear()
+            return
+        if payload.get("pattern"):
+            self.delete_pattern(payload["pattern"])
+        elif payload.get("key"):
+            self.delete(payload["key"])
+
+
+l1_cache = LocalCache(max_entries=settings.CACHE_L1_MAX_ENTRIES)
+
+
+async def publish_l1_invalidation(client, *, key: Optional[str] = None, pattern: Optional[str] = None) -> None:
+    """Tell every worker (including this one) to drop an L1 key or pattern."""
+    if key is not None:
+        l1_cache.delete(key)
+    if pattern is not None:
+        l1_cache.delete_pattern(pattern)
+    if client is None:
+        return
+    try:
+        await client.publish(L1_INVALIDATION_CHANNEL, json.dumps({"key": key, "pattern": pattern}))
+    except Exception as e:
+        print(f"L1 cache invalidation publish error: {e}")
+
+
+async def listen_for_l1_invalidations() -> None:
+    """Drop L1 entries as invalidations arrive; runs for the app's lifetime."""
+    await listen_for_invalidations(L1_INVALIDATION_CHANNEL, l1_cache.apply_invalidation, on_reset=l1_cache.clear)
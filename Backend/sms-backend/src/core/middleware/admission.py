@@ -0,0 +1,154 @@
+import asyncio
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+
+INTERACTIVE = "interactive"
+HEAVY = "heavy"
+
+# Path segments of exports, reports and bulk operations (a single report-card stays interactive)
+_HEAVY_SEGMENT_RE = re.compile(
+    r"/(?:export|exports|download|import|reports?|report-cards|academic-reports|activity-report"
+    r"|bulk|bulk-[a-z-]+|transition)(?:/|$)"
+)
+
+
+def classify_lane(path: str) -> str:
+    """HEAVY for exports, reports and bulk operations, INTERACTIVE otherwise."""
+    return HEAVY if _HEAVY_SEGMENT_RE.search(path) else INTERACTIVE
+
+
+@dataclass(frozen=True)
+class LaneLimits:
+    concurrency: int
+    queue: int
+    timeout: float
+    retry_after: int
+
+
+class LaneSaturated(Exception):
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+
+
+class Lane:
+    """Concurrency cap plus a bounded wait queue for one tenant's lane."""
+
+    def __init__(self, limits: LaneLimits):
+        self.limits = limits
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limits.concurrency)
+
+    @property
+    def idle(self) -> bool:
+        return self.active == 0 and self.waiting == 0
+
+    async def acquire(self) -> None:
+        if self._semaphore.locked() and self.waiting >= self.limits.queue:
+            raise LaneSaturated(self.limits.retry_after)
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.limits.timeout)
+        except asyncio.TimeoutError:
+            raise LaneSaturated(self.limits.retry_after)
+        finally:
+            self.waiting -= 1
+        self.active += 1
+
+    def release(self) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+
+class AdmissionControlMiddleware:
+    """Per-tenant bulkhead: caps in-flight requests per tenant, in separate
+    heavy and interactive lanes, so one tenant's exports or year-end run cannot
+    take every worker and pooled DB connection.
+
+    Requests over a lane's cap wait (up to the lane's timeout) in a bounded
+    queue; beyond that they get 503 with Retry-After. Each request holds at
+    most one pooled session, so the request caps bound the tenant's share of
+    the DB pool as well. Limits apply per worker process.
+
+    Must sit inside tenant_middleware so request.state.tenant is populated.
+    """
+
+    def __init__(self, app: ASGIApp, lanes: Optional[Dict[str, LaneLimits]] = None):
+        self.app = app
+        self.lane_limits = lanes or {
+            INTERACTIVE: LaneLimits(
+                concurrency=settings.ADMISSION_INTERACTIVE_CONCURRENCY,
+                queue=settings.ADMISSION_INTERACTIVE_QUEUE,
+                timeout=settings.ADMISSION_INTERACTIVE_TIMEOUT_SECONDS,
+                retry_after=2,
+            ),
+            HEAVY: LaneLimits(
+                concurrency=settings.ADMISSION_HEAVY_CONCURRENCY,
+                queue=settings.ADMISSION_HEAVY_QUEUE,
+                timeout=settings.ADMISSION_HEAVY_TIMEOUT_SECONDS,
+                retry_after=30,
+            ),
+        }
+        self._lanes: Dict[Tuple[str, str], Lane] = {}
+
+    def _tenant_key(self, scope: Scope) -> Optional[str]:
+        tenant = scope.get("state", {}).get("tenant")
+        if tenant is not None:
+            return str(tenant.id)
+        # Paths tenant_middleware bypasses (e.g. exports): fall back to what the client sent
+        headers = dict(scope.get("headers") or [])
+        raw = headers.get(b"x-tenant-id") or headers.get(b"host")
+        return raw.decode("latin-1") if raw else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.ADMISSION_CONTROL_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        path = scope.get("path", "")
+        tenant_key = self._tenant_key(scope)
+        if tenant_key is None or not path.startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        lane_name = classify_lane(path)
+        key = (tenant_key, lane_name)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = Lane(self.lane_limits[lane_name])
+        try:
+            await lane.acquire()
+        except LaneSaturated as e:
+            self._discard_if_idle(key, lane)
+            await self._reject(send, lane_name, e.retry_after)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            lane.release()
+            self._discard_if_idle(key, lane)
+
+    def _discard_if_idle(self, key: Tuple[str, str], lane: Lane) -> None:
+        # Keep the map to tenants with traffic in flight
+        if lane.idle and self._lanes.get(key) is lane:
+            del self._lanes[key]
+
+    async def _reject(self, send: Send, lane_name: str, retry_after: int) -> None:
+        body = json.dumps({
+            "detail": f"Too many concurrent {lane_name} requests for this school. Please retry shortly."
+        }).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,298 +1,280 @@
 import json
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 from uuid import UUID
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from src.core.security.jwt import verify_token
-from src.db.session import get_db, get_super_admin_db
-from src.services.logging import AuditLoggingService
-from src.services.logging.super_admin_activity_log_service import SuperAdminActivityLogService
-
-
-class AuditLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all API requests and responses for audit purposes."""
-    
-    def __init__(self, app):
-        super().__init__(app)
+
+from fastapi import Request
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.security.jwt import verify_request_token
+from src.services.logging.audit_pipeline import audit_pipeline
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+ACTIONS = {
+    "GET": "view",
+    "POST": "create",
+    "PUT": "update",
+    "PATCH": "update",
+    "DELETE": "delete",
+}
+
+# First matching path segment wins, so more specific segments come first
+# (e.g. /academic-grades before /grades)
+ENTITY_TYPES = (
+    ("/users", "user"),
+    ("/tenants", "tenant"),
+    ("/audit-logs", "audit_log"),
+    ("/roles", "role"),
+    ("/permissions", "permission"),
+    ("/students", "student"),
+    ("/teachers", "teacher"),
+    ("/staff", "staff"),
+    ("/parents", "parent"),
+    ("/academic-grades", "academic_grade"),
+    ("/academic-years", "academic_year"),
+    ("/sections", "section"),
+    ("/subjects", "subject"),
+    ("/grading-schemas", "grading_schema"),
+    ("/exams", "exam"),
+    ("/enrollments", "enrollment"),
+    ("/timetables", "timetable"),
+    ("/attendance", "attendance"),
+    ("/assignments", "assignment"),
+    ("/grades", "grade"),
+    ("/announcements", "announcement"),
+    ("/dashboard", "dashboard"),
+    ("/auth", "auth"),
+)
+
+# Suffixes added to super-admin audit details
+ENDPOINT_CONTEXTS = (
+    ("/activate", "(Activation)"),
+    ("/deactivate", "(Deactivation)"),
+    ("/reset-password", "(Password Reset)"),
+    ("/assign-role", "(Role Assignment)"),
+)
+
+
+def entity_type_for(path: str) -> str:
+    for segment, entity_type in ENTITY_TYPES:
+        if segment in path:
+            return entity_type
+    return "system"
+
+
+@dataclass(frozen=True)
+class RouteInfo:
+    """What the audit log needs to know about one route template."""
+    entity_type: str
+    # Path parameters, last first: the entity ID is the last one holding a UUID
+    id_params: Tuple[str, ...]
+    super_admin: bool
+    context: Optional[str]
+
+
+def route_info(template: str, param_names=()) -> RouteInfo:
+    context = next((label for segment, label in ENDPOINT_CONTEXTS if segment in template), None)
+    return RouteInfo(
+        entity_type=entity_type_for(template),
+        id_params=tuple(reversed(list(param_names))),
+        super_admin="/super-admin/" in template,
+        context=context,
+    )
+
+
+def build_route_table() -> Dict[str, RouteInfo]:
+    """RouteInfo for every API route, keyed by its full path template."""
+    from src.api.v1.api import api_router
+
+    table = {}
+    for route in api_router.routes:
+        template = getattr(route, "path", None)
+        if template is None:
+            continue
+        template = settings.API_V1_STR + template
+        table[template] = route_info(template, getattr(route, "param_convertors", {}).keys())
+    return table
+
+
+class AuditLoggingMiddleware:
+    """Middleware to log all API requests and responses for audit purposes.
+
+    Entity type and ID come from the matched route: the router leaves the
+    route and its path parameters in the scope, and each route template is
+    classified once at startup.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
         self.excluded_paths = {
             "/docs", "/redoc", "/openapi.json", "/favicon.ico",
             "/health", "/metrics"
         }
-    
-    def is_super_admin_operation(self, request: Request) -> bool:
-        """Check if this is a super-admin operation based on the URL path."""
-        return "/super-admin/" in str(request.url.path)
-    
-    async def extract_user_info(self, request: Request) -> tuple[Optional[UUID], Optional[UUID], bool]:
-        """Extract user_id, tenant_id, and super_admin status from JWT token."""
-        try:
-            # Get token from Authorization header
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                return None, None, False
-            
-            token = auth_header.split(" ")[1]
-            payload = await verify_token(token)
-            
-            if not payload:
-                return None, None, False
-            
-            # Access TokenPayload attributes directly, not as dictionary
-            user_id = UUID(payload.sub) if payload.sub else None
-            tenant_id = UUID(payload.tenant_id) if payload.tenant_id else None
-            is_super_admin = payload.is_super_admin  # Access as attribute, not dictionary key
-            
-            return user_id, tenant_id, is_super_admin
-        except Exception:
-            return None, None, False
-    
-    def determine_action_and_entity(self, request: Request) -> tuple[str, str]:
-        """Determine the action and entity type based on the request."""
-        method = request.method.lower()
-        path = str(request.url.path)
-        
-        # Map HTTP methods to actions
-        action_map = {
-            "get": "view",
-            "post": "create",
-            "put": "update",
-            "patch": "update",
-            "delete": "delete"
-        }
-        
-        action = action_map.get(method, "unknown")
-        
-        # Determine entity type from path
-        if "/users" in path:
-            entity_type = "user"
-        elif "/tenants" in path:
-            entity_type = "tenant"
-        elif "/audit-logs" in path:
-            entity_type = "audit_log"
-        elif "/roles" in path:
-            entity_type = "role"
-        elif "/permissions" in path:
-            entity_type = "permission"
-        elif "/students" in path:
-            entity_type = "student"
-        elif "/teachers" in path:
-            entity_type = "teacher"
-        elif "/staff" in path:
-            entity_type = "staff"
-        elif "/parents" in path:
-            entity_type = "parent"
-        elif "/academic-grades" in path:
-            entity_type = "academic_grade"
-        elif "/academic-years" in path:
-            entity_type = "academic_year"
-        elif "/sections" in path:
-            entity_type = "section"
-        elif "/subjects" in path:
-            entity_type = "subject"
-        elif "/grading-schemas" in path:
-            entity_type = "grading_schema"
-        elif "/exams" in path:
-            entity_type = "exam"
-        elif "/enrollments" in path:
-            entity_type = "enrollment"
-        elif "/timetables" in path:
-            entity_type = "timetable"
-        elif "/attendance" in path:
-            entity_type = "attendance"
-        elif "/assignments" in path:
-            entity_type = "assignment"
-        elif "/grades" in path:
-            entity_type = "grade"
-        elif "/announcements" in path:
-            entity_type = "announcement"
-        elif "/dashboard" in path:
-            entity_type = "dashboard"
-        elif "/auth" in path:
-            entity_type = "auth"
-        else:
-            entity_type = "system"
-        
-        return action, entity_type
-    
-    def should_log_request(self, request: Request) -> bool:
+        self.routes = build_route_table()
+
+    def should_log_request(self, method: str, path: str, query: str) -> bool:
         """Determine if this request should be logged based on method and path."""
-        method = request.method.lower()
-        path = str(request.url.path)
-        
         # Always log state-changing operations
-        if method in ["post", "put", "patch", "delete"]:
+        if method in WRITE_METHODS:
             return True
-            
         # For GET requests, only log actual data exports (not just viewing)
-        if method == "get":
-            # Only log actual export/download operations
-            if ("/export" in path or "/download" in path or 
-                ("?" in str(request.url) and any(param in str(request.url.query) 
-                 for param in ["export", "download"]))):
-                return True
-        
+        if method == "GET":
+            return (
+                "/export" in path or "/download" in path
+                or "export" in query or "download" in query
+            )
         return False
 
-    def get_log_priority(self, request: Request) -> str:
+    def get_log_priority(self, method: str, path: str) -> str:
         """Determine log priority for retention policies."""
-        method = request.method.lower()
-        path = str(request.url.path)
-        
         # Critical operations - keep longer
-        if method in ["delete"] or "/admin" in path:
+        if method == "DELETE" or "/admin" in path:
             return "critical"  # Keep 2+ years
-            
         # Important operations - medium retention
-        if method in ["post", "put", "patch"]:
+        if method in WRITE_METHODS:
             return "important"  # Keep 1 year
-            
         # Informational - short retention
         return "info"  # Keep 3-6 months
 
-    async def dispatch(self, request: Request, call_next):
-        # Skip logging for excluded paths
-        if any(excluded in str(request.url.path) for excluded in self.excluded_paths):
-            return await call_next(request)
-        
-        # Check if we should log this request
-        if not self.should_log_request(request):
-            return await call_next(request)
-        
-        # Extract user information
-        user_id, tenant_id, is_super_admin = await self.extract_user_info(request)
-        
-        # Determine action and entity type
-        action, entity_type = self.determine_action_and_entity(request)
-        
-        # Capture request body for state-changing operations
-        request_body = None
-        if request.method.lower() in ["post", "put", "patch", "delete"]:
+    async def extract_user_info(self, scope: Scope) -> tuple[Optional[UUID], Optional[UUID], bool]:
+        """Extract user_id, tenant_id, and super_admin status from JWT token."""
+        try:
+            # Reuses the verification IdleActivityMiddleware already did
+            payload = await verify_request_token(Request(scope))
+            if not payload:
+                return None, None, False
+            user_id = UUID(payload.sub) if payload.sub else None
+            tenant_id = UUID(payload.tenant_id) if payload.tenant_id else None
+            return user_id, tenant_id, payload.is_super_admin
+        except Exception:
+            return None, None, False
+
+    def resolve_route(self, scope: Scope) -> Tuple[RouteInfo, Optional[UUID]]:
+        """RouteInfo and entity ID for the route that handled the request."""
+        route = scope.get("route")
+        template = getattr(route, "path", None)
+        info = self.routes.get(template) if template else None
+        if info is None:
+            if template:
+                # Route outside api_router: classify its template once and remember it
+                info = self.routes[template] = route_info(template, route.param_convertors.keys())
+            else:
+                info = route_info(scope.get("path", ""))
+
+        path_params = scope.get("path_params") or {}
+        for name in info.id_params:
+            value = path_params.get(name)
+            if isinstance(value, UUID):
+                return info, value
             try:
-                # IMPORTANT: Consuming request.body() exhausts the stream.
-                # We must replace it so downstream handlers (like FastAPI route handlers) can read it.
-                body = await request.body()
-                
-                # Restore the request body stream immediately so downstream always gets it
-                async def receive():
-                    return {"type": "http.request", "body": body}
-                request._receive = receive
-
-                if body and body.strip():
-                    content_type = request.headers.get("Content-Type", "")
-                    if "application/json" in content_type:
-                        try:
-                            request_body = json.loads(body.decode('utf-8'))
-                        except json.JSONDecodeError:
-                             print(f"[AuditMiddleware] Non-JSON or malformed body for {request.method} {request.url.path}")
-                    else:
-                        # For non-JSON (like multipart/form-data), we don't try to parse as JSON
-                        # but we've already restored the stream above.
-                        pass
-            except Exception as e:
-                import traceback
-                print(f"[AuditMiddleware] ERROR capturing body for {request.method} {request.url.path}: {repr(e)}")
-                # We still want to continue to call_next
-        
-        # Extract entity ID from URL path
-        entity_id = self.extract_entity_id_from_path(request)
-        
-        # Process the request
-        response = await call_next(request)
-        
+                return info, UUID(str(value))
+            except ValueError:
+                continue
+        return info, None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope.get("path", "")
+        query = scope.get("query_string", b"").decode("latin-1")
+        if (any(excluded in path for excluded in self.excluded_paths)
+                or not self.should_log_request(method, path, query)):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        # Copy JSON bodies of state-changing requests as the app reads them
+        capture_body = method in WRITE_METHODS and "application/json" in headers.get("content-type", "")
+        body_chunks = []
+        status_code = 500
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                body_chunks.append(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive_wrapper if capture_body else receive, send_wrapper)
+
         # Only log successful requests (2xx status codes)
-        if 200 <= response.status_code < 300:
-            try:
-                # Check if this is a super-admin operation
-                if self.is_super_admin_operation(request) and is_super_admin:
-                    # Use super-admin logging (no tenant isolation)
-                    db = next(get_super_admin_db())
-                    try:
-                        super_admin_service = SuperAdminActivityLogService(db=db)
-                        
-                        # Extract target tenant from request if applicable
-                        target_tenant_id = None
-                        if "tenant_id" in str(request.url.query):
-                            # Extract from query params
-                            import urllib.parse
-                            query_params = urllib.parse.parse_qs(str(request.url.query))
-                            if "tenant_id" in query_params:
-                                try:
-                                    target_tenant_id = UUID(query_params["tenant_id"][0])
-                                except (ValueError, IndexError):
-                                    pass
-                        
-                        # Generate enhanced details
-                        details = self.generate_enhanced_details(request, action, entity_type, entity_id, request_body, target_tenant_id)
-                        
-                        await super_admin_service.log_super_admin_activity(
-                            user_id=user_id,
-                            action=action,
-                            entity_type=entity_type,
-                            entity_id=entity_id,
-                            target_tenant_id=target_tenant_id,
-                            new_values=request_body,
-                            details=details,
-                            request=request
-                        )
-                    finally:
-                        db.close()
-                
-                elif tenant_id:  # Regular tenant-based logging
-                    db = next(get_db())
-                    try:
-                        audit_service = AuditLoggingService(db=db, tenant_id=tenant_id)
-                        await audit_service.log_activity(
-                            user_id=user_id,
-                            action=action,
-                            entity_type=entity_type,
-                            entity_id=entity_id,
-                            new_values=request_body,
-                            request=request
-                        )
-                    finally:
-                        db.close()
-                        
-            except Exception as e:
-                # Log the error but don't fail the request
-                print(f"Audit logging error: {e}")
-        
-        return response
-
-    def extract_entity_id_from_path(self, request: Request) -> Optional[UUID]:
-        """Extract entity ID from URL path."""
-        import re
-        path = str(request.url.path)
-        
-        # 1. Check for UUID patterns in the path (standard IDs)
-        uuid_pattern = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
-        matches = re.findall(uuid_pattern, path, re.IGNORECASE)
-        
-        if matches:
+        if not 200 <= status_code < 300:
+            return
+        try:
+            await self.log_request(scope, headers, query, b"".join(body_chunks))
+        except Exception as e:
+            # Log the error but don't fail the request
+            print(f"Audit logging error: {e}")
+
+    async def log_request(self, scope: Scope, headers: Headers, query: str, body: bytes) -> None:
+        method = scope["method"]
+        user_id, tenant_id, is_super_admin = await self.extract_user_info(scope)
+        info, entity_id = self.resolve_route(scope)
+        action = ACTIONS.get(method, "unknown")
+
+        request_body = None
+        if body.strip():
             try:
-                # Often the last UUID is the resource ID (the first might be tenant_id in some routers)
-                # But if we have /entity/{id}/sub-entity/{sub_id}, we probably want sub_id
-                return UUID(matches[-1])
-            except ValueError:
-                pass
-        
-        # 2. Check for numeric IDs (common in some legacy or specific endpoints)
-        numeric_id_pattern = r'/(\d+)(/|$)'
-        num_matches = re.search(numeric_id_pattern, path)
-        if num_matches:
-            # We don't log numeric IDs as UUIDs, so we return None or handled differently
-            # For this system, we mainly use UUIDs
-            pass
-            
-        return None
-    
-    def generate_enhanced_details(self, request: Request, action: str, entity_type: str, 
-                            entity_id: Optional[UUID], request_body: Optional[dict], 
+                request_body = json.loads(body.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                print(f"[AuditMiddleware] Non-JSON or malformed body for {method} {scope.get('path')}")
+
+        client = scope.get("client")
+        ip_address = client[0] if client else None
+        user_agent = headers.get("user-agent")
+        # Events are queued and written in batches by audit_pipeline, off the request path
+        if info.super_admin and is_super_admin:
+            # Extract target tenant from request if applicable
+            target_tenant_id = None
+            if "tenant_id" in query:
+                try:
+                    target_tenant_id = UUID(QueryParams(query).get("tenant_id"))
+                except (TypeError, ValueError):
+                    pass
+
+            details = self.generate_enhanced_details(info, action, entity_id, request_body, target_tenant_id)
+            audit_pipeline.log_super_admin_activity(
+                user_id=user_id,
+                action=action,
+                entity_type=info.entity_type,
+                entity_id=entity_id,
+                target_tenant_id=target_tenant_id,
+                new_values=request_body,
+                details=details,
+                ip_address=ip_address,
+                user_agent=user_agent
+            )
+
+        elif tenant_id:  # Regular tenant-based logging
+            audit_pipeline.log_activity(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                action=action,
+                entity_type=info.entity_type,
+                entity_id=entity_id,
+                new_values=request_body,
+                ip_address=ip_address,
+                user_agent=user_agent
+            )
+
+    def generate_enhanced_details(self, info: RouteInfo, action: str,
+                            entity_id: Optional[UUID], request_body: Optional[dict],
                             target_tenant_id: Optional[UUID]) -> str:
         """Generate enhanced details for audit logs."""
-        path = str(request.url.path)
+        entity_type = info.entity_type
         details_parts = []
-        
+
         # Base action description
         if action == "create":
             details_parts.append(f"Created new {entity_type}")
@@ -302,51 +284,26 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
             details_parts.append(f"Deleted {entity_type}")
         else:
             details_parts.append(f"Super-admin {action} on {entity_type}")
-        
+
         # Add entity ID if available
         if entity_id:
             details_parts.append(f"(ID: {str(entity_id)})")
-        
+
         # Add specific field changes for updates
-        if action == "update" and request_body:
+        if action == "update" and isinstance(request_body, dict):
             changed_fields = list(request_body.keys())
             if changed_fields:
                 if len(changed_fields) <= 3:
                     details_parts.append(f"Fields: {', '.join(changed_fields)}")
                 else:
                     details_parts.append(f"Fields: {', '.join(changed_fields[:3])} and {len(changed_fields)-3} more")
-        
+
         # Add tenant context
         if target_tenant_id:
             details_parts.append(f"for tenant {str(target_tenant_id)[:8]}...")
-        
+
         # Add endpoint context
-        if "/activate" in path:
-            details_parts.append("(Activation)")
-        elif "/deactivate" in path:
-            details_parts.append("(Deactivation)")
-        elif "/reset-password" in path:
-            details_parts.append("(Password Reset)")
-        elif "/assign-role" in path:
-            details_parts.append("(Role Assignment)")
-        
-        return " ".join(details_parts)
+        if info.context:
+            details_parts.append(info.context)
 
-    def should_log_get_request(self, request: Request, response_time: float) -> bool:
-        """Determine if GET request should be logged."""
-        path = str(request.url.path)
-        
-        # Always log access to sensitive endpoints
-        sensitive_endpoints = [
-            "/users", "/audit-logs", "/admin", "/super-admin",
-            "/financial", "/grades", "/reports"
-        ]
-        
-        if any(endpoint in path for endpoint in sensitive_endpoints):
-            return True
-            
-        # Log slow requests (potential data export/bulk operations)
-        if response_time > 2.0:  # 2 seconds
-            return True
-            
-        return False
\ No newline at end of file
+        return " ".join(details_parts)
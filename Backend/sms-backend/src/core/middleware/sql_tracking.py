@@ -0,0 +1,68 @@
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.db.sql_tracker import start_tracking, stop_tracking, current_tracker
+
+logger = logging.getLogger("sms.sql")
+
+
+class SQLTrackingMiddleware:
+    """Track SQL statements per request.
+
+    Adds a Server-Timing header (DB time, statement count, total time) and logs
+    one structured line per request; repeated statement fingerprints at or above
+    SQL_N_PLUS_ONE_THRESHOLD are logged as a possible N+1 warning.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = None):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold or settings.SQL_N_PLUS_ONE_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.SQL_TRACKING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        token = start_tracking(self.n_plus_one_threshold)
+        tracker = current_tracker()
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                total_ms = (time.perf_counter() - started) * 1000
+                headers.append("Server-Timing", f"{tracker.server_timing()}, app;dur={total_ms:.1f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_tracking(token)
+            self._log(scope, status_code, tracker, (time.perf_counter() - started) * 1000)
+
+    def _log(self, scope: Scope, status_code: int, tracker, total_ms: float) -> None:
+        if tracker.count == 0:
+            return
+        suspects = tracker.n_plus_one()
+        record = {
+            "event": "sql_request",
+            "method": scope.get("method"),
+            "path": scope.get("path"),
+            "status": status_code,
+            "queries": tracker.count,
+            "db_ms": round(tracker.total_ms, 1),
+            "total_ms": round(total_ms, 1),
+        }
+        if suspects:
+            record["n_plus_one"] = suspects
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
@@ -1,7 +1,7 @@
 import logfire
 from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.orm import Session
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 from uuid import UUID
 from fastapi.security import APIKeyHeader
 from fastapi.responses import JSONResponse
@@ -9,9 +9,7 @@ from fastapi.responses import JSONResponse
 from src.db.session import get_db, set_tenant_id, get_tenant_id
 from src.db.models.tenant import Tenant
 from src.core.exceptions import TenantNotFoundError
-
-# In-memory cache for tenants to avoid DB hits on every request
-TENANT_CACHE = {}
+from src.core.tenant_cache import TenantSnapshot, tenant_cache
 
 X_TENANT_ID = APIKeyHeader(name="X-Tenant-ID", auto_error=False)
 
@@ -26,62 +24,41 @@ async def get_tenant_from_domain(request: Request) -> Optional[str]:
         return None
     return host.split(":")[0]
 
+def get_request_tenant(request: Request) -> Optional[TenantSnapshot]:
+    """Return the tenant already resolved for this request, if any."""
+    return getattr(request.state, "tenant", None)
+
 async def get_tenant_from_request(
     request: Request,
     x_tenant_id: Optional[str] = Depends(X_TENANT_ID),
     db: Session = Depends(get_db)
-) -> Tenant:
-    """Get tenant from request using multiple strategies: X-Tenant-ID (UUID or code), then domain."""
-    tenant = None
+) -> TenantSnapshot:
+    """Get tenant from request using multiple strategies: X-Tenant-ID (UUID or code), then domain.
+    Reuses the tenant resolved by tenant_middleware when there is one."""
+    tenant = get_request_tenant(request)
+    if tenant:
+        set_tenant_id(tenant.id)
+        return tenant
+
     host = request.headers.get("host", "").split(":")[0]
     
-    print(f"[TENANT] Resolving tenant - X-Tenant-ID: {x_tenant_id}, Host: {host}")
-    
-    # Strategy 1: Get from header
-    if x_tenant_id:
-        try:
-            # First, try as UUID (matches Tenant.id)
-            tenant_uuid = UUID(x_tenant_id)
-            tenant = db.query(Tenant).filter(
-                Tenant.id == tenant_uuid,
-                Tenant.is_active == True
-            ).first()
-            if tenant:
-                print(f"[TENANT] Found tenant by ID: {tenant_uuid} - {tenant.name}")
-        except ValueError:
-            # If not a UUID, try as code (matches Tenant.code)
-            tenant = db.query(Tenant).filter(
-                Tenant.code == x_tenant_id.upper(),
-                Tenant.is_active == True
-            ).first()
-            if tenant:
-                print(f"[TENANT] Found tenant by code: {x_tenant_id} - {tenant.name}")
-            else:
-                # Try as domain name
-                tenant = db.query(Tenant).filter(
-                    Tenant.domain == x_tenant_id.lower(),
-                    Tenant.is_active == True
-                ).first()
-                if tenant:
-                    print(f"[TENANT] Found tenant by domain in header: {x_tenant_id} - {tenant.name}")
-
-    # Strategy 2: Get from domain
-    if not tenant and host:
-        tenant = db.query(Tenant).filter(
-            Tenant.domain == host,
-            Tenant.is_active == True
-        ).first()
-        if tenant:
-            print(f"[TENANT] Found tenant by host domain: {host} - {tenant.name}")
+    # Strategies 1 and 2: header (UUID, code or domain), then host domain
+    tenant = _cached_tenant(
+        f"hdr:{x_tenant_id}:{host}",
+        lambda session: _lookup_tenant_by_header_or_host(session, x_tenant_id, host),
+        db
+    )
 
     # Strategy 3: Special handling for Foundation tenant
     if not tenant and (x_tenant_id == "Foundation" or host == "Foundation"):
-        tenant = db.query(Tenant).filter(
-            Tenant.name == "Foundation",
-            Tenant.is_active == True
-        ).first()
-        if tenant:
-            print(f"[TENANT] Found Foundation tenant by name: {tenant.name}")
+        tenant = _cached_tenant(
+            "name:Foundation",
+            lambda session: session.query(Tenant).filter(
+                Tenant.name == "Foundation",
+                Tenant.is_active == True
+            ).first(),
+            db
+        )
 
     # Strategy 4: Development fallback for localhost (REMOVED: Force global identification)
     # The previous logic force-defaulted to Foundation on localhost, which caused collisions.
@@ -89,12 +66,9 @@ async def get_tenant_from_request(
 
     if not tenant:
         print(f"[TENANT] ERROR: Tenant not found for X-Tenant-ID: {x_tenant_id}, Host: {host}")
-        # List available tenants for debugging
-        available_tenants = db.query(Tenant).filter(Tenant.is_active == True).all()
-        print(f"[TENANT] Available active tenants: {[(t.name, t.domain, str(t.id)) for t in available_tenants]}")
         raise TenantNotFoundError("Tenant not found")
     
-    print(f"[TENANT] Setting tenant context: {tenant.id} - {tenant.name}")
+    request.state.tenant = tenant
     set_tenant_id(tenant.id)
     return tenant
 
@@ -102,56 +76,86 @@ async def get_optional_tenant_from_request(
     request: Request,
     x_tenant_id: Optional[str] = Depends(X_TENANT_ID),
     db: Session = Depends(get_db)
-) -> Optional[Tenant]:
+) -> Optional[TenantSnapshot]:
     """Get tenant optionally, returning None if not found."""
-    tenant = None
+    tenant = get_request_tenant(request)
+    if tenant:
+        set_tenant_id(tenant.id)
+        return tenant
     
     # Strategy 1: Check context (set by auth middleware)
     try:
         context_tenant_id = get_tenant_id()
         if context_tenant_id:
-            tenant = db.query(Tenant).filter(
-                Tenant.id == UUID(str(context_tenant_id)),
-                Tenant.is_active == True
-            ).first()
-            if tenant:
-                print(f"Found tenant by context ID: {context_tenant_id}")
-                set_tenant_id(tenant.id)
-                return tenant
+            tenant = get_tenant_snapshot_by_id(UUID(str(context_tenant_id)), db)
     except (LookupError, ValueError):
         pass
 
     # Strategy 2: Get from header
-    if x_tenant_id:
-        try:
-            tenant_uuid = UUID(x_tenant_id)
-            tenant = db.query(Tenant).filter(
-                Tenant.id == tenant_uuid,
-                Tenant.is_active == True
-            ).first()
-        except ValueError:
-            tenant = db.query(Tenant).filter(
-                Tenant.code == x_tenant_id.upper(),
-                Tenant.is_active == True
-            ).first()
-        if tenant:
-            print(f"Found tenant by header: {x_tenant_id}")
-            set_tenant_id(tenant.id)
-            return tenant
+    if not tenant and x_tenant_id:
+        def lookup_by_header(session: Session) -> Optional[Tenant]:
+            try:
+                return session.query(Tenant).filter(
+                    Tenant.id == UUID(x_tenant_id),
+                    Tenant.is_active == True
+                ).first()
+            except ValueError:
+                return session.query(Tenant).filter(
+                    Tenant.code == x_tenant_id.upper(),
+                    Tenant.is_active == True
+                ).first()
+        tenant = _cached_tenant(f"opt-hdr:{x_tenant_id}", lookup_by_header, db)
 
     # Strategy 3: Get from domain
     if not tenant:
         host = request.headers.get("host", "").split(":")[0]
-        tenant = db.query(Tenant).filter(
-            Tenant.domain == host,
-            Tenant.is_active == True
-        ).first()
-        if tenant:
-            print(f"Found tenant by domain: {host}")
-            set_tenant_id(tenant.id)
+        tenant = _cached_tenant(
+            f"host:{host}",
+            lambda session: session.query(Tenant).filter(
+                Tenant.domain == host,
+                Tenant.is_active == True
+            ).first(),
+            db
+        )
 
+    if tenant:
+        request.state.tenant = tenant
+        set_tenant_id(tenant.id)
     return tenant
 
+def get_tenant_snapshot_by_id(tenant_id: UUID, db: Optional[Session] = None) -> Optional[TenantSnapshot]:
+    """Look up an active tenant by id through the tenant cache."""
+    return _cached_tenant(
+        f"id:{tenant_id}",
+        lambda session: session.query(Tenant).filter(
+            Tenant.id == tenant_id,
+            Tenant.is_active == True
+        ).first(),
+        db
+    )
+
+def _cached_tenant(
+    key: str,
+    lookup: Callable[[Session], Optional[Tenant]],
+    db: Optional[Session] = None
+) -> Optional[TenantSnapshot]:
+    """Return the cached snapshot for key, running lookup (and caching its result) on a miss.
+    Without a db a short-lived session is opened and closed around the lookup."""
+    hit, snapshot = tenant_cache.get(key)
+    if hit:
+        return snapshot
+    if db is not None:
+        tenant = lookup(db)
+    else:
+        db = next(get_db())
+        try:
+            tenant = lookup(db)
+        finally:
+            db.close() # CRITICAL: Release connection BEFORE calling next
+    snapshot = TenantSnapshot.from_model(tenant) if tenant else None
+    tenant_cache.set(key, snapshot)
+    return snapshot
+
 def get_tenant_id_from_request(
     tenant: Union[Tenant, dict] = Depends(get_tenant_from_request),
 ) -> Union[str, UUID]:
@@ -200,64 +204,64 @@ async def tenant_middleware(request: Request, call_next):
     tenant_header = request.headers.get("X-Tenant-ID")
     domain = request.headers.get("host", "").split(":")[0]
     
-    # Check Cache First
-    cache_key = f"{tenant_header}:{domain}"
-    if cache_key in TENANT_CACHE:
-        t_id, t_domain = TENANT_CACHE[cache_key]
-        print(f"[TENANT MW] Cache hit for {path} -> {t_id}")
-        set_tenant_id(t_id)
-        return await call_next(request)
-
-    print(f"[TENANT MW] Resolving path: {path} (Header: {tenant_header}, Domain: {domain})")
-    tenant = None
-    db = next(get_db())
-    try:
-        # Strategy 1: Get from header
-        if tenant_header:
-            try:
-                tenant_uuid = UUID(tenant_header)
-                tenant = db.query(Tenant).filter(Tenant.id == tenant_uuid, Tenant.is_active == True).first()
-            except ValueError:
-                # If not a UUID, check for code or domain
-                tenant = db.query(Tenant).filter(Tenant.code == tenant_header.upper(), Tenant.is_active == True).first()
-                if not tenant:
-                    tenant = db.query(Tenant).filter(Tenant.domain == tenant_header.lower(), Tenant.is_active == True).first()
-
-        # Strategy 2: Get from domain
-        if not tenant:
-            tenant = db.query(Tenant).filter(Tenant.domain == domain, Tenant.is_active == True).first()
-            # Removed localhost force-default as it causes cross-tenant collisions in dev
-        
-        # Strategy 3: Path/Referer fallback (simplified)
-        if not tenant:
-            referer = request.headers.get("referer", "")
-            if referer:
-                from urllib.parse import urlparse
-                path_segments = urlparse(referer).path.strip('/').split('/')
-                if path_segments and path_segments[0]:
-                    slug = path_segments[0]
-                    try:
-                        tenant = db.query(Tenant).filter(Tenant.id == UUID(slug), Tenant.is_active == True).first()
-                    except ValueError:
-                        tenant = db.query(Tenant).filter(Tenant.domain == slug, Tenant.is_active == True).first()
-
-        if tenant:
-            # Update Cache
-            TENANT_CACHE[cache_key] = (tenant.id, tenant.domain)
-            set_tenant_id(tenant.id)
-            # Re-fetch ID for context before closing db
-            t_id = tenant.id
-        else:
-            t_id = None
-            
-    finally:
-        db.close() # CRITICAL: Release connection BEFORE calling next
-
-    if t_id:
-        with logfire.span("tenant_request", tenant_id=str(t_id)):
+    snapshot = _resolve_tenant_snapshot(tenant_header, domain, request.headers.get("referer", ""))
+    if snapshot:
+        # Dependencies and get_current_user reuse this instead of querying again
+        request.state.tenant = snapshot
+        set_tenant_id(snapshot.id)
+        with logfire.span("tenant_request", tenant_id=str(snapshot.id)):
             return await call_next(request)
     
     return JSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={"detail": "Tenant not found or inactive"}
     )
+
+
+def _lookup_tenant_by_header_or_host(db: Session, tenant_header: Optional[str], domain: str) -> Optional[Tenant]:
+    """Find an active tenant by X-Tenant-ID (UUID, code or domain), then by host."""
+    tenant = None
+    # Strategy 1: Get from header
+    if tenant_header:
+        try:
+            tenant_uuid = UUID(tenant_header)
+            tenant = db.query(Tenant).filter(Tenant.id == tenant_uuid, Tenant.is_active == True).first()
+        except ValueError:
+            # If not a UUID, check for code or domain
+            tenant = db.query(Tenant).filter(Tenant.code == tenant_header.upper(), Tenant.is_active == True).first()
+            if not tenant:
+                tenant = db.query(Tenant).filter(Tenant.domain == tenant_header.lower(), Tenant.is_active == True).first()
+
+    # Strategy 2: Get from domain
+    if not tenant:
+        tenant = db.query(Tenant).filter(Tenant.domain == domain, Tenant.is_active == True).first()
+        # Removed localhost force-default as it causes cross-tenant collisions in dev
+    return tenant
+
+
+def _lookup_tenant_by_slug(db: Session, slug: str) -> Optional[Tenant]:
+    """Find an active tenant from the first path segment of the referer."""
+    try:
+        return db.query(Tenant).filter(Tenant.id == UUID(slug), Tenant.is_active == True).first()
+    except ValueError:
+        return db.query(Tenant).filter(Tenant.domain == slug, Tenant.is_active == True).first()
+
+
+def _resolve_tenant_snapshot(tenant_header: Optional[str], domain: str, referer: str) -> Optional[TenantSnapshot]:
+    """Resolve the request's tenant through tenant_cache, querying only on a miss."""
+    snapshot = _cached_tenant(
+        f"hdr:{tenant_header}:{domain}",
+        lambda session: _lookup_tenant_by_header_or_host(session, tenant_header, domain)
+    )
+    if snapshot:
+        return snapshot
+
+    # Strategy 3: Path/Referer fallback (simplified)
+    if not referer:
+        return None
+    from urllib.parse import urlparse
+    path_segments = urlparse(referer).path.strip('/').split('/')
+    if not path_segments or not path_segments[0]:
+        return None
+    slug = path_segments[0]
+    return _cached_tenant(f"ref:{slug}", lambda session: _lookup_tenant_by_slug(session, slug))
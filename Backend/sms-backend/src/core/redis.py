@@ -7,38 +7,59 @@ except ImportError:
     redis = None
     REDIS_AVAILABLE = False
 from src.core.config import settings
-import json
-from typing import Any, Optional, List, Dict
-from pydantic import BaseModel
-from sqlalchemy.orm import DeclarativeBase
-from datetime import date, datetime
-from uuid import UUID
-
-class RedisEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, BaseModel):
-            return obj.model_dump()
-        if hasattr(obj, '__table__'): # SQLAlchemy model
-            data = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-            # Include loaded relationships to prevent data loss during caching
-            from sqlalchemy import inspect
-            state = inspect(obj)
-            for rel in state.mapper.relationships:
-                if rel.key in state.unloaded:
-                    continue
-                value = getattr(obj, rel.key)
-                if value is not None:
-                    data[rel.key] = value
-            return data
-        return super().default(obj)
+from src.core.local_cache import l1_cache, publish_l1_invalidation
+from src.core.cache_codec import CacheSerializer, RedisEncoder, get_codec
+import asyncio
+import random
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Optional, List, Dict, Tuple
+
+# Keys fetched per SCAN call and removed per UNLINK by sweep_keys
+SWEEP_BATCH_SIZE = 500
+
+# Values stored with a soft TTL look like "swr:<fresh-until epoch>:<encoded value>".
+# Encoded JSON never starts with this, so plain values read back unchanged.
+SOFT_TTL_MARKER = "swr:"
+
+# Deletes a single-flight lock only if this caller still holds it
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def jittered(expire: int, jitter: float) -> int:
+    """Spread expire by up to +/- jitter (a fraction) so keys filled together expire apart."""
+    if jitter <= 0:
+        return expire
+    spread = expire * jitter
+    return max(1, int(round(expire + random.uniform(-spread, spread))))
+
+
+def wrap_soft_ttl(raw: str, fresh_for: int) -> str:
+    return f"{SOFT_TTL_MARKER}{time.time() + fresh_for:.3f}:{raw}"
+
+
+def unwrap_soft_ttl(raw: str) -> Tuple[str, bool]:
+    """Return (encoded value, stale) for a stored value."""
+    if not raw.startswith(SOFT_TTL_MARKER):
+        return raw, False
+    fresh_until, _, value = raw[len(SOFT_TTL_MARKER):].partition(":")
+    try:
+        return value, float(fresh_until) <= time.time()
+    except ValueError:
+        return raw, False
 
 class RedisCache:
     def __init__(self):
         self.client: Optional[redis.Redis] = None
+        self.serializer = CacheSerializer(get_codec(settings.CACHE_CODEC))
+        self._local_generations: Dict[str, int] = {}
+        # Single-flight loads/refreshes running in this worker, by cache key
+        self._inflight: Dict[str, "asyncio.Task"] = {}
 
     async def connect(self):
         if not REDIS_AVAILABLE:
@@ -59,7 +80,14 @@ class RedisCache:
                 print(f"Failed to connect to Redis: {e}")
                 self.client = None
 
-    async def get(self, key: str) -> Any:
+    def encode(self, value: Any) -> str:
+        return self.serializer.encode(value)
+
+    def decode(self, raw: str) -> Any:
+        return self.serializer.decode(raw)
+
+    async def get_raw(self, key: str) -> Optional[str]:
+        """Return the stored (encoded) value for key, or None."""
         if not REDIS_AVAILABLE:
             return None
         try:
@@ -67,13 +95,13 @@ class RedisCache:
                 await self.connect()
             if not self.client:
                 return None
-            data = await self.client.get(key)
-            return json.loads(data) if data else None
+            return await self.client.get(key)
         except Exception as e:
             print(f"Redis get error: {e}")
             return None
 
-    async def set(self, key: str, value: Any, expire: int = 300):
+    async def set_raw(self, key: str, raw: str, expire: int = 300):
+        """Store an already-encoded value."""
         if not REDIS_AVAILABLE:
             return
         try:
@@ -81,36 +109,300 @@ class RedisCache:
                 await self.connect()
             if not self.client:
                 return
-            await self.client.set(key, json.dumps(value, cls=RedisEncoder), ex=expire)
+            await self.client.set(key, raw, ex=expire)
         except Exception as e:
             print(f"Redis set error: {e}")
 
+    async def get(self, key: str) -> Any:
+        data = await self.get_raw(key)
+        return self.decode(unwrap_soft_ttl(data)[0]) if data else None
+
+    async def set(self, key: str, value: Any, expire: int = 300):
+        if not REDIS_AVAILABLE:
+            return
+        try:
+            raw = self.encode(value)
+        except Exception as e:
+            print(f"Redis set error: {e}")
+            return
+        await self.set_raw(key, raw, expire=expire)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        expire: int = 300,
+        stale_ttl: int = 0,
+        jitter: float = 0.0,
+        lock_timeout: Optional[int] = None,
+    ) -> Any:
+        """Return the cached value for key, computing it at most once across workers.
+
+        Concurrent misses in this worker share one compute() call, and a Redis
+        lock lets only one worker compute while the others wait for its value.
+        With stale_ttl, values stay servable for that many seconds past expire
+        while a single background refresh replaces them. jitter spreads expire
+        by up to that fraction.
+        """
+        computed: Dict[str, Any] = {}
+
+        async def compute_raw() -> Optional[str]:
+            value = await compute()
+            computed["value"] = value
+            if value is None:
+                return None
+            try:
+                return self.encode(value)
+            except Exception as e:
+                print(f"Redis set error: {e}")
+                return None
+
+        raw = await self.get_or_compute_raw(
+            key, compute_raw, expire=expire, stale_ttl=stale_ttl, jitter=jitter, lock_timeout=lock_timeout
+        )
+        if raw is not None:
+            return self.decode(raw)
+        # Uncacheable result: hand back what this caller computed, or compute it now
+        return computed["value"] if "value" in computed else await compute()
+
+    async def get_or_compute_raw(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Optional[str]]],
+        expire: int = 300,
+        stale_ttl: int = 0,
+        jitter: float = 0.0,
+        lock_timeout: Optional[int] = None,
+    ) -> Optional[str]:
+        """get_or_compute for callers that encode values themselves (e.g. @cached).
+
+        compute returns the encoded value, or None for results not to cache.
+        """
+        lock_timeout = lock_timeout or settings.CACHE_LOCK_TIMEOUT_SECONDS
+        raw = await self.get_raw(key)
+        if raw is not None:
+            value, stale = unwrap_soft_ttl(raw)
+            if stale and key not in self._inflight:
+                self._single_flight(key, lambda: self._refresh(key, compute, expire, stale_ttl, jitter, lock_timeout))
+            return value
+        return await asyncio.shield(
+            self._single_flight(key, lambda: self._fill(key, compute, expire, stale_ttl, jitter, lock_timeout))
+        )
+
+    def _single_flight(self, key: str, factory: Callable[[], Awaitable[Optional[str]]]) -> "asyncio.Task":
+        """Join the task already loading key in this worker, or start one.
+
+        The task outlives a cancelled caller so the others still get the value.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(factory())
+
+            def _done(t: "asyncio.Task") -> None:
+                if self._inflight.get(key) is t:
+                    del self._inflight[key]
+                if not t.cancelled() and t.exception() is not None:
+                    print(f"Cache compute error for {key}: {t.exception()}")
+
+            task.add_done_callback(_done)
+        return task
+
+    async def _fill(self, key: str, compute, expire: int, stale_ttl: int, jitter: float, lock_timeout: int) -> Optional[str]:
+        token = await self._acquire_lock(key, lock_timeout)
+        if token is None:
+            # Another worker is computing this key; use its value once stored
+            raw = await self._wait_for_value(key, lock_timeout)
+            if raw is not None:
+                return unwrap_soft_ttl(raw)[0]
+        try:
+            raw = await compute()
+            if raw is not None:
+                await self._store(key, raw, expire, stale_ttl, jitter)
+            return raw
+        finally:
+            if token:
+                await self._release_lock(key, token)
+
+    async def _refresh(self, key: str, compute, expire: int, stale_ttl: int, jitter: float, lock_timeout: int) -> Optional[str]:
+        token = await self._acquire_lock(key, lock_timeout)
+        if token is None:
+            # Another worker is already refreshing it
+            return None
+        try:
+            raw = await compute()
+            if raw is not None:
+                await self._store(key, raw, expire, stale_ttl, jitter)
+            return raw
+        finally:
+            if token:
+                await self._release_lock(key, token)
+
+    async def _store(self, key: str, raw: str, expire: int, stale_ttl: int, jitter: float) -> None:
+        ttl = jittered(expire, jitter)
+        if stale_ttl > 0:
+            await self.set_raw(key, wrap_soft_ttl(raw, ttl), expire=ttl + stale_ttl)
+        else:
+            await self.set_raw(key, raw, expire=ttl)
+
+    async def _acquire_lock(self, key: str, lock_timeout: int) -> Optional[str]:
+        """Token if this worker may compute key, None if another worker holds the lock.
+
+        Without Redis there is nothing to coordinate, so returns "" (proceed, nothing to release).
+        """
+        if not REDIS_AVAILABLE:
+            return ""
+        try:
+            if not self.client:
+                await self.connect()
+            if not self.client:
+                return ""
+            token = uuid.uuid4().hex
+            if await self.client.set(f"lock:{key}", token, nx=True, ex=lock_timeout):
+                return token
+            return None
+        except Exception as e:
+            print(f"Redis lock error: {e}")
+            return ""
+
+    async def _release_lock(self, key: str, token: str) -> None:
+        try:
+            await self.client.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+        except Exception as e:
+            print(f"Redis unlock error: {e}")
+
+    async def _wait_for_value(self, key: str, lock_timeout: int) -> Optional[str]:
+        """Poll for the lock holder's value; None if it gives up or the lock expires."""
+        deadline = time.monotonic() + lock_timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+            try:
+                raw = await self.client.get(key)
+                if raw is not None:
+                    return raw
+                if not await self.client.exists(f"lock:{key}"):
+                    return None
+            except Exception as e:
+                print(f"Redis get error: {e}")
+                return None
+        return None
+
     async def delete(self, key: str):
         if not REDIS_AVAILABLE:
+            l1_cache.delete(key)
             return
         try:
             if not self.client:
                 await self.connect()
             if not self.client:
+                l1_cache.delete(key)
                 return
             await self.client.delete(key)
         except Exception as e:
             print(f"Redis delete error: {e}")
+        # Drop the key from every worker's in-process tier too
+        await publish_l1_invalidation(self.client, key=key)
 
     async def delete_pattern(self, pattern: str):
-        """Delete all keys matching a pattern."""
+        """Delete all keys matching a pattern.
+
+        Walks the keyspace with SCAN, so Redis is never blocked the way KEYS
+        blocks it; prefer invalidate_namespace for invalidation on writes.
+        """
         if not REDIS_AVAILABLE:
+            l1_cache.delete_pattern(pattern)
             return
         try:
             if not self.client:
                 await self.connect()
             if not self.client:
+                l1_cache.delete_pattern(pattern)
                 return
-            keys = await self.client.keys(pattern)
-            if keys:
-                await self.client.delete(*keys)
-                print(f"[Redis] Deleted {len(keys)} keys matching pattern: {pattern}")
+            deleted = await self.sweep_keys(pattern)
+            if deleted:
+                print(f"[Redis] Deleted {deleted} keys matching pattern: {pattern}")
         except Exception as e:
             print(f"Redis delete_pattern error: {e}")
+        await publish_l1_invalidation(self.client, pattern=pattern)
+
+    async def sweep_keys(self, pattern: str, skip: Optional[str] = None, batch_size: int = SWEEP_BATCH_SIZE) -> int:
+        """UNLINK keys matching pattern in SCAN-sized batches; returns the count.
+
+        Keys containing `skip` are left alone (e.g. ":g=" to keep namespaced keys).
+        """
+        if not REDIS_AVAILABLE:
+            return 0
+        if not self.client:
+            await self.connect()
+        if not self.client:
+            return 0
+        deleted = 0
+        batch: List[str] = []
+        async for key in self.client.scan_iter(match=pattern, count=batch_size):
+            if skip and skip in key:
+                continue
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await self.client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await self.client.unlink(*batch)
+        return deleted
+
+    async def get_generation(self, namespace: str, tenant_id: Any, shared_only: bool = False) -> Optional[int]:
+        """Current generation of a (namespace, tenant) pair, 0 if never invalidated.
+
+        Held in the L1 tier briefly; invalidate_namespace evicts it on every worker.
+        With shared_only, returns None unless the value comes from Redis: the
+        per-worker fallback is fine for cache keys, not for ETags across workers.
+        """
+        if shared_only and not REDIS_AVAILABLE:
+            return None
+        key = generation_key(namespace, tenant_id)
+        raw = l1_cache.get(key)
+        if raw is not None:
+            return int(raw)
+        generation = self._local_generations.get(key, 0)
+        if REDIS_AVAILABLE:
+            try:
+                if not self.client:
+                    await self.connect()
+                if not self.client:
+                    return None if shared_only else generation
+                generation = int(await self.client.get(key) or 0)
+            except Exception as e:
+                print(f"Redis get_generation error: {e}")
+                return None if shared_only else generation
+        l1_cache.set(key, str(generation), settings.CACHE_GENERATION_L1_TTL_SECONDS)
+        return generation
+
+    async def invalidate_namespace(self, namespace: str, tenant_id: Any) -> int:
+        """Bump the generation so every cached key in the namespace is skipped.
+
+        A single INCR regardless of how many keys exist; stale entries are never
+        read again and expire on their own TTL.
+        """
+        key = generation_key(namespace, tenant_id)
+        # Kept locally too, so L1 entries still invalidate while Redis is down
+        generation = self._local_generations.get(key, 0) + 1
+        client = None
+        if REDIS_AVAILABLE:
+            try:
+                if not self.client:
+                    await self.connect()
+                client = self.client
+                if client:
+                    generation = int(await client.incr(key))
+            except Exception as e:
+                print(f"Redis invalidate_namespace error: {e}")
+        self._local_generations[key] = generation
+        await publish_l1_invalidation(client, key=key)
+        return generation
+
+
+def generation_key(namespace: str, tenant_id: Any) -> str:
+    return f"cache:gen:{namespace}:{tenant_id}"
+
 
 cache = RedisCache()
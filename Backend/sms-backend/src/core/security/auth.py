@@ -3,16 +3,16 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload
 
-from src.core.security.jwt import verify_token
-from src.db.crud.auth import user as user_crud
+from src.core.security.jwt import verify_request_token
 from src.db.session import get_db, set_tenant_id
+from src.core.middleware.tenant import get_request_tenant, get_tenant_snapshot_by_id
+from src.core.security.principal import get_principal
 from src.schemas.auth.token import TokenPayload
 from src.db.models.auth import User
 
@@ -21,11 +21,12 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
 async def get_current_user(
+    request: Request,
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
 ) -> User:
     """Get the current authenticated user from JWT token."""
-    token_data = await verify_token(token)
+    token_data = await verify_request_token(request, token)
     if not token_data:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,12 +49,11 @@ async def get_current_user(
             try:
                 tenant_id_uuid = UUID(tenant_id)
                 
-                # Verify tenant exists and is active
-                from src.db.models.tenant import Tenant
-                tenant = db.query(Tenant).filter(
-                    Tenant.id == tenant_id_uuid,
-                    Tenant.is_active == True
-                ).first()
+                # Verify tenant exists and is active, reusing the tenant
+                # tenant_middleware already resolved for this request
+                tenant = get_request_tenant(request)
+                if tenant is None or tenant.id != tenant_id_uuid:
+                    tenant = get_tenant_snapshot_by_id(tenant_id_uuid, db)
                 
                 if not tenant:
                     print(f"[AUTH] ERROR: Tenant {tenant_id_uuid} not found or inactive")
@@ -88,26 +88,30 @@ async def get_current_user(
             detail="Invalid user ID format in token"
         )
 
-    # Try to get user with tenant context first
-    user = db.query(User).options(joinedload(User.roles)).filter(User.id == user_uuid).first()
-
-    # If not found and it's a super admin, try global lookup
-    if not user and token_data.is_super_admin:
-        user = user_crud.get_by_id_global(db, id=user_uuid)
-
-    if not user:
+    # Roles, permissions and active flag come from the principal cache
+    principal = await get_principal(db, user_uuid)
+    if not principal:
         print(f"[AUTH] ERROR: User {user_uuid} not found")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
         
-    if not user.is_active:
+    if not principal.is_active:
         print(f"[AUTH] ERROR: User {user_uuid} is inactive")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
+    request.state.principal = principal
+
+    # Role checks read request.state.principal (get_current_principal), so roles are not loaded here
+    user = db.query(User).filter(User.id == user_uuid).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
     
     print(f"[AUTH] Successfully authenticated user: {user.email} (ID: {user.id})")
     return user
@@ -0,0 +1,162 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.config import settings
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when the hashing queue is full; callers should answer 503."""
+
+    def __init__(self, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__("Password hashing queue is full")
+
+
+def _hash(password: str) -> str:
+    from src.core.security.password import password_context
+    return password_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    from src.core.security.password import password_context
+    try:
+        return password_context.verify(plain_password, hashed_password)
+    except Exception as e:
+        print(f"Password verification error: {e}")
+        return False
+
+
+class PasswordHashingPool:
+    """Runs Argon2 hashing in a small process pool, off the event loop.
+
+    At most max_workers hashes run at once, which also caps Argon2's memory use
+    (64 MB each). Up to max_pending jobs may be queued or running; beyond that
+    submissions fail fast with PasswordHashingBusyError.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._peak_pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_ms = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that holds an event loop and DB pools is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _submit(self, fn: Callable, *args: Any) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHashingBusyError()
+            self._pending += 1
+            self._submitted += 1
+            self._peak_pending = max(self._peak_pending, self._pending)
+            try:
+                try:
+                    future = self._get_executor().submit(fn, *args)
+                except BrokenProcessPool:
+                    # A worker died; start a fresh pool for this and later jobs
+                    self._executor = None
+                    future = self._get_executor().submit(fn, *args)
+            except Exception:
+                self._pending -= 1
+                raise
+        started = time.perf_counter()
+
+        def _done(_: Future) -> None:
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+                self._total_ms += (time.perf_counter() - started) * 1000
+
+        future.add_done_callback(_done)
+        return future
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def run_sync(self, fn: Callable, *args: Any) -> Any:
+        """Blocking variant for sync code already running in a worker thread."""
+        return self._submit(fn, *args).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and throughput counters for metrics endpoints."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "peak_pending": self._peak_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_ms": round(self._total_ms / self._completed, 1) if self._completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHashingPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await password_hasher.run(_hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await password_hasher.run(_verify, plain_password, hashed_password)
+
+
+def hash_password_sync(password: str) -> str:
+    """hash_password for sync endpoints running in the threadpool."""
+    return password_hasher.run_sync(_hash, password)
+
+
+def verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    """verify_password for sync endpoints running in the threadpool."""
+    return password_hasher.run_sync(_verify, plain_password, hashed_password)
+
+
+async def hash_passwords(passwords: List[str]) -> List[str]:
+    """Hash several passwords in parallel across the pool's workers.
+
+    Submits one batch per worker count at a time so a large import never fills
+    the queue that logins rely on; waits and retries if the queue is busy anyway.
+    """
+    hashes: List[str] = []
+    batch_size = max(1, password_hasher.max_workers)
+    for start in range(0, len(passwords), batch_size):
+        batch = passwords[start:start + batch_size]
+        while True:
+            try:
+                hashes.extend(await asyncio.gather(*(hash_password(p) for p in batch)))
+                break
+            except PasswordHashingBusyError:
+                await asyncio.sleep(0.1)
+    return hashes
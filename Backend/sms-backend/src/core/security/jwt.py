@@ -1,5 +1,7 @@
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from uuid import UUID
 
 from jose import jwt
@@ -53,32 +55,105 @@ def create_refresh_token(subject: Union[str, UUID], tenant_id: Union[str, UUID],
     return encoded_jwt
 
 
-async def verify_token(token: str) -> Optional[TokenPayload]:
-    """Verify a JWT token and return its payload."""
-    try:
+class _VerifiedTokenCache:
+    """Small LRU of decoded tokens keyed by signature, so a token seen recently
+    is not decoded and signature-checked again. Revocation is still checked
+    on every call; only the decode is skipped."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, TokenPayload]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        signature = token.rsplit(".", 1)[-1]
+        with self._lock:
+            entry = self._entries.get(signature)
+            if entry is None or entry[0] != token:
+                return None
+            self._entries.move_to_end(signature)
+            return entry[1]
+
+    def set(self, token: str, payload: TokenPayload) -> None:
+        signature = token.rsplit(".", 1)[-1]
+        with self._lock:
+            self._entries[signature] = (token, payload)
+            self._entries.move_to_end(signature)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(token.rsplit(".", 1)[-1], None)
+
+
+_verified_tokens = _VerifiedTokenCache(settings.TOKEN_VERIFY_CACHE_MAX_ENTRIES)
+
+
+def _decode_token(token: str) -> Optional[TokenPayload]:
+    """Decode and validate a JWT, using the verified-token cache when possible."""
+    token_data = _verified_tokens.get(token)
+    if token_data is None:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         token_data = TokenPayload(**payload)
-        
-        # Fix: Use timezone-aware datetime comparison
-        if datetime.fromtimestamp(token_data.exp, tz=timezone.utc) < datetime.now(timezone.utc):
-            return None
-            
-        # Check if token is blacklisted
-        from src.services.auth.token_blacklist import TokenBlacklistService
-        blacklist_service = TokenBlacklistService()
-        if await blacklist_service.is_token_blacklisted(token):
+        _verified_tokens.set(token, token_data)
+
+    # Fix: Use timezone-aware datetime comparison
+    if datetime.fromtimestamp(token_data.exp, tz=timezone.utc) < datetime.now(timezone.utc):
+        _verified_tokens.discard(token)
+        return None
+    return token_data
+
+
+async def verify_token(token: str, touch: bool = False) -> Optional[TokenPayload]:
+    """Verify a JWT token and return its payload.
+
+    Blacklist and idle-timeout checks run in a single Redis call; with
+    touch=True the access token's last activity is also refreshed.
+    """
+    try:
+        token_data = _decode_token(token)
+        if token_data is None:
             return None
 
-        # Enforce idle timeout for access tokens
-        if settings.IDLE_ENFORCEMENT_ENABLED and token_data.type == "access" and token_data.jti:
-            # Ensure last-activity exists at first usage
-            await blacklist_service.ensure_last_activity(token_data.jti, token_data.exp)
-            if await blacklist_service.is_idle_timed_out(token_data.jti):
-                # Optional: mark token blacklisted for faster future failures
-                await blacklist_service.blacklist_token(token, token_data.exp)
-                return None
-            
+        from src.services.auth.token_blacklist import TokenBlacklistService, TOKEN_OK
+        is_access = token_data.type == "access"
+        status = await TokenBlacklistService().check_token(
+            token,
+            token_data.jti if is_access else None,
+            token_data.exp,
+            enforce_idle=settings.IDLE_ENFORCEMENT_ENABLED and is_access,
+            touch=touch and is_access,
+        )
+        if status != TOKEN_OK:
+            return None
         return token_data
     except (jwt.JWTError, ValidationError) as e:
         print(f"Token verification failed: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+async def verify_request_token(request: Any, token: Optional[str] = None) -> Optional[TokenPayload]:
+    """Verify the request's bearer token once and memoize the result on request.state.
+
+    Middleware and get_current_user all call this, so a request pays for one
+    decode and one Redis round trip. Verifying an access token here also counts
+    as activity for idle-timeout purposes; that write is coalesced by
+    TokenBlacklistService.record_activity.
+    """
+    if token is None:
+        auth_header = request.headers.get("Authorization")
+        if not auth_header or not auth_header.startswith("Bearer "):
+            return None
+        token = auth_header.split(" ")[1]
+
+    memo = getattr(request.state, "verified_token", None)
+    if memo is not None and memo[0] == token:
+        return memo[1]
+
+    token_data = await verify_token(token)
+    request.state.verified_token = (token, token_data)
+    if token_data and token_data.type == "access" and token_data.jti:
+        from src.services.auth.token_blacklist import TokenBlacklistService
+        await TokenBlacklistService().record_activity(token_data.jti, token_data.exp)
+    return token_data
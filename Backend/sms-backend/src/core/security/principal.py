@@ -0,0 +1,151 @@
+import json
+from dataclasses import dataclass, field
+from typing import FrozenSet, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session, selectinload
+
+from src.core.config import settings
+from src.core.redis import cache, REDIS_AVAILABLE
+from src.db.models.auth import User
+from src.db.models.auth.user_role import UserRole, user_role_association
+
+SUPER_ADMIN_ROLES = frozenset({"super-admin", "superadmin"})
+
+
+def _principal_key(user_id: UUID) -> str:
+    return f"principal:{user_id}"
+
+
+def _version_key(user_id: UUID) -> str:
+    return f"principal:version:{user_id}"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """What authorization needs to know about a user, without touching the DB."""
+    user_id: UUID
+    tenant_id: Optional[UUID]
+    is_active: bool
+    roles: FrozenSet[str] = field(default_factory=frozenset)
+    permissions: FrozenSet[str] = field(default_factory=frozenset)
+    version: int = 0
+
+    @property
+    def is_super_admin(self) -> bool:
+        return bool(self.roles & SUPER_ADMIN_ROLES)
+
+    def has_role(self, role: str) -> bool:
+        return role in self.roles
+
+    def has_any_role(self, roles: Iterable[str]) -> bool:
+        return not self.roles.isdisjoint(roles)
+
+    def has_permission(self, permission: str) -> bool:
+        return permission in self.permissions
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "user_id": str(self.user_id),
+            "tenant_id": str(self.tenant_id) if self.tenant_id else None,
+            "is_active": self.is_active,
+            "roles": sorted(self.roles),
+            "permissions": sorted(self.permissions),
+            "version": self.version,
+        })
+
+    @classmethod
+    def from_json(cls, data: str) -> "Principal":
+        raw = json.loads(data)
+        return cls(
+            user_id=UUID(raw["user_id"]),
+            tenant_id=UUID(raw["tenant_id"]) if raw["tenant_id"] else None,
+            is_active=raw["is_active"],
+            roles=frozenset(raw["roles"]),
+            permissions=frozenset(raw["permissions"]),
+            version=raw["version"],
+        )
+
+
+def build_principal(db: Session, user_id: UUID, version: int = 0) -> Optional[Principal]:
+    """Load a user's roles and flattened permissions from the database."""
+    user = db.query(User).options(
+        selectinload(User.roles).selectinload(UserRole.permissions)
+    ).filter(User.id == user_id).first()
+    if not user:
+        return None
+    return Principal(
+        user_id=user.id,
+        tenant_id=user.tenant_id,
+        is_active=user.is_active,
+        roles=frozenset(role.name for role in user.roles),
+        permissions=frozenset(p.name for role in user.roles for p in role.permissions),
+        version=version,
+    )
+
+
+async def get_principal(db: Session, user_id: UUID) -> Optional[Principal]:
+    """Return the cached principal for user_id, rebuilding it when its version is stale.
+
+    The cached entry and the user's current version are read in one MGET; a
+    version bump by invalidate_principals makes every cached copy stale at once.
+    Version keys never expire, so a version only ever moves forward.
+    """
+    if not REDIS_AVAILABLE:
+        return build_principal(db, user_id)
+    try:
+        await cache.connect()
+        if not cache.client:
+            return build_principal(db, user_id)
+        cached, version = await cache.client.mget(_principal_key(user_id), _version_key(user_id))
+        version = int(version or 0)
+        if cached:
+            principal = Principal.from_json(cached)
+            if principal.version == version:
+                return principal
+        principal = build_principal(db, user_id, version)
+        if principal:
+            await cache.client.set(
+                _principal_key(user_id), principal.to_json(), ex=settings.PRINCIPAL_CACHE_TTL_SECONDS
+            )
+        return principal
+    except Exception as e:
+        print(f"Principal cache error: {e}")
+        return build_principal(db, user_id)
+
+
+async def invalidate_principals(user_ids: Iterable[UUID]) -> None:
+    """Bump the version of each user so their cached principals are rebuilt."""
+    user_ids = list(user_ids)
+    if not user_ids or not REDIS_AVAILABLE:
+        return
+    try:
+        await cache.connect()
+        if not cache.client:
+            return
+        async with cache.client.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                # No expiry: if the counter lapsed and restarted at a version some
+                # cached principal already carries, that stale principal would match again
+                pipe.incr(_version_key(user_id))
+            await pipe.execute()
+    except Exception as e:
+        print(f"Principal cache invalidation error: {e}")
+
+
+def invalidate_principals_sync(user_ids: Iterable[UUID]) -> None:
+    """invalidate_principals for sync endpoints running in the threadpool."""
+    import anyio
+    try:
+        anyio.from_thread.run(invalidate_principals, list(user_ids))
+    except RuntimeError as e:
+        # Not on an AnyIO worker thread; cached principals expire by TTL
+        print(f"Principal cache invalidation skipped: {e}")
+
+
+def role_member_ids(db: Session, role_id: UUID) -> list:
+    """Ids of every user holding role_id, for invalidating after a permission change."""
+    rows = db.query(user_role_association.c.user_id).filter(
+        user_role_association.c.role_id == role_id
+    ).all()
+    return [row.user_id for row in rows]
@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+from src.core.config import settings
+from src.core.invalidation import listen_for_invalidations, publish_invalidations
+
+# Redis pub/sub channel used to tell every worker to drop a tenant's entries
+TENANT_INVALIDATION_CHANNEL = "tenant-cache:invalidate"
+
+
+@dataclass(frozen=True)
+class TenantSnapshot:
+    """The tenant fields request handling needs, detached from any DB session."""
+    id: UUID
+    name: str
+    code: str
+    domain: Optional[str]
+    is_active: bool
+    plan_type: Optional[str]
+
+    @classmethod
+    def from_model(cls, tenant: Any) -> "TenantSnapshot":
+        return cls(
+            id=tenant.id,
+            name=tenant.name,
+            code=tenant.code,
+            domain=tenant.domain,
+            is_active=tenant.is_active,
+            plan_type=getattr(tenant, "plan_type", None),
+        )
+
+
+class TenantCache:
+    """Bounded TTL/LRU cache of tenant lookups for this worker.
+
+    Lookups that found no active tenant are cached too (as None) with a
+    shorter TTL, so unknown hosts do not hit the database on every request.
+    """
+
+    def __init__(self, max_entries: int, ttl: int, negative_ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Optional[TenantSnapshot]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Tuple[bool, Optional[TenantSnapshot]]:
+        """Return (hit, snapshot); snapshot is None for a cached miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, snapshot = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, snapshot
+
+    def set(self, key: str, snapshot: Optional[TenantSnapshot]) -> None:
+        ttl = self.ttl if snapshot is not None else self.negative_ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_tenant(self, tenant_id: Any) -> None:
+        """Drop every entry for tenant_id, plus all cached misses.
+
+        Misses are dropped because an activated or renamed tenant may now
+        match a host that was previously unknown.
+        """
+        tenant_id = str(tenant_id)
+        with self._lock:
+            stale = [
+                key for key, (_, snapshot) in self._entries.items()
+                if snapshot is None or str(snapshot.id) == tenant_id
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+tenant_cache = TenantCache(
+    max_entries=settings.TENANT_CACHE_MAX_ENTRIES,
+    ttl=settings.TENANT_CACHE_TTL_SECONDS,
+    negative_ttl=settings.TENANT_CACHE_NEGATIVE_TTL_SECONDS,
+)
+
+
+async def publish_tenant_invalidation(tenant_id: Any) -> None:
+    """Invalidate tenant_id here and tell the other workers to do the same."""
+    tenant_cache.invalidate_tenant(tenant_id)
+    await publish_invalidations(TENANT_INVALIDATION_CHANNEL, [str(tenant_id)])
+
+
+def schedule_tenant_invalidation(background_tasks: Any, tenant_id: Any) -> None:
+    """Drop tenant_id from this worker now and publish to the others after the response."""
+    tenant_cache.invalidate_tenant(tenant_id)
+    background_tasks.add_task(publish_tenant_invalidation, tenant_id)
+
+
+async def listen_for_tenant_invalidations() -> None:
+    """Drop tenant entries as invalidations arrive; runs for the app's lifetime."""
+    await listen_for_invalidations(
+        TENANT_INVALIDATION_CHANNEL, tenant_cache.invalidate_tenant, on_reset=tenant_cache.clear
+    )
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.core.invalidation import publish_invalidations_soon
+
+V = TypeVar("V")
+
+
+class TenantScopedCache(Generic[V]):
+    """Bounded TTL/LRU cache for this worker whose keys are tuples starting with the tenant id (as str).
+
+    Entries are dropped per tenant with invalidate_tenant. Each invalidation
+    bumps the tenant's generation, and a value loaded while that happened is
+    not stored, since it may predate the change (see get_or_load).
+    """
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, ...], Tuple[float, V]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        # Bumped by clear(), which invalidates every tenant at once
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def generation(self, tenant_id: Any) -> Tuple[int, int]:
+        """Token to read before loading a value and pass back to set()."""
+        with self._lock:
+            return self._epoch, self._generations.get(str(tenant_id), 0)
+
+    def get(self, key: Tuple[str, ...]) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple[str, ...], value: V, generation: Tuple[int, int]) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != (self._epoch, self._generations.get(key[0], 0)):
+                # Invalidated while the value was loading
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Tuple[str, ...], loader: Callable[[], V]) -> V:
+        """Cached value for key, else loader()'s result (stored unless invalidated meanwhile)."""
+        value = self.get(key)
+        if value is None:
+            generation = self.generation(key[0])
+            value = loader()
+            self.set(key, value, generation)
+        return value
+
+    def invalidate_tenant(self, tenant_id: Any) -> None:
+        tenant_id = str(tenant_id)
+        with self._lock:
+            self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+            for key in [key for key in self._entries if key[0] == tenant_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+
+def track_stale_tenants(
+    cache: TenantScopedCache, models: Tuple[type, ...], channel: str, info_key: str
+) -> Callable[[Session, Any], None]:
+    """Invalidate cache for tenants whose models rows a session commits, here and (via channel) on other workers.
+
+    Registers session hooks: after_flush collects the tenants, after_commit
+    invalidates and publishes, after_rollback invalidates (values loaded
+    mid-transaction may have seen the rolled-back rows). Returns
+    mark_stale(db, tenant_id) for writes the flush hook cannot see, such as
+    bulk query updates/deletes.
+    """
+
+    def mark_stale(db: Session, tenant_id: Any) -> None:
+        db.info.setdefault(info_key, set()).add(str(tenant_id))
+
+    @event.listens_for(Session, "after_flush")
+    def _collect_stale_tenants(session: Session, flush_context) -> None:
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, models) and obj.tenant_id is not None:
+                mark_stale(session, obj.tenant_id)
+
+    @event.listens_for(Session, "after_commit")
+    def _invalidate_stale_tenants(session: Session) -> None:
+        tenant_ids = session.info.pop(info_key, None)
+        if not tenant_ids:
+            return
+        for tenant_id in tenant_ids:
+            cache.invalidate_tenant(tenant_id)
+        publish_invalidations_soon(channel, tenant_ids)
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard_stale_tenants(session: Session) -> None:
+        for tenant_id in session.info.pop(info_key, None) or ():
+            cache.invalidate_tenant(tenant_id)
+
+    return mark_stale
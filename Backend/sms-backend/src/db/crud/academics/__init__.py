@@ -1,6 +1,7 @@
 # Import CRUD modules to make them available from the package
 from src.db.crud.academics.enrollment import enrollment
 from src.db.crud.academics.grade import grade
+from src.db.crud.academics.grade_aggregate import grade_aggregate
 from src.db.crud.academics.assignment import assignment
 from src.db.crud.academics.subject import subject
 from src.db.crud.academics.academic_grade import academic_grade
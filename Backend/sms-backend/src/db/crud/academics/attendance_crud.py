@@ -10,6 +10,10 @@ from src.schemas.academics.attendance import AttendanceCreate, AttendanceUpdate
 
 class CRUDAttendance(TenantCRUDBase[Attendance, AttendanceCreate, AttendanceUpdate]):
     """CRUD operations for Attendance model."""
+
+    # Sheets read oldest day first; offset and cursor pages share this order
+    keyset_columns = ("date", "student_id", "id")
+    keyset_descending = False
     
     def get_by_student_and_date(
         self, 
@@ -166,30 +170,28 @@ class CRUDAttendance(TenantCRUDBase[Attendance, AttendanceCreate, AttendanceUpda
         tenant_id: Any, 
         attendance_records: List[AttendanceCreate]
     ) -> List[Attendance]:
-        """Bulk create attendance records."""
-        tenant_id = self._ensure_uuid(tenant_id)
-        
-        # Validate tenant exists
-        from src.db.models.tenant import Tenant
-        tenant = db.query(Tenant).filter(Tenant.id == tenant_id, Tenant.is_active == True).first()
-        if not tenant:
-            raise ValueError(f"Tenant {tenant_id} not found or inactive")
-        
-        db_objects = []
-        for record in attendance_records:
-            obj_data = record.model_dump()
-            obj_data["tenant_id"] = tenant_id
-            db_obj = Attendance(**obj_data)
-            db_objects.append(db_obj)
-        
-        db.add_all(db_objects)
-        db.commit()
-        
-        # Refresh all objects
-        for obj in db_objects:
-            db.refresh(obj)
-        
-        return db_objects
+        """Bulk create attendance records in a single INSERT ... RETURNING."""
+        return self.bulk_create(db, tenant_id, objs_in=attendance_records, returning=True)
+
+    def bulk_upsert_attendance(
+        self,
+        db: Session,
+        tenant_id: Any,
+        attendance_records: List[Union[AttendanceCreate, Dict[str, Any]]]
+    ) -> List[Attendance]:
+        """Insert or update a sheet of attendance records in one statement.
+
+        Conflicts on the one-per-student-per-class-per-date constraint update the
+        existing row's status and marking metadata instead of failing.
+        """
+        return self.bulk_upsert(
+            db,
+            tenant_id,
+            objs_in=attendance_records,
+            constraint="unique_student_class_date_attendance",
+            update_columns=["status", "schedule_id", "period", "marked_by", "marked_at"],
+            returning=True
+        )
     
     def update_attendance_status(
         self, 
@@ -222,13 +224,11 @@ class CRUDAttendance(TenantCRUDBase[Attendance, AttendanceCreate, AttendanceUpda
         
         return self.update(db, tenant_id, db_obj=attendance, obj_in=update_data)
 
-    def get_multi(
+    def _filtered_query(
         self,
         db: Session,
         tenant_id: Any,
         *,
-        skip: int = 0,
-        limit: int = 100,
         student_id: Optional[UUID] = None,
         class_id: Optional[UUID] = None,
         schedule_id: Optional[UUID] = None,
@@ -236,8 +236,8 @@ class CRUDAttendance(TenantCRUDBase[Attendance, AttendanceCreate, AttendanceUpda
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         status_filter: Optional[AttendanceStatus] = None
-    ) -> List[Attendance]:
-        """Get multiple attendance records with pagination and optional filters."""
+    ):
+        """Build the filtered attendance query shared by the list methods."""
         tenant_id = self._ensure_uuid(tenant_id)
         query = db.query(Attendance).filter(Attendance.tenant_id == tenant_id)
 
@@ -255,9 +255,36 @@ class CRUDAttendance(TenantCRUDBase[Attendance, AttendanceCreate, AttendanceUpda
             query = query.filter(Attendance.date <= end_date)
         if status_filter:
             query = query.filter(Attendance.status == status_filter)
+        return query
 
-        # Stable ordering
-        query = query.order_by(Attendance.date.asc(), Attendance.student_id.asc())
+    def get_multi(
+        self,
+        db: Session,
+        tenant_id: Any,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        **filters
+    ) -> List[Attendance]:
+        """Get multiple attendance records with pagination and optional filters."""
+        query = self._filtered_query(db, tenant_id, **filters)
+
+        # Stable ordering, the same one cursor mode pages through
+        query = self._apply_default_ordering(query)
         return query.offset(skip).limit(limit).all()
 
+    def get_multi_with_cursor(
+        self,
+        db: Session,
+        tenant_id: Any,
+        *,
+        after: Optional[str] = None,
+        limit: int = 100,
+        **filters
+    ) -> tuple[List[Attendance], Optional[str]]:
+        """Get attendance records in keyset mode, returning (items, next_cursor)."""
+        query = self._filtered_query(db, tenant_id, **filters)
+        page = self.paginate_keyset(query, after=after, limit=limit)
+        return page, page.next_cursor
+
 attendance_crud = CRUDAttendance(Attendance)
\ No newline at end of file
@@ -4,6 +4,8 @@ from sqlalchemy import and_, or_, func
 from datetime import date
 
 from src.db.crud.base import TenantCRUDBase
+from src.db.crud.base.counting import invalidate_counts
+from src.db.crud.base.unit_of_work import commit_or_defer
 from src.db.models.academics.enrollment import Enrollment
 from src.db.models.people.student import Student
 from src.schemas.academics.enrollment import EnrollmentCreate, EnrollmentUpdate
@@ -80,8 +82,7 @@ class CRUDEnrollment(TenantCRUDBase[Enrollment, EnrollmentCreate, EnrollmentUpda
             enrollment.withdrawal_reason = withdrawal_reason
             
         db.add(enrollment)
-        db.commit()
-        db.refresh(enrollment)
+        commit_or_defer(db, enrollment)
         return enrollment
     
     def remove(self, db: Session, tenant_id: Any, *, id: Any) -> Optional[Enrollment]:
@@ -91,7 +92,8 @@ class CRUDEnrollment(TenantCRUDBase[Enrollment, EnrollmentCreate, EnrollmentUpda
             return None
         
         db.delete(enrollment)
-        db.commit()
+        commit_or_defer(db)
+        invalidate_counts(self.model.__tablename__, self._ensure_uuid(tenant_id))
         return enrollment
     
     def count(self, db: Session, tenant_id: Any, search: Optional[str] = None, **filters) -> int:
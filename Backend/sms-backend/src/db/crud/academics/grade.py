@@ -2,8 +2,11 @@ from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 from datetime import date
+from uuid import uuid4
 
 from src.db.crud.base import TenantCRUDBase
+from src.db.crud.base.unit_of_work import commit_or_defer
+from src.db.crud.academics.grade_aggregate import GradeDeltas, grade_aggregate
 from src.db.models.academics.grade import Grade, GradeType
 from src.db.models.people.student import Student
 from src.db.models.academics.subject import Subject
@@ -122,7 +125,13 @@ class CRUDGrade(TenantCRUDBase[Grade, GradeCreate, GradeUpdate]):
             for g in existing_grades
         }
 
-        db_objs = []
+        new_rows = []
+        update_rows = []
+        # Id of the row each input ends up in, so results come back in input order
+        result_ids = []
+        # Core bulk statements skip the flush hook that maintains grade_aggregates
+        deltas = GradeDeltas()
+        replaced = {}
         for obj_in in obj_in_list:
             obj_in_data = obj_in.model_dump()
             key = (obj_in.student_id, obj_in.assessment_id, obj_in.assessment_type, obj_in.subject_id)
@@ -131,19 +140,27 @@ class CRUDGrade(TenantCRUDBase[Grade, GradeCreate, GradeUpdate]):
             
             if existing_grade:
                 # Update existing record
-                for k, v in obj_in_data.items():
-                    setattr(existing_grade, k, v)
-                db_objs.append(existing_grade)
+                update_rows.append({**obj_in_data, "id": existing_grade.id})
+                replaced[existing_grade.id] = existing_grade
+                result_ids.append(existing_grade.id)
             else:
                 # Create new record
-                db_obj = Grade(**obj_in_data, tenant_id=tenant_id)
-                db.add(db_obj)
-                db_objs.append(db_obj)
+                new_id = uuid4()
+                new_rows.append({**obj_in_data, "id": new_id})
+                result_ids.append(new_id)
         
-        db.commit()
-        # No need to refresh all if we just want to return the objects
-        # SQLAlchemy handles the object state since they are still in session
-        return db_objs
+        for grade_obj in replaced.values():
+            deltas.remove(grade_obj)
+
+        # One multi-row INSERT plus one executemany UPDATE, committed together
+        created = self.bulk_create(db, tenant_id, objs_in=new_rows, returning=True, commit=False)
+        updated = self.bulk_update(db, tenant_id, rows=update_rows, returning=True, commit=False)
+        for grade_obj in created + updated:
+            deltas.add(grade_obj)
+        grade_aggregate.apply(db, deltas)
+        commit_or_defer(db)
+        by_id = {grade_obj.id: grade_obj for grade_obj in created + updated}
+        return [by_id[grade_id] for grade_id in result_ids]
 
 
 grade = CRUDGrade(Grade)
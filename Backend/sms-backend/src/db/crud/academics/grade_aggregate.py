@@ -0,0 +1,245 @@
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, inspect, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.db.crud.base import TenantCRUDBase
+from src.db.models.academics.grade import Grade
+from src.db.models.academics.grade_aggregate import GradeAggregate, aggregate_id
+from src.db.models.academics.period import Period
+
+# (tenant_id, enrollment_id, subject_id, period_id, semester_id, grading_category_id, assessment_type)
+BucketKey = Tuple[Any, Any, Any, Any, Any, Any, str]
+
+KEY_COLUMNS = ("tenant_id", "enrollment_id", "subject_id", "period_id", "semester_id", "grading_category_id", "assessment_type")
+VALUE_COLUMNS = ("score", "max_score", "percentage")
+TRACKED_COLUMNS = KEY_COLUMNS + VALUE_COLUMNS
+
+# Same bucket id as aggregate_id(), computed in SQL
+GRADE_AGGREGATE_ID_SQL = (
+    "md5(concat_ws('|', g.tenant_id::text, g.enrollment_id::text, coalesce(g.subject_id::text, ''), "
+    "coalesce(g.period_id::text, ''), coalesce(g.semester_id::text, ''), "
+    "coalesce(g.grading_category_id::text, ''), g.assessment_type::text))::uuid"
+)
+
+REBUILD_SQL = f"""
+INSERT INTO grade_aggregates (
+    id, tenant_id, enrollment_id, subject_id, period_id, semester_id, grading_category_id, assessment_type,
+    score_sum, max_score_sum, percentage_sum, grade_count, created_at, updated_at
+)
+SELECT {GRADE_AGGREGATE_ID_SQL}, g.tenant_id, g.enrollment_id, g.subject_id, g.period_id, g.semester_id,
+       g.grading_category_id, g.assessment_type::text,
+       sum(g.score), sum(g.max_score), sum(g.percentage), count(*), now(), now()
+FROM grades g
+{{where}}
+GROUP BY g.tenant_id, g.enrollment_id, g.subject_id, g.period_id, g.semester_id, g.grading_category_id, g.assessment_type
+"""
+
+_DELTAS_KEY = "grade_aggregate_deltas"
+
+
+def _assessment_type(value: Any) -> str:
+    return str(getattr(value, "value", value))
+
+
+def _getter(values: Any):
+    if isinstance(values, Mapping):
+        return values.get
+    return lambda name: getattr(values, name, None)
+
+
+def bucket_key(values: Any) -> Optional[BucketKey]:
+    """Bucket of a grade (ORM object or row mapping); None if it has no enrollment yet."""
+    get = _getter(values)
+    if get("tenant_id") is None or get("enrollment_id") is None or get("assessment_type") is None:
+        return None
+    return tuple(get(name) for name in KEY_COLUMNS[:-1]) + (_assessment_type(get("assessment_type")),)
+
+
+class GradeDeltas:
+    """Per-bucket changes to score/max_score/percentage sums and grade counts."""
+
+    def __init__(self):
+        self.buckets: Dict[BucketKey, List[float]] = defaultdict(lambda: [0.0, 0.0, 0.0, 0])
+
+    def add(self, values: Any, sign: int = 1) -> None:
+        key = bucket_key(values)
+        if key is None:
+            return
+        get = _getter(values)
+        bucket = self.buckets[key]
+        bucket[0] += sign * float(get("score") or 0.0)
+        bucket[1] += sign * float(get("max_score") or 0.0)
+        bucket[2] += sign * float(get("percentage") or 0.0)
+        bucket[3] += sign
+
+    def remove(self, values: Any) -> None:
+        self.add(values, sign=-1)
+
+    def __bool__(self) -> bool:
+        return any(bucket[3] or any(bucket[:3]) for bucket in self.buckets.values())
+
+
+class CRUDGradeAggregate(TenantCRUDBase[GradeAggregate, Any, Any]):
+    """Maintenance and reads for the grade_aggregates table."""
+
+    def apply(self, db: Any, deltas: GradeDeltas) -> None:
+        """Add deltas to their buckets in the caller's transaction; empty buckets are removed.
+
+        db may be a Session or a Connection.
+        """
+        now = datetime.now(timezone.utc)
+        rows = []
+        for key, (score, max_score, percentage, count) in deltas.buckets.items():
+            if not count and not (score or max_score or percentage):
+                continue
+            rows.append({
+                "id": aggregate_id(*key),
+                **dict(zip(KEY_COLUMNS, key)),
+                "score_sum": score,
+                "max_score_sum": max_score,
+                "percentage_sum": percentage,
+                "grade_count": count,
+                "created_at": now,
+                "updated_at": now,
+            })
+        if not rows:
+            return
+        table = GradeAggregate.__table__
+        stmt = insert(table).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                "score_sum": table.c.score_sum + stmt.excluded.score_sum,
+                "max_score_sum": table.c.max_score_sum + stmt.excluded.max_score_sum,
+                "percentage_sum": table.c.percentage_sum + stmt.excluded.percentage_sum,
+                "grade_count": table.c.grade_count + stmt.excluded.grade_count,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        ))
+        db.execute(delete(table).where(
+            table.c.id.in_([row["id"] for row in rows]),
+            table.c.grade_count <= 0
+        ))
+
+    def rebuild(self, db: Session, tenant_id: Optional[Any] = None) -> int:
+        """Recompute aggregates from raw grades (backfills and drift repair); returns the bucket count.
+
+        Runs in the caller's transaction; the caller commits.
+        """
+        table = GradeAggregate.__table__
+        if tenant_id is not None:
+            tenant_id = self._ensure_uuid(tenant_id)
+            db.execute(delete(table).where(table.c.tenant_id == tenant_id))
+            result = db.execute(text(REBUILD_SQL.format(where="WHERE g.tenant_id = :tenant_id")), {"tenant_id": tenant_id})
+        else:
+            db.execute(delete(table))
+            result = db.execute(text(REBUILD_SQL.format(where="")))
+        return result.rowcount
+
+    def subject_averages(
+        self, db: Session, tenant_id: Any, enrollment_ids: Iterable[Any], published_only: bool = False
+    ) -> Dict[Tuple[Any, Any], float]:
+        """Mean grade percentage per (enrollment_id, subject_id)."""
+        enrollment_ids = list(enrollment_ids)
+        if not enrollment_ids:
+            return {}
+        query = db.query(
+            GradeAggregate.enrollment_id,
+            GradeAggregate.subject_id,
+            func.sum(GradeAggregate.percentage_sum),
+            func.sum(GradeAggregate.grade_count)
+        ).filter(
+            GradeAggregate.tenant_id == tenant_id,
+            GradeAggregate.enrollment_id.in_(enrollment_ids)
+        )
+        if published_only:
+            query = query.join(Period, GradeAggregate.period_id == Period.id).filter(Period.is_published == True)
+        rows = query.group_by(GradeAggregate.enrollment_id, GradeAggregate.subject_id).all()
+        return {
+            (enrollment_id, subject_id): percentage_sum / count
+            for enrollment_id, subject_id, percentage_sum, count in rows if count
+        }
+
+    def list_buckets(
+        self,
+        db: Session,
+        tenant_id: Any,
+        enrollment_ids: Iterable[Any],
+        published_only: bool = False,
+        subject_id: Optional[Any] = None
+    ) -> List[Any]:
+        """Aggregate rows for enrollments, with the period's name and is_published (None when the bucket has no period)."""
+        enrollment_ids = list(enrollment_ids)
+        if not enrollment_ids:
+            return []
+        query = db.query(
+            GradeAggregate.enrollment_id,
+            GradeAggregate.subject_id,
+            GradeAggregate.period_id,
+            GradeAggregate.semester_id,
+            GradeAggregate.assessment_type,
+            GradeAggregate.grading_category_id,
+            GradeAggregate.score_sum,
+            GradeAggregate.max_score_sum,
+            GradeAggregate.percentage_sum,
+            GradeAggregate.grade_count,
+            Period.name.label("period_name"),
+            Period.is_published.label("period_published")
+        ).filter(
+            GradeAggregate.tenant_id == tenant_id,
+            GradeAggregate.enrollment_id.in_(enrollment_ids)
+        )
+        if subject_id is not None:
+            query = query.filter(GradeAggregate.subject_id == subject_id)
+        if published_only:
+            query = query.join(Period, GradeAggregate.period_id == Period.id).filter(Period.is_published == True)
+        else:
+            query = query.outerjoin(Period, GradeAggregate.period_id == Period.id)
+        return query.all()
+
+
+grade_aggregate = CRUDGradeAggregate(GradeAggregate)
+
+
+def _changed(obj: Grade) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in TRACKED_COLUMNS)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_grade_deltas(session: Session, flush_context, instances) -> None:
+    """Work out aggregate changes for Grade rows this flush inserts, updates or deletes.
+
+    Old values are read from the database (they are what this flush replaces),
+    new values from the objects. Core bulk statements bypass the flush; see
+    CRUDGrade.bulk_create_grades.
+    """
+    deltas = GradeDeltas()
+    replaced = {obj.id for obj in session.dirty if isinstance(obj, Grade) and _changed(obj)}
+    replaced.update(obj.id for obj in session.deleted if isinstance(obj, Grade))
+    if replaced:
+        table = Grade.__table__
+        old_rows = session.connection().execute(
+            select(*[table.c[name] for name in TRACKED_COLUMNS]).where(table.c.id.in_(list(replaced)))
+        ).mappings().all()
+        for row in old_rows:
+            deltas.remove(row)
+    for obj in session.new:
+        if isinstance(obj, Grade):
+            deltas.add(obj)
+    for obj in session.dirty:
+        if isinstance(obj, Grade) and obj.id in replaced and obj not in session.deleted:
+            deltas.add(obj)
+    session.info[_DELTAS_KEY] = deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_grade_deltas(session: Session, flush_context) -> None:
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas:
+        grade_aggregate.apply(session.connection(), deltas)
@@ -53,6 +53,9 @@ class CRUDGradingSchema(TenantCRUDBase[GradingSchema, GradingSchemaCreate, Gradi
                 GradingCategory.schema_id == db_obj.id,
                 GradingCategory.tenant_id == tenant_id
             ).delete(synchronize_session=False)
+            # Bulk delete is invisible to the flush hook
+            from src.services.academics.grading_context import mark_grading_context_stale
+            mark_grading_context_stale(db, tenant_id)
             
             # Add new categories
             for cat_in in obj_in.categories:
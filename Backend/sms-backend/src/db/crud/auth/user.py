@@ -7,7 +7,7 @@ from typing import Optional
 from src.db.crud.base import TenantCRUDBase
 from src.db.models.auth import User, UserRole
 from src.schemas.auth.user import UserCreate, UserUpdate
-from src.core.security.password import get_password_hash, verify_password
+from src.core.security.password import verify_password
 from src.utils.uuid_utils import ensure_uuid
 import logging
 import secrets
@@ -58,15 +58,22 @@ class CRUDUser(TenantCRUDBase[User, UserCreate, UserUpdate]):
         
         return result is not None
 
+    def get_login_candidate_global(self, db: Session, email: str) -> Any:
+        """User that a global (tenant-less) login for email would check the password against."""
+        return db.query(self.model).options(joinedload(self.model.roles)).filter(self.model.email == email).first()
+
     def authenticate_global(self, db: Session, email: str, password: str) -> Any:
         # Authenticate user globally (without tenant_id)
-        user = db.query(self.model).options(joinedload(self.model.roles)).filter(self.model.email == email).first()
+        user = self.get_login_candidate_global(db, email=email)
         if not user or not verify_password(password, user.password_hash):
             return None
         return user
     
-    def authenticate(self, db: Session, tenant_id: Any, *, email: str, password: str) -> Any:
-        """Authenticate a user by email and password."""
+    def get_login_candidate(self, db: Session, tenant_id: Any, *, email: str) -> Any:
+        """User that a login to tenant_id for email would check the password against.
+
+        Falls back to a super-admin with that email in any tenant.
+        """
         tenant_id_uuid = ensure_uuid(tenant_id)
         logger.info(f"[AUTH] Authenticating email={email} (Fix v1.0), tenant_id={tenant_id}")
         
@@ -90,6 +97,11 @@ class CRUDUser(TenantCRUDBase[User, UserCreate, UserUpdate]):
                 logger.debug(f"[AUTH] User not found in ANY tenant.")
                 return None
         
+        return user
+
+    def authenticate(self, db: Session, tenant_id: Any, *, email: str, password: str) -> Any:
+        """Authenticate a user by email and password."""
+        user = self.get_login_candidate(db, tenant_id, email=email)
         if not user:
             return None
 
@@ -100,13 +112,8 @@ class CRUDUser(TenantCRUDBase[User, UserCreate, UserUpdate]):
         logger.debug(f"[AUTH] Authentication successful for user {email}")
         return user
     
-    def create(self, db: Session, tenant_id: Any, *, obj_in: UserCreate) -> Any:
-        """Create a new user with password hashing."""
-        # If password is not provided or is empty, generate a default password
-        password = obj_in.password
-        if not password:  # This triggers for empty string!
-            password = generate_default_password()
-            
+    def create(self, db: Session, tenant_id: Any, *, obj_in: UserCreate, password_hash: str) -> Any:
+        """Create a new user; password_hash must already be computed (callers hash off the event loop)."""
         db_obj = User(
             email=obj_in.email,
             first_name=obj_in.first_name,
@@ -117,29 +124,27 @@ class CRUDUser(TenantCRUDBase[User, UserCreate, UserUpdate]):
             profile_picture=obj_in.profile_picture,
             preferences=obj_in.preferences,
             tenant_id=tenant_id,
-            password_hash=get_password_hash(password)
+            password_hash=password_hash
         )
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
-        
-        # Return the generated password if it was auto-generated
-        if password != obj_in.password:
-            db_obj.generated_password = password
-            
         return db_obj
     
-    def update(self, db: Session, tenant_id: Any, *, db_obj: Any, obj_in: Union[UserUpdate, Dict[str, Any]]) -> Any:
-        """Update a user, handling password hashing if needed."""
+    def update(
+        self, db: Session, tenant_id: Any, *, db_obj: Any, obj_in: Union[UserUpdate, Dict[str, Any]],
+        password_hash: Optional[str] = None
+    ) -> Any:
+        """Update a user. A new password must come pre-hashed as password_hash."""
         if isinstance(obj_in, dict):
-            update_data = obj_in
+            update_data = dict(obj_in)
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
         
-        # Hash password if it's being updated
-        if update_data.get("password"):
-            update_data["password_hash"] = get_password_hash(update_data["password"])
-            del update_data["password"]
+        if update_data.pop("password", None) and password_hash is None:
+            raise ValueError("password_hash is required when changing the password")
+        if password_hash is not None:
+            update_data["password_hash"] = password_hash
         
         # Use SQLAlchemy's update() method to avoid triggering __init__
         if update_data:
@@ -1,4 +1,6 @@
 from .base import CRUDBase, TenantCRUDBase
+from .async_base import AsyncTenantCRUDBase
+from .unit_of_work import unit_of_work, in_unit_of_work
 
-__all__ = ["CRUDBase", "TenantCRUDBase"]
+__all__ = ["CRUDBase", "TenantCRUDBase", "AsyncTenantCRUDBase", "unit_of_work", "in_unit_of_work"]
 
@@ -0,0 +1,169 @@
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+from src.db.models.base import TenantModel
+from src.db.crud.base.pagination import decode_cursor, cursor_for
+from src.utils.uuid_utils import ensure_uuid
+
+
+TenantModelType = TypeVar("TenantModelType", bound=TenantModel)
+CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
+UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
+
+
+class AsyncTenantCRUDBase(Generic[TenantModelType, CreateSchemaType, UpdateSchemaType]):
+    """Async counterpart of TenantCRUDBase for use with an AsyncSession.
+
+    Mirrors the sync API so services can be migrated one at a time.
+    """
+
+    def __init__(self, model: Type[TenantModelType]):
+        """Initialize with the model class."""
+        self.model = model
+
+    def _ensure_uuid(self, tenant_id: Any) -> UUID:
+        """Ensure the tenant_id is a UUID object."""
+        if isinstance(tenant_id, str):
+            tenant_id = UUID(tenant_id)
+        elif not isinstance(tenant_id, UUID):
+            raise ValueError("tenant_id must be a UUID object")
+        return tenant_id
+
+    def _base_query(self, tenant_id: Any, options: Optional[List[Any]] = None, filters: Optional[Dict] = None):
+        """Build a tenant-filtered SELECT with options and equality/IN filters applied."""
+        stmt = select(self.model).where(self.model.tenant_id == ensure_uuid(tenant_id))
+
+        if options:
+            stmt = stmt.options(*options)
+
+        for field, value in (filters or {}).items():
+            if hasattr(self.model, field):
+                column = getattr(self.model, field)
+                if isinstance(value, list) and value:
+                    stmt = stmt.where(column.in_(value))
+                elif value is not None:
+                    stmt = stmt.where(column == value)
+        return stmt
+
+    def _apply_ordering(self, stmt):
+        """Apply the same default ordering as the sync CRUD base."""
+        if hasattr(self.model, 'created_at'):
+            return stmt.order_by(self.model.created_at.desc())
+        if hasattr(self.model, 'id'):
+            return stmt.order_by(self.model.id.asc())
+        return stmt
+
+    async def get_by_id(self, db: AsyncSession, tenant_id: Any, id: Any) -> Optional[TenantModelType]:
+        """Get a record by ID with tenant filtering."""
+        tenant_id = self._ensure_uuid(tenant_id)
+        result = await db.execute(
+            select(self.model).where(
+                self.model.tenant_id == tenant_id,
+                self.model.id == id
+            )
+        )
+        return result.scalars().first()
+
+    async def list(self, db: AsyncSession, *, tenant_id: Any = None, skip: int = 0, limit: int = 100, options: Optional[List[Any]] = None, **kwargs) -> List[TenantModelType]:
+        """List records with tenant filtering and pagination."""
+        stmt = self._base_query(tenant_id, options, kwargs.get('filters', {}))
+        stmt = self._apply_ordering(stmt).offset(skip).limit(limit)
+        result = await db.execute(stmt)
+        return list(result.scalars().unique().all())
+
+    async def list_with_cursor(self, db: AsyncSession, *, tenant_id: Any = None, after: Optional[str] = None, limit: int = 100, options: Optional[List[Any]] = None, **kwargs) -> tuple[List[TenantModelType], Optional[str]]:
+        """List records in keyset mode, returning (items, next_cursor)."""
+        stmt = self._base_query(tenant_id, options, kwargs.get('filters', {}))
+        if after:
+            created_at, last_id = decode_cursor(after)
+            stmt = stmt.where(tuple_(self.model.created_at, self.model.id) < tuple_(created_at, last_id))
+        stmt = stmt.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit + 1)
+        rows = list((await db.execute(stmt)).scalars().unique().all())
+        items = rows[:limit]
+        return items, (cursor_for(items[-1]) if len(rows) > limit else None)
+
+    async def get_multi(
+        self, db: AsyncSession, tenant_id: Any, *, skip: int = 0, limit: int = 100, **kwargs
+    ) -> List[TenantModelType]:
+        """Get multiple records (compatibility alias for list)."""
+        return await self.list(db, tenant_id=tenant_id, skip=skip, limit=limit, **kwargs)
+
+    async def list_with_count(self, db: AsyncSession, *, tenant_id: Any = None, skip: int = 0, limit: int = 100, options: Optional[List[Any]] = None, **kwargs) -> tuple[List[TenantModelType], int]:
+        """List records with total count, tenant filtering, and pagination."""
+        filters = kwargs.get('filters', {})
+        count_stmt = select(func.count()).select_from(self._base_query(tenant_id, None, filters).subquery())
+        total = (await db.execute(count_stmt)).scalar_one()
+
+        stmt = self._base_query(tenant_id, options, filters)
+        stmt = self._apply_ordering(stmt).offset(skip).limit(limit)
+        result = await db.execute(stmt)
+        return list(result.scalars().unique().all()), total
+
+    async def create(
+        self, db: AsyncSession, tenant_id: Any, *, obj_in: CreateSchemaType
+    ) -> TenantModelType:
+        """Create a new record with tenant ID."""
+        tenant_id = self._ensure_uuid(tenant_id)
+
+        # Validate tenant exists
+        from src.db.models.tenant import Tenant
+        result = await db.execute(
+            select(Tenant.id).where(Tenant.id == tenant_id, Tenant.is_active == True)
+        )
+        if result.scalar_one_or_none() is None:
+            raise ValueError(f"Tenant {tenant_id} not found or inactive")
+
+        obj_in_data = jsonable_encoder(obj_in)
+        # Ensure tenant_id is set
+        obj_in_data["tenant_id"] = tenant_id
+        db_obj = self.model(**obj_in_data)
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        tenant_id: Any,
+        *,
+        db_obj: TenantModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> TenantModelType:
+        """Update a record with tenant validation."""
+        tenant_id = self._ensure_uuid(tenant_id)
+
+        # Ensure the object belongs to the tenant
+        if str(db_obj.tenant_id) != str(tenant_id):
+            raise ValueError("Object does not belong to the tenant")
+
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        for field, value in update_data.items():
+            # Never overwrite tenant_id or id during a normal update
+            if field not in ["tenant_id", "id"] and hasattr(db_obj, field):
+                setattr(db_obj, field, value)
+
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def delete(
+        self, db: AsyncSession, tenant_id: Any, *, id: Any
+    ) -> Optional[TenantModelType]:
+        """Delete a record with tenant validation."""
+        tenant_id = self._ensure_uuid(tenant_id)
+
+        obj = await self.get_by_id(db, tenant_id, id)
+        if not obj:
+            return None
+        await db.delete(obj)
+        await db.commit()
+        return obj
@@ -1,9 +1,15 @@
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from datetime import datetime, timezone
+from sqlalchemy import insert, inspect as sa_inspect, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from uuid import UUID
+from uuid import UUID, uuid4
 from src.db.models.base import Base, TenantModel
+from src.db.crud.base.pagination import DEFAULT_KEYSET, CursorPage, column_types, cursor_for, decode_cursor
+from src.db.crud.base.counting import CountStrategy, count_query, invalidate_counts, make_count_cache_key
+from src.db.crud.base.unit_of_work import commit_or_defer
 from src.utils.uuid_utils import ensure_uuid
 
 
@@ -65,8 +71,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        commit_or_defer(db, db_obj, flush=True)
+        invalidate_counts(self.model.__tablename__)
         return db_obj
     
     def update(
@@ -84,8 +90,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 setattr(db_obj, field, value)
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        commit_or_defer(db, db_obj)
+        invalidate_counts(self.model.__tablename__)
         return db_obj
     
     def remove(self, db: Session, *, id: Any) -> ModelType:
@@ -95,12 +101,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if not obj:
             return None
         db.delete(obj)
-        db.commit()
+        commit_or_defer(db)
+        invalidate_counts(self.model.__tablename__)
         return obj
 
 
 class TenantCRUDBase(Generic[TenantModelType, CreateSchemaType, UpdateSchemaType]):
     """Base class for CRUD operations on tenant-aware models."""
+
+    # Columns (ending in a unique one) that order list pages in both offset and cursor mode
+    keyset_columns = DEFAULT_KEYSET
+    keyset_descending = True
     
     def __init__(self, model: Type[TenantModelType]):
         """Initialize with the model class."""
@@ -124,11 +135,10 @@ class TenantCRUDBase(Generic[TenantModelType, CreateSchemaType, UpdateSchemaType
         ).first()
     
     
-    def list(self, db: Session, *, tenant_id: Any = None, skip: int = 0, limit: int = 100, options: Optional[List[Any]] = None, **kwargs):
+    def _build_list_query(self, db: Session, tenant_id: Any, options: Optional[List[Any]] = None, filters: Optional[Dict] = None):
+        """Build the tenant-filtered query shared by list and list_with_count."""
         # Convert tenant_id to UUID if it's not already
         tenant_id_uuid = ensure_uuid(tenant_id)
-        
-        # Use the converted UUID in your query
         query = db.query(self.model).filter(self.model.tenant_id == tenant_id_uuid)
         
         # Apply options (like joinedload)
@@ -137,54 +147,88 @@ class TenantCRUDBase(Generic[TenantModelType, CreateSchemaType, UpdateSchemaType
                 query = query.options(option)
         
         # Apply additional filters
-        filters = kwargs.get('filters', {})
-        for field, value in filters.items():
+        for field, value in (filters or {}).items():
             if hasattr(self.model, field):
                 column = getattr(self.model, field)
                 if isinstance(value, list) and value:
                     query = query.filter(column.in_(value))
                 elif value is not None:
                     query = query.filter(column == value)
-        
-        # Add default ordering by created_at to maintain consistent order
-        if hasattr(self.model, 'created_at'):
-            query = query.order_by(self.model.created_at.desc()) # Changed to desc for logs usually
+        return query
+
+    def _apply_default_ordering(self, query):
+        """Order by the keyset columns (newest first by default), falling back to id."""
+        if all(hasattr(self.model, name) for name in self.keyset_columns):
+            return query.order_by(*self._keyset_order())
         elif hasattr(self.model, 'id'):
-            query = query.order_by(self.model.id.asc())
+            return query.order_by(self.model.id.asc())
+        return query
+
+    def _keyset_order(self) -> List[Any]:
+        columns = [getattr(self.model, name) for name in self.keyset_columns]
+        return [c.desc() for c in columns] if self.keyset_descending else [c.asc() for c in columns]
+
+    def apply_keyset(self, query, after: Optional[str] = None):
+        """Order a query by the keyset columns and seek past the `after` cursor.
+
+        Unlike OFFSET, the seek predicate lets the database start reading at the
+        cursor position, so every page costs the same as the first one.
+        """
+        if after:
+            values = decode_cursor(after, column_types(self.model, self.keyset_columns))
+            row = tuple_(*(getattr(self.model, name) for name in self.keyset_columns))
+            query = query.filter(row < tuple_(*values) if self.keyset_descending else row > tuple_(*values))
+        return query.order_by(*self._keyset_order())
+
+    def paginate_keyset(self, query, *, after: Optional[str] = None, limit: int = 100) -> CursorPage:
+        """Fetch one keyset page from query; the page's next_cursor is None on the last page."""
+        rows = self.apply_keyset(query, after).limit(limit + 1).all()
+        items = rows[:limit]
+        next_cursor = cursor_for(items[-1], self.keyset_columns) if len(rows) > limit else None
+        return CursorPage(items, next_cursor)
+
+    def list(self, db: Session, *, tenant_id: Any = None, skip: int = 0, limit: int = 100, options: Optional[List[Any]] = None, after: Optional[str] = None, **kwargs):
+        """List records; with an `after` cursor the result is a CursorPage carrying next_cursor."""
+        query = self._build_list_query(db, tenant_id, options, kwargs.get('filters', {}))
+
+        # Cursor mode: seek past the cursor instead of using OFFSET
+        if after:
+            return self.paginate_keyset(query, after=after, limit=limit)
         
+        # Add default ordering by created_at to maintain consistent order
+        query = self._apply_default_ordering(query)
         return query.offset(skip).limit(limit).all()
 
+    def list_with_cursor(self, db: Session, *, tenant_id: Any = None, after: Optional[str] = None, limit: int = 100, options: Optional[List[Any]] = None, **kwargs) -> tuple[List[TenantModelType], Optional[str]]:
+        """List records in keyset mode, returning (items, next_cursor)."""
+        query = self._build_list_query(db, tenant_id, options, kwargs.get('filters', {}))
+        page = self.paginate_keyset(query, after=after, limit=limit)
+        return page, page.next_cursor
+
     def get_multi(
         self, db: Session, tenant_id: Any, *, skip: int = 0, limit: int = 100, **kwargs
     ) -> List[TenantModelType]:
         """Get multiple records (compatibility alias for list)."""
         return self.list(db, tenant_id=tenant_id, skip=skip, limit=limit, **kwargs)
 
-    def list_with_count(self, db: Session, *, tenant_id: Any = None, skip: int = 0, limit: int = 100, options: Optional[List[Any]] = None, **kwargs) -> tuple[List[TenantModelType], int]:
-        """List records with total count, tenant filtering, and pagination."""
-        tenant_id_uuid = ensure_uuid(tenant_id)
-        query = db.query(self.model).filter(self.model.tenant_id == tenant_id_uuid)
-        
-        if options:
-            for option in options:
-                query = query.options(option)
-        
+    def list_with_count(self, db: Session, *, tenant_id: Any = None, skip: int = 0, limit: int = 100, options: Optional[List[Any]] = None, after: Optional[str] = None, count_strategy: CountStrategy = CountStrategy.EXACT, **kwargs) -> tuple[List[TenantModelType], Optional[int]]:
+        """List records with total count, tenant filtering, and pagination.
+        The total is a CountedTotal whose `strategy` reports how it was computed.
+        With an `after` cursor no count is taken: items is a CursorPage and total is None."""
         filters = kwargs.get('filters', {})
-        for field, value in filters.items():
-            if hasattr(self.model, field):
-                column = getattr(self.model, field)
-                if isinstance(value, list) and value:
-                    query = query.filter(column.in_(value))
-                elif value is not None:
-                    query = query.filter(column == value)
+        query = self._build_list_query(db, tenant_id, options, filters)
+
+        if after:
+            return self.paginate_keyset(query, after=after, limit=limit), None
         
-        total = query.count()
+        total = count_query(
+            db,
+            query,
+            strategy=count_strategy,
+            cache_key=make_count_cache_key(self.model.__tablename__, tenant_id, filters)
+        )
 
-        if hasattr(self.model, 'created_at'):
-            query = query.order_by(self.model.created_at.desc())
-        elif hasattr(self.model, 'id'):
-            query = query.order_by(self.model.id.asc())
-            
+        query = self._apply_default_ordering(query)
         items = query.offset(skip).limit(limit).all()
         return items, total
     
@@ -195,20 +239,217 @@ class TenantCRUDBase(Generic[TenantModelType, CreateSchemaType, UpdateSchemaType
         tenant_id = self._ensure_uuid(tenant_id)
         
         # Validate tenant exists
-        from src.db.models.tenant import Tenant
-        tenant = db.query(Tenant).filter(Tenant.id == tenant_id, Tenant.is_active == True).first()
-        if not tenant:
-            raise ValueError(f"Tenant {tenant_id} not found or inactive")
+        self._validate_tenant(db, tenant_id)
     
         obj_in_data = jsonable_encoder(obj_in)
         # Ensure tenant_id is set
         obj_in_data["tenant_id"] = tenant_id
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        commit_or_defer(db, db_obj, flush=True)
+        invalidate_counts(self.model.__tablename__, tenant_id)
         return db_obj
     
+    def _validate_tenant(self, db: Session, tenant_id: UUID) -> None:
+        """Raise ValueError if the tenant does not exist or is inactive."""
+        from src.db.models.tenant import Tenant
+        exists = db.query(Tenant.id).filter(Tenant.id == tenant_id, Tenant.is_active == True).first()
+        if not exists:
+            raise ValueError(f"Tenant {tenant_id} not found or inactive")
+
+    def _prepare_bulk_rows(
+        self, tenant_id: UUID, objs_in: List[Union[CreateSchemaType, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Turn schemas/dicts into column dicts stamped with tenant_id.
+
+        Keys that are not mapped columns are dropped. Keys missing from some rows
+        are filled from the column's Python default (scalar or callable); columns
+        with SQL or server defaults stay missing so the database applies them,
+        and _group_by_keys splits such rows into separate statements.
+        """
+        columns = {attr.key for attr in sa_inspect(self.model).column_attrs}
+        now = datetime.now(timezone.utc)
+        rows = []
+        for obj_in in objs_in:
+            data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+            row = {k: v for k, v in data.items() if k in columns}
+            row["tenant_id"] = tenant_id
+            if "id" in columns and row.get("id") is None:
+                row["id"] = uuid4()
+            if "created_at" in columns:
+                row.setdefault("created_at", now)
+            if "updated_at" in columns:
+                row.setdefault("updated_at", now)
+            rows.append(row)
+
+        # Fill keys missing from some rows with the column's Python-side default
+        all_keys = set().union(*rows) if rows else set()
+        table_columns = self.model.__table__.c
+        for row in rows:
+            for key in all_keys - row.keys():
+                column = table_columns[key] if key in table_columns else None
+                default = column.default if column is not None else None
+                if default is not None and default.is_scalar:
+                    row[key] = default.arg
+                elif default is not None and default.is_callable:
+                    row[key] = default.arg(None)
+                elif column is None or (default is None and column.server_default is None):
+                    row[key] = None
+        return rows
+
+    @staticmethod
+    def _group_by_keys(rows: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split rows into runs sharing one key set (one statement each); usually a single group."""
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row), []).append(row)
+        return list(groups.values())
+
+    def bulk_create(
+        self,
+        db: Session,
+        tenant_id: Any,
+        *,
+        objs_in: List[Union[CreateSchemaType, Dict[str, Any]]],
+        returning: bool = False,
+        commit: bool = True
+    ) -> Union[List[TenantModelType], int]:
+        """Insert many records in a single INSERT statement.
+
+        Returns the inserted ORM objects when returning=True, otherwise the
+        number of rows inserted. Pass commit=False to compose with other
+        statements in the caller's transaction.
+        """
+        tenant_id = self._ensure_uuid(tenant_id)
+        if not objs_in:
+            return [] if returning else 0
+        self._validate_tenant(db, tenant_id)
+
+        rows = self._prepare_bulk_rows(tenant_id, objs_in)
+        items = []
+        for group in self._group_by_keys(rows):
+            if returning:
+                stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+                items.extend(db.scalars(stmt, group).all())
+            else:
+                db.execute(insert(self.model), group)
+        if returning and "id" in rows[0]:
+            # Groups run separately; return items in objs_in order
+            position = {row["id"]: i for i, row in enumerate(rows)}
+            items.sort(key=lambda item: position[item.id])
+        if commit:
+            commit_or_defer(db)
+        invalidate_counts(self.model.__tablename__, tenant_id)
+        return items if returning else len(rows)
+
+    def bulk_upsert(
+        self,
+        db: Session,
+        tenant_id: Any,
+        *,
+        objs_in: List[Union[CreateSchemaType, Dict[str, Any]]],
+        conflict_columns: Optional[List[str]] = None,
+        constraint: Optional[str] = None,
+        update_columns: Optional[List[str]] = None,
+        returning: bool = False,
+        commit: bool = True
+    ) -> Union[List[TenantModelType], int]:
+        """Insert many records, updating rows that hit a unique constraint.
+
+        Uses PostgreSQL INSERT ... ON CONFLICT in a single statement. Identify the
+        conflict target with either conflict_columns (index elements) or the
+        constraint name. update_columns defaults to every supplied column except
+        the keys and creation metadata; pass [] to skip conflicting rows instead.
+        """
+        tenant_id = self._ensure_uuid(tenant_id)
+        if not objs_in:
+            return [] if returning else 0
+        if not conflict_columns and not constraint:
+            raise ValueError("bulk_upsert requires conflict_columns or constraint")
+        self._validate_tenant(db, tenant_id)
+
+        rows = self._prepare_bulk_rows(tenant_id, objs_in)
+        target = {"constraint": constraint} if constraint else {"index_elements": conflict_columns}
+        result = [] if returning else 0
+
+        for group in self._group_by_keys(rows):
+            stmt = pg_insert(self.model).values(group)
+            group_update_columns = update_columns
+            if group_update_columns is None:
+                excluded_keys = {"id", "tenant_id", "created_at", *(conflict_columns or [])}
+                group_update_columns = [k for k in group[0] if k not in excluded_keys]
+
+            if group_update_columns:
+                set_ = {col: stmt.excluded[col] for col in group_update_columns}
+                if hasattr(self.model, "updated_at"):
+                    set_["updated_at"] = stmt.excluded.updated_at
+                stmt = stmt.on_conflict_do_update(
+                    where=self.model.__table__.c.tenant_id == tenant_id,
+                    set_=set_,
+                    **target
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(**target)
+
+            if returning:
+                result.extend(db.scalars(
+                    stmt.returning(self.model),
+                    execution_options={"populate_existing": True}
+                ).all())
+            else:
+                result += db.execute(stmt).rowcount
+        if commit:
+            commit_or_defer(db)
+        invalidate_counts(self.model.__tablename__, tenant_id)
+        return result
+
+    def bulk_update(
+        self,
+        db: Session,
+        tenant_id: Any,
+        *,
+        rows: List[Dict[str, Any]],
+        returning: bool = False,
+        commit: bool = True
+    ) -> Union[List[TenantModelType], int]:
+        """Update many records by primary key in one executemany UPDATE.
+
+        Each row must contain "id"; tenant_id is never changed and rows belonging
+        to other tenants are left untouched. With returning=True the updated
+        records are reloaded in a single SELECT.
+        """
+        tenant_id = self._ensure_uuid(tenant_id)
+        if not rows:
+            return [] if returning else 0
+
+        columns = {attr.key for attr in sa_inspect(self.model).column_attrs}
+        now = datetime.now(timezone.utc)
+        params = []
+        for row in rows:
+            if row.get("id") is None:
+                raise ValueError("bulk_update rows must include an id")
+            data = {k: v for k, v in row.items() if k in columns and k != "tenant_id"}
+            if hasattr(self.model, "updated_at"):
+                data.setdefault("updated_at", now)
+            params.append(data)
+
+        db.execute(
+            update(self.model).where(self.model.tenant_id == tenant_id),
+            params
+        )
+        if commit:
+            commit_or_defer(db)
+        # Updated columns may move rows in or out of filtered counts
+        invalidate_counts(self.model.__tablename__, tenant_id)
+
+        if returning:
+            ids = [row["id"] for row in params]
+            return db.query(self.model).populate_existing().filter(
+                self.model.tenant_id == tenant_id,
+                self.model.id.in_(ids)
+            ).all()
+        return len(params)
+
     def update(
         self, 
         db: Session, 
@@ -238,8 +479,8 @@ class TenantCRUDBase(Generic[TenantModelType, CreateSchemaType, UpdateSchemaType
                 setattr(db_obj, field, value)
         
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        commit_or_defer(db, db_obj)
+        invalidate_counts(self.model.__tablename__, tenant_id)
         return db_obj
     
     def delete(
@@ -253,7 +494,8 @@ class TenantCRUDBase(Generic[TenantModelType, CreateSchemaType, UpdateSchemaType
         if not obj:
             return None
         db.delete(obj)
-        db.commit()
+        commit_or_defer(db)
+        invalidate_counts(self.model.__tablename__, tenant_id)
         return obj
 
         
\ No newline at end of file
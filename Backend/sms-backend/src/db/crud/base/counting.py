@@ -0,0 +1,153 @@
+import json
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Query, Session
+
+logger = logging.getLogger(__name__)
+
+
+class CountStrategy(str, Enum):
+    """How the total for a paginated list is computed."""
+    EXACT = "exact"          # COUNT(*) on every request
+    CACHED = "cached"        # COUNT(*) reused for a TTL, keyed on tenant + filters
+    ESTIMATED = "estimated"  # PostgreSQL planner row estimate
+
+
+# Below this many estimated rows an exact count is cheap, so use it instead.
+ESTIMATE_EXACT_THRESHOLD = 10000
+DEFAULT_COUNT_CACHE_TTL = 60
+
+
+class CountedTotal(int):
+    """An int total that also records the strategy used to compute it.
+
+    Behaves like a plain int for existing callers of list_with_count.
+    """
+    strategy: CountStrategy
+
+    def __new__(cls, value: int, strategy: CountStrategy):
+        obj = super().__new__(cls, value)
+        obj.strategy = strategy
+        return obj
+
+
+class _CountCache:
+    """Small thread-safe TTL cache of exact counts for this worker."""
+
+    def __init__(self, max_entries: int = 2048):
+        self._entries: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get(self, key: str) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: int, ttl: int) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Drop expired entries first, then the oldest insertion
+                now = time.monotonic()
+                for k in [k for k, (exp, _) in self._entries.items() if exp < now]:
+                    del self._entries[k]
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for k in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[k]
+
+
+count_cache = _CountCache()
+
+
+def count_cache_prefix(table: str, tenant_id: Any) -> str:
+    """Key prefix shared by every cached count for a table and tenant."""
+    return f"count:{table}:{tenant_id}:"
+
+
+def invalidate_counts(table: str, tenant_id: Any = None) -> None:
+    """Drop this worker's cached counts for table after a write.
+
+    Drops the tenant's counts plus the cross-tenant ("*") ones, or every count
+    for the table when tenant_id is None. Other workers catch up within the TTL.
+    """
+    if tenant_id is None:
+        count_cache.invalidate_prefix(f"count:{table}:")
+        return
+    count_cache.invalidate_prefix(count_cache_prefix(table, tenant_id))
+    count_cache.invalidate_prefix(count_cache_prefix(table, "*"))
+
+
+def make_count_cache_key(table: str, tenant_id: Any, filters: Optional[Dict] = None) -> str:
+    """Build a cache key from the table, tenant and filter values."""
+    filters_part = json.dumps(
+        {k: v for k, v in (filters or {}).items() if v is not None},
+        sort_keys=True,
+        default=str
+    )
+    return count_cache_prefix(table, tenant_id) + filters_part
+
+
+def estimate_query_rows(db: Session, query: Query) -> Optional[int]:
+    """Return the PostgreSQL planner's row estimate for query, or None."""
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+    try:
+        compiled = query.order_by(None).statement.compile(dialect=bind.dialect)
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning(f"Planner row estimate failed, falling back to exact count: {e}")
+        return None
+
+
+def count_query(
+    db: Session,
+    query: Query,
+    *,
+    strategy: CountStrategy = CountStrategy.EXACT,
+    cache_key: Optional[str] = None,
+    ttl: int = DEFAULT_COUNT_CACHE_TTL
+) -> CountedTotal:
+    """Count the rows matched by query using the requested strategy.
+
+    ESTIMATED falls back to an exact count when the estimate is small or
+    unavailable, and CACHED falls back to EXACT when no cache_key is given.
+    The returned total records the strategy that was actually used.
+    """
+    strategy = CountStrategy(strategy)
+
+    if strategy == CountStrategy.ESTIMATED:
+        estimate = estimate_query_rows(db, query)
+        if estimate is not None and estimate >= ESTIMATE_EXACT_THRESHOLD:
+            return CountedTotal(estimate, CountStrategy.ESTIMATED)
+        strategy = CountStrategy.EXACT
+
+    if strategy == CountStrategy.CACHED and cache_key:
+        cached = count_cache.get(cache_key)
+        if cached is not None:
+            return CountedTotal(cached, CountStrategy.CACHED)
+        total = query.order_by(None).count()
+        count_cache.set(cache_key, total, ttl)
+        return CountedTotal(total, CountStrategy.CACHED)
+
+    return CountedTotal(query.order_by(None).count(), CountStrategy.EXACT)
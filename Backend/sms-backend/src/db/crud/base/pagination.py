@@ -0,0 +1,81 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+# Default keyset: newest first, id as the tie-breaker
+DEFAULT_KEYSET = ("created_at", "id")
+
+
+class CursorPage(list):
+    """A page of items that also carries the cursor of the next page.
+
+    Behaves like a plain list for existing callers of list(); next_cursor is
+    None on the last page.
+    """
+    next_cursor: Optional[str]
+
+    def __init__(self, items: Sequence[Any] = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any, python_type: Optional[type]) -> Any:
+    if value is None or python_type is None:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Build an opaque keyset cursor from a row's keyset values, e.g. (created_at, id)."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[Optional[type]] = (datetime, UUID)) -> Tuple[Any, ...]:
+    """Decode a cursor produced by encode_cursor, converting each value to its column's type.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if len(values) != len(types):
+            raise ValueError
+        return tuple(_decode_value(v, t) for v, t in zip(values, types))
+    except Exception:
+        raise ValueError("Invalid pagination cursor")
+
+
+def cursor_for(obj: Any, columns: Sequence[str] = DEFAULT_KEYSET) -> Optional[str]:
+    """Return the cursor pointing just past obj, or None if obj is None."""
+    if obj is None:
+        return None
+    return encode_cursor(*(getattr(obj, name) for name in columns))
+
+
+def column_types(model: Any, columns: Sequence[str]) -> List[Optional[type]]:
+    """Python types of a model's keyset columns, for decode_cursor."""
+    types = []
+    for name in columns:
+        try:
+            types.append(getattr(model, name).type.python_type)
+        except (AttributeError, NotImplementedError):
+            types.append(None)
+    return types
@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+# Nesting depth of unit_of_work blocks, stored on the session itself so every
+# CRUD call that shares the session sees it.
+_UOW_DEPTH_KEY = "unit_of_work_depth"
+
+
+def in_unit_of_work(db: Session) -> bool:
+    """Return True if db is inside a unit_of_work block."""
+    return db.info.get(_UOW_DEPTH_KEY, 0) > 0
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """Group several CRUD calls into a single transaction.
+
+    Inside the block CRUD writes skip their own commit and refresh; the
+    outermost block commits once on success and rolls back on any error.
+    Nested blocks join the enclosing one.
+    """
+    depth = db.info.get(_UOW_DEPTH_KEY, 0)
+    db.info[_UOW_DEPTH_KEY] = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            db.commit()
+    except Exception:
+        if depth == 0:
+            db.rollback()
+        raise
+    finally:
+        db.info[_UOW_DEPTH_KEY] = depth
+
+
+def commit_or_defer(db: Session, db_obj: Optional[Any] = None, *, flush: bool = False) -> None:
+    """Commit and refresh db_obj, or leave it to the enclosing unit of work.
+
+    Inside a unit of work nothing is committed or refreshed. Pass flush=True
+    when the caller needs generated values such as primary keys right away.
+    """
+    if in_unit_of_work(db):
+        if flush:
+            db.flush()
+        return
+    db.commit()
+    if db_obj is not None:
+        db.refresh(db_obj)
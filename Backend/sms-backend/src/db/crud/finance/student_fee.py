@@ -1,8 +1,10 @@
 from typing import List, Optional
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
-from uuid import UUID
+from uuid import UUID, uuid4
 from src.db.crud.base import TenantCRUDBase
+from src.db.crud.base.unit_of_work import commit_or_defer
+from src.db.crud.finance.fee_installment import fee_installment as fee_installment_crud
 from src.db.models.finance.student_fee import StudentFee
 from src.db.models.finance.fee_installment import FeeInstallment
 from src.db.models.finance.fee_structure import FeeStructure
@@ -61,8 +63,7 @@ class CRUDStudentFee(TenantCRUDBase[StudentFee, StudentFeeCreate, StudentFeeUpda
             db_installment = FeeInstallment(**inst_data)
             db.add(db_installment)
             
-        db.commit()
-        db.refresh(db_obj)
+        commit_or_defer(db, db_obj)
         return db_obj
 
     def create_bulk(self, db: Session, tenant_id: any, *, obj_in: BulkStudentFeeCreate) -> dict:
@@ -86,48 +87,46 @@ class CRUDStudentFee(TenantCRUDBase[StudentFee, StudentFeeCreate, StudentFeeUpda
             Enrollment.is_active == True
         ).all()
         
-        count = 0
-        skipped = 0
-        
-        for enrollment in enrollments:
-            # 3. Check if existence
-            existing = db.query(StudentFee).filter(
+        # 3. One lookup for students that already have this structure applied
+        already_applied = {
+            row.student_id for row in db.query(StudentFee.student_id).filter(
                 StudentFee.tenant_id == tenant_id,
-                StudentFee.student_id == enrollment.student_id,
                 StudentFee.fee_structure_id == structure.id
-            ).first()
-            
-            if existing:
-                skipped += 1
+            ).all()
+        }
+        
+        fee_rows = []
+        installment_rows = []
+        for enrollment in enrollments:
+            if enrollment.student_id in already_applied:
                 continue
-                
-            # 4. Create StudentFee
-            new_fee = StudentFee(
-                tenant_id=tenant_id,
-                student_id=enrollment.student_id,
-                fee_structure_id=structure.id,
-                total_amount=structure.amount,
-                balance=structure.amount,
-                status="PENDING"
-            )
-            db.add(new_fee)
-            db.flush()
-            
-            # 5. Create installments
-            if obj_in.installments:
-                for inst_data in obj_in.installments:
-                    db_inst = FeeInstallment(
-                        tenant_id=tenant_id,
-                        student_fee_id=new_fee.id,
-                        amount=inst_data.amount,
-                        due_date=inst_data.due_date,
-                        status="PENDING"
-                    )
-                    db.add(db_inst)
+            already_applied.add(enrollment.student_id)
             
-            count += 1
+            # 4. StudentFee ids are generated up front so installments can reference them
+            fee_id = uuid4()
+            fee_rows.append({
+                "id": fee_id,
+                "student_id": enrollment.student_id,
+                "fee_structure_id": structure.id,
+                "total_amount": structure.amount,
+                "balance": structure.amount,
+                "status": "PENDING"
+            })
             
-        db.commit()
-        return {"count": count, "skipped": skipped}
+            # 5. Installments for the fee
+            for inst_data in obj_in.installments or []:
+                installment_rows.append({
+                    "student_fee_id": fee_id,
+                    "amount": inst_data.amount,
+                    "due_date": inst_data.due_date,
+                    "status": "PENDING"
+                })
+        
+        # Two multi-row INSERTs committed together
+        count = self.bulk_create(db, tenant_id, objs_in=fee_rows, commit=False)
+        if installment_rows:
+            fee_installment_crud.bulk_create(db, tenant_id, objs_in=installment_rows, commit=False)
+        commit_or_defer(db)
+        return {"count": count, "skipped": len(enrollments) - count}
 
 student_fee = CRUDStudentFee(StudentFee)
@@ -9,6 +9,18 @@ from src.schemas.people.parent import ParentCreate, ParentUpdate
 class CRUDParent(TenantCRUDBase[Parent, ParentCreate, ParentUpdate]):
     """CRUD operations for Parent model."""
     
+    def create(self, db: Session, *, tenant_id: Any, obj_in: Union[ParentCreate, Dict[str, Any]], password_hash: str) -> Parent:
+        """Create a new parent; password_hash must already be computed (hashed off the event loop)."""
+        if isinstance(obj_in, dict):
+            create_data = obj_in.copy()
+        else:
+            create_data = obj_in.dict(exclude_unset=True)
+        
+        create_data['password_hash'] = password_hash
+        create_data.pop('password', None)  # Remove plain password
+        
+        return super().create(db=db, tenant_id=tenant_id, obj_in=create_data)
+    
     def get_by_student(self, db: Session, tenant_id: Any, student_id: Any) -> List[Parent]:
         """Get parents of a specific student within a tenant."""
         return db.query(Parent).join(
@@ -4,7 +4,6 @@ from sqlalchemy.orm import Session
 from src.db.crud.base import TenantCRUDBase
 from src.db.models.people import Student
 from src.schemas.people.student import StudentCreate, StudentUpdate
-from src.core.security.password import get_password_hash
 import secrets
 import string
 
@@ -93,8 +92,11 @@ class CRUDStudent(TenantCRUDBase[Student, StudentCreate, StudentUpdate]):
         
         return f"{prefix}{str(next_num).zfill(digits)}"
     
-    def create(self, db: Session, *, tenant_id: Any, obj_in: Union[StudentCreate, Dict[str, Any]]) -> Student:
-        """Create a new student with auto-generated admission number and password hashing."""
+    def create(self, db: Session, *, tenant_id: Any, obj_in: Union[StudentCreate, Dict[str, Any]], password_hash: str) -> Student:
+        """Create a new student with auto-generated admission number.
+
+        password_hash must already be computed (the services hash off the event loop).
+        """
         if isinstance(obj_in, dict):
             create_data = obj_in.copy()
         else:
@@ -104,26 +106,16 @@ class CRUDStudent(TenantCRUDBase[Student, StudentCreate, StudentUpdate]):
         if not create_data.get('admission_number'):
             create_data['admission_number'] = self.generate_admission_number(db, tenant_id)
         
-        # Handle password hashing
-        password = create_data.get('password')
-        if not password:  # Generate default password if not provided
-            password = generate_default_password()
-        
-        # Convert password to password_hash
-        create_data['password_hash'] = get_password_hash(password)
-        if 'password' in create_data:
-            del create_data['password']  # Remove plain password
+        create_data['password_hash'] = password_hash
+        create_data.pop('password', None)  # Remove plain password
         
         # Set first login flag
         create_data['is_first_login'] = True
         
-        # Store generated values for response
         created_student = super().create(db=db, tenant_id=tenant_id, obj_in=create_data)
         
         # Attach generated values to the student object for the response
-        if not obj_in.dict().get('password'):
-            created_student.generated_password = password
-        if not obj_in.dict().get('admission_number'):
+        if not (obj_in.get('admission_number') if isinstance(obj_in, dict) else obj_in.admission_number):
             created_student.generated_admission_number = create_data['admission_number']
             
         return created_student
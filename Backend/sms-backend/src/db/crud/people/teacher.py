@@ -5,7 +5,6 @@ from sqlalchemy import func, or_
 from src.db.crud.base import TenantCRUDBase
 from src.db.models.people import Teacher
 from src.schemas.people.teacher import TeacherCreate, TeacherUpdate
-from src.core.security.password import get_password_hash
 import secrets
 import string
 
@@ -63,8 +62,11 @@ class CRUDTeacher(TenantCRUDBase[Teacher, TeacherCreate, TeacherUpdate]):
         # Format with specified digits (e.g., TCH0001, TCH0002, etc.)
         return f"{prefix}{str(next_num).zfill(digits)}"
     
-    def create(self, db: Session, *, tenant_id: Any, obj_in: Union[TeacherCreate, Dict[str, Any]]) -> Teacher:
-        """Create a new teacher with auto-generated employee ID and password hashing."""
+    def create(self, db: Session, *, tenant_id: Any, obj_in: Union[TeacherCreate, Dict[str, Any]], password_hash: str) -> Teacher:
+        """Create a new teacher with auto-generated employee ID.
+
+        password_hash must already be computed (the services hash off the event loop).
+        """
         if isinstance(obj_in, dict):
             create_data = obj_in.copy()
         else:
@@ -74,15 +76,8 @@ class CRUDTeacher(TenantCRUDBase[Teacher, TeacherCreate, TeacherUpdate]):
         if not create_data.get('employee_id'):
             create_data['employee_id'] = self.generate_employee_id(db, tenant_id)
         
-        # Handle password hashing
-        password = create_data.get('password')
-        if not password:  # Generate default password if not provided
-            password = generate_default_password()
-        
-        # Convert password to password_hash
-        create_data['password_hash'] = get_password_hash(password)
-        if 'password' in create_data:
-            del create_data['password']  # Remove plain password
+        create_data['password_hash'] = password_hash
+        create_data.pop('password', None)  # Remove plain password
         
         # Set first login flag
         create_data['is_first_login'] = True
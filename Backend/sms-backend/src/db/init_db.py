@@ -7,6 +7,7 @@ from src.db.crud import permission as permission_crud
 from src.db.crud import user as user_crud
 from src.schemas.auth import UserRoleCreate, PermissionCreate, UserCreate
 from uuid import uuid4
+from src.core.security.password import get_password_hash
 
 def init_db(db):
     # Create super-admin role if it doesn't exist
@@ -61,7 +62,8 @@ def init_db(db):
                 last_name="Admin",
                 is_active=True,
                 tenant_id=system_tenant_id
-            )
+            ),
+            password_hash=get_password_hash("superadmin123")
         )
         print(f"Created super-admin with tenant_id: {system_tenant_id}")
     else:
@@ -86,6 +88,7 @@ def init_db(db):
                 last_name="User",
                 is_active=True,
                 tenant_id=test_tenant_id
-            )
+            ),
+            password_hash=get_password_hash("password123")
         )
         print(f"Created test user with tenant ID: {test_tenant_id}")
\ No newline at end of file
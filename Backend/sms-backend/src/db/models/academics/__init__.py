@@ -7,6 +7,7 @@ from src.db.models.academics.class_enrollment import ClassEnrollment
 from src.db.models.academics.enrollment import Enrollment
 from src.db.models.academics.exam import Exam
 from src.db.models.academics.grade import Grade
+from src.db.models.academics.grade_aggregate import GradeAggregate
 from src.db.models.academics.schedule import Schedule
 from src.db.models.academics.section import Section
 from src.db.models.academics.subject import Subject
@@ -30,6 +31,7 @@ __all__ = [
     "Enrollment",
     "Exam",
     "Grade",
+    "GradeAggregate",
     "Schedule",
     "Section",
     "Subject",
@@ -0,0 +1,71 @@
+import hashlib
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import Column, String, ForeignKey, Float, Integer, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.db.models.base import TenantModel
+
+
+def aggregate_id(
+    tenant_id: Any,
+    enrollment_id: Any,
+    subject_id: Optional[Any],
+    period_id: Optional[Any],
+    semester_id: Optional[Any],
+    grading_category_id: Optional[Any],
+    assessment_type: Any
+) -> uuid.UUID:
+    """Deterministic id of the aggregate bucket a grade falls into.
+
+    Must match the md5-based id computed in SQL by the rebuild
+    (see GRADE_AGGREGATE_ID_SQL in src/db/crud/academics/grade_aggregate.py).
+    """
+    parts = [tenant_id, enrollment_id, subject_id, period_id, semester_id, grading_category_id]
+    key = "|".join("" if part is None else str(part) for part in parts)
+    key += "|" + str(getattr(assessment_type, "value", assessment_type))
+    return uuid.UUID(hashlib.md5(key.encode()).hexdigest())
+
+
+class GradeAggregate(TenantModel):
+    """Running totals of grades per enrollment, subject, period/semester, grading category and assessment type.
+
+    Maintained in the same transaction as grade writes (see
+    src/db/crud/academics/grade_aggregate.py), so subject averages can be
+    read without scanning raw grades. Averages of percentages use
+    percentage_sum / grade_count; category scores use score_sum / max_score_sum.
+    Deleting a period or semester nulls it here as on grades; the delete
+    path rebuilds the tenant's buckets so the ids match again.
+    """
+
+    __tablename__ = "grade_aggregates"
+
+    enrollment_id = Column(UUID(as_uuid=True), ForeignKey("enrollments.id", ondelete="CASCADE"), nullable=False)
+    subject_id = Column(UUID(as_uuid=True), ForeignKey("subjects.id", ondelete="CASCADE"), nullable=True)
+    period_id = Column(UUID(as_uuid=True), ForeignKey("periods.id", ondelete="SET NULL"), nullable=True)
+    semester_id = Column(UUID(as_uuid=True), ForeignKey("semesters.id", ondelete="SET NULL"), nullable=True)
+    grading_category_id = Column(UUID(as_uuid=True), ForeignKey("grading_categories.id", ondelete="CASCADE"), nullable=True)
+    assessment_type = Column(String(20), nullable=False)
+
+    score_sum = Column(Float, nullable=False, default=0.0)
+    max_score_sum = Column(Float, nullable=False, default=0.0)
+    percentage_sum = Column(Float, nullable=False, default=0.0)
+    grade_count = Column(Integer, nullable=False, default=0)
+
+    # Relationships
+    enrollment = relationship("Enrollment")
+    subject = relationship("Subject")
+    period_obj = relationship("Period")
+
+    __table_args__ = (
+        Index('ix_grade_aggregates_tenant_enrollment_subject', 'tenant_id', 'enrollment_id', 'subject_id'),
+    )
+
+    @property
+    def average_percentage(self) -> Optional[float]:
+        return self.percentage_sum / self.grade_count if self.grade_count else None
+
+    def __repr__(self):
+        return f"<GradeAggregate {self.enrollment_id} {self.subject_id} {self.assessment_type} n={self.grade_count}>"
@@ -1,8 +1,11 @@
 import logging
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from src.core.config import settings
+from src.db.sql_tracker import current_tracker
 import contextvars
+import time
 from uuid import UUID
 from typing import Optional
 # Create a context variable to store tenant ID
@@ -57,6 +60,34 @@ def checkout(dbapi_connection, connection_record, connection_proxy):
 def checkin(dbapi_connection, connection_record):
     logger.debug("Database connection checked in")
 
+
+def register_sql_tracking(target_engine) -> None:
+    """Record each statement's duration on the active request's SQL tracker."""
+
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if current_tracker() is not None:
+            conn.info.setdefault("sql_tracker_start", []).append(time.perf_counter())
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        tracker = current_tracker()
+        starts = conn.info.get("sql_tracker_start")
+        if tracker is not None and starts:
+            tracker.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+    @event.listens_for(target_engine, "handle_error")
+    def handle_error(exception_context):
+        # Drop the start time of a failed statement so the stack stays balanced
+        conn = exception_context.connection
+        starts = conn.info.get("sql_tracker_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+
+if settings.SQL_TRACKING_ENABLED:
+    register_sql_tracking(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
@@ -64,4 +95,57 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_async_database_url(url: str) -> str:
+    """Translate a sync database URL into its asyncpg equivalent."""
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    if url.startswith("postgresql+psycopg2://"):
+        url = "postgresql://" + url[len("postgresql+psycopg2://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    return url
+
+
+# Async engine for services migrated to AsyncTenantBaseService. The sync engine
+# above stays the default until every service has moved over.
+try:
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL),
+        pool_size=settings.ASYNC_DB_POOL_SIZE,
+        max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+        pool_timeout=60,
+        pool_pre_ping=True,
+        pool_recycle=1800
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False
+    )
+    ASYNC_DB_AVAILABLE = True
+    if settings.SQL_TRACKING_ENABLED:
+        register_sql_tracking(async_engine.sync_engine)
+except Exception as e:
+    logger.warning(f"Async database engine unavailable (is asyncpg installed?): {e}")
+    async_engine = None
+    AsyncSessionLocal = None
+    ASYNC_DB_AVAILABLE = False
+
+
+async def get_async_db():
+    """Yield an AsyncSession for the current request."""
+    if not ASYNC_DB_AVAILABLE:
+        raise RuntimeError("Async database engine is not configured")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_super_admin_async_db():
+    """Get an async database session for super admin operations.
+    This session can access data across all tenants."""
+    async for db in get_async_db():
+        yield db
\ No newline at end of file
@@ -0,0 +1,72 @@
+import contextvars
+import hashlib
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Tracker for the request being served. Sync endpoints run in a threadpool with
+# a copy of the request context, so they see (and mutate) the same tracker.
+_current_tracker = contextvars.ContextVar("sql_tracker", default=None)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# Collapse literal IN lists and numbers so "IN (1, 2)" and "IN (3)" fingerprint alike
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"\b\d+\b")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so repeats with different parameters match."""
+    normalized = _WHITESPACE_RE.sub(" ", statement).strip()
+    normalized = _STRING_RE.sub("?", normalized)
+    normalized = _IN_LIST_RE.sub("IN (?)", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    return normalized
+
+
+class SQLTracker:
+    """Statement count, DB time and repeated fingerprints for one request."""
+
+    def __init__(self, n_plus_one_threshold: int = 5):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.count = 0
+        self.total_ms = 0.0
+        self._fingerprints: Counter = Counter()
+        self._samples: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        fp = fingerprint(statement)
+        key = hashlib.sha1(fp.encode()).hexdigest()[:12]
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+            self._fingerprints[key] += 1
+            self._samples.setdefault(key, fp)
+
+    def n_plus_one(self) -> List[Dict[str, Any]]:
+        """Fingerprints repeated at least n_plus_one_threshold times, most frequent first."""
+        with self._lock:
+            return [
+                {"fingerprint": key, "count": count, "statement": self._samples[key][:300]}
+                for key, count in self._fingerprints.most_common()
+                if count >= self.n_plus_one_threshold
+            ]
+
+    def server_timing(self) -> str:
+        """Value for the Server-Timing response header."""
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+def start_tracking(n_plus_one_threshold: int = 5) -> contextvars.Token:
+    """Begin tracking SQL for the current context; pass the token to stop_tracking."""
+    return _current_tracker.set(SQLTracker(n_plus_one_threshold))
+
+
+def stop_tracking(token: contextvars.Token) -> None:
+    _current_tracker.reset(token)
+
+
+def current_tracker() -> Optional[SQLTracker]:
+    return _current_tracker.get()
@@ -47,7 +47,7 @@ from src.schemas.academics.exam import (
 
 from .attendance import (
     Attendance, AttendanceCreate, AttendanceUpdate, AttendanceWithDetails,
-    AttendanceSummary, BulkAttendanceCreate, AttendanceReport
+    AttendanceSummary, BulkAttendanceCreate, AttendanceReport, AttendanceListResponse
 )
 from src.schemas.academics.grading_schema import (
     GradingSchema, GradingSchemaCreate, GradingSchemaUpdate,
@@ -45,6 +45,11 @@ class Attendance(AttendanceInDB):
     is_present: bool = Field(..., description="Whether student was present (including late/tardy)")
     duration_minutes: int = Field(0, description="Duration in minutes if check-in/out available")
 
+class AttendanceListResponse(BaseModel):
+    """Schema for a cursor page of attendance records."""
+    items: List[Attendance]
+    next_cursor: Optional[str] = None
+
 class AttendanceWithDetails(Attendance):
     """Schema for Attendance with student and class details."""
     student_name: str
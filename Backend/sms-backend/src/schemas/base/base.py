@@ -27,11 +27,13 @@ class TenantSchema(TimestampSchema):
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response schema."""
     items: List[T]
-    total: int
+    total: Optional[int] = None  # None in cursor mode when no count is taken
     skip: int
     limit: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
+    count_strategy: Optional[str] = None  # exact, cached or estimated
     
     class Config:
         from_attributes = True
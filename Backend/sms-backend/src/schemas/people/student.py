@@ -117,7 +117,8 @@ class StudentCreateResponse(Student):
 class StudentListResponse(BaseModel):
     """Schema for paginated student list."""
     items: List[Student]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 class StudentBulkDelete(BaseModel):
     """Schema for bulk student deletion."""
@@ -0,0 +1,153 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import Session, selectinload
+
+from src.core.config import settings
+from src.core.invalidation import listen_for_invalidations
+from src.core.tenant_scoped_cache import TenantScopedCache, track_stale_tenants
+from src.db.models.academics.period import Period
+from src.db.models.academics.semester import Semester
+
+# Redis pub/sub channel used to tell every worker to drop a tenant's calendars
+CALENDAR_INVALIDATION_CHANNEL = "academic-calendar:invalidate"
+
+# Period context used when a date falls outside every semester/period of a year with none defined
+DEFAULT_PERIOD_CONTEXT = {"name": "P1", "number": 1, "semester": 1, "period_id": None, "semester_id": None}
+
+
+@dataclass(frozen=True)
+class CalendarPeriod:
+    id: UUID
+    name: str
+    number: int
+    start_date: date
+    end_date: date
+
+
+@dataclass(frozen=True)
+class CalendarSemester:
+    id: UUID
+    number: int
+    start_date: date
+    end_date: date
+    periods: "IntervalIndex"
+
+
+class IntervalIndex:
+    """Date intervals sorted by start date, searched with bisect.
+
+    Intervals may overlap; a running maximum of end dates stops the backward
+    scan as soon as no earlier interval can still contain the date.
+    """
+
+    def __init__(self, items: Sequence[Any]):
+        self.items = sorted(items, key=lambda item: item.start_date)
+        self._starts = [item.start_date for item in self.items]
+        self._max_ends = []
+        max_end = None
+        for item in self.items:
+            max_end = item.end_date if max_end is None or item.end_date > max_end else max_end
+            self._max_ends.append(max_end)
+        self.first = min(items, key=lambda item: item.number) if items else None
+
+    def find(self, on: date) -> Optional[Any]:
+        """Latest-starting interval containing on, else None."""
+        i = bisect_right(self._starts, on) - 1
+        while i >= 0 and self._max_ends[i] >= on:
+            if self.items[i].end_date >= on:
+                return self.items[i]
+            i -= 1
+        return None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class AcademicCalendarIndex:
+    """An academic year's semesters and periods, for date lookups without queries."""
+
+    def __init__(self, academic_year_id: Any, semesters: List[CalendarSemester]):
+        self.academic_year_id = academic_year_id
+        self.semesters = IntervalIndex(semesters)
+
+    @classmethod
+    def load(cls, db: Session, academic_year_id: Any) -> "AcademicCalendarIndex":
+        rows = db.query(Semester).options(selectinload(Semester.periods)).filter(
+            Semester.academic_year_id == academic_year_id
+        ).all()
+        return cls(academic_year_id, [
+            CalendarSemester(
+                id=s.id,
+                number=s.semester_number,
+                start_date=s.start_date,
+                end_date=s.end_date,
+                periods=IntervalIndex([
+                    CalendarPeriod(id=p.id, name=p.name, number=p.period_number, start_date=p.start_date, end_date=p.end_date)
+                    for p in s.periods
+                ])
+            )
+            for s in rows
+        ])
+
+    def semester_for(self, on: date) -> Optional[CalendarSemester]:
+        """Semester containing on, falling back to the first semester of the year."""
+        return self.semesters.find(on) or self.semesters.first
+
+    def period_for(self, on: date, semester: Optional[CalendarSemester] = None) -> Optional[CalendarPeriod]:
+        """Period of semester (default: semester_for(on)) containing on, falling back to its first period."""
+        semester = semester or self.semester_for(on)
+        if semester is None:
+            return None
+        return semester.periods.find(on) or semester.periods.first
+
+    def period_context(self, on: Optional[date]) -> Dict[str, Any]:
+        """Period name, number, semester number and ids for a date, as stored on grades."""
+        semester = self.semester_for(on) if on else None
+        if semester is None:
+            return dict(DEFAULT_PERIOD_CONTEXT)
+        period = self.period_for(on, semester)
+        if period is None:
+            return {**DEFAULT_PERIOD_CONTEXT, "semester": semester.number, "semester_id": semester.id}
+        return {
+            "name": period.name,
+            "number": period.number,
+            "semester": semester.number,
+            "period_id": period.id,
+            "semester_id": semester.id
+        }
+
+
+# Calendar indexes per (tenant, academic year) for this worker, dropped per
+# tenant when semesters or periods are committed
+calendar_cache: TenantScopedCache[AcademicCalendarIndex] = TenantScopedCache(
+    max_entries=settings.ACADEMIC_CALENDAR_CACHE_MAX_ENTRIES,
+    ttl=settings.ACADEMIC_CALENDAR_CACHE_TTL_SECONDS,
+)
+
+
+def get_academic_calendar(db: Session, tenant_id: Any, academic_year_id: Any) -> AcademicCalendarIndex:
+    """Calendar index for an academic year, built once per worker and reused until invalidated."""
+    return calendar_cache.get_or_load(
+        (str(tenant_id), str(academic_year_id)),
+        lambda: AcademicCalendarIndex.load(db, academic_year_id)
+    )
+
+
+# mark_calendar_stale(db, tenant_id): drop the tenant's calendars when db commits
+# (for writes the flush hook cannot see)
+mark_calendar_stale = track_stale_tenants(
+    calendar_cache, (Semester, Period), CALENDAR_INVALIDATION_CHANNEL, "academic_calendar_stale_tenants"
+)
+
+
+async def listen_for_calendar_invalidations() -> None:
+    """Drop tenants' calendars as other workers commit changes; runs for the app's lifetime."""
+    await listen_for_invalidations(
+        CALENDAR_INVALIDATION_CHANNEL,
+        calendar_cache.invalidate_tenant,
+        on_reset=calendar_cache.clear
+    )
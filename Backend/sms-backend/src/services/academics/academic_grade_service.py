@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from src.db.crud.academics import academic_grade as academic_grade_crud
 from src.db.models.academics.academic_grade import AcademicGrade
-from src.schemas.academics.academic_grade import AcademicGradeCreate, AcademicGradeUpdate
+from src.schemas.academics.academic_grade import AcademicGradeCreate, AcademicGradeUpdate, AcademicGrade as AcademicGradeSchema
 from src.services.base.base import TenantBaseService, SuperAdminBaseService
 from src.core.exceptions.business import EntityNotFoundError, DuplicateEntityError
 from src.db.session import get_db, get_super_admin_db
@@ -18,9 +18,13 @@ from src.core.redis import cache
 from sqlalchemy import delete
 from src.db.models.academics.promotion_criteria import PromotionCriteria
 
+# Generation namespace shared by every cached academic grade lookup
+ACADEMIC_GRADES_NAMESPACE = "academic_grades"
 
 class AcademicGradeService(TenantBaseService[AcademicGrade, AcademicGradeCreate, AcademicGradeUpdate]):
     """Service for managing academic grades within a tenant."""
+
+    data_version = ACADEMIC_GRADES_NAMESPACE
     
     def __init__(
         self,
@@ -31,32 +35,27 @@ class AcademicGradeService(TenantBaseService[AcademicGrade, AcademicGradeCreate,
         tenant_id = tenant.id if hasattr(tenant, 'id') else tenant
         super().__init__(crud=academic_grade_crud, model=AcademicGrade, tenant_id=tenant_id, db=db)
 
-    @cached(prefix="academic_grades:get", expire=600)
-    async def get(self, id: Any) -> Optional[AcademicGrade]:
+    @cached(prefix="academic_grades:get", expire=600, namespace=ACADEMIC_GRADES_NAMESPACE, schema=AcademicGradeSchema)
+    async def get(self, id: Any) -> Optional[AcademicGradeSchema]:
         """Get a specific academic grade (Cached)."""
         return await super().get(id=id)
 
     async def update(self, id: Any, obj_in: Union[AcademicGradeUpdate, Dict[str, Any]]) -> Optional[AcademicGrade]:
         """Update an academic grade and invalidate cache."""
-        result = await super().update(id=id, obj_in=obj_in)
-        if result:
-            await cache.delete(f"academic_grades:get:id={id}:tenant={self.tenant_id}")
-            await cache.delete_pattern(f"academic_grades:list*:tenant={self.tenant_id}")
-            await cache.delete_pattern(f"academic_grades:active*:tenant={self.tenant_id}")
-        return result
+        return await super().update(id=id, obj_in=obj_in)
     
-    @cached(prefix="academic_grades:name", expire=600)
-    async def get_by_name(self, name: str) -> Optional[AcademicGrade]:
+    @cached(prefix="academic_grades:name", expire=600, namespace=ACADEMIC_GRADES_NAMESPACE, schema=AcademicGradeSchema)
+    async def get_by_name(self, name: str) -> Optional[AcademicGradeSchema]:
         """Get an academic grade by name."""
         return academic_grade_crud.get_by_name(self.db, tenant_id=self.tenant_id, name=name)
     
-    @cached(prefix="academic_grades:active", expire=600)
-    async def get_active_grades(self, skip: int = 0, limit: int = 100) -> List[AcademicGrade]:
+    @cached(prefix="academic_grades:active", expire=600, namespace=ACADEMIC_GRADES_NAMESPACE, schema=AcademicGradeSchema)
+    async def get_active_grades(self, skip: int = 0, limit: int = 100) -> List[AcademicGradeSchema]:
         """Get all active academic grades."""
         return academic_grade_crud.get_active_grades(self.db, tenant_id=self.tenant_id, skip=skip, limit=limit)
 
-    @cached(prefix="academic_grades:list", expire=600)
-    async def list(self, *, skip: int = 0, limit: int = 100, filters: Dict = {}) -> List[AcademicGrade]:
+    @cached(prefix="academic_grades:list", expire=600, namespace=ACADEMIC_GRADES_NAMESPACE, schema=AcademicGradeSchema)
+    async def list(self, *, skip: int = 0, limit: int = 100, filters: Dict = {}) -> List[AcademicGradeSchema]:
         """List records with tenant filtering and caching."""
         return await super().list(skip=skip, limit=limit, filters=filters)
     
@@ -67,11 +66,7 @@ class AcademicGradeService(TenantBaseService[AcademicGrade, AcademicGradeCreate,
         if existing:
             raise DuplicateEntityError("AcademicGrade", "name", obj_in.name)
         
-        # Invalidate list caches (using pattern to catch all arg variations)
-        await cache.delete_pattern(f"academic_grades:list*:tenant={self.tenant_id}")
-        await cache.delete_pattern(f"academic_grades:active*:tenant={self.tenant_id}")
-        
-        # Create the academic grade
+        # Create the academic grade (the base class invalidates cached lookups)
         return await super().create(obj_in=obj_in)
 
     async def delete(self, id: Any) -> Optional[AcademicGrade]:
@@ -113,13 +108,14 @@ class AcademicGradeService(TenantBaseService[AcademicGrade, AcademicGradeCreate,
         # Flush to ensure criteria/sections are gone before grade deletion triggers constraint check
         self.db.flush()
 
-        # 3. Invalidate caches
-        await cache.delete(f"academic_grades:get:id={id}:tenant={self.tenant_id}")
-        await cache.delete_pattern(f"academic_grades:list*:tenant={self.tenant_id}")
-        await cache.delete_pattern(f"academic_grades:active*:tenant={self.tenant_id}")
+        # 3. Perform the actual grade deletion (the base class invalidates cached lookups)
+        result = await super().delete(id=id)
 
-        # 4. Perform the actual grade deletion
-        return await super().delete(id=id)
+        # 4. The grade's sections went with it
+        if section_ids:
+            from src.services.academics.section_service import SectionService
+            await cache.invalidate_namespace(SectionService.data_version, self.tenant_id)
+        return result
 
 
 class SuperAdminAcademicGradeService(SuperAdminBaseService[AcademicGrade, AcademicGradeCreate, AcademicGradeUpdate]):
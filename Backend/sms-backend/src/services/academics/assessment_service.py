@@ -13,7 +13,7 @@ from src.schemas.academics.assessment import AssessmentCreate, AssessmentUpdate
 from src.services.academics.grading_service import GradingService
 from src.core.exceptions.business import BusinessRuleViolationError, EntityNotFoundError
 
-from src.schemas.auth import User
+from src.core.security.principal import Principal
 
 class AssessmentService(TenantBaseService[Assessment, AssessmentCreate, AssessmentUpdate]):
     def __init__(self, tenant: Any = Depends(get_tenant_from_request), db: Session = Depends(get_db)):
@@ -21,9 +21,9 @@ class AssessmentService(TenantBaseService[Assessment, AssessmentCreate, Assessme
         self.grading_service = GradingService(db, tenant_id)
         super().__init__(crud=assessment_crud, model=Assessment, tenant_id=tenant_id, db=db)
 
-    def _apply_rbac_filter(self, query: Any, current_user: User) -> Any:
+    def _apply_rbac_filter(self, query: Any, principal: Principal) -> Any:
         """Apply RBAC filters to the assessment query."""
-        user_roles = {role.name for role in current_user.roles}
+        user_roles = principal.roles
         
         # Admin, Principal, Dean can see everything
         if any(role in ["admin", "super-admin", "principal", "dean"] for role in user_roles):
@@ -33,7 +33,7 @@ class AssessmentService(TenantBaseService[Assessment, AssessmentCreate, Assessme
         if "teacher" in user_roles:
             # For now, simplify to assessments they created. 
             # In a more complex system, we'd join with ClassSubject or ClassTeacher.
-            return query.filter(Assessment.teacher_id == current_user.id)
+            return query.filter(Assessment.teacher_id == principal.user_id)
             
         # Student can see assessments for classes they are enrolled in
         if "student" in user_roles:
@@ -44,14 +44,14 @@ class AssessmentService(TenantBaseService[Assessment, AssessmentCreate, Assessme
                 ((Assessment.section_id == None) | (Enrollment.section_id == Assessment.section_id)) &
                 (Enrollment.academic_year_id == Assessment.academic_year_id)
             ).filter(
-                Enrollment.student_id == current_user.id,
+                Enrollment.student_id == principal.user_id,
                 Enrollment.is_active == True
             )
             
         # Default: No access if no recognized role
         return query.filter(Assessment.id == None)
 
-    async def list_assessments(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, current_user: User) -> List[Assessment]:
+    async def list_assessments(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, principal: Principal) -> List[Assessment]:
         """List assessments with RBAC filtering."""
         query = self.db.query(Assessment).filter(Assessment.tenant_id == self.tenant_id)
         
@@ -72,40 +72,40 @@ class AssessmentService(TenantBaseService[Assessment, AssessmentCreate, Assessme
                     query = query.filter(getattr(Assessment, field) == value)
         
         # Apply RBAC
-        query = self._apply_rbac_filter(query, current_user)
+        query = self._apply_rbac_filter(query, principal)
         
         return query.offset(skip).limit(limit).all()
 
-    async def get_assessment(self, id: UUID, current_user: User) -> Optional[Assessment]:
+    async def get_assessment(self, id: UUID, principal: Principal) -> Optional[Assessment]:
         """Get a single assessment with RBAC check."""
         query = self.db.query(Assessment).filter(Assessment.id == id, Assessment.tenant_id == self.tenant_id)
-        query = self._apply_rbac_filter(query, current_user)
+        query = self._apply_rbac_filter(query, principal)
         return query.first()
 
-    async def update_assessment(self, id: UUID, obj_in: AssessmentUpdate, current_user: User) -> Assessment:
+    async def update_assessment(self, id: UUID, obj_in: AssessmentUpdate, principal: Principal) -> Assessment:
         """Update assessment with RBAC check (Owner or Admin)."""
         assessment = await self.get(id=id)
         if not assessment:
             raise EntityNotFoundError("Assessment", id)
             
-        user_roles = {role.name for role in current_user.roles}
+        user_roles = principal.roles
         is_admin = any(role in ["admin", "super-admin", "principal", "dean"] for role in user_roles)
         
-        if not is_admin and assessment.teacher_id != current_user.id:
+        if not is_admin and assessment.teacher_id != principal.user_id:
             raise BusinessRuleViolationError("You can only update your own assessments.")
             
         return await self.update(id=id, obj_in=obj_in)
 
-    async def delete_assessment(self, id: UUID, current_user: User):
+    async def delete_assessment(self, id: UUID, principal: Principal):
         """Delete assessment with RBAC check (Owner or Admin)."""
         assessment = await self.get(id=id)
         if not assessment:
             raise EntityNotFoundError("Assessment", id)
             
-        user_roles = {role.name for role in current_user.roles}
+        user_roles = principal.roles
         is_admin = any(role in ["admin", "super-admin", "principal", "dean"] for role in user_roles)
         
-        if not is_admin and assessment.teacher_id != current_user.id:
+        if not is_admin and assessment.teacher_id != principal.user_id:
             raise BusinessRuleViolationError("You can only delete your own assessments.")
             
         await self.delete(id=id)
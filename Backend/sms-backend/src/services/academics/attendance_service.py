@@ -20,6 +20,7 @@ from src.db.crud.academics.schedule_crud import schedule_crud
 from src.db.crud.academics.academic_year_crud import academic_year_crud
 from src.db.crud.academics.grade import grade as grade_crud
 from src.db.models.academics.grade import Grade, GradeType
+from src.utils.uuid_utils import ensure_uuid
 
 class AttendanceService(TenantBaseService[Attendance, AttendanceCreate, AttendanceUpdate]):
     """Service for managing attendance within a tenant."""
@@ -64,27 +65,15 @@ class AttendanceService(TenantBaseService[Attendance, AttendanceCreate, Attendan
             self.db, self.tenant_id, schedule_id, attendance_date
         )
     
-    # Daily Attendance Management
-    async def mark_daily_attendance(
-        self, 
-        student_id: UUID,
+    def _validate_marking_context(
+        self,
         class_id: UUID,
         academic_year_id: UUID,
-        status: AttendanceStatus,
         marked_by: UUID,
         schedule_id: Optional[UUID] = None,
-        attendance_date: Optional[date] = None,
-        check_in_time: Optional[datetime] = None,
-        check_out_time: Optional[datetime] = None,
-        comments: Optional[str] = None,
         period: Optional[str] = None
-    ) -> Attendance:
-        if attendance_date is None:
-            attendance_date = date.today()
-        # Validate entities
-        student = student_crud.get_by_id(self.db, tenant_id=self.tenant_id, id=student_id)
-        if not student:
-            raise EntityNotFoundError("Student", student_id)
+    ) -> None:
+        """Validate the class, schedule/period, academic year and marker for an attendance sheet."""
         cls = class_crud.get_by_id(self.db, tenant_id=self.tenant_id, id=class_id)
         if not cls:
             raise EntityNotFoundError("Class", class_id)
@@ -118,6 +107,29 @@ class AttendanceService(TenantBaseService[Attendance, AttendanceCreate, Attendan
             if user and not any(role.name in ["admin", "super_admin"] for role in getattr(user, "roles", [])):
                 raise BusinessRuleViolationError("Only the section sponsor or an administrator can mark attendance.")
 
+    # Daily Attendance Management
+    async def mark_daily_attendance(
+        self, 
+        student_id: UUID,
+        class_id: UUID,
+        academic_year_id: UUID,
+        status: AttendanceStatus,
+        marked_by: UUID,
+        schedule_id: Optional[UUID] = None,
+        attendance_date: Optional[date] = None,
+        check_in_time: Optional[datetime] = None,
+        check_out_time: Optional[datetime] = None,
+        comments: Optional[str] = None,
+        period: Optional[str] = None
+    ) -> Attendance:
+        if attendance_date is None:
+            attendance_date = date.today()
+        # Validate entities
+        student = student_crud.get_by_id(self.db, tenant_id=self.tenant_id, id=student_id)
+        if not student:
+            raise EntityNotFoundError("Student", student_id)
+        self._validate_marking_context(class_id, academic_year_id, marked_by, schedule_id, period)
+
         # Check if attendance already exists
         existing = await self.get_by_student_and_date(student_id, attendance_date, class_id)
         if existing:
@@ -145,27 +157,46 @@ class AttendanceService(TenantBaseService[Attendance, AttendanceCreate, Attendan
         self, 
         attendance_in: BulkAttendanceCreate
     ) -> List[Attendance]:
-        """Bulk mark attendance with upsert logic."""
-        results = []
-        student_ids = set()
-        
-        for record in attendance_in.attendances:
-            student_id = record['student_id']
-            status = record['status']
-            student_ids.add(student_id)
-            
-            # Use the mark_daily_attendance logic which handles upsert via update_attendance_status
-            att = await self.mark_daily_attendance(
-                student_id=student_id,
-                class_id=attendance_in.class_id,
-                schedule_id=attendance_in.schedule_id,
-                academic_year_id=attendance_in.academic_year_id,
-                status=status,
-                marked_by=attendance_in.marked_by,
-                attendance_date=attendance_in.date,
-                period=attendance_in.period
-            )
-            results.append(att)
+        """Bulk mark attendance with upsert logic.
+        Validates the sheet once and writes every row in a single INSERT ... ON CONFLICT."""
+        self._validate_marking_context(
+            attendance_in.class_id,
+            attendance_in.academic_year_id,
+            attendance_in.marked_by,
+            attendance_in.schedule_id,
+            attendance_in.period
+        )
+
+        student_ids = {ensure_uuid(record['student_id']) for record in attendance_in.attendances}
+        found_ids = {
+            row.id for row in self.db.query(student_crud.model.id).filter(
+                student_crud.model.tenant_id == self.tenant_id,
+                student_crud.model.id.in_(student_ids)
+            ).all()
+        }
+        missing = student_ids - found_ids
+        if missing:
+            raise EntityNotFoundError("Student", next(iter(missing)))
+
+        marked_at = datetime.utcnow()
+        attendance_date = attendance_in.date or date.today()
+        rows = [
+            {
+                "student_id": ensure_uuid(record['student_id']),
+                "class_id": attendance_in.class_id,
+                "schedule_id": attendance_in.schedule_id,
+                "academic_year_id": attendance_in.academic_year_id,
+                "date": attendance_date,
+                "status": AttendanceStatus(getattr(record['status'], "value", record['status'])),
+                "period": attendance_in.period,
+                "marked_by": attendance_in.marked_by,
+                "marked_at": marked_at,
+            }
+            for record in attendance_in.attendances
+        ]
+        # ON CONFLICT cannot touch the same row twice in one statement; last entry wins
+        rows = list({row["student_id"]: row for row in rows}.values())
+        results = attendance_crud.bulk_upsert_attendance(self.db, self.tenant_id, rows)
         
         # Sync attendance to grade model for all affected students
         for sid in student_ids:
@@ -279,6 +310,41 @@ class AttendanceService(TenantBaseService[Attendance, AttendanceCreate, Attendan
             status_filter=status_filter,
         )
 
+    def get_multi_with_cursor(
+        self,
+        *,
+        after: Optional[str] = None,
+        limit: int = 100,
+        student_id: Optional[UUID] = None,
+        class_id: Optional[UUID] = None,
+        schedule_id: Optional[UUID] = None,
+        academic_year_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status_filter: Optional[Any] = None,
+    ) -> tuple[List[Attendance], Optional[str]]:
+        """Keyset-paginated variant of get_multi, returning (items, next_cursor)."""
+        if status_filter is not None:
+            try:
+                normalized = getattr(status_filter, "value", status_filter)
+                status_filter = AttendanceStatus(normalized)
+            except Exception:
+                status_filter = None
+
+        return attendance_crud.get_multi_with_cursor(
+            self.db,
+            self.tenant_id,
+            after=after,
+            limit=limit,
+            student_id=student_id,
+            class_id=class_id,
+            schedule_id=schedule_id,
+            academic_year_id=academic_year_id,
+            start_date=start_date,
+            end_date=end_date,
+            status_filter=status_filter,
+        )
+
     
     async def generate_attendance_report(
         self, 
@@ -19,6 +19,7 @@ from src.db.models.academics.enrollment import Enrollment as MainEnrollment
 from src.db.crud.people import student as student_crud
 from src.db.crud.academics.class_crud import class_crud
 from src.db.crud.academics.academic_year_crud import academic_year_crud
+from src.db.crud.base.unit_of_work import commit_or_defer, in_unit_of_work
 from src.schemas.academics.class_enrollment import (
     ClassEnrollmentCreate,
     ClassEnrollmentUpdate,
@@ -116,12 +117,18 @@ class ClassEnrollmentService:
             is_active=True,
         )
         try:
+            if in_unit_of_work(self.db):
+                # Savepoint so a duplicate does not abort the enclosing transaction
+                with self.db.begin_nested():
+                    self.db.add(enroll)
+                return enroll
             self.db.add(enroll)
             self.db.commit()
             self.db.refresh(enroll)
             return enroll
         except IntegrityError:
-            self.db.rollback()
+            if not in_unit_of_work(self.db):
+                self.db.rollback()
             # UniqueConstraint('student_id', 'class_id', 'academic_year_id')
             raise DuplicateEntityError("ClassEnrollment", "unique_student_class_year", "duplicate")
 
@@ -167,8 +174,7 @@ class ClassEnrollmentService:
             setattr(enroll, field, value)
 
         self.db.add(enroll)
-        self.db.commit()
-        self.db.refresh(enroll)
+        commit_or_defer(self.db, enroll)
         return enroll
 
     async def remove(self, *, id: UUID) -> Optional[ClassEnrollment]:
@@ -176,7 +182,7 @@ class ClassEnrollmentService:
         if not enroll:
             return None
         self.db.delete(enroll)
-        self.db.commit()
+        commit_or_defer(self.db)
         return enroll
 
     async def drop_student_from_class(self, *, enrollment_id: UUID, drop_date: Optional[date] = None) -> ClassEnrollment:
@@ -188,8 +194,7 @@ class ClassEnrollmentService:
 
         enroll.drop_class(drop_date=drop_date)
         self.db.add(enroll)
-        self.db.commit()
-        self.db.refresh(enroll)
+        commit_or_defer(self.db, enroll)
         return enroll
 
     async def complete_student_enrollment(self, *, enrollment_id: UUID, completion_date: Optional[date] = None) -> ClassEnrollment:
@@ -199,8 +204,7 @@ class ClassEnrollmentService:
 
         enroll.complete_class(completion_date=completion_date)
         self.db.add(enroll)
-        self.db.commit()
-        self.db.refresh(enroll)
+        commit_or_defer(self.db, enroll)
         return enroll
 
     async def reactivate_enrollment(self, *, enrollment_id: UUID) -> ClassEnrollment:
@@ -212,8 +216,7 @@ class ClassEnrollmentService:
 
         enroll.reactivate()
         self.db.add(enroll)
-        self.db.commit()
-        self.db.refresh(enroll)
+        commit_or_defer(self.db, enroll)
         return enroll
 
     async def get_students_in_class(
@@ -9,7 +9,7 @@ from src.db.crud.academics.section import section
 from src.db.crud.people import student as student_crud
 from src.db.models.academics.enrollment import Enrollment
 from src.db.models.academics.class_enrollment import ClassEnrollment
-from src.schemas.academics.enrollment import EnrollmentCreate, EnrollmentUpdate
+from src.schemas.academics.enrollment import EnrollmentCreate, EnrollmentUpdate, Enrollment as EnrollmentSchema
 from src.services.base.base import TenantBaseService, SuperAdminBaseService
 from src.core.exceptions.business import (
     EntityNotFoundError, 
@@ -35,8 +35,8 @@ class EnrollmentService(TenantBaseService[Enrollment, EnrollmentCreate, Enrollme
         tenant_id = tenant.id if hasattr(tenant, 'id') else tenant
         super().__init__(crud=enrollment_crud, model=Enrollment, tenant_id=tenant_id, db=db)
     
-    @cached(prefix="enrollments:get", expire=300)
-    async def get(self, id: Any) -> Optional[Enrollment]:
+    @cached(prefix="enrollments:get", expire=300, schema=EnrollmentSchema)
+    async def get(self, id: Any) -> Optional[EnrollmentSchema]:
         """Get a specific enrollment (Cached)."""
         return await super().get(id=id)
     
@@ -44,13 +44,17 @@ class EnrollmentService(TenantBaseService[Enrollment, EnrollmentCreate, Enrollme
         """Update an enrollment and invalidate caches."""
         result = await super().update(id=id, obj_in=obj_in)
         if result:
-            await cache.delete(f"enrollments:get:id={id}:tenant={self.tenant_id}")
-            await cache.delete(f"enrollments:multi:tenant={self.tenant_id}")
-            await cache.delete(f"enrollments:active:student_id={result.student_id}:tenant={self.tenant_id}")
+            await self._invalidate_cached(result)
         return result
+
+    async def _invalidate_cached(self, enrollment: Any) -> None:
+        """Drop the cached get/active lookups for an enrollment after a write."""
+        await cache.delete(f"enrollments:get:id={enrollment.id}:tenant={self.tenant_id}")
+        await cache.delete(f"enrollments:multi:tenant={self.tenant_id}")
+        await cache.delete(f"enrollments:active:student_id={enrollment.student_id}:tenant={self.tenant_id}")
     
-    @cached(prefix="enrollments:active", expire=300)
-    async def get_active_enrollment(self, student_id: UUID) -> Optional[Enrollment]:
+    @cached(prefix="enrollments:active", expire=300, schema=EnrollmentSchema)
+    async def get_active_enrollment(self, student_id: UUID) -> Optional[EnrollmentSchema]:
         """Get a student's active enrollment (Cached)."""
         return enrollment_crud.get_active_enrollment(
             self.db, tenant_id=self.tenant_id, student_id=student_id
@@ -207,6 +211,8 @@ class EnrollmentService(TenantBaseService[Enrollment, EnrollmentCreate, Enrollme
                  self.db.add(student)
                  self.db.commit()
 
+        if updated_enrollment:
+            await self._invalidate_cached(updated_enrollment)
         return updated_enrollment
     
 
@@ -258,38 +264,9 @@ class EnrollmentService(TenantBaseService[Enrollment, EnrollmentCreate, Enrollme
         ).delete(synchronize_session=False)
         self.db.commit()
         
-        return self.crud.remove(self.db, self.tenant_id, id=id)
-
-
-class SuperAdminEnrollmentService(SuperAdminBaseService[Enrollment, EnrollmentCreate, EnrollmentUpdate]):
-    """Super-admin service for managing enrollments across all tenants."""
-    
-    def __init__(self, *args, **kwargs):
-        super().__init__(crud=enrollment_crud, model=Enrollment, *args, **kwargs)
-    
-    async def get_all_enrollments(self, skip: int = 0, limit: int = 100,
-                          academic_year: Optional[str] = None,
-                          grade: Optional[str] = None,
-                          section: Optional[str] = None,
-                          status: Optional[str] = None,
-                          tenant_id: Optional[UUID] = None) -> List[Enrollment]:
-        """Get all enrollments across all tenants with filtering."""
-        query = self.db.query(Enrollment)
-        
-        # Apply filters
-        if academic_year:
-            query = query.filter(Enrollment.academic_year == academic_year)
-        if grade:
-            query = query.filter(Enrollment.grade == grade)
-        if section:
-            query = query.filter(Enrollment.section == section)
-        if status:
-            query = query.filter(Enrollment.status == status)
-        if tenant_id:
-            query = query.filter(Enrollment.tenant_id == tenant_id)
-        
-        # Apply pagination
-        return query.offset(skip).limit(limit).all()
+        result = self.crud.remove(self.db, self.tenant_id, id=id)
+        await self._invalidate_cached(db_obj)
+        return result
 
     async def update_semester_status(
         self,
@@ -300,7 +277,8 @@ class SuperAdminEnrollmentService(SuperAdminBaseService[Enrollment, EnrollmentCr
         completion_date: Optional[date] = None
     ) -> Enrollment:
         """Update semester status and optional completion date."""
-        enrollment = await self.get(id=id)
+        # The ORM row, not the cached schema returned by self.get()
+        enrollment = self.crud.get_by_id(self.db, tenant_id=self.tenant_id, id=id)
         if not enrollment:
             raise EntityNotFoundError("Enrollment", id)
 
@@ -321,6 +299,37 @@ class SuperAdminEnrollmentService(SuperAdminBaseService[Enrollment, EnrollmentCr
             if status == "completed":
                 payload["semester_2_completion_date"] = completion_date or date.today()
 
-        # Persist via base update
-        return await self.crud.update(self.db, self.tenant_id, db_obj=enrollment, obj_in=payload)
+        result = self.crud.update(self.db, self.tenant_id, db_obj=enrollment, obj_in=payload)
+        await self._invalidate_cached(result)
+        return result
 
+
+class SuperAdminEnrollmentService(SuperAdminBaseService[Enrollment, EnrollmentCreate, EnrollmentUpdate]):
+    """Super-admin service for managing enrollments across all tenants."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(crud=enrollment_crud, model=Enrollment, *args, **kwargs)
+    
+    async def get_all_enrollments(self, skip: int = 0, limit: int = 100,
+                          academic_year: Optional[str] = None,
+                          grade: Optional[str] = None,
+                          section: Optional[str] = None,
+                          status: Optional[str] = None,
+                          tenant_id: Optional[UUID] = None) -> List[Enrollment]:
+        """Get all enrollments across all tenants with filtering."""
+        query = self.db.query(Enrollment)
+        
+        # Apply filters
+        if academic_year:
+            query = query.filter(Enrollment.academic_year == academic_year)
+        if grade:
+            query = query.filter(Enrollment.grade == grade)
+        if section:
+            query = query.filter(Enrollment.section == section)
+        if status:
+            query = query.filter(Enrollment.status == status)
+        if tenant_id:
+            query = query.filter(Enrollment.tenant_id == tenant_id)
+        
+        # Apply pagination
+        return query.offset(skip).limit(limit).all()
@@ -1,12 +1,14 @@
 from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
 from sqlalchemy import String
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from uuid import UUID
 from datetime import date
 from fastapi import Depends
 
 from src.db.crud.academics import grade as grade_crud
 from src.db.crud.academics import subject as subject_crud
+from src.db.crud.academics.grade_aggregate import grade_aggregate
 from src.db.crud.people import student as student_crud
 from src.db.models.academics.grade import Grade, GradeType
 from src.schemas.academics.grade import GradeCreate, GradeUpdate
@@ -18,7 +20,8 @@ from src.core.exceptions.business import (
     BusinessRuleViolationError
 )
 # Promotion and Attendance integration
-from src.services.academics.promotion_criteria_service import PromotionCriteriaService
+from src.services.academics.academic_calendar import get_academic_calendar
+from src.services.academics.grading_context import get_grading_context
 from src.services.academics.attendance_service import AttendanceService
 from src.db.crud.academics.academic_year_crud import academic_year_crud
 from src.db.crud.tenant.tenant_settings import tenant_settings as tenant_settings_crud
@@ -171,30 +174,45 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
                 if hasattr(obj_in, 'semester_id'):
                     obj_in.semester_id = ctx["semester_id"]
 
-        grades = grade_crud.bulk_create_grades(self.db, tenant_id=self.tenant_id, obj_in_list=obj_in_list)
+        # Grades and their submission sync commit together, once
+        with self.unit_of_work():
+            grades = grade_crud.bulk_create_grades(self.db, tenant_id=self.tenant_id, obj_in_list=obj_in_list)
+            self._sync_assignment_submissions(grades)
+            
+        return grades
+
+    def _sync_assignment_submissions(self, grades: List[Grade]) -> None:
+        """Mirror assignment grades onto Submissions so they show on the student dashboard/assignments list.
         
-        # Sync with Submissions for assignments to ensure visibility on student dashboard/assignments list
+        Runs in a savepoint: a failure here is logged and rolled back without failing the grades.
+        """
+        from sqlalchemy import tuple_
+        from src.db.models.academics.submission import Submission
+        from datetime import datetime
+
+        assignment_grades = [g for g in grades if g.assessment_type == GradeType.ASSIGNMENT]
+        if not assignment_grades:
+            return
+
         try:
-            from src.db.models.academics.submission import Submission
-            from src.db.crud.academics.submission import submission as submission_crud
-            from datetime import datetime
-
-            for grade in grades:
-                if grade.assessment_type == GradeType.ASSIGNMENT:
-                    # Check if submission already exists
-                    existing_sub = submission_crud.get_by_assignment_and_student(
-                        self.db, 
-                        assignment_id=grade.assessment_id, 
-                        student_id=grade.student_id, 
-                        tenant_id=self.tenant_id
-                    )
-                    
+            with self.db.begin_nested():
+                # One lookup for every existing submission instead of one per grade
+                pairs = {(g.assessment_id, g.student_id) for g in assignment_grades}
+                existing_subs = {
+                    (sub.assignment_id, sub.student_id): sub
+                    for sub in self.db.query(Submission).filter(
+                        Submission.tenant_id == self.tenant_id,
+                        tuple_(Submission.assignment_id, Submission.student_id).in_(list(pairs))
+                    ).all()
+                }
+
+                for grade in assignment_grades:
+                    existing_sub = existing_subs.get((grade.assessment_id, grade.student_id))
                     if existing_sub:
                         # Update status and score
                         existing_sub.score = grade.score
                         existing_sub.status = "GRADED"
                         existing_sub.feedback = grade.comments
-                        self.db.add(existing_sub)
                     else:
                         # Create a "pseudo-submission" so it shows up in the student list
                         new_sub = Submission(
@@ -208,13 +226,10 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
                             content="Automatically created via marks entry"
                         )
                         self.db.add(new_sub)
-            
-            self.db.commit()
+                        existing_subs[(grade.assessment_id, grade.student_id)] = new_sub
         except Exception as e:
+            # The savepoint is already rolled back; the grades themselves are kept
             print(f"Warning: Failed to sync submissions in bulk_create_academic_grades: {e}")
-            self.db.rollback() # Rollback the sync attempt but don't fail the whole request
-            
-        return grades
 
     async def publish_grades(self, academic_year_id: UUID, grade_id: UUID, subject_id: UUID, period_number: int) -> int:
         """Bulk publish grades for a specific period/subject/class."""
@@ -251,53 +266,52 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
         )
     
     async def calculate_gpa(self, student_id: UUID, academic_year: str) -> Optional[float]:
-        """Calculate the GPA for a student in a specific academic year."""
-        # Get all subjects for the student in the academic year
-        # For each subject, calculate the average grade
-        # Calculate the GPA based on the average grades and subject credits
-        # This is a simplified implementation
-        
-        # Get all grades for the student in the academic year
-        grades = self.db.query(Grade).filter(
-            Grade.tenant_id == self.tenant_id,
-            Grade.student_id == student_id,
+        """Calculate the GPA for a student in a specific academic year.
+
+        Credit-weighted mean of the student's subject averages, read from grade_aggregates.
+        """
+        from sqlalchemy import func
+        from src.db.models.academics.enrollment import Enrollment
+        from src.db.models.academics.grade_aggregate import GradeAggregate
+        from src.db.models.academics.subject import Subject
+
+        rows = self.db.query(
+            GradeAggregate.subject_id,
+            func.sum(GradeAggregate.percentage_sum),
+            func.sum(GradeAggregate.grade_count),
+            Subject.credits
+        ).join(
+            Enrollment, GradeAggregate.enrollment_id == Enrollment.id
+        ).outerjoin(
+            Subject, (Subject.id == GradeAggregate.subject_id) & (Subject.tenant_id == self.tenant_id)
+        ).filter(
+            GradeAggregate.tenant_id == self.tenant_id,
+            Enrollment.student_id == student_id,
             # Filter by academic year using the enrollment
-            Grade.enrollment.has(academic_year=academic_year)
-        ).all()
-        
-        if not grades:
+            Enrollment.academic_year == academic_year
+        ).group_by(GradeAggregate.subject_id, Subject.credits).all()
+
+        if not rows:
             return 0.0
-        
-        # Group grades by subject
-        subject_grades = {}
-        for grade in grades:
-            if grade.subject_id not in subject_grades:
-                subject_grades[grade.subject_id] = []
-            subject_grades[grade.subject_id].append(grade)
-        
-        # Calculate average grade for each subject
-        subject_averages = {}
-        for subject_id, grades in subject_grades.items():
-            total_percentage = sum(grade.percentage for grade in grades)
-            subject_averages[subject_id] = total_percentage / len(grades)
-        
-        # Get subject credits
-        subject_credits = {}
-        for subject_id in subject_averages.keys():
-            subject = subject_crud.get_by_id(self.db, tenant_id=self.tenant_id, id=subject_id)
-            if subject:
-                subject_credits[subject_id] = subject.credits
-            else:
-                subject_credits[subject_id] = 1  # Default to 1 credit if subject not found
-        
-        # Calculate GPA
-        total_credits = sum(subject_credits.values())
-        weighted_sum = sum(subject_averages[subject_id] * subject_credits[subject_id] for subject_id in subject_averages.keys())
-        
+
+        total_credits = 0
+        weighted_sum = 0.0
+        for subject_id, percentage_sum, count, credits in rows:
+            if not count:
+                continue
+            # Default to 1 credit if subject not found
+            credits = credits if credits is not None else 1
+            total_credits += credits
+            weighted_sum += (percentage_sum / count) * credits
+
         return weighted_sum / total_credits if total_credits > 0 else 0.0
     
     async def generate_report_card(self, student_id: UUID, academic_year: str) -> Dict[str, Any]:
-        """Generate a report card for a student in a specific academic year."""
+        """Generate a report card for a student in a specific academic year.
+
+        Resolves the student's enrollment and builds its card the same way
+        generate_report_cards does, from the enrollment's grade aggregates.
+        """
         # Get student details
         student = student_crud.get_by_id(self.db, tenant_id=self.tenant_id, id=student_id)
         if not student:
@@ -337,197 +351,454 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
             else:
                 raise BusinessRuleViolationError(f"Student {student.full_name} is not enrolled in any class for the selected academic year. Please enroll the student first.")
 
-        academic_year_id = enrollment.academic_year_id if enrollment else None
-        grade_id = enrollment.grade_id if enrollment else None
-        
-        ay = academic_year_crud.get_by_id(self.db, self.tenant_id, academic_year_id) if academic_year_id else None
-
-        # Load Promotion Criteria for weighting
-        criteria_service = PromotionCriteriaService(tenant=self.tenant_id, db=self.db)
-        criteria = None
-        if academic_year_id and grade_id:
-            criteria = criteria_service.get_by_year_and_grade(
-                academic_year_id=academic_year_id, grade_id=grade_id
-            )
-        
-        weighting_schema = (criteria.weighting_schema if criteria else None) or {}
-        aggregate_method = (criteria.aggregate_method if criteria else "average")
-        
-        # Get Reporting Configuration from database instead of settings if possible
-        semesters = self.db.query(Semester).filter(Semester.academic_year_id == target_ay.id).order_by(Semester.semester_number).all()
-        semester_ids = [s.id for s in semesters]
-        
-        # Get only PUBLISHED grades based on GLOBAL Period/Semester publication status
-        query = self.db.query(Grade).join(Period, Grade.period_id == Period.id).options(
-            joinedload(Grade.period_obj)
+        if not target_ay:
+            raise EntityNotFoundError("AcademicYear", enrollment.academic_year_id)
+        return self._build_report_cards(target_ay, [enrollment])[0]
+
+    async def generate_report_cards(
+        self,
+        academic_year_id: UUID,
+        grade_id: Optional[UUID] = None,
+        section_id: Optional[UUID] = None,
+        active_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Generate report cards for every student enrolled in a grade or section.
+
+        Returns the same per-student structure as generate_report_card. The
+        cohort's grade aggregates, periods, semesters and attendance are loaded
+        in a few set-based queries, and subject scores for all students are
+        computed together with numpy; raw grades are read only for remarks and
+        the per-grade lists.
+        """
+        from src.db.models.academics.enrollment import Enrollment
+
+        ay = academic_year_crud.get_by_id(self.db, self.tenant_id, academic_year_id)
+        if not ay:
+            raise EntityNotFoundError("AcademicYear", academic_year_id)
+
+        query = self.db.query(Enrollment).options(
+            joinedload(Enrollment.student),
+            joinedload(Enrollment.grade_obj),
+            joinedload(Enrollment.section_obj)
         ).filter(
-            Grade.tenant_id == self.tenant_id,
-            Grade.student_id == student_id,
-            Period.is_published == True
+            Enrollment.tenant_id == self.tenant_id,
+            Enrollment.academic_year_id == academic_year_id
         )
-        
-        if enrollment:
-            query = query.filter(Grade.enrollment_id == enrollment.id)
-        else:
-            raise EntityNotFoundError("Enrollment", student_id)
-            
-        grades = query.all()
-        
-        # Determine active periods based on GLOBAL PUBLICATION
-        published_periods = self.db.query(Period).filter(
-            Period.semester_id.in_(semester_ids),
+        if grade_id:
+            query = query.filter(Enrollment.grade_id == grade_id)
+        if section_id:
+            query = query.filter(Enrollment.section_id == section_id)
+        if active_only:
+            query = query.filter(Enrollment.is_active == True)
+        enrollments = query.order_by(Enrollment.roll_number, Enrollment.created_at).all()
+        if not enrollments:
+            return []
+        return self._build_report_cards(ay, enrollments)
+
+    def _build_report_cards(self, ay: Any, enrollments: List[Any]) -> List[Dict[str, Any]]:
+        """Report cards for enrollments of academic year ay, in the given order."""
+        from src.db.models.academics.attendance import Attendance
+        from src.db.models.academics.subject import Subject
+
+        academic_year_id = ay.id
+        enrollment_ids = [e.id for e in enrollments]
+        student_ids = [e.student_id for e in enrollments]
+
+        semesters = self.db.query(Semester).options(selectinload(Semester.periods)).filter(
+            Semester.academic_year_id == academic_year_id
+        ).order_by(Semester.semester_number).all()
+        layout = self._report_card_layout(semesters)
+        period_columns = layout["period_columns"]
+        calendar = get_academic_calendar(self.db, self.tenant_id, academic_year_id)
+
+        def resolve_period(day: Optional[date]) -> str:
+            return calendar.period_context(day)["name"]
+
+        # Percentages come from grade_aggregates: published buckets feed the report, all of them the GPA
+        buckets = grade_aggregate.list_buckets(self.db, self.tenant_id, enrollment_ids)
+        # Raw published grades only for remarks and the per-grade breakdown
+        grade_rows = self.db.query(
+            Grade.enrollment_id,
+            Grade.subject_id,
+            Grade.assessment_type,
+            Grade.percentage,
+            Grade.assessment_date,
+            Grade.comments,
+            Period.name
+        ).join(Period, Grade.period_id == Period.id).filter(
+            Grade.tenant_id == self.tenant_id,
+            Grade.enrollment_id.in_(enrollment_ids),
             Period.is_published == True
-        ).order_by(Period.period_number).all()
-        
-        published_period_numbers = [p.period_number for p in published_periods]
-        period_names = [p.name for p in published_periods] # Only names of published periods
-        
-        active_columns = []
-        for s in semesters:
-            s_periods = [p for p in published_periods if p.semester_id == s.id]
-            for p in s_periods:
-                active_columns.append(p.name)
-            
-            # Add semester average if all periods in this semester are published OR if the semester itself is published
-            # Logic: If we have ANY published periods in a semester, we show them. 
-            # If the WHOLE semester is marked as published, or if we have all expected periods published.
-            expected_count = self.db.query(Period).filter(Period.semester_id == s.id).count()
-            if len(s_periods) == expected_count and expected_count > 0:
-                 active_columns.append(f"S{s.semester_number}")
-
-        # Add Final column if all semesters are fully published
-        all_periods_count = self.db.query(Period).join(Semester).filter(Semester.academic_year_id == target_ay.id).count()
-        if len(published_periods) == all_periods_count and all_periods_count > 0:
-            active_columns.append("Final")
+        ).all()
 
-        # Group grades by subject
-        subject_data = {}
-        for grade in grades:
-            sid = grade.subject_id
-            if not sid: continue
-                
-            if sid not in subject_data:
-                subject = subject_crud.get_by_id(self.db, tenant_id=self.tenant_id, id=sid)
-                subject_name = subject.name if subject else "Unknown Subject"
-                subject_data[sid] = {
-                    "subject_id": sid,
-                    "subject_name": subject_name,
+        subject_ids = {bucket.subject_id for bucket in buckets if bucket.subject_id}
+        subjects = {
+            s.id: s for s in self.db.query(Subject.id, Subject.name, Subject.credits).filter(
+                Subject.tenant_id == self.tenant_id,
+                Subject.id.in_(subject_ids)
+            ).all()
+        } if subject_ids else {}
+
+        # Attendance per student: year percentage and per-period counts
+        attendance = {sid: {"present": 0, "late": 0, "total": 0} for sid in student_ids}
+        period_attendance = {
+            sid: {p: {"absent": 0, "late": 0, "total": 0} for p in layout["period_names"]}
+            for sid in student_ids
+        }
+        att_rows = self.db.query(Attendance.student_id, Attendance.date, Attendance.status).filter(
+            Attendance.tenant_id == self.tenant_id,
+            Attendance.student_id.in_(student_ids),
+            Attendance.date >= ay.start_date,
+            Attendance.date <= ay.end_date
+        ).all()
+        for student_id, att_date, att_status in att_rows:
+            att_status = getattr(att_status, "value", att_status)
+            totals = attendance[student_id]
+            totals["total"] += 1
+            if att_status in ("present", "late"):
+                totals["present"] += 1
+            counts = period_attendance[student_id].get(resolve_period(att_date))
+            if counts is not None:
+                counts["total"] += 1
+                if att_status == "absent": counts["absent"] += 1
+                elif att_status == "late": counts["late"] += 1
+        attendance_percentage = {
+            sid: (t["present"] / t["total"]) * 100 if t["total"] > 0 else 0.0
+            for sid, t in attendance.items()
+        }
+
+        # Index published buckets by (enrollment, subject) pair, type and period column
+        pairs: Dict[Tuple[UUID, UUID], int] = {}
+        subject_data: List[Dict[str, Any]] = []
+        type_index: Dict[str, int] = {}
+        column_index = {name: i for i, name in enumerate(period_columns)}
+        pair_idx, type_idx, column_idx, sums, counts = [], [], [], [], []
+        remarks: Dict[UUID, Dict[str, str]] = {eid: {} for eid in enrollment_ids}
+        # (percentage sum, grade count) per enrollment and subject, for the GPA
+        all_grades: Dict[UUID, Dict[Optional[UUID], Tuple[float, int]]] = {eid: {} for eid in enrollment_ids}
+
+        for bucket in buckets:
+            totals = all_grades[bucket.enrollment_id].get(bucket.subject_id, (0.0, 0))
+            all_grades[bucket.enrollment_id][bucket.subject_id] = (
+                totals[0] + bucket.percentage_sum, totals[1] + bucket.grade_count
+            )
+            if bucket.period_published is not True or not bucket.subject_id:
+                continue
+
+            key = (bucket.enrollment_id, bucket.subject_id)
+            p = pairs.get(key)
+            if p is None:
+                p = pairs[key] = len(subject_data)
+                subject = subjects.get(bucket.subject_id)
+                subject_data.append({
+                    "subject_id": bucket.subject_id,
+                    "subject_name": subject.name if subject else "Unknown Subject",
                     "grades_by_type": {},
-                    "grades_by_period": {p: [] for p in period_names},
+                    "grades_by_period": {name: [] for name in period_columns},
                     "average_score": 0.0,
                     "percentage": 0.0,
                     "letter_grade": "N/A"
-                }
-            
-            gtype = str(grade.assessment_type)
-            if gtype not in subject_data[sid]["grades_by_type"]:
-                subject_data[sid]["grades_by_type"][gtype] = []
-            subject_data[sid]["grades_by_type"][gtype].append(float(grade.percentage))
+                })
 
-            # Track by period
-            period_name = grade.period_obj.name if grade.period_obj else "Unknown"
-            if period_name in subject_data[sid]["grades_by_period"]:
-                subject_data[sid]["grades_by_period"][period_name].append(float(grade.percentage))
+            pair_idx.append(p)
+            type_idx.append(type_index.setdefault(self._type_label(bucket.assessment_type), len(type_index)))
+            column_idx.append(column_index.get(bucket.period_name, -1))
+            sums.append(bucket.percentage_sum)
+            counts.append(bucket.grade_count)
 
-        # Attendance Integration
-        att_service = AttendanceService(tenant=self.tenant_id, db=self.db)
-        attendance_percentage = await att_service.get_student_attendance_percentage(
-            student_id=student_id,
-            start_date=ay.start_date if ay else None,
-            end_date=ay.end_date if ay else None
+        for row in grade_rows:
+            if row.comments:
+                period = resolve_period(row.assessment_date)
+                enrollment_remarks = remarks[row.enrollment_id]
+                if period not in enrollment_remarks or len(row.comments) > len(enrollment_remarks[period]):
+                    enrollment_remarks[period] = row.comments
+            p = pairs.get((row.enrollment_id, row.subject_id)) if row.subject_id else None
+            if p is None:
+                continue
+            data = subject_data[p]
+            value = float(row.percentage)
+            data["grades_by_type"].setdefault(str(row.assessment_type), []).append(value)
+            if row.name in column_index:
+                data["grades_by_period"][row.name].append(value)
+
+        enrollment_by_id = {e.id: e for e in enrollments}
+        schemes = self._weighting_schemes(academic_year_id, {e.grade_id for e in enrollments}, type_index)
+        pair_enrollments = [enrollment_by_id[eid] for eid, _ in pairs]
+        scores = self._aggregate_subject_scores(
+            pair_idx=np.array(pair_idx, dtype=np.intp),
+            type_idx=np.array(type_idx, dtype=np.intp),
+            column_idx=np.array(column_idx, dtype=np.intp),
+            values=np.array(sums, dtype=float),
+            counts=np.array(counts, dtype=float),
+            n_pairs=len(pairs),
+            n_types=len(type_index),
+            n_columns=len(period_columns),
+            type_weights=np.array([schemes[e.grade_id][0] for e in pair_enrollments]).reshape(len(pairs), len(type_index)),
+            attendance_weights=np.array([schemes[e.grade_id][1] for e in pair_enrollments], dtype=float),
+            weighted=np.array([schemes[e.grade_id][2] for e in pair_enrollments], dtype=bool),
+            attendance=np.array([attendance_percentage[e.student_id] for e in pair_enrollments], dtype=float),
+            semester_columns=[
+                [column_index[name] for name in names] for names in layout["semester_periods"].values()
+            ]
         )
 
-        # Process remarks (heuristic: longest comment per period)
-        remarks = {}
-        for grade in grades:
-            if grade.comments:
-                period = self._determine_period(ay, grade.assessment_date)
-                if period not in remarks or len(grade.comments) > len(remarks[period]):
-                    remarks[period] = grade.comments
-
-        # Calculate aggregated scores
-        for sid, data in subject_data.items():
-            final_percentage = 0.0
-            if aggregate_method == "weighted" and weighting_schema:
-                total_weight = 0.0
-                weighted_sum = 0.0
-                for gtype, weight in weighting_schema.items():
-                    weight = float(weight)
-                    if gtype == "attendance":
-                        weighted_sum += attendance_percentage * weight
-                        total_weight += weight
-                    elif gtype in data["grades_by_type"]:
-                        type_avg = sum(data["grades_by_type"][gtype]) / len(data["grades_by_type"][gtype])
-                        weighted_sum += type_avg * weight
-                        total_weight += weight
-                final_percentage = weighted_sum / total_weight if total_weight > 0 else 0.0
-            else:
-                all_vals = [v for types in data["grades_by_type"].values() for v in types]
-                final_percentage = sum(all_vals) / len(all_vals) if all_vals else 0.0
-            
-            data["percentage"] = round(final_percentage, 2)
+        subjects_by_enrollment: Dict[UUID, List[Dict[str, Any]]] = {eid: [] for eid in enrollment_ids}
+        semester_keys = list(layout["semester_periods"].keys())
+        for (enrollment_id, _), p in pairs.items():
+            data = subject_data[p]
+            data["percentage"] = round(float(scores["final"][p]), 2)
             data["letter_grade"] = self._calculate_letter_grade(data["percentage"])
-            
-            # Period and Semester averages
             data["period_grades"] = {
-                p: (sum(gs) / len(gs) if gs else None) 
-                for p, gs in data["grades_by_period"].items()
+                name: (float(scores["periods"][p, i]) if scores["period_counts"][p, i] > 0 else None)
+                for i, name in enumerate(period_columns)
+            }
+            data["semester_grades"] = {
+                key: (float(scores["semesters"][p, i]) if not np.isnan(scores["semesters"][p, i]) else None)
+                for i, key in enumerate(semester_keys)
             }
-            
-            # Dynamic semester grades calculation
-            semester_averages = {}
-            for s in semesters:
-                s_p_names = [p.name for p in s.periods if p.is_published]
-                s_vals = [data["period_grades"].get(p_n) for p_n in s_p_names if data["period_grades"].get(p_n) is not None]
-                avg = sum(s_vals) / len(s_vals) if s_vals else None
-                semester_averages[f"S{s.semester_number}"] = avg
-            
-            data["semester_grades"] = semester_averages
             data["assessment_grades"] = []
+            subjects_by_enrollment[enrollment_id].append(data)
+
+        generated_date = date.today().isoformat()
+        cards = []
+        for enrollment in enrollments:
+            student = enrollment.student
+            gpa = 0.0
+            # Same scope as calculate_gpa: grades whose enrollment carries the year's name
+            if enrollment.academic_year == ay.name:
+                gpa = self._gpa_from_percentages(all_grades[enrollment.id], subjects)
+            cards.append({
+                "student_id": enrollment.student_id,
+                "student_name": str(student.full_name),
+                "admission_number": str(student.admission_number) if student.admission_number else "N/A",
+                "academic_year": str(ay.name),
+                "grade": str(enrollment.grade_name),
+                "section": str(enrollment.section_name),
+                "subjects": subjects_by_enrollment[enrollment.id],
+                "attendance_percentage": round(attendance_percentage[enrollment.student_id], 2),
+                "period_attendance": period_attendance[enrollment.student_id],
+                "gpa": gpa,
+                "generated_date": generated_date,
+                "active_columns": list(layout["active_columns"]),
+                "remarks": remarks[enrollment.id],
+                "signatures": {
+                    "class_teacher": None,
+                    "academic_dean": None,
+                    "principal": None
+                },
+                "signatory_names": {
+                    "class_teacher": "Class Teacher",
+                    "academic_dean": "Academic Dean",
+                    "principal": "Principal"
+                }
+            })
+        return cards
+
+    async def subject_percentages(self, academic_year_id: UUID, enrollments: List[Any]) -> Dict[UUID, Dict[UUID, float]]:
+        """Report card subject percentages per enrollment, read from grade_aggregates.
 
-        # Period-based Attendance Summary
-        period_attendance = {p: {"absent": 0, "late": 0, "total": 0} for p in period_names}
-        att_records = await att_service.get_student_attendance_range(
-            student_id=student_id,
-            start_date=ay.start_date if ay else None,
-            end_date=ay.end_date if ay else None
+        Same published-period scope and weighting as generate_report_card,
+        without loading individual grades.
+        """
+        buckets = grade_aggregate.list_buckets(
+            self.db, self.tenant_id, [e.id for e in enrollments], published_only=True
         )
-        for att in att_records:
-            period = self._determine_period(ay, att.date)
-            if period in period_attendance:
-                period_attendance[period]["total"] += 1
-                if att.status == "absent": period_attendance[period]["absent"] += 1
-                elif att.status == "late": period_attendance[period]["late"] += 1
-
-        gpa = float(await self.calculate_gpa(student_id, academic_year) or 0.0)
-        
-        # Construct response
+        pairs: Dict[Tuple[UUID, UUID], int] = {}
+        type_index: Dict[str, int] = {}
+        pair_idx, type_idx, sums, counts = [], [], [], []
+        for bucket in buckets:
+            if not bucket.subject_id:
+                continue
+            pair_idx.append(pairs.setdefault((bucket.enrollment_id, bucket.subject_id), len(pairs)))
+            type_idx.append(type_index.setdefault(self._type_label(bucket.assessment_type), len(type_index)))
+            sums.append(bucket.percentage_sum)
+            counts.append(bucket.grade_count)
+
+        schemes = self._weighting_schemes(academic_year_id, {e.grade_id for e in enrollments}, type_index)
+        enrollment_by_id = {e.id: e for e in enrollments}
+        pair_enrollments = [enrollment_by_id[eid] for eid, _ in pairs]
+
+        attendance_percentage = {}
+        if any(weighted and attendance_weight for _, attendance_weight, weighted in schemes.values()):
+            ay = academic_year_crud.get_by_id(self.db, self.tenant_id, academic_year_id)
+            attendance_percentage = self._attendance_percentages(
+                [e.student_id for e in enrollments],
+                ay.start_date if ay else None,
+                ay.end_date if ay else None
+            )
+
+        scores = self._aggregate_subject_scores(
+            pair_idx=np.array(pair_idx, dtype=np.intp),
+            type_idx=np.array(type_idx, dtype=np.intp),
+            column_idx=np.full(len(pair_idx), -1, dtype=np.intp),
+            values=np.array(sums, dtype=float),
+            counts=np.array(counts, dtype=float),
+            n_pairs=len(pairs),
+            n_types=len(type_index),
+            n_columns=0,
+            type_weights=np.array([schemes[e.grade_id][0] for e in pair_enrollments]).reshape(len(pairs), len(type_index)),
+            attendance_weights=np.array([schemes[e.grade_id][1] for e in pair_enrollments], dtype=float),
+            weighted=np.array([schemes[e.grade_id][2] for e in pair_enrollments], dtype=bool),
+            attendance=np.array([attendance_percentage.get(e.student_id, 0.0) for e in pair_enrollments], dtype=float),
+            semester_columns=[]
+        )
+
+        result: Dict[UUID, Dict[UUID, float]] = {e.id: {} for e in enrollments}
+        for (enrollment_id, subject_id), p in pairs.items():
+            result[enrollment_id][subject_id] = round(float(scores["final"][p]), 2)
+        return result
+
+    @staticmethod
+    def _type_label(assessment_type: str) -> str:
+        """Label of an aggregate's assessment type, as str(Grade.assessment_type) renders it."""
+        member = GradeType._value2member_map_.get(assessment_type)
+        return str(member) if member is not None else assessment_type
+
+    def _weighting_schemes(
+        self, academic_year_id: UUID, grade_ids: Any, type_index: Dict[str, int]
+    ) -> Dict[UUID, Tuple[np.ndarray, float, bool]]:
+        """Per grade level: weight per assessment type, attendance weight, and whether weighting applies."""
+        schemes = {}
+        for level_id in grade_ids:
+            context = get_grading_context(self.db, self.tenant_id, academic_year_id, level_id) if level_id else None
+            weighting_schema = context.weighting_schema if context else {}
+            aggregate_method = context.aggregate_method if context else "average"
+            type_weights = np.zeros(len(type_index))
+            attendance_weight = 0.0
+            for gtype, weight in weighting_schema.items():
+                if gtype == "attendance":
+                    attendance_weight = float(weight)
+                elif gtype in type_index:
+                    type_weights[type_index[gtype]] = float(weight)
+            schemes[level_id] = (type_weights, attendance_weight, aggregate_method == "weighted" and bool(weighting_schema))
+        return schemes
+
+    def _attendance_percentages(
+        self, student_ids: List[UUID], start_date: Optional[date], end_date: Optional[date]
+    ) -> Dict[UUID, float]:
+        """Attendance percentage ((present + late) / total) per student, in one grouped query."""
+        from sqlalchemy import func
+        from src.db.models.academics.attendance import Attendance, AttendanceStatus
+
+        query = self.db.query(
+            Attendance.student_id,
+            func.count(Attendance.id),
+            func.count(Attendance.id).filter(Attendance.status.in_([AttendanceStatus.PRESENT, AttendanceStatus.LATE]))
+        ).filter(
+            Attendance.tenant_id == self.tenant_id,
+            Attendance.student_id.in_(student_ids)
+        )
+        if start_date:
+            query = query.filter(Attendance.date >= start_date)
+        if end_date:
+            query = query.filter(Attendance.date <= end_date)
         return {
-            "student_id": student_id,
-            "student_name": str(student.full_name),
-            "admission_number": str(student.admission_number) if student.admission_number else "N/A",
-            "academic_year": str(academic_year),
-            "grade": str(enrollment.grade_name if enrollment else "N/A"),
-            "section": str(enrollment.section_name if enrollment else "N/A"),
-            "subjects": list(subject_data.values()),
-            "attendance_percentage": round(attendance_percentage, 2),
-            "period_attendance": period_attendance,
-            "gpa": gpa,
-            "generated_date": date.today().isoformat(),
-            "active_columns": active_columns,
-            "remarks": remarks,
-            "signatures": {
-                "class_teacher": None, # Placeholder for URL
-                "academic_dean": None,
-                "principal": None
+            student_id: (attended / total) * 100 if total else 0.0
+            for student_id, total, attended in query.group_by(Attendance.student_id).all()
+        }
+
+    def _report_card_layout(self, semesters: List[Semester]) -> Dict[str, Any]:
+        """Report card columns for a year's semesters (with periods loaded), as in generate_report_card."""
+        published_periods = sorted(
+            (p for s in semesters for p in s.periods if p.is_published),
+            key=lambda p: p.period_number
+        )
+        active_columns = []
+        for s in semesters:
+            s_periods = [p for p in published_periods if p.semester_id == s.id]
+            active_columns.extend(p.name for p in s_periods)
+            if len(s_periods) == len(s.periods) and s.periods:
+                active_columns.append(f"S{s.semester_number}")
+        all_periods_count = sum(len(s.periods) for s in semesters)
+        if len(published_periods) == all_periods_count and all_periods_count > 0:
+            active_columns.append("Final")
+
+        period_names = [p.name for p in published_periods]
+        return {
+            "period_names": period_names,
+            "period_columns": list(dict.fromkeys(period_names)),
+            "semester_periods": {
+                f"S{s.semester_number}": [p.name for p in s.periods if p.is_published] for s in semesters
             },
-            "signatory_names": {
-                "class_teacher": "Class Teacher",
-                "academic_dean": "Academic Dean",
-                "principal": "Principal"
-            }
+            "active_columns": active_columns,
+        }
+
+    @staticmethod
+    def _aggregate_subject_scores(
+        *,
+        pair_idx: np.ndarray,
+        type_idx: np.ndarray,
+        column_idx: np.ndarray,
+        values: np.ndarray,
+        counts: Optional[np.ndarray] = None,
+        n_pairs: int,
+        n_types: int,
+        n_columns: int,
+        type_weights: np.ndarray,
+        attendance_weights: np.ndarray,
+        weighted: np.ndarray,
+        attendance: np.ndarray,
+        semester_columns: List[List[int]]
+    ) -> Dict[str, np.ndarray]:
+        """Final, period and semester percentages for every (student, subject) pair at once.
+
+        Each grade is one entry of the index arrays; pre-summed buckets pass
+        their percentage sums as values and grade counts as counts. Final scores follow
+        generate_report_card: the plain mean of all grades, or for weighted
+        pairs the weight-normalized mean of per-type averages (plus attendance).
+        """
+        flat = pair_idx * n_types + type_idx
+        type_sum = np.bincount(flat, weights=values, minlength=n_pairs * n_types).reshape(n_pairs, n_types)
+        type_count = np.bincount(flat, weights=counts, minlength=n_pairs * n_types).reshape(n_pairs, n_types)
+        type_avg = np.divide(type_sum, type_count, out=np.zeros((n_pairs, n_types)), where=type_count > 0)
+
+        total_count = type_count.sum(axis=1)
+        plain = np.divide(type_sum.sum(axis=1), total_count, out=np.zeros(n_pairs), where=total_count > 0)
+
+        # Only weight types the pair actually has grades for
+        present_weights = type_weights * (type_count > 0)
+        weighted_sum = (present_weights * type_avg).sum(axis=1) + attendance_weights * attendance
+        total_weight = present_weights.sum(axis=1) + attendance_weights
+        weighted_avg = np.divide(weighted_sum, total_weight, out=np.zeros(n_pairs), where=total_weight > 0)
+
+        in_column = column_idx >= 0
+        flat = pair_idx[in_column] * n_columns + column_idx[in_column]
+        column_sum = np.bincount(flat, weights=values[in_column], minlength=n_pairs * n_columns).reshape(n_pairs, n_columns)
+        column_count = np.bincount(
+            flat, weights=counts[in_column] if counts is not None else None, minlength=n_pairs * n_columns
+        ).reshape(n_pairs, n_columns)
+        periods = np.divide(column_sum, column_count, out=np.full((n_pairs, n_columns), np.nan), where=column_count > 0)
+
+        semesters = np.full((n_pairs, len(semester_columns)), np.nan)
+        for i, columns in enumerate(semester_columns):
+            if not columns:
+                continue
+            period_values = periods[:, columns]
+            count = (~np.isnan(period_values)).sum(axis=1)
+            np.divide(np.nansum(period_values, axis=1), count, out=semesters[:, i], where=count > 0)
+
+        return {
+            "final": np.where(weighted, weighted_avg, plain),
+            "periods": periods,
+            "period_counts": column_count,
+            "semesters": semesters,
         }
 
+    def _gpa_from_percentages(self, totals_by_subject: Dict[Optional[UUID], Tuple[float, int]], subjects: Dict[UUID, Any]) -> float:
+        """calculate_gpa over already-loaded (percentage sum, grade count) totals per subject."""
+        if not totals_by_subject:
+            return 0.0
+        total_credits = 0
+        weighted_sum = 0.0
+        for subject_id, (percentage_sum, count) in totals_by_subject.items():
+            if not count:
+                continue
+            subject = subjects.get(subject_id)
+            credits = subject.credits if subject else 1
+            total_credits += credits
+            weighted_sum += (percentage_sum / count) * credits
+        return float(weighted_sum / total_credits) if total_credits > 0 else 0.0
+
     async def get_subject_performance_summary(
         self, 
         student_id: UUID, 
@@ -548,7 +819,6 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
         # 2. Get Enrollment to determine Grade Level and Class (for attendance)
         from src.db.models.academics.enrollment import Enrollment
         from src.db.models.academics.class_model import Class
-        from src.db.models.academics.class_subject import ClassSubject
         
         enrollment = self.db.query(Enrollment).filter(
             Enrollment.tenant_id == self.tenant_id,
@@ -570,89 +840,44 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
             Class.academic_year_id == academic_year_id
         ).first()
 
-        # 2. Get the grading schema for this subject within the class
-        cls_subject = None
-        if cls:
-            cls_subject = self.db.query(ClassSubject).filter(
-                ClassSubject.class_id == cls.id,
-                ClassSubject.subject_id == subject_id
-            ).first()
-
-        # 3. Load Weighting Logic (Academic Year Wide Schema)
-        use_dynamic_schema = False
-        grading_schema = None
-        
-        from src.db.models.academics.grading_schema import GradingSchema
-        
-        # Look for a grading schema explicitly linked to this academic year (Active first)
-        grading_schema = self.db.query(GradingSchema).filter(
-            GradingSchema.tenant_id == self.tenant_id,
-            GradingSchema.academic_year_id == academic_year_id,
-            GradingSchema.is_active == True
-        ).first()
-
-        # Fallback 1: Any schema for this year
-        if not grading_schema:
-            grading_schema = self.db.query(GradingSchema).filter(
-                GradingSchema.tenant_id == self.tenant_id,
-                GradingSchema.academic_year_id == academic_year_id
-            ).first()
-
-        # Fallback 2: ClassSubject specific
-        if not grading_schema and cls_subject and cls_subject.grading_schema_id:
-            grading_schema = cls_subject.grading_schema
-            
-        # Fallback 3: Any active schema for tenant
-        if not grading_schema:
-            grading_schema = self.db.query(GradingSchema).filter(
-                GradingSchema.tenant_id == self.tenant_id,
-                GradingSchema.is_active == True
-            ).first()
-
-        if grading_schema:
-            use_dynamic_schema = True
+        # 3. Load Weighting Logic: the resolved schema/criteria for this year, grade and subject (cached per worker)
+        context = get_grading_context(
+            self.db, self.tenant_id, academic_year_id, enrollment.grade_id,
+            subject_id=subject_id, section_id=enrollment.section_id
+        )
+        use_dynamic_schema = context.use_dynamic_schema
+        weighting_schema = context.summary_weighting
+        aggregate_method = context.summary_aggregate_method
 
-        weighting_schema = {}
-        aggregate_method = "average"
-        
-        if use_dynamic_schema:
-            aggregate_method = "weighted"
-            for cat in grading_schema.categories:
-                weighting_schema[str(cat.id)] = cat.weight / 100.0 # Convert to fraction
-        else:
-            criteria_service = PromotionCriteriaService(tenant=self.tenant_id, db=self.db)
-            criteria = criteria_service.get_by_year_and_grade(
-                academic_year_id=academic_year_id, grade_id=enrollment.grade_id
-            )
-            raw_schema = (criteria.weighting_schema if criteria else None) or {
-                "assignment": 0.2,
-                "quiz": 0.2,
-                "test": 0.2,
-                "exam": 0.4
-            }
-            # Ensure keys are consistently lowercase for matching
-            weighting_schema = {str(k).lower(): v for k, v in raw_schema.items()}
-            aggregate_method = (criteria.aggregate_method if criteria else "average")
+        # 4. Totals from grade_aggregates; raw grades only for the per-grade breakdown
+        buckets = [
+            bucket for bucket in grade_aggregate.list_buckets(self.db, self.tenant_id, [enrollment.id], subject_id=subject_id)
+            if (not period_id or bucket.period_id == period_id) and (not semester_id or bucket.semester_id == semester_id)
+        ]
 
-        # 4. Fetch all grades
         from src.db.models.academics.grade import Grade
-        query = self.db.query(Grade).filter(
+        query = self.db.query(
+            Grade.id,
+            Grade.assessment_type,
+            Grade.assessment_name,
+            Grade.score,
+            Grade.max_score,
+            Grade.percentage,
+            Grade.assessment_date
+        ).filter(
             Grade.tenant_id == self.tenant_id,
-            Grade.student_id == student_id,
             Grade.subject_id == subject_id,
-            Grade.enrollment_id == enrollment.id if enrollment else None
+            Grade.enrollment_id == enrollment.id
         )
         
         if period_id:
             query = query.filter(Grade.period_id == period_id)
         if semester_id:
             query = query.filter(Grade.semester_id == semester_id)
-            
-        grades = query.all()
 
         # Group grades by type
         grades_by_type = {}
-        for g in grades:
+        for g in query.all():
             gtype = str(g.assessment_type)
             if gtype not in grades_by_type:
                 grades_by_type[gtype] = []
@@ -665,6 +890,16 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
                 "date": g.assessment_date.isoformat() if g.assessment_date else None
             })
 
+        # (percentage sum, grade count) per assessment type label
+        type_totals: Dict[str, List[float]] = {}
+        for bucket in buckets:
+            totals = type_totals.setdefault(self._type_label(bucket.assessment_type), [0.0, 0])
+            totals[0] += bucket.percentage_sum
+            totals[1] += bucket.grade_count
+        percentage_sum = sum(totals[0] for totals in type_totals.values())
+        grade_count = sum(totals[1] for totals in type_totals.values())
+        plain_average = percentage_sum / grade_count if grade_count else 0.0
+
         # 5. Calculate Attendance Percentage
         attendance_percentage = 100.0
         if cls:
@@ -684,17 +919,17 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
             weighted_sum = 0.0
             
             if use_dynamic_schema:
-                for cat in grading_schema.categories:
+                for cat in context.categories:
                     cat_name_upper = cat.name.upper()
-                    cat_grades = [
-                        g for g in grades 
-                        if (g.grading_category_id and str(g.grading_category_id) == str(cat.id)) or 
-                        (not g.grading_category_id and str(g.assessment_type).upper() == cat_name_upper)
+                    cat_buckets = [
+                        b for b in buckets
+                        if (b.grading_category_id and str(b.grading_category_id) == str(cat.id)) or
+                        (not b.grading_category_id and self._type_label(b.assessment_type).upper() == cat_name_upper)
                     ]
                     
-                    if cat_grades:
-                        total_score = sum(g.score for g in cat_grades)
-                        total_max = sum(g.max_score for g in cat_grades)
+                    if cat_buckets:
+                        total_score = sum(b.score_sum for b in cat_buckets)
+                        total_max = sum(b.max_score_sum for b in cat_buckets)
                         if total_max > 0:
                             cat_weight = weighting_schema[str(cat.id)]
                             cat_score_percent = (total_score / total_max) * 100.0
@@ -704,7 +939,7 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
                                 "type": cat.name, 
                                 "weight": cat_weight * 100.0, 
                                 "score": cat_score_percent,
-                                "count": len(cat_grades)
+                                "count": sum(b.grade_count for b in cat_buckets)
                             })
             else:
                 for gtype, weight in weighting_schema.items():
@@ -717,13 +952,14 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
                         details.append({"type": "attendance", "weight": weight, "score": attendance_percentage})
                     else:
                         found_type = None
-                        for actual_type in grades_by_type.keys():
-                            if actual_type.lower() == gtype_lower:
+                        for actual_type, totals in type_totals.items():
+                            if actual_type.lower() == gtype_lower and totals[1]:
                                 found_type = actual_type
                                 break
                                 
                         if found_type:
-                            type_avg = sum(g["percentage"] for g in grades_by_type[found_type]) / len(grades_by_type[found_type])
+                            type_sum, type_count = type_totals[found_type]
+                            type_avg = type_sum / type_count
                             weighted_sum += type_avg * weight
                             total_weight += weight
                             details.append({"type": gtype, "weight": weight, "score": type_avg})
@@ -731,11 +967,9 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
             if total_weight > 0:
                 final_percentage = weighted_sum / total_weight
             else:
-                all_percentages = [g["percentage"] for types in grades_by_type.values() for g in types]
-                final_percentage = sum(all_percentages) / len(all_percentages) if all_percentages else 0.0
+                final_percentage = plain_average
         else:
-            all_percentages = [g["percentage"] for types in grades_by_type.values() for g in types]
-            final_percentage = sum(all_percentages) / len(all_percentages) if all_percentages else 0.0
+            final_percentage = plain_average
 
         return {
             "student_id": str(student_id),
@@ -788,55 +1022,10 @@ class GradeCalculationService(TenantBaseService[Grade, GradeCreate, GradeUpdate]
             return "F"
 
     def _get_period_context(self, ay: Any, assessment_date: date, config: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Returns the period context: name, number, semester, and IDs from the database."""
+        """Returns the period context: name, number, semester, and IDs, from the cached academic calendar."""
         if not ay or not assessment_date:
             return {"name": "P1", "number": 1, "semester": 1, "period_id": None, "semester_id": None}
-            
-        # Try to find the semester from the database
-        semester = self.db.query(Semester).filter(
-            Semester.academic_year_id == ay.id,
-            Semester.start_date <= assessment_date,
-            Semester.end_date >= assessment_date
-        ).first()
-        
-        # Fallback if dates don't align perfectly (e.g. edge cases)
-        if not semester:
-             semester = self.db.query(Semester).filter(
-                Semester.academic_year_id == ay.id
-            ).order_by(Semester.semester_number).first()
-            
-        if not semester:
-            return {"name": "P1", "number": 1, "semester": 1, "period_id": None, "semester_id": None}
-
-        # Try to find the period from the database
-        period = self.db.query(Period).filter(
-            Period.semester_id == semester.id,
-            Period.start_date <= assessment_date,
-            Period.end_date >= assessment_date
-        ).first()
-
-        # Fallback for period
-        if not period:
-            period = self.db.query(Period).filter(
-                Period.semester_id == semester.id
-            ).order_by(Period.period_number).first()
-
-        if not period:
-            return {
-                "name": "P1", 
-                "number": 1, 
-                "semester": semester.semester_number, 
-                "period_id": None, 
-                "semester_id": semester.id
-            }
-
-        return {
-            "name": period.name,
-            "number": period.period_number,
-            "semester": semester.semester_number,
-            "period_id": period.id,
-            "semester_id": semester.id
-        }
+        return get_academic_calendar(self.db, self.tenant_id, ay.id).period_context(assessment_date)
 
     def _determine_period(self, ay: Any, assessment_date: date, config: Dict[str, Any] = None) -> str:
         """Determines the academic period (P1-P6/Dynamic) based on assessment date."""
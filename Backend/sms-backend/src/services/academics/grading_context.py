@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.invalidation import listen_for_invalidations
+from src.core.tenant_scoped_cache import TenantScopedCache, track_stale_tenants
+from src.db.crud.academics.promotion_criteria import promotion_criteria_crud
+from src.db.models.academics.class_model import Class
+from src.db.models.academics.class_subject import ClassSubject
+from src.db.models.academics.grading_schema import GradingSchema, GradingCategory
+from src.db.models.academics.promotion_criteria import PromotionCriteria
+
+# Redis pub/sub channel used to tell every worker to drop a tenant's grading contexts
+GRADING_CONTEXT_INVALIDATION_CHANNEL = "grading-context:invalidate"
+
+# Weights used by the subject summary when there is neither a schema nor criteria weighting
+DEFAULT_WEIGHTING = (("assignment", 0.2), ("quiz", 0.2), ("test", 0.2), ("exam", 0.4))
+
+# (tenant_id, academic_year_id, grade_id, subject_id, section_id)
+ContextKey = Tuple[str, str, str, str, str]
+
+
+@dataclass(frozen=True)
+class CategoryWeight:
+    id: UUID
+    name: str
+    weight: float  # fraction, e.g. 0.35 for a 35% category
+
+
+@dataclass(frozen=True)
+class GradingContext:
+    """How grades are combined for an academic year, grade level and subject, detached from any DB session.
+
+    categories come from the resolved GradingSchema (empty when there is none);
+    criteria_weighting, aggregate_method and passing_mark from PromotionCriteria.
+    """
+    schema_id: Optional[UUID]
+    categories: Tuple[CategoryWeight, ...]
+    criteria_weighting: Tuple[Tuple[str, float], ...]
+    aggregate_method: str
+    passing_mark: int
+
+    @property
+    def use_dynamic_schema(self) -> bool:
+        return self.schema_id is not None
+
+    @property
+    def weighting_schema(self) -> Dict[str, float]:
+        """Criteria weighting as stored, e.g. {"exam": 0.6, "attendance": 0.1}."""
+        return dict(self.criteria_weighting)
+
+    @property
+    def summary_weighting(self) -> Dict[str, float]:
+        """Weights the subject summary applies: per category id, else lowercased criteria (or default) weights."""
+        if self.use_dynamic_schema:
+            return {str(cat.id): cat.weight for cat in self.categories}
+        return {str(k).lower(): v for k, v in (self.criteria_weighting or DEFAULT_WEIGHTING)}
+
+    @property
+    def summary_aggregate_method(self) -> str:
+        return "weighted" if self.use_dynamic_schema else self.aggregate_method
+
+
+def _context_key(tenant_id: Any, academic_year_id: Any, grade_id: Any, subject_id: Any, section_id: Any) -> ContextKey:
+    return tuple("" if part is None else str(part) for part in (tenant_id, academic_year_id, grade_id, subject_id, section_id))
+
+
+# Resolved grading contexts for this worker, dropped per tenant when grading
+# schemas, categories, class subjects or promotion criteria are committed
+grading_context_cache: TenantScopedCache[GradingContext] = TenantScopedCache(
+    max_entries=settings.GRADING_CONTEXT_CACHE_MAX_ENTRIES,
+    ttl=settings.GRADING_CONTEXT_CACHE_TTL_SECONDS,
+)
+
+
+def _resolve_schema(
+    db: Session, tenant_id: Any, academic_year_id: Any, grade_id: Any, subject_id: Any, section_id: Any
+) -> Optional[GradingSchema]:
+    """Active schema for the year, any schema for the year, the class subject's schema, then any active tenant schema."""
+    schema = db.query(GradingSchema).filter(
+        GradingSchema.tenant_id == tenant_id,
+        GradingSchema.academic_year_id == academic_year_id,
+        GradingSchema.is_active == True
+    ).first()
+    if not schema:
+        schema = db.query(GradingSchema).filter(
+            GradingSchema.tenant_id == tenant_id,
+            GradingSchema.academic_year_id == academic_year_id
+        ).first()
+    if not schema and subject_id and grade_id and section_id:
+        cls_subject = db.query(ClassSubject).join(Class, ClassSubject.class_id == Class.id).filter(
+            Class.tenant_id == tenant_id,
+            Class.grade_id == grade_id,
+            Class.section_id == section_id,
+            Class.academic_year_id == academic_year_id,
+            ClassSubject.subject_id == subject_id
+        ).first()
+        if cls_subject and cls_subject.grading_schema_id:
+            schema = cls_subject.grading_schema
+    if not schema:
+        schema = db.query(GradingSchema).filter(
+            GradingSchema.tenant_id == tenant_id,
+            GradingSchema.is_active == True
+        ).first()
+    return schema
+
+
+def _load_grading_context(
+    db: Session, tenant_id: Any, academic_year_id: Any, grade_id: Any, subject_id: Any, section_id: Any
+) -> GradingContext:
+    schema = _resolve_schema(db, tenant_id, academic_year_id, grade_id, subject_id, section_id)
+    criteria = promotion_criteria_crud.get_by_year_and_grade(
+        db, tenant_id=tenant_id, academic_year_id=academic_year_id, grade_id=grade_id
+    ) if academic_year_id and grade_id else None
+    return GradingContext(
+        schema_id=schema.id if schema else None,
+        categories=tuple(
+            CategoryWeight(id=cat.id, name=cat.name, weight=cat.weight / 100.0)  # Convert to fraction
+            for cat in (schema.categories if schema else [])
+        ),
+        criteria_weighting=tuple((criteria.weighting_schema or {}).items()) if criteria else (),
+        aggregate_method=(criteria.aggregate_method if criteria else "average"),
+        passing_mark=(criteria.passing_mark if criteria else 70),
+    )
+
+
+def get_grading_context(
+    db: Session,
+    tenant_id: Any,
+    academic_year_id: Any,
+    grade_id: Any,
+    subject_id: Any = None,
+    section_id: Any = None
+) -> GradingContext:
+    """Resolved grading context, from this worker's cache when possible.
+
+    subject_id and section_id only matter for the class-subject schema fallback;
+    leave them out when only the criteria fields are needed.
+    """
+    return grading_context_cache.get_or_load(
+        _context_key(tenant_id, academic_year_id, grade_id, subject_id, section_id),
+        lambda: _load_grading_context(db, tenant_id, academic_year_id, grade_id, subject_id, section_id)
+    )
+
+
+def get_grading_contexts(
+    db: Session, tenant_id: Any, academic_year_id: Any, grade_ids: Iterable[Any]
+) -> Dict[Any, GradingContext]:
+    """Grading contexts for several grade levels of one academic year, keyed by grade_id."""
+    return {
+        grade_id: get_grading_context(db, tenant_id, academic_year_id, grade_id)
+        for grade_id in set(grade_ids)
+    }
+
+
+_CONTEXT_MODELS = (GradingSchema, GradingCategory, ClassSubject, PromotionCriteria)
+
+# mark_grading_context_stale(db, tenant_id): drop the tenant's contexts when db
+# commits; needed after bulk query updates/deletes, which the flush hook cannot see
+mark_grading_context_stale = track_stale_tenants(
+    grading_context_cache, _CONTEXT_MODELS, GRADING_CONTEXT_INVALIDATION_CHANNEL, "grading_context_stale_tenants"
+)
+
+
+async def listen_for_grading_context_invalidations() -> None:
+    """Drop tenants' grading contexts as other workers commit changes; runs for the app's lifetime."""
+    await listen_for_invalidations(
+        GRADING_CONTEXT_INVALIDATION_CHANNEL,
+        grading_context_cache.invalidate_tenant,
+        on_reset=grading_context_cache.clear
+    )
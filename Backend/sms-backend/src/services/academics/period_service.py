@@ -3,6 +3,7 @@ from uuid import UUID
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from src.db.crud.academics.period_crud import period_crud
+from src.db.crud.academics.grade_aggregate import grade_aggregate
 from src.db.models.academics.period import Period
 from src.schemas.academics.period import PeriodCreate, PeriodUpdate
 from src.services.base.base import TenantBaseService
@@ -11,6 +12,8 @@ from src.core.middleware.tenant import get_tenant_from_request
 
 class PeriodService(TenantBaseService[Period, PeriodCreate, PeriodUpdate]):
     """Service for managing academic periods."""
+
+    data_version = "periods"
     
     def __init__(
         self,
@@ -34,4 +37,20 @@ class PeriodService(TenantBaseService[Period, PeriodCreate, PeriodUpdate]):
         period.is_published = not period.is_published
         self.db.commit()
         self.db.refresh(period)
+        await self.bump_data_version()
         return period
+
+    async def delete(self, *, id: Any) -> Optional[Period]:
+        """Delete a period, rebuilding grade aggregates in the same transaction.
+
+        Its grades keep their scores with period_id set to NULL, so their
+        aggregate buckets are recomputed rather than dropped.
+        """
+        with self.unit_of_work():
+            result = self.crud.delete(db=self.db, tenant_id=self.tenant_id, id=id)
+            if result is not None:
+                self.db.flush()
+                grade_aggregate.rebuild(self.db, self.tenant_id)
+        if result is not None:
+            await self.bump_data_version()
+        return result
@@ -181,7 +181,6 @@ class PromotionService(TenantBaseService):
     
     async def evaluate_eligibility(self, enrollment_id: UUID) -> Dict[str, Any]:
         from src.db.models.academics.enrollment import Enrollment as EnrollmentModel
-        from src.db.models.academics.grade import Grade
         from src.services.academics.promotion_criteria_service import PromotionCriteriaService
         from src.services.academics.promotion_status_service import PromotionStatusService
         from src.services.academics.attendance_service import AttendanceService
@@ -221,19 +220,13 @@ class PromotionService(TenantBaseService):
         section = self.db.query(Section).filter(Section.id == enrollment.section_id).first()
         section_name = section.name if section else "Unknown"
 
-        # 2. Get Grades
-        grades = (
-            self.db.query(Grade)
-            .filter(Grade.tenant_id == self.tenant_id, Grade.enrollment_id == enrollment_id)
-            .all()
-        )
-        
-        from collections import defaultdict
-        subject_percentages = defaultdict(list)
-        for g in grades:
-            subject_percentages[g.subject_id].append(g.percentage)
-        
-        subject_avg = {sid: (sum(vals) / len(vals)) for sid, vals in subject_percentages.items()}
+        # 2. Subject averages, from the running totals kept in grade_aggregates
+        from src.db.crud.academics.grade_aggregate import grade_aggregate
+        subject_avg = {
+            sid: avg for (_, sid), avg in grade_aggregate.subject_averages(
+                self.db, self.tenant_id, [enrollment_id]
+            ).items()
+        }
         avg_subject_score = sum(subject_avg.values()) / max(len(subject_avg), 1)
         failed_subject_ids = [sid for sid, avg in subject_avg.items() if avg < passing_mark]
 
@@ -266,7 +259,7 @@ class PromotionService(TenantBaseService):
             total_score = avg_subject_score
 
         # 4. Determine Status
-        if not grades and (not weighting_schema or float(weighting_schema.get('attendance', 0)) == 0):
+        if not subject_avg and (not weighting_schema or float(weighting_schema.get('attendance', 0)) == 0):
             status = "Repeating"
             notes = "No grades recorded"
         else:
@@ -365,7 +358,7 @@ class PromotionService(TenantBaseService):
         
         # Check if student should graduate
         if current_sequence >= max_sequence:
-            return self._graduate_student(current_enrollment)
+            return await self._graduate_student(current_enrollment)
         
         # Find next grade
         next_sequence = current_sequence + 1
@@ -385,14 +378,6 @@ class PromotionService(TenantBaseService):
         # Apply promotion rules if provided
         target_section = promotion_rules.get(str(current_enrollment.student_id)) if promotion_rules else current_enrollment.section
         
-        # Mark current enrollment as completed
-        enrollment_crud.update(
-            self.db,
-            self.tenant_id,
-            db_obj=current_enrollment,
-            obj_in={"status": "completed", "is_active": False}
-        )
-        
         # Resolve normalized IDs for next-grade enrollment
         from src.services.academics.academic_year_service import AcademicYearService
         from src.services.academics.academic_grade_service import AcademicGradeService
@@ -440,22 +425,36 @@ class PromotionService(TenantBaseService):
             semester_2_status="pending",
             comments=f"Promoted from {current_grade} to {next_grade} on {date.today()}"
         )
-        new_enrollment = enrollment_crud.create(self.db, tenant_id=self.tenant_id, obj_in=new_enrollment_data)
-
         classes = cls_service.get_by_grade_and_section(next_grade_obj.id, target_section_obj.id)
-        for c in classes:
-            if c.academic_year != target_academic_year:
-                continue
-            try:
-                cl_enroll_service.enroll_student(
-                    obj_in=ClassEnrollmentCreate(
-                        student_id=current_enrollment.student_id,
-                        class_id=c.id,
-                        academic_year_id=ay_obj.id
+
+        # Close the old enrollment, open the new one and enroll in classes as one transaction
+        with self.unit_of_work():
+            enrollment_crud.update(
+                self.db,
+                self.tenant_id,
+                db_obj=current_enrollment,
+                obj_in={"status": "completed", "is_active": False}
+            )
+            new_enrollment = enrollment_crud.create(self.db, tenant_id=self.tenant_id, obj_in=new_enrollment_data)
+
+            for c in classes:
+                if c.academic_year != target_academic_year:
+                    continue
+                # Savepoint per class so one failed enrollment does not abort the promotion
+                savepoint = self.db.begin_nested()
+                try:
+                    await cl_enroll_service.enroll_student(
+                        obj_in=ClassEnrollmentCreate(
+                            student_id=current_enrollment.student_id,
+                            class_id=c.id,
+                            academic_year_id=ay_obj.id
+                        )
                     )
-                )
-            except Exception:
-                continue
+                    savepoint.commit()
+                except Exception:
+                    if savepoint.is_active:
+                        savepoint.rollback()
+                    continue
 
         return {
             "student_id": current_enrollment.student_id,
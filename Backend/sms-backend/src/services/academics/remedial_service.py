@@ -22,11 +22,11 @@ class RemedialService(TenantBaseService[RemedialSession, RemedialSessionCreate,
         with aggregated subject grades below the passing mark.
         """
         from src.services.academics.grade_calculation import GradeCalculationService
-        from src.services.academics.promotion_criteria_service import PromotionCriteriaService
+        from src.services.academics.grading_context import get_grading_context
         from src.db.models.academics.enrollment import Enrollment
+        from src.db.models.academics.subject import Subject
         
         calc_service = GradeCalculationService(db=self.db, tenant_id=self.tenant_id)
-        criteria_service = PromotionCriteriaService(db=self.db, tenant=self.tenant_id)
         
         query = self.db.query(Enrollment).filter(
             Enrollment.tenant_id == self.tenant_id,
@@ -38,22 +38,26 @@ class RemedialService(TenantBaseService[RemedialSession, RemedialSessionCreate,
             
         enrollments = query.all()
         at_risk = []
-        
+
+        # Subject percentages for the whole cohort, from grade_aggregates
+        try:
+            percentages = await calc_service.subject_percentages(academic_year_id, enrollments)
+        except Exception as e:
+            # An empty list would read as "nobody at risk"; surface the failure instead
+            print(f"Error computing subject percentages for at-risk scan: {e}")
+            raise
+        subject_ids = {sid for by_subject in percentages.values() for sid in by_subject}
+        subject_names = dict(
+            self.db.query(Subject.id, Subject.name).filter(
+                Subject.tenant_id == self.tenant_id, Subject.id.in_(subject_ids)
+            ).all()
+        ) if subject_ids else {}
+
         for en in enrollments:
-            criteria = criteria_service.get_by_year_and_grade(
-                academic_year_id=en.academic_year_id, grade_id=en.grade_id
-            )
-            passing_mark = criteria.passing_mark if criteria else 70
-            
-            # Using str(academic_year_id) because generate_report_card supports string lookup
-            try:
-                report = await calc_service.generate_report_card(student_id=en.student_id, academic_year=str(academic_year_id))
-            except Exception:
-                continue
-                
-            for data in report.get("subjects", []):
-                sid = data.get("subject_id")
-                if data["percentage"] < passing_mark:
+            passing_mark = get_grading_context(self.db, self.tenant_id, en.academic_year_id, en.grade_id).passing_mark
+
+            for sid, percentage in percentages.get(en.id, {}).items():
+                if percentage < passing_mark:
                     # Check if session already exists
                     existing = self.db.query(RemedialSession).filter(
                         RemedialSession.tenant_id == self.tenant_id,
@@ -67,8 +71,8 @@ class RemedialService(TenantBaseService[RemedialSession, RemedialSessionCreate,
                             "student_id": en.student_id,
                             "student_name": en.student.full_name if en.student else "Unknown",
                             "subject_id": sid,
-                            "subject_name": data["subject_name"],
-                            "current_grade": data["percentage"],
+                            "subject_name": subject_names.get(sid, "Unknown"),
+                            "current_grade": percentage,
                             "passing_mark": passing_mark,
                             "enrollment_id": en.id
                         })
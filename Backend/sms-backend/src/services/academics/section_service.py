@@ -17,6 +17,8 @@ from src.db.models.academics.timetable import Timetable
 
 class SectionService(TenantBaseService[Section, SectionCreate, SectionUpdate]):
     """Service for managing sections within a tenant."""
+
+    data_version = "sections"
     
     def __init__(
         self,
@@ -3,6 +3,7 @@ from uuid import UUID
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from src.db.crud.academics.semester_crud import semester_crud
+from src.db.crud.academics.grade_aggregate import grade_aggregate
 from src.db.models.academics.semester import Semester
 from src.schemas.academics.semester import SemesterCreate, SemesterUpdate
 from src.services.base.base import TenantBaseService
@@ -11,6 +12,8 @@ from src.core.middleware.tenant import get_tenant_from_request
 
 class SemesterService(TenantBaseService[Semester, SemesterCreate, SemesterUpdate]):
     """Service for managing academic semesters."""
+
+    data_version = "semesters"
     
     def __init__(
         self,
@@ -34,4 +37,20 @@ class SemesterService(TenantBaseService[Semester, SemesterCreate, SemesterUpdate
         semester.is_published = not semester.is_published
         self.db.commit()
         self.db.refresh(semester)
+        await self.bump_data_version()
         return semester
+
+    async def delete(self, *, id: Any) -> Optional[Semester]:
+        """Delete a semester, rebuilding grade aggregates in the same transaction.
+
+        Its grades keep their scores with semester_id set to NULL, so their
+        aggregate buckets are recomputed rather than dropped.
+        """
+        with self.unit_of_work():
+            result = self.crud.delete(db=self.db, tenant_id=self.tenant_id, id=id)
+            if result is not None:
+                self.db.flush()
+                grade_aggregate.rebuild(self.db, self.tenant_id)
+        if result is not None:
+            await self.bump_data_version()
+        return result
@@ -16,6 +16,8 @@ from sqlalchemy import text
 
 class SubjectService(TenantBaseService[Subject, SubjectCreate, SubjectUpdate]):
     """Service for managing subjects within a tenant."""
+
+    data_version = "subjects"
     
     def __init__(
         self,
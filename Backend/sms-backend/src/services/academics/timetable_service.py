@@ -55,9 +55,44 @@ class TimetableService(TenantBaseService[Timetable, TimetableCreate, TimetableUp
         if current_date is None:
             current_date = date.today()
         timetables = timetable_crud.get_current_timetables(self.db, tenant_id=self.tenant_id, current_date=current_date)
-        return [self._enrich_timetable_slots(t) for t in timetables]
+        return self._enrich_timetables(timetables)
     
-    def _enrich_timetable_slots(self, timetable: Timetable) -> Timetable:
+    def _slot_class_ids(self, timetable: Timetable) -> set:
+        """Collect the class_id referenced by each slot of a timetable."""
+        data = getattr(timetable, 'timetable_data', None) or {}
+        return {
+            slot.get('class_id') for slot in data.get('time_slots', [])
+            if isinstance(slot, dict) and slot.get('class_id')
+        }
+    
+    def _load_class_subjects(self, class_ids: set) -> Dict[str, Any]:
+        """Fetch ClassSubjects (with subject and teacher) for all slots in one query."""
+        if not class_ids:
+            return {}
+        from src.db.models.academics.class_subject import ClassSubject
+        ids = []
+        for class_id in class_ids:
+            try:
+                ids.append(ensure_uuid(class_id))
+            except (ValueError, TypeError):
+                continue
+        if not ids:
+            return {}
+        class_objs = self.db.query(ClassSubject).filter(
+            ClassSubject.id.in_(ids),
+            ClassSubject.tenant_id == self.tenant_id
+        ).all()
+        return {str(c.id): c for c in class_objs}
+    
+    def _enrich_timetables(self, timetables: List[Timetable]) -> List[Timetable]:
+        """Enrich several timetables, loading every referenced ClassSubject at once."""
+        class_ids = set()
+        for timetable in timetables:
+            class_ids |= self._slot_class_ids(timetable)
+        class_map = self._load_class_subjects(class_ids)
+        return [self._enrich_timetable_slots(t, class_map) for t in timetables]
+    
+    def _enrich_timetable_slots(self, timetable: Timetable, class_map: Optional[Dict[str, Any]] = None) -> Timetable:
         """Enrich timetable slots with subject and teacher names from Classes.
         Returns the modified Timetable object."""
         if not hasattr(timetable, 'timetable_data') or not timetable.timetable_data:
@@ -67,6 +102,9 @@ class TimetableService(TenantBaseService[Timetable, TimetableCreate, TimetableUp
         if 'time_slots' not in data:
             return timetable
         
+        if class_map is None:
+            class_map = self._load_class_subjects(self._slot_class_ids(timetable))
+        
         slots = data.get('time_slots', [])
         enriched_slots = []
         
@@ -75,17 +113,11 @@ class TimetableService(TenantBaseService[Timetable, TimetableCreate, TimetableUp
                 class_id = slot.get('class_id')
                 enriched_slot = dict(slot)
                 
-                # Fetch ClassSubject details if class_id exists
-                if class_id:
-                    from src.db.models.academics.class_subject import ClassSubject
-                    class_obj = self.db.query(ClassSubject).filter(
-                        ClassSubject.id == class_id,
-                        ClassSubject.tenant_id == self.tenant_id
-                    ).first()
-                    
-                    if class_obj:
-                        enriched_slot['subject_name'] = class_obj.subject.name if class_obj.subject else None
-                        enriched_slot['teacher_name'] = f"{class_obj.teacher.first_name} {class_obj.teacher.last_name}" if class_obj.teacher else None
+                # Attach ClassSubject details if class_id exists
+                class_obj = class_map.get(str(class_id)) if class_id else None
+                if class_obj:
+                    enriched_slot['subject_name'] = class_obj.subject.name if class_obj.subject else None
+                    enriched_slot['teacher_name'] = f"{class_obj.teacher.first_name} {class_obj.teacher.last_name}" if class_obj.teacher else None
                 
                 enriched_slots.append(enriched_slot)
             else:
@@ -135,7 +167,7 @@ class TimetableService(TenantBaseService[Timetable, TimetableCreate, TimetableUp
         timetables = query.offset(skip).limit(limit).all()
         
         # Enrich each timetable with subject and teacher names
-        return [self._enrich_timetable_slots(t) for t in timetables]
+        return self._enrich_timetables(timetables)
     
     async def create(self, *, obj_in: TimetableCreate) -> Timetable:
         """Create a new timetable with validation."""
@@ -1,4 +1,7 @@
-from typing import Optional
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timezone
 try:
     import redis.asyncio as redis  # type: ignore
@@ -7,6 +10,42 @@ except Exception:
 
 from src.core.config import settings
 
+# Flush buffered activity writes once this many are pending, without waiting for the timer
+ACTIVITY_FLUSH_BATCH_SIZE = 500
+# How often expired entries are swept from the in-process maps
+SWEEP_INTERVAL_SECONDS = 300
+
+# Token status codes returned by CHECK_TOKEN_SCRIPT and check_token
+TOKEN_OK = 0
+TOKEN_BLACKLISTED = 1
+TOKEN_IDLE_TIMED_OUT = 2
+
+# One round trip for the blacklist, idle and last-activity checks.
+# KEYS: blacklist key, optional last-activity key
+# ARGV: now, ttl, idle window in seconds (0 disables), touch (1 records activity)
+CHECK_TOKEN_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 1
+end
+if #KEYS < 2 then
+    return 0
+end
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local idle = tonumber(ARGV[3])
+local last = redis.call('GET', KEYS[2])
+if last and idle > 0 and now - tonumber(last) > idle then
+    if ttl > 0 then
+        redis.call('SET', KEYS[1], '1', 'EX', ttl)
+    end
+    return 2
+end
+if (not last or ARGV[4] == '1') and ttl > 0 then
+    redis.call('SET', KEYS[2], ARGV[1], 'EX', ttl)
+end
+return 0
+"""
+
 class TokenBlacklistService:
     _instance = None
     
@@ -15,8 +54,15 @@ class TokenBlacklistService:
             cls._instance = super(TokenBlacklistService, cls).__new__(cls)
             cls._instance.redis_client = None
             cls._instance.redis_available = False
-            cls._instance._blacklisted_tokens = set()
+            # In-memory fallback: token -> expiry, jti -> (last activity, expiry)
+            cls._instance._blacklisted_tokens = {}
             cls._instance._last_activity = {}
+            # Activity write coalescing: jti -> (last write, expiry), and writes awaiting a flush
+            cls._instance._recent_writes = {}
+            cls._instance._pending_activity = {}
+            cls._instance._lock = threading.Lock()
+            cls._instance._last_sweep = time.monotonic()
+            cls._instance._check_script = None
             
             if redis is not None:
                 try:
@@ -27,6 +73,7 @@ class TokenBlacklistService:
                         password=getattr(settings, "REDIS_PASSWORD", None),
                         decode_responses=True
                     )
+                    cls._instance._check_script = cls._instance.redis_client.register_script(CHECK_TOKEN_SCRIPT)
                     cls._instance.redis_available = True
                 except Exception as e:
                     print(f"Redis unavailable, falling back to in-memory: {e}")
@@ -40,7 +87,7 @@ class TokenBlacklistService:
                 ttl = max(0, int(expiry_timestamp) - current_timestamp)
                 await self.redis_client.setex(f"token:blacklist:{token}", ttl, "1")
             else:
-                self._blacklisted_tokens.add(token)
+                self._blacklisted_tokens[token] = int(expiry_timestamp)
             return True
         except Exception as e:
             print(f"Failed to blacklist token: {e}")
@@ -63,11 +110,12 @@ class TokenBlacklistService:
             if self.redis_available:
                 key = f"token:last_activity:{jti}"
                 ttl = max(0, int(expiry_timestamp) - now_ts)
-                await self.redis_client.set(key, str(now_ts))
                 if ttl > 0:
-                    await self.redis_client.expire(key, ttl)
+                    await self.redis_client.set(key, str(now_ts), ex=ttl)
+                else:
+                    await self.redis_client.set(key, str(now_ts))
             else:
-                self._last_activity[jti] = now_ts
+                self._last_activity[jti] = (now_ts, int(expiry_timestamp))
         except Exception as e:
             print(f"Failed to update last activity: {e}")
 
@@ -90,7 +138,8 @@ class TokenBlacklistService:
             if self.redis_available:
                 val = await self.redis_client.get(f"token:last_activity:{jti}")
                 return int(val) if val is not None else None
-            return self._last_activity.get(jti)
+            entry = self._last_activity.get(jti)
+            return entry[0] if entry else None
         except Exception as e:
             print(f"Failed to get last activity: {e}")
             return None
@@ -105,3 +154,125 @@ class TokenBlacklistService:
             return False
         now_ts = int(datetime.now(timezone.utc).timestamp())
         return (now_ts - last_ts) > (idle_minutes * 60)
+
+    def _activity_granularity(self) -> int:
+        """Seconds between recorded activity writes for one jti.
+
+        Capped at half the idle window so a coalesced write can never make an
+        active session look idle.
+        """
+        granularity = max(0, settings.IDLE_ACTIVITY_GRANULARITY_SECONDS)
+        idle_seconds = int(getattr(settings, "IDLE_TIMEOUT_MINUTES", 0)) * 60
+        if idle_seconds > 0:
+            granularity = min(granularity, idle_seconds // 2)
+        return granularity
+
+    async def record_activity(self, jti: str, expiry_timestamp: int) -> None:
+        """Note activity for jti, writing at most once per IDLE_ACTIVITY_GRANULARITY_SECONDS.
+
+        With Redis the write is buffered and sent with others in one pipeline by
+        flush_activity; without Redis it goes straight to the in-memory map.
+        """
+        now_ts = int(datetime.now(timezone.utc).timestamp())
+        flush_now = False
+        with self._lock:
+            self._maybe_sweep(now_ts)
+            last_write = self._recent_writes.get(jti)
+            if last_write is not None and now_ts - last_write[0] < self._activity_granularity():
+                return
+            self._recent_writes[jti] = (now_ts, int(expiry_timestamp))
+            if not self.redis_available:
+                self._last_activity[jti] = (now_ts, int(expiry_timestamp))
+                return
+            self._pending_activity[jti] = (now_ts, int(expiry_timestamp))
+            flush_now = len(self._pending_activity) >= ACTIVITY_FLUSH_BATCH_SIZE
+        if flush_now:
+            await self.flush_activity()
+
+    async def flush_activity(self) -> int:
+        """Write all buffered activity timestamps in one pipeline; returns how many."""
+        with self._lock:
+            pending, self._pending_activity = self._pending_activity, {}
+        if not pending or not self.redis_available:
+            return 0
+        now_ts = int(datetime.now(timezone.utc).timestamp())
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for jti, (activity_ts, expiry_timestamp) in pending.items():
+                    ttl = int(expiry_timestamp) - now_ts
+                    if ttl > 0:
+                        pipe.set(f"token:last_activity:{jti}", str(activity_ts), ex=ttl)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Failed to flush last activity: {e}")
+            # Let the next request for these tokens write again
+            with self._lock:
+                for jti in pending:
+                    self._recent_writes.pop(jti, None)
+        return len(pending)
+
+    async def run_activity_flusher(self) -> None:
+        """Flush buffered activity on a timer; runs for the app's lifetime."""
+        try:
+            while True:
+                await asyncio.sleep(settings.IDLE_ACTIVITY_FLUSH_INTERVAL_SECONDS)
+                await self.flush_activity()
+        finally:
+            # Shutdown: don't drop the last batch
+            await self.flush_activity()
+
+    def _maybe_sweep(self, now_ts: int) -> None:
+        """Drop expired entries from the in-process maps. Caller holds _lock."""
+        if time.monotonic() - self._last_sweep < SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = time.monotonic()
+        for jti in [j for j, (_, exp) in self._recent_writes.items() if exp <= now_ts]:
+            del self._recent_writes[jti]
+        for jti in [j for j, (_, exp) in self._last_activity.items() if exp <= now_ts]:
+            del self._last_activity[jti]
+        for token in [t for t, exp in self._blacklisted_tokens.items() if exp <= now_ts]:
+            del self._blacklisted_tokens[token]
+
+    async def check_token(
+        self,
+        token: str,
+        jti: Optional[str],
+        expiry_timestamp: int,
+        enforce_idle: bool = False,
+        touch: bool = False,
+    ) -> int:
+        """Blacklist, idle-timeout and last-activity handling in one Redis call.
+
+        Returns TOKEN_OK, TOKEN_BLACKLISTED or TOKEN_IDLE_TIMED_OUT. A token that
+        has gone idle is blacklisted on the spot. Last activity is recorded when
+        missing, or on every call with touch=True; per-request activity should
+        go through record_activity instead, which coalesces writes.
+        """
+        now_ts = int(datetime.now(timezone.utc).timestamp())
+        ttl = max(0, int(expiry_timestamp) - now_ts)
+        idle_seconds = int(getattr(settings, "IDLE_TIMEOUT_MINUTES", 0)) * 60 if enforce_idle else 0
+        track_activity = bool(jti) and (enforce_idle or touch)
+        try:
+            if self.redis_available:
+                keys = [f"token:blacklist:{token}"]
+                if track_activity:
+                    keys.append(f"token:last_activity:{jti}")
+                return int(await self._check_script(
+                    keys=keys, args=[now_ts, ttl, max(0, idle_seconds), 1 if touch else 0]
+                ))
+
+            if token in self._blacklisted_tokens:
+                return TOKEN_BLACKLISTED
+            if not track_activity:
+                return TOKEN_OK
+            entry = self._last_activity.get(jti)
+            last_ts = entry[0] if entry else None
+            if last_ts is not None and idle_seconds > 0 and now_ts - last_ts > idle_seconds:
+                self._blacklisted_tokens[token] = int(expiry_timestamp)
+                return TOKEN_IDLE_TIMED_OUT
+            if last_ts is None or touch:
+                self._last_activity[jti] = (now_ts, int(expiry_timestamp))
+            return TOKEN_OK
+        except Exception as e:
+            print(f"Failed to check token status: {e}")
+            return TOKEN_OK
@@ -1,10 +1,21 @@
 from .base import TenantBaseService, SuperAdminBaseService
-from .rate_limit import RateLimitService, rate_limit
+from .async_base import AsyncTenantBaseService
+from .rate_limit import (
+    RateLimitService, RateLimitRule, rate_limit, SLIDING_WINDOW, TOKEN_BUCKET,
+    default_rate_limit, heavy_rate_limit, auth_rate_limit
+)
 
 __all__ = [
     "TenantBaseService",
     "SuperAdminBaseService",
+    "AsyncTenantBaseService",
     "RateLimitService",
-    "rate_limit"
+    "RateLimitRule",
+    "rate_limit",
+    "SLIDING_WINDOW",
+    "TOKEN_BUCKET",
+    "default_rate_limit",
+    "heavy_rate_limit",
+    "auth_rate_limit"
 ]
 
@@ -0,0 +1,105 @@
+from typing import Generic, TypeVar, Dict, List, Optional, Type, Any, Union
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from src.db.models.base import TenantModel
+from src.db.crud.base import AsyncTenantCRUDBase
+from src.db.session import get_async_db
+from src.core.middleware.tenant import get_tenant_from_request
+
+ModelType = TypeVar("ModelType", bound=TenantModel)
+CreateSchemaType = TypeVar("CreateSchemaType")
+UpdateSchemaType = TypeVar("UpdateSchemaType")
+
+
+class AsyncTenantBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Async variant of TenantBaseService backed by an AsyncSession.
+    Queries are awaited on asyncpg instead of blocking the event loop.
+    Services can switch to this base one at a time; the public API is the same."""
+    def __init__(
+        self,
+        crud: AsyncTenantCRUDBase,
+        model: Type[ModelType],
+        tenant_id: Any = Depends(get_tenant_from_request),
+        db: AsyncSession = Depends(get_async_db),
+    ):
+        self.crud = crud
+        self.model = model
+
+        # Handle different tenant_id formats properly
+        if isinstance(tenant_id, dict):
+            tenant_id_value = tenant_id["id"]
+        elif hasattr(tenant_id, 'id'):  # Tenant object
+            tenant_id_value = tenant_id.id
+        else:
+            tenant_id_value = tenant_id
+
+        self.tenant_id = self._ensure_uuid(tenant_id_value)
+        self.db = db
+
+    def _ensure_uuid(self, value: Any) -> UUID:
+        """Ensure the value is a UUID object."""
+        if isinstance(value, str):
+            try:
+                return UUID(value)
+            except ValueError:
+                raise ValueError(f"Invalid UUID format: {value}")
+        elif isinstance(value, UUID):
+            return value
+        else:
+            raise ValueError(f"Value must be a UUID or valid UUID string: {value}")
+
+    async def get(self, id: Any) -> Optional[ModelType]:
+        """Get a record by ID with tenant filtering."""
+        return await self.crud.get_by_id(db=self.db, tenant_id=self.tenant_id, id=id)
+
+    async def list(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None, **kwargs) -> List[ModelType]:
+        """List records with tenant filtering, pagination, and optional filters."""
+        return await self.crud.list(
+            db=self.db,
+            tenant_id=self.tenant_id,
+            skip=skip,
+            limit=limit,
+            filters=filters or {},
+            options=options,
+            **kwargs
+        )
+
+    async def list_with_cursor(self, *, after: Optional[str] = None, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None) -> tuple[List[ModelType], Optional[str]]:
+        """List records in keyset (cursor) mode, returning (items, next_cursor)."""
+        return await self.crud.list_with_cursor(
+            db=self.db,
+            tenant_id=self.tenant_id,
+            after=after,
+            limit=limit,
+            filters=filters or {},
+            options=options
+        )
+
+    async def list_with_count(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None, **kwargs) -> tuple[List[ModelType], int]:
+        """List records with total count and tenant filtering."""
+        return await self.crud.list_with_count(
+            db=self.db,
+            tenant_id=self.tenant_id,
+            skip=skip,
+            limit=limit,
+            filters=filters or {},
+            options=options,
+            **kwargs
+        )
+
+    async def create(self, *, obj_in: CreateSchemaType) -> ModelType:
+        """Create a new record with tenant ID."""
+        return await self.crud.create(db=self.db, tenant_id=self.tenant_id, obj_in=obj_in)
+
+    async def update(self, *, id: Any, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> Optional[ModelType]:
+        """Update a record with tenant validation."""
+        db_obj = await self.crud.get_by_id(db=self.db, tenant_id=self.tenant_id, id=id)
+        if not db_obj:
+            return None
+        return await self.crud.update(db=self.db, tenant_id=self.tenant_id, db_obj=db_obj, obj_in=obj_in)
+
+    async def delete(self, *, id: Any) -> Optional[ModelType]:
+        """Delete a record with tenant validation."""
+        return await self.crud.delete(db=self.db, tenant_id=self.tenant_id, id=id)
@@ -5,8 +5,11 @@ from uuid import UUID
 
 from src.db.models.base import TenantModel
 from src.db.crud.base import TenantCRUDBase
+from src.db.crud.base.counting import CountStrategy, count_query, make_count_cache_key
+from src.db.crud.base.unit_of_work import unit_of_work
 from src.db.session import get_db, get_super_admin_db
 from src.core.middleware.tenant import get_tenant_from_request
+from src.core.redis import cache
 from src.utils.uuid_utils import ensure_uuid
 
 ModelType = TypeVar("ModelType", bound=TenantModel)
@@ -16,6 +19,10 @@ UpdateSchemaType = TypeVar("UpdateSchemaType")
 class TenantBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base service class for tenant-aware operations.
     Automatically injects tenant context into all operations."""
+
+    # Namespace of the per-tenant data version (and @cached generation) that
+    # create/update/delete bump; used for ETags on reference data lists.
+    data_version: Optional[str] = None
     def __init__(
         self,
         crud: TenantCRUDBase,
@@ -48,13 +55,25 @@ class TenantBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             return value
         else:
             raise ValueError(f"Value must be a UUID or valid UUID string: {value}")
+
+    def unit_of_work(self):
+        """Run several writes in one transaction: `with service.unit_of_work(): ...`.
+
+        CRUD calls inside the block skip their own commit and refresh; the
+        block commits once at the end or rolls everything back on error.
+        """
+        return unit_of_work(self.db)
     
     async def get(self, id: Any) -> Optional[ModelType]:
         """Get a record by ID with tenant filtering."""
         return self.crud.get_by_id(db=self.db, tenant_id=self.tenant_id, id=id)
     
-    async def list(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None, **kwargs) -> List[ModelType]:
-        """List records with tenant filtering, pagination, and optional filters."""
+    async def list(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None, after: Optional[str] = None, **kwargs) -> List[ModelType]:
+        """List records with tenant filtering, pagination, and optional filters.
+        Pass an `after` cursor to page by keyset instead of OFFSET; the result then
+        carries the following page's cursor as `next_cursor`."""
+        if after:
+            kwargs["after"] = after
         return self.crud.list(
             db=self.db, 
             tenant_id=self.tenant_id, 
@@ -65,8 +84,22 @@ class TenantBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             **kwargs
         )
 
-    async def list_with_count(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None, **kwargs) -> tuple[List[ModelType], int]:
-        """List records with total count and tenant filtering."""
+    async def list_with_cursor(self, *, after: Optional[str] = None, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None) -> tuple[List[ModelType], Optional[str]]:
+        """List records in keyset (cursor) mode, returning (items, next_cursor)."""
+        return self.crud.list_with_cursor(
+            db=self.db,
+            tenant_id=self.tenant_id,
+            after=after,
+            limit=limit,
+            filters=filters or {},
+            options=options
+        )
+
+    async def list_with_count(self, *, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, options: Optional[List[Any]] = None, after: Optional[str] = None, **kwargs) -> tuple[List[ModelType], Optional[int]]:
+        """List records with total count and tenant filtering.
+        With an `after` cursor the count is skipped (total is None) and items carry `next_cursor`."""
+        if after:
+            kwargs["after"] = after
         return self.crud.list_with_count(
             db=self.db,
             tenant_id=self.tenant_id,
@@ -77,9 +110,16 @@ class TenantBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             **kwargs
         )
     
-    async def create(self, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new record with tenant ID."""
-        return self.crud.create(db=self.db, tenant_id=self.tenant_id, obj_in=obj_in)
+    async def bump_data_version(self) -> None:
+        """Mark this tenant's data of this type as changed (no-op without data_version)."""
+        if self.data_version:
+            await cache.invalidate_namespace(self.data_version, self.tenant_id)
+
+    async def create(self, *, obj_in: CreateSchemaType, **crud_kwargs: Any) -> ModelType:
+        """Create a new record with tenant ID; crud_kwargs go to crud.create (e.g. password_hash)."""
+        result = self.crud.create(db=self.db, tenant_id=self.tenant_id, obj_in=obj_in, **crud_kwargs)
+        await self.bump_data_version()
+        return result
     
     async def update(self, *, id: Any, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> Optional[ModelType]:
         """Update a record with tenant validation."""
@@ -87,11 +127,16 @@ class TenantBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj = self.crud.get_by_id(db=self.db, tenant_id=self.tenant_id, id=id)
         if not db_obj:
             return None
-        return self.crud.update(db=self.db, tenant_id=self.tenant_id, db_obj=db_obj, obj_in=obj_in)
+        result = self.crud.update(db=self.db, tenant_id=self.tenant_id, db_obj=db_obj, obj_in=obj_in)
+        await self.bump_data_version()
+        return result
     
     async def delete(self, *, id: Any) -> Optional[ModelType]:
         """Delete a record with tenant validation."""
-        return self.crud.delete(db=self.db, tenant_id=self.tenant_id, id=id)
+        result = self.crud.delete(db=self.db, tenant_id=self.tenant_id, id=id)
+        if result is not None:
+            await self.bump_data_version()
+        return result
 
 
 class SuperAdminBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
@@ -133,14 +178,19 @@ class SuperAdminBaseService(Generic[ModelType, CreateSchemaType, UpdateSchemaTyp
                 query = query.filter(getattr(self.model, field) == value)
         return query.offset(skip).limit(limit).all()
 
-    async def list_with_count(self, *, skip: int = 0, limit: int = 100, filters: Dict = {}) -> tuple[List[ModelType], int]:
+    async def list_with_count(self, *, skip: int = 0, limit: int = 100, filters: Dict = {}, count_strategy: CountStrategy = CountStrategy.EXACT) -> tuple[List[ModelType], int]:
         """List all records across tenants with total count."""
         query = self.db.query(self.model)
         for field, value in filters.items():
             if hasattr(self.model, field):
                 query = query.filter(getattr(self.model, field) == value)
         
-        total = query.count()
+        total = count_query(
+            self.db,
+            query,
+            strategy=count_strategy,
+            cache_key=make_count_cache_key(self.model.__tablename__, "*", filters)
+        )
         items = query.offset(skip).limit(limit).all()
         return items, total
 
@@ -1,143 +1,295 @@
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Tuple
 from fastapi import HTTPException, status, Request
-from datetime import datetime, timedelta
-import json
+from collections import OrderedDict
+from dataclasses import dataclass
 import hashlib
 import logging
+import math
+import threading
+import time
+import uuid
 
-from src.core.config import settings
+from src.core.redis import cache, REDIS_AVAILABLE
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Initialize Redis client if possible
-try:
-    import redis
-    redis_client = redis.Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=settings.REDIS_DB,
-        password=settings.REDIS_PASSWORD,
-        decode_responses=True
-    )
-    # Test connection
-    redis_client.ping()
-    REDIS_AVAILABLE = True
-    logger.info("Redis connection established successfully")
-except ImportError as e:
-    logger.warning(f"Redis module not available: {e}. Rate limiting will be disabled.")
-    REDIS_AVAILABLE = False
-    redis_client = None
-except Exception as e:
-    logger.warning(f"Redis connection error: {e}. Rate limiting will be disabled.")
-    REDIS_AVAILABLE = False
-    redis_client = None
+SLIDING_WINDOW = "sliding_window"
+TOKEN_BUCKET = "token_bucket"
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """Allow `limit` requests per `period` seconds using `algorithm`."""
+    limit: int
+    period: int
+    algorithm: str = SLIDING_WINDOW
+
+
+# Quota tiers per Tenant.plan_type; routes opt into a tier with rate_limit(tier=...).
+# Tier quotas are shared by every client of the tenant.
+PLAN_RATE_LIMITS: Dict[str, Dict[str, RateLimitRule]] = {
+    "flat_rate": {
+        "default": RateLimitRule(600, 60, TOKEN_BUCKET),
+        "heavy": RateLimitRule(30, 60),
+        "auth": RateLimitRule(20, 60),
+    },
+    "per_user": {
+        "default": RateLimitRule(1200, 60, TOKEN_BUCKET),
+        "heavy": RateLimitRule(60, 60),
+        "auth": RateLimitRule(40, 60),
+    },
+}
+DEFAULT_PLAN = "flat_rate"
+
+# Keys tracked by the in-process fallback limiter before the least recent is dropped
+LOCAL_LIMITER_MAX_KEYS = 10000
+
+# Both scripts read the clock from Redis so every worker agrees on "now".
+# Each returns {allowed, remaining, reset_ms}.
+SLIDING_WINDOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    local reset = window
+    if oldest[2] then
+        reset = tonumber(oldest[2]) + window - now
+    end
+    return {0, 0, reset}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, limit - count - 1, window}
+"""
+
+TOKEN_BUCKET_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local rate = capacity / window
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local reset = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    reset = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], window)
+return {allowed, math.floor(tokens), reset}
+"""
+
+_SCRIPTS = {SLIDING_WINDOW: SLIDING_WINDOW_SCRIPT, TOKEN_BUCKET: TOKEN_BUCKET_SCRIPT}
+
+
+class LocalRateLimiter:
+    """Per-worker limiter with the same algorithms, used while Redis is unreachable.
+
+    Limits are enforced per process, so with N workers a client may get up to
+    N times the quota - still far better than not limiting at all.
+    """
+
+    def __init__(self, max_keys: int = LOCAL_LIMITER_MAX_KEYS):
+        self.max_keys = max_keys
+        self._state: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rule: RateLimitRule) -> Tuple[bool, int, int]:
+        """Record one request; returns (allowed, remaining, reset_ms)."""
+        now = time.monotonic() * 1000
+        window = rule.period * 1000
+        with self._lock:
+            if rule.algorithm == TOKEN_BUCKET:
+                result, state = self._token_bucket(self._state.get(key), now, window, rule.limit)
+            else:
+                result, state = self._sliding_window(self._state.get(key), now, window, rule.limit)
+            self._state[key] = state
+            self._state.move_to_end(key)
+            while len(self._state) > self.max_keys:
+                self._state.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _sliding_window(hits, now: float, window: float, limit: int):
+        hits = [ts for ts in (hits or []) if ts > now - window]
+        if len(hits) >= limit:
+            return (False, 0, int(hits[0] + window - now)), hits
+        hits.append(now)
+        return (True, limit - len(hits), int(window)), hits
+
+    @staticmethod
+    def _token_bucket(state, now: float, window: float, capacity: int):
+        rate = capacity / window
+        tokens, ts = state or (capacity, now)
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+        if tokens >= 1:
+            tokens -= 1
+            return (True, int(tokens), 0), (tokens, now)
+        return (False, 0, math.ceil((1 - tokens) / rate)), (tokens, now)
+
+
+local_limiter = LocalRateLimiter()
+
+
+def get_plan_rule(plan_type: Optional[str], tier: str) -> RateLimitRule:
+    """Quota for a route tier under a tenant plan, falling back to the default plan and tier."""
+    plan = PLAN_RATE_LIMITS.get(plan_type or DEFAULT_PLAN, PLAN_RATE_LIMITS[DEFAULT_PLAN])
+    return plan.get(tier) or plan["default"]
 
 
 class RateLimitService:
     """
     Service for implementing rate limiting on API endpoints.
+
+    Each check is a single Lua script call, so concurrent requests cannot race
+    past the limit. Falls back to an in-process limiter when Redis is down.
     """
-    def __init__(self, limit: int = 100, period: int = 60):
+    def __init__(self, limit: int = 100, period: int = 60, algorithm: str = SLIDING_WINDOW, tier: Optional[str] = None):
         """
         Initialize rate limiter.
-        
+
         Args:
             limit: Maximum number of requests allowed in the period
             period: Time period in seconds
+            algorithm: SLIDING_WINDOW or TOKEN_BUCKET
+            tier: Quota tier from PLAN_RATE_LIMITS; when set, limit/period come
+                from the request tenant's plan and the quota is tenant-wide
         """
-        self.limit = limit
-        self.period = period
-    
+        if algorithm not in _SCRIPTS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+        self.rule = RateLimitRule(limit, period, algorithm)
+        self.tier = tier
+        self._scripts: Dict[str, Any] = {}
+        self._script_client = None
+
+    @property
+    def limit(self) -> int:
+        return self.rule.limit
+
+    @property
+    def period(self) -> int:
+        return self.rule.period
+
     def _get_key(self, request: Request, tenant_id: Optional[str] = None) -> str:
         """
         Generate a unique key for rate limiting based on client IP and tenant ID.
         """
-        client_ip = request.client.host
+        client_ip = request.client.host if request.client else "unknown"
         path = request.url.path
-        
+
         # Include tenant_id in the key if provided
         if tenant_id:
             key_base = f"{client_ip}:{tenant_id}:{path}"
         else:
             key_base = f"{client_ip}:{path}"
-        
+
         # Hash the key to ensure it's safe for Redis
         return f"rate_limit:{hashlib.md5(key_base.encode()).hexdigest()}"
-    
+
+    def _resolve(self, request: Request, tenant_id: Optional[str] = None) -> Tuple[str, RateLimitRule]:
+        """Pick the key and rule for this request."""
+        if self.tier is None:
+            return self._get_key(request, tenant_id), self.rule
+        tenant = getattr(request.state, "tenant", None)
+        if tenant is None:
+            # No tenant resolved (bypass paths): apply the default plan per client
+            return self._get_key(request, tenant_id), get_plan_rule(None, self.tier)
+        return f"rate_limit:tenant:{tenant.id}:{self.tier}", get_plan_rule(tenant.plan_type, self.tier)
+
+    async def _hit_redis(self, key: str, rule: RateLimitRule) -> Optional[Tuple[bool, int, int]]:
+        """Run the rule's script; None when Redis cannot be used."""
+        if not REDIS_AVAILABLE:
+            return None
+        await cache.connect()
+        if not cache.client:
+            return None
+        if self._script_client is not cache.client:
+            self._scripts = {}
+            self._script_client = cache.client
+        script = self._scripts.get(rule.algorithm)
+        if script is None:
+            script = self._scripts[rule.algorithm] = cache.client.register_script(_SCRIPTS[rule.algorithm])
+        args = [rule.period * 1000, rule.limit]
+        if rule.algorithm == SLIDING_WINDOW:
+            args.append(uuid.uuid4().hex)
+        allowed, remaining, reset_ms = await script(keys=[key], args=args)
+        return bool(allowed), int(remaining), int(reset_ms)
+
     async def check_rate_limit(self, request: Request, tenant_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Check if the request exceeds the rate limit.
-        
+
         Returns:
             Dict with rate limit information
-        
+
         Raises:
             HTTPException if rate limit is exceeded
         """
-        # If Redis is not available, skip rate limiting
-        if not REDIS_AVAILABLE:
-            return {
-                "limit": self.limit,
-                "remaining": self.limit,
-                "reset": int(datetime.utcnow().timestamp() + self.period)
-            }
-            
-        key = self._get_key(request, tenant_id)
-        current_time = datetime.utcnow().timestamp()
-        window_start = current_time - self.period
-        
-        # Remove old requests
-        redis_client.zremrangebyscore(key, 0, window_start)
-        
-        # Count current requests in the window
-        current_count = redis_client.zcard(key)
-        
-        # Check if limit is exceeded
-        if current_count >= self.limit:
-            # Get reset time
-            oldest_request = float(redis_client.zrange(key, 0, 0, withscores=True)[0][1])
-            reset_time = oldest_request + self.period - current_time
-            
+        key, rule = self._resolve(request, tenant_id)
+        try:
+            result = await self._hit_redis(key, rule)
+        except Exception as e:
+            logger.warning(f"Rate limit Redis error, using in-process limiter: {e}")
+            result = None
+        if result is None:
+            result = local_limiter.hit(key, rule)
+
+        allowed, remaining, reset_ms = result
+        reset_seconds = max(1, math.ceil(reset_ms / 1000))
+        if not allowed:
             # Set headers for rate limit response
             headers = {
-                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Limit": str(rule.limit),
                 "X-RateLimit-Remaining": "0",
-                "X-RateLimit-Reset": str(int(reset_time))
+                "X-RateLimit-Reset": str(reset_seconds),
+                "Retry-After": str(reset_seconds)
             }
-            
+
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Rate limit exceeded",
                 headers=headers
             )
-        
-        # Add current request to the window
-        redis_client.zadd(key, {str(current_time): current_time})
-        # Set expiration on the key
-        redis_client.expire(key, self.period)
-        
+
         # Return rate limit information
         return {
-            "limit": self.limit,
-            "remaining": self.limit - current_count - 1,
-            "reset": int(current_time + self.period)
+            "limit": rule.limit,
+            "remaining": remaining,
+            "reset": int(time.time()) + reset_seconds
         }
 
 # Create dependency for rate limiting
-def rate_limit(limit: int = 100, period: int = 60):
+def rate_limit(limit: int = 100, period: int = 60, algorithm: str = SLIDING_WINDOW, tier: Optional[str] = None):
     """
     Dependency for rate limiting API endpoints.
-    
+
     Args:
         limit: Maximum number of requests allowed in the period
         period: Time period in seconds
+        algorithm: SLIDING_WINDOW or TOKEN_BUCKET
+        tier: Use the tenant plan's quota for this tier instead of limit/period
     """
-    rate_limiter = RateLimitService(limit=limit, period=period)
-    
+    rate_limiter = RateLimitService(limit=limit, period=period, algorithm=algorithm, tier=tier)
+
     async def check_rate_limit_dependency(request: Request):
         return await rate_limiter.check_rate_limit(request)
-    
+
     return check_rate_limit_dependency
 
-    
\ No newline at end of file
+
+# Shared tier dependencies: default on the whole API router, heavy on export/bulk/report
+# routes, auth on login and token refresh.
+default_rate_limit = rate_limit(tier="default")
+heavy_rate_limit = rate_limit(tier="heavy")
+auth_rate_limit = rate_limit(tier="auth")
@@ -5,6 +5,7 @@ from fastapi import Request, Depends
 from sqlalchemy.orm import Session, joinedload
 
 from src.db.crud.logging.activity_log import activity_log_crud
+from src.db.crud.base.counting import CountStrategy, count_query, make_count_cache_key
 from src.db.models.logging.activity_log import ActivityLog
 from src.schemas.logging.activity_log import ActivityLogCreate, ActivityLogUpdate
 from src.services.base.base import TenantBaseService, SuperAdminBaseService
@@ -58,8 +59,8 @@ class AuditLoggingService(TenantBaseService[ActivityLog, ActivityLogCreate, Acti
         )
         return self.crud.create(self.db, tenant_id=self.tenant_id, obj_in=log_data)
 
-    async def list_with_count(self, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, **kwargs) -> tuple[List[ActivityLog], int]:
-        """List records with total count, eager loading of user, and super-admin filtering."""
+    def _build_tenant_log_query(self, filters: Optional[Dict] = None):
+        """Build the tenant log query, excluding logs written by super-admins."""
         from src.db.models.auth.user import User
         
         # Start with base query
@@ -78,9 +79,19 @@ class AuditLoggingService(TenantBaseService[ActivityLog, ActivityLogCreate, Acti
         # We use an outer join to keep system logs (user_id is null)
         query = query.outerjoin(User, ActivityLog.user_id == User.id)
         query = query.filter((User.id == None) | (User.tenant_id == self.tenant_id))
+        return query
+
+    async def list_with_count(self, skip: int = 0, limit: int = 100, filters: Optional[Dict] = None, count_strategy: CountStrategy = CountStrategy.EXACT, **kwargs) -> tuple[List[ActivityLog], int]:
+        """List records with total count, eager loading of user, and super-admin filtering."""
+        query = self._build_tenant_log_query(filters)
         
         # Get total count
-        total = query.count()
+        total = count_query(
+            self.db,
+            query,
+            strategy=count_strategy,
+            cache_key=make_count_cache_key(ActivityLog.__tablename__, self.tenant_id, filters)
+        )
         
         # Add eager loading and sorting
         query = query.options(joinedload(ActivityLog.user))
@@ -89,7 +100,13 @@ class AuditLoggingService(TenantBaseService[ActivityLog, ActivityLogCreate, Acti
         items = query.offset(skip).limit(limit).all()
         return items, total
 
-    async def get_by_date_range(self, start_date: datetime, end_date: datetime, skip: int = 0, limit: int = 100) -> tuple[List[ActivityLog], int]:
+    async def list_with_cursor(self, *, after: Optional[str] = None, limit: int = 100, filters: Optional[Dict] = None, **kwargs) -> tuple[List[ActivityLog], Optional[str]]:
+        """Keyset-paginated variant of list_with_count, returning (items, next_cursor)."""
+        query = self._build_tenant_log_query(filters).options(joinedload(ActivityLog.user))
+        page = self.crud.paginate_keyset(query, after=after, limit=limit)
+        return page, page.next_cursor
+
+    async def get_by_date_range(self, start_date: datetime, end_date: datetime, skip: int = 0, limit: int = 100, count_strategy: CountStrategy = CountStrategy.EXACT) -> tuple[List[ActivityLog], int]:
         """Get activity logs within a date range with pagination support."""
         from src.db.models.auth.user import User
         
@@ -102,7 +119,14 @@ class AuditLoggingService(TenantBaseService[ActivityLog, ActivityLogCreate, Acti
         query = query.outerjoin(User, ActivityLog.user_id == User.id)
         query = query.filter((User.id == None) | (User.tenant_id == self.tenant_id))
         
-        total = query.count()
+        total = count_query(
+            self.db,
+            query,
+            strategy=count_strategy,
+            cache_key=make_count_cache_key(
+                ActivityLog.__tablename__, self.tenant_id, {"start_date": start_date, "end_date": end_date}
+            )
+        )
         
         query = query.options(joinedload(ActivityLog.user))
         query = query.order_by(ActivityLog.created_at.desc())
@@ -0,0 +1,266 @@
+import asyncio
+import json
+import os
+import threading
+from datetime import datetime, UTC
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+
+from src.core.config import settings
+from src.db.models.logging.activity_log import ActivityLog
+from src.db.models.logging.super_admin_activity_log import SuperAdminActivityLog
+from src.db.session import SessionLocal
+
+TENANT_EVENT = "tenant"
+SUPER_ADMIN_EVENT = "super_admin"
+
+_MODELS = {TENANT_EVENT: ActivityLog, SUPER_ADMIN_EVENT: SuperAdminActivityLog}
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (UUID, datetime)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class AuditLogPipeline:
+    """Buffers audit events in memory and writes them to the database in batches.
+
+    Requests only enqueue (no DB work on the request path); a background task
+    inserts each batch with one multi-row INSERT. Batches the database rejects
+    are appended to a JSON-lines spill file and replayed on the next start.
+    Rows carry their own ids, and inserts skip ids already present, so a
+    replayed batch never duplicates entries.
+    """
+
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float, spill_path: str):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_path = spill_path
+        self._queue: "asyncio.Queue[Tuple[str, Dict[str, Any]]]" = asyncio.Queue(maxsize=max_size)
+        self._spill_lock = threading.Lock()
+        # Batch being collected or written; kept here so shutdown can still save it
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self.written = 0
+        self.spilled = 0
+        self.rejected = 0
+
+    def submit(self, kind: str, **values: Any) -> None:
+        """Queue one event; never blocks. Call from the event loop."""
+        now = datetime.now(UTC)
+        row = {"id": uuid4(), "created_at": now, "updated_at": now, **values}
+        try:
+            self._queue.put_nowait((kind, row))
+        except asyncio.QueueFull:
+            # Sustained DB outage or burst beyond the buffer: keep the event on disk
+            self._spill([(kind, row)])
+
+    def log_activity(
+        self,
+        *,
+        tenant_id: UUID,
+        user_id: Optional[UUID],
+        action: str,
+        entity_type: str,
+        entity_id: Optional[UUID] = None,
+        old_values: Optional[Dict] = None,
+        new_values: Optional[Dict] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """Queue a tenant activity log entry (see AuditLoggingService.log_activity)."""
+        self.submit(
+            TENANT_EVENT,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            old_values=old_values,
+            new_values=new_values,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+
+    def log_super_admin_activity(
+        self,
+        *,
+        user_id: Optional[UUID],
+        action: str,
+        entity_type: str,
+        entity_id: Optional[UUID] = None,
+        target_tenant_id: Optional[UUID] = None,
+        old_values: Optional[Dict] = None,
+        new_values: Optional[Dict] = None,
+        details: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """Queue a super-admin activity log entry (see SuperAdminActivityLogService)."""
+        self.submit(
+            SUPER_ADMIN_EVENT,
+            user_id=user_id,
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            target_tenant_id=target_tenant_id,
+            old_values=old_values,
+            new_values=new_values,
+            details=details,
+            ip_address=ip_address,
+            user_agent=user_agent,
+        )
+
+    async def run(self) -> None:
+        """Write queued events in batches; runs for the app's lifetime.
+
+        Starts by retrying events spilled by the previous run.
+        """
+        try:
+            try:
+                await self.replay_spill()
+            except Exception as e:
+                print(f"Audit log spill replay failed: {e}")
+            while True:
+                batch = await self._next_batch()
+                await self._flush(batch)
+                self._pending = []
+        finally:
+            # Shutdown (or cancellation mid-batch): write the pending batch, then whatever is still queued.
+            # Inserts skip existing ids, so a batch interrupted mid-write is safe to write again.
+            batch, self._pending = self._pending, []
+            batch = batch or self._drain()
+            while batch:
+                await self._flush(batch)
+                batch = self._drain()
+
+    async def _next_batch(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Wait for the first event, then collect more for up to flush_interval into self._pending."""
+        self._pending = batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def _drain(self) -> List[Tuple[str, Dict[str, Any]]]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _flush(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        try:
+            await run_in_threadpool(self._write, batch)
+        except Exception as e:
+            print(f"Audit log write failed, spilling {len(batch)} events: {e}")
+            self._spill(batch)
+
+    def _write(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        rows_by_kind: Dict[str, List[Dict[str, Any]]] = {}
+        for kind, row in batch:
+            rows_by_kind.setdefault(kind, []).append(row)
+        db = SessionLocal()
+        try:
+            try:
+                for kind, rows in rows_by_kind.items():
+                    self._insert(db, kind, rows)
+                db.commit()
+                self.written += len(batch)
+            except IntegrityError:
+                # e.g. an event for a tenant deleted meanwhile: keep the rest of the batch
+                db.rollback()
+                self._write_one_by_one(db, batch)
+        finally:
+            db.close()
+
+    def _write_one_by_one(self, db, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        rejected = []
+        for kind, row in batch:
+            try:
+                self._insert(db, kind, [row])
+                db.commit()
+                self.written += 1
+            except IntegrityError as e:
+                db.rollback()
+                print(f"Audit log event rejected: {e.orig}")
+                rejected.append((kind, row))
+        if rejected:
+            self.rejected += len(rejected)
+            self._spill(rejected, path=f"{self.spill_path}.rejected")
+
+    @staticmethod
+    def _insert(db, kind: str, rows: List[Dict[str, Any]]) -> None:
+        model = _MODELS[kind]
+        db.execute(insert(model).on_conflict_do_nothing(index_elements=["id"]), rows)
+
+    def _spill(self, batch: List[Tuple[str, Dict[str, Any]]], path: Optional[str] = None) -> None:
+        path = path or self.spill_path
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with self._spill_lock, open(path, "a", encoding="utf-8") as f:
+                for kind, row in batch:
+                    f.write(json.dumps({"kind": kind, "row": row}, default=_json_default) + "\n")
+            if path == self.spill_path:
+                self.spilled += len(batch)
+        except Exception as e:
+            print(f"Audit log spill failed, {len(batch)} events lost: {e}")
+
+    async def replay_spill(self) -> int:
+        """Write events spilled by an earlier run; returns how many were read.
+
+        A replay interrupted by a crash is finished first; the current spill
+        file then waits for the next start.
+        """
+        replay_path = f"{self.spill_path}.replaying"
+        if not os.path.exists(replay_path):
+            if not os.path.exists(self.spill_path):
+                return 0
+            with self._spill_lock:
+                os.replace(self.spill_path, replay_path)
+        batch = []
+        with open(replay_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                    row = event["row"]
+                    for key in ("id", "tenant_id", "user_id", "entity_id", "target_tenant_id"):
+                        if row.get(key):
+                            row[key] = UUID(row[key])
+                    for key in ("created_at", "updated_at"):
+                        row[key] = datetime.fromisoformat(row[key])
+                    batch.append((event["kind"], row))
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Skipping unreadable spilled audit event: {e}")
+        for start in range(0, len(batch), self.batch_size):
+            await self._flush(batch[start:start + self.batch_size])
+        os.remove(replay_path)
+        return len(batch)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "spilled": self.spilled,
+            "rejected": self.rejected,
+        }
+
+
+audit_pipeline = AuditLogPipeline(
+    max_size=settings.AUDIT_QUEUE_MAX_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    spill_path=settings.AUDIT_SPILL_PATH,
+)
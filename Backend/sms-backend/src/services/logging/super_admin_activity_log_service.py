@@ -5,6 +5,7 @@ from fastapi import Request
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from src.db.crud.base.counting import CountStrategy, count_query, make_count_cache_key
 from src.db.models.logging.super_admin_activity_log import SuperAdminActivityLog
 from src.db.models.auth.user import User
 from src.schemas.logging.super_admin_activity_log import SuperAdminActivityLogCreate, SuperAdminActivityLogUpdate
@@ -99,7 +100,8 @@ class SuperAdminActivityLogService:
         entity_type: Optional[str] = None,
         target_tenant_id: Optional[UUID] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        count_strategy: CountStrategy = CountStrategy.EXACT
     ) -> int:
         """Get count of super-admin activity logs with filtering."""
         query = self.db.query(SuperAdminActivityLog)
@@ -120,4 +122,17 @@ class SuperAdminActivityLogService:
         elif end_date:
             query = query.filter(SuperAdminActivityLog.created_at <= end_date)
         
-        return query.count()
\ No newline at end of file
+        filters = {
+            "user_id": user_id,
+            "action": action,
+            "entity_type": entity_type,
+            "target_tenant_id": target_tenant_id,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        return count_query(
+            self.db,
+            query,
+            strategy=count_strategy,
+            cache_key=make_count_cache_key(SuperAdminActivityLog.__tablename__, "*", filters)
+        )
\ No newline at end of file
@@ -20,6 +20,8 @@ from src.core.middleware.tenant import get_tenant_from_request
 from src.db.models.logging.activity_log import ActivityLog
 
 from src.db.crud.auth.user import user as user_crud
+from src.core.security.hashing import hash_password, hash_passwords
+from src.services.auth.password import generate_default_password
 
 class StudentService(TenantBaseService[Student, StudentCreate, StudentUpdate]):
     """
@@ -66,8 +68,12 @@ class StudentService(TenantBaseService[Student, StudentCreate, StudentUpdate]):
         """Get a student by admission number within the current tenant."""
         return student_crud.get_by_admission_number(self.db, tenant_id=self.tenant_id, admission_number=admission_number)
     
-    async def create(self, *, obj_in: StudentCreate) -> Student:
-        """Create a new student with duplicate checking."""
+    async def create(self, *, obj_in: StudentCreate, password_hash: Optional[str] = None) -> Student:
+        """Create a new student with duplicate checking.
+
+        password_hash, when given, must be the hash of obj_in.password; otherwise
+        the password (generated if missing) is hashed in the hashing process pool.
+        """
         # Check for duplicate email globally
         if obj_in.email:
             existing_user = user_crud.get_by_email_any_tenant(self.db, email=obj_in.email)
@@ -80,14 +86,34 @@ class StudentService(TenantBaseService[Student, StudentCreate, StudentUpdate]):
             if existing:
                 raise DuplicateEntityError("Student", "admission_number", obj_in.admission_number)
         
-        return await super().create(obj_in=obj_in)
+        password_was_generated = False
+        if password_hash is None:
+            password_was_generated = not obj_in.password
+            password = obj_in.password or generate_default_password()
+            obj_in = obj_in.model_copy(update={"password": password})
+            password_hash = await hash_password(password)
+
+        created = await super().create(obj_in=obj_in, password_hash=password_hash)
+        if password_was_generated:
+            created.generated_password = obj_in.password
+        return created
     
     async def bulk_create(self, *, students_in: List[StudentCreate]) -> List[Dict[str, Any]]:
-        """Create multiple students with individual status reporting."""
+        """Create multiple students with individual status reporting.
+
+        Passwords are hashed up front, in parallel, by the hashing process pool.
+        """
+        passwords = [s_in.password or generate_default_password() for s_in in students_in]
+        password_hashes = await hash_passwords(passwords)
+
         results = []
-        for s_in in students_in:
+        for s_in, password, password_hash in zip(students_in, passwords, password_hashes):
             try:
-                created = await self.create(obj_in=s_in)
+                password_was_generated = not s_in.password
+                s_in = s_in.model_copy(update={"password": password})
+                created = await self.create(obj_in=s_in, password_hash=password_hash)
+                if password_was_generated:
+                    created.generated_password = password
                 results.append({"success": True, "student": created, "id": str(created.id)})
             except DuplicateEntityError as e:
                 results.append({"success": False, "error": str(e), "email": s_in.email})
@@ -10,6 +10,8 @@ from src.schemas.people import TeacherCreate, TeacherUpdate
 from src.services.base.base import TenantBaseService, SuperAdminBaseService
 from src.core.middleware.tenant import get_tenant_from_request
 from src.db.session import get_db
+from src.core.security.hashing import hash_password, hash_passwords
+from src.services.auth.password import generate_default_password
 
 from src.db.models.logging.activity_log import ActivityLog
 
@@ -68,12 +70,37 @@ class TeacherService(TenantBaseService[Teacher, TeacherCreate, TeacherUpdate]):
         teacher.activate()
         return await self.update(id=teacher_id, obj_in={"status": "active", "exit_date": None, "resignation_reason": None})
     
+    async def create(self, *, obj_in: TeacherCreate, password_hash: Optional[str] = None) -> Teacher:
+        """Create a teacher.
+
+        password_hash, when given, must be the hash of obj_in.password; otherwise
+        the password (generated if missing) is hashed in the hashing process pool.
+        """
+        password_was_generated = False
+        if password_hash is None:
+            password_was_generated = not obj_in.password
+            password = obj_in.password or generate_default_password()
+            obj_in = obj_in.model_copy(update={"password": password})
+            password_hash = await hash_password(password)
+
+        created = await super().create(obj_in=obj_in, password_hash=password_hash)
+        if password_was_generated:
+            created.generated_password = obj_in.password
+        return created
+
     async def create_bulk(self, teachers_data: List[TeacherCreate]) -> List[Teacher]:
-        """Create multiple teachers with auto-generated employee IDs."""
+        """Create multiple teachers with auto-generated employee IDs.
+
+        Passwords are hashed up front, in parallel, by the hashing process pool.
+        """
+        passwords = [t.password or generate_default_password() for t in teachers_data]
+        password_hashes = await hash_passwords(passwords)
+
         created_teachers = []
-        for teacher_data in teachers_data:
+        for teacher_data, password, password_hash in zip(teachers_data, passwords, password_hashes):
             # Employee ID will be auto-generated in CRUD if not provided
-            teacher = await self.create(obj_in=teacher_data)
+            teacher_data = teacher_data.model_copy(update={"password": password})
+            teacher = await self.create(obj_in=teacher_data, password_hash=password_hash)
             created_teachers.append(teacher)
         return created_teachers
 
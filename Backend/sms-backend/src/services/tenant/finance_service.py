@@ -4,6 +4,7 @@ from uuid import UUID
 from datetime import date, datetime
 from decimal import Decimal
 
+from src.db.crud.base import unit_of_work
 from src.db.crud.finance import fee_category, fee_structure, student_fee, fee_installment, fee_payment, expense_category, expenditure
 from src.schemas.finance.fee_category import FeeCategoryCreate
 from src.schemas.finance.fee_structure import FeeStructureCreate
@@ -44,25 +45,26 @@ class FinanceService:
 
     @staticmethod
     def record_payment(db: Session, tenant_id: UUID, payment_in: FeePaymentCreate) -> Any:
-        """Record a fee payment and update the student fee balance."""
-        # Create payment record
-        payment = fee_payment.create(db, obj_in=payment_in, tenant_id=tenant_id)
-        
-        # Update the student fee balance
-        fee = student_fee.get_by_id(db, tenant_id=tenant_id, id=payment_in.student_fee_id)
-        if fee:
-            new_amount_paid = fee.amount_paid + payment_in.amount_paid
-            new_balance = fee.total_amount - new_amount_paid
+        """Record a fee payment and update the student fee balance in one transaction."""
+        with unit_of_work(db):
+            # Create payment record
+            payment = fee_payment.create(db, obj_in=payment_in, tenant_id=tenant_id)
             
-            # Determine new status
-            if new_balance <= 0:
-                new_status = "PAID"
-            elif new_amount_paid > 0:
-                new_status = "PARTIAL"
-            else:
-                new_status = "PENDING"
+            # Update the student fee balance
+            fee = student_fee.get_by_id(db, tenant_id=tenant_id, id=payment_in.student_fee_id)
+            if fee:
+                new_amount_paid = fee.amount_paid + payment_in.amount_paid
+                new_balance = fee.total_amount - new_amount_paid
                 
-            student_fee.update(db, tenant_id=tenant_id, db_obj=fee, obj_in={"amount_paid": new_amount_paid, "balance": new_balance, "status": new_status})
+                # Determine new status
+                if new_balance <= 0:
+                    new_status = "PAID"
+                elif new_amount_paid > 0:
+                    new_status = "PARTIAL"
+                else:
+                    new_status = "PENDING"
+                    
+                student_fee.update(db, tenant_id=tenant_id, db_obj=fee, obj_in={"amount_paid": new_amount_paid, "balance": new_balance, "status": new_status})
             
         return payment
 
@@ -0,0 +1,92 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from src.services.academics.academic_calendar import (
+    DEFAULT_PERIOD_CONTEXT,
+    AcademicCalendarIndex,
+    CalendarPeriod,
+    CalendarSemester,
+    IntervalIndex,
+)
+
+
+def _period(name, number, start, end):
+    return CalendarPeriod(id=uuid4(), name=name, number=number, start_date=start, end_date=end)
+
+
+def _semester(number, start, end, periods):
+    return CalendarSemester(id=uuid4(), number=number, start_date=start, end_date=end, periods=IntervalIndex(periods))
+
+
+@pytest.fixture
+def calendar():
+    # Listed out of order to check the index sorts them
+    second = _semester(2, date(2025, 1, 6), date(2025, 6, 20), [
+        _period("P4", 4, date(2025, 3, 17), date(2025, 6, 20)),
+        _period("P3", 3, date(2025, 1, 6), date(2025, 3, 14)),
+    ])
+    first = _semester(1, date(2024, 9, 2), date(2024, 12, 20), [
+        _period("P1", 1, date(2024, 9, 2), date(2024, 10, 25)),
+        _period("P2", 2, date(2024, 10, 28), date(2024, 12, 20)),
+    ])
+    return AcademicCalendarIndex(uuid4(), [second, first])
+
+
+@pytest.mark.parametrize("on, period_name, semester_number", [
+    (date(2024, 9, 2), "P1", 1),
+    (date(2024, 10, 25), "P1", 1),
+    (date(2024, 10, 28), "P2", 1),
+    (date(2024, 12, 20), "P2", 1),
+    (date(2025, 1, 6), "P3", 2),
+    (date(2025, 3, 17), "P4", 2),
+    (date(2025, 6, 20), "P4", 2),
+])
+def test_period_context_inside_periods(calendar, on, period_name, semester_number):
+    context = calendar.period_context(on)
+
+    assert context["name"] == period_name
+    assert context["semester"] == semester_number
+
+
+def test_gap_between_periods_falls_back_to_first_period(calendar):
+    # Weekend between P1 and P2
+    assert calendar.period_context(date(2024, 10, 26))["name"] == "P1"
+    # Between P3 and P4, the semester's first period is P3
+    assert calendar.period_context(date(2025, 3, 15))["name"] == "P3"
+
+
+def test_date_outside_every_semester_falls_back_to_first_semester(calendar):
+    context = calendar.period_context(date(2024, 12, 28))
+
+    assert context["semester"] == 1
+    assert context["name"] == "P1"
+
+
+def test_missing_date_and_empty_calendar_use_default_context(calendar):
+    assert calendar.period_context(None) == DEFAULT_PERIOD_CONTEXT
+    assert AcademicCalendarIndex(uuid4(), []).period_context(date(2024, 9, 2)) == DEFAULT_PERIOD_CONTEXT
+
+
+def test_semester_without_periods_keeps_its_number(calendar):
+    empty = _semester(1, date(2024, 9, 2), date(2024, 12, 20), [])
+    context = AcademicCalendarIndex(uuid4(), [empty]).period_context(date(2024, 10, 1))
+
+    assert context["semester"] == 1
+    assert context["semester_id"] == empty.id
+    assert context["period_id"] is None
+
+
+def test_interval_index_overlapping_intervals():
+    long = _period("Long", 1, date(2024, 1, 1), date(2024, 12, 31))
+    short = _period("Short", 2, date(2024, 3, 1), date(2024, 3, 31))
+    index = IntervalIndex([short, long])
+
+    # Latest-starting interval wins while it contains the date
+    assert index.find(date(2024, 3, 15)) is short
+    # Past the short interval the scan reaches the earlier, longer one
+    assert index.find(date(2024, 6, 1)) is long
+    assert index.find(date(2023, 12, 31)) is None
+    assert index.find(date(2025, 1, 1)) is None
+    assert index.first is long
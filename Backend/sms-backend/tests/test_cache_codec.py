@@ -0,0 +1,81 @@
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from src.core.cache_codec import CODECS, SCHEMA_TAG_PREFIX, CacheSerializer, get_codec
+
+
+class CachedSubject(BaseModel):
+    id: UUID
+    name: str
+    credits: Optional[int] = None
+
+
+class CachedPeriod(BaseModel):
+    id: UUID
+    start_date: date
+    updated_at: datetime
+    subjects: List[CachedSubject] = []
+
+
+@pytest.fixture(params=sorted(CODECS))
+def serializer(request):
+    return CacheSerializer(get_codec(request.param))
+
+
+def test_schema_instance_round_trip(serializer):
+    period = CachedPeriod(
+        id=uuid4(),
+        start_date=date(2024, 9, 2),
+        updated_at=datetime(2024, 9, 2, 7, 45),
+        subjects=[CachedSubject(id=uuid4(), name="Math", credits=3)]
+    )
+
+    raw = serializer.encode(period)
+    decoded = serializer.decode(raw)
+
+    assert raw.startswith(SCHEMA_TAG_PREFIX)
+    assert type(decoded) is CachedPeriod
+    assert decoded == period
+
+
+def test_schema_list_round_trip(serializer):
+    subjects = [CachedSubject(id=uuid4(), name="Math"), CachedSubject(id=uuid4(), name="Art", credits=1)]
+
+    decoded = serializer.decode(serializer.encode(subjects))
+
+    assert decoded == subjects
+    assert all(type(item) is CachedSubject for item in decoded)
+
+
+def test_plain_values_are_untagged(serializer):
+    value = {"count": 3, "names": ["a", "b"], "ratio": 0.5, "empty": None}
+
+    raw = serializer.encode(value)
+
+    assert not raw.startswith(SCHEMA_TAG_PREFIX)
+    assert serializer.decode(raw) == value
+
+
+def test_mixed_schema_list_is_stored_as_plain_json(serializer):
+    subject_id = uuid4()
+    mixed = [CachedSubject(id=subject_id, name="Math"), {"name": "raw"}]
+
+    decoded = serializer.decode(serializer.encode(mixed))
+
+    assert decoded == [{"id": str(subject_id), "name": "Math", "credits": None}, {"name": "raw"}]
+
+
+def test_unknown_schema_tag_falls_back_to_json(serializer):
+    raw = f'{SCHEMA_TAG_PREFIX}src.schemas.removed:GoneSchema|{{"name": "Math"}}'
+
+    assert serializer.decode(raw) == {"name": "Math"}
+
+
+def test_tags_outside_the_package_are_not_imported(serializer):
+    raw = f'{SCHEMA_TAG_PREFIX}os:PathLike|{{"name": "Math"}}'
+
+    assert serializer.decode(raw) == {"name": "Math"}
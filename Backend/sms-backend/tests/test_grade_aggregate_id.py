@@ -0,0 +1,75 @@
+import os
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.db.crud.academics.grade_aggregate import GRADE_AGGREGATE_ID_SQL
+from src.db.models.academics.grade import GradeType
+from src.db.models.academics.grade_aggregate import aggregate_id
+
+# GRADE_AGGREGATE_ID_SQL uses PostgreSQL casts and md5(), so it needs a real server
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+# Evaluates the rebuild's id expression over a single literal grade row aliased as g
+ID_QUERY = text(f"""
+SELECT {GRADE_AGGREGATE_ID_SQL} FROM (
+    SELECT CAST(:tenant_id AS uuid) AS tenant_id,
+           CAST(:enrollment_id AS uuid) AS enrollment_id,
+           CAST(:subject_id AS uuid) AS subject_id,
+           CAST(:period_id AS uuid) AS period_id,
+           CAST(:semester_id AS uuid) AS semester_id,
+           CAST(:grading_category_id AS uuid) AS grading_category_id,
+           CAST(:assessment_type AS text) AS assessment_type
+) AS g
+""")
+
+NULLABLE_COLUMNS = [
+    {},
+    {"period_id": None},
+    {"semester_id": None},
+    {"period_id": None, "semester_id": None},
+    {"subject_id": None, "grading_category_id": None},
+    {"subject_id": None, "period_id": None, "semester_id": None, "grading_category_id": None},
+]
+
+
+@pytest.fixture(scope="module")
+def postgres_connection():
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_engine(TEST_POSTGRES_URL)
+    with engine.connect() as connection:
+        yield connection
+    engine.dispose()
+
+
+def _bucket(**overrides):
+    bucket = {
+        "tenant_id": uuid4(),
+        "enrollment_id": uuid4(),
+        "subject_id": uuid4(),
+        "period_id": uuid4(),
+        "semester_id": uuid4(),
+        "grading_category_id": uuid4(),
+    }
+    bucket.update(overrides)
+    return bucket
+
+
+@pytest.mark.parametrize("assessment_type", list(GradeType))
+@pytest.mark.parametrize("nulls", NULLABLE_COLUMNS)
+def test_aggregate_id_matches_rebuild_sql(postgres_connection, assessment_type, nulls):
+    bucket = _bucket(**nulls)
+    params = {name: (str(value) if value is not None else None) for name, value in bucket.items()}
+    params["assessment_type"] = assessment_type.value
+
+    sql_id = postgres_connection.execute(ID_QUERY, params).scalar_one()
+
+    # The driver may return the uuid column as a string
+    assert str(sql_id) == str(aggregate_id(assessment_type=assessment_type, **bucket))
+
+
+def test_aggregate_id_accepts_enum_or_value():
+    bucket = _bucket(period_id=None, semester_id=None)
+    assert aggregate_id(assessment_type=GradeType.EXAM, **bucket) == aggregate_id(assessment_type="EXAM", **bucket)
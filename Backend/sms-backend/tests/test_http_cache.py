@@ -0,0 +1,31 @@
+import pytest
+
+from src.core.http_cache import etag_matches
+
+ETAG = 'W/"students-7-1712"'
+
+
+@pytest.mark.parametrize("if_none_match", [
+    'W/"students-7-1712"',
+    '"students-7-1712"',
+    '"other", W/"students-7-1712"',
+    ' W/"students-7-1712" ',
+    "*",
+])
+def test_etag_matches(if_none_match):
+    assert etag_matches(if_none_match, ETAG)
+
+
+@pytest.mark.parametrize("if_none_match", [
+    None,
+    "",
+    'W/"students-8-1712"',
+    '"students-7-1712-extra"',
+    'students-7-1712',
+])
+def test_etag_does_not_match(if_none_match):
+    assert not etag_matches(if_none_match, ETAG)
+
+
+def test_strong_etag_matches_weak_header():
+    assert etag_matches('W/"abc"', '"abc"')
@@ -0,0 +1,64 @@
+from datetime import date, datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.db.crud.base.pagination import CursorPage, cursor_for, decode_cursor, encode_cursor
+
+
+class Row:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+def test_cursor_round_trip_default_keyset():
+    created_at = datetime(2024, 9, 1, 8, 30, 15, 123456, tzinfo=timezone.utc)
+    row_id = uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert decode_cursor(cursor) == (created_at, row_id)
+
+
+def test_cursor_round_trip_typed_columns():
+    values = (date(2024, 9, 2), "Doe", 42, uuid4())
+
+    cursor = encode_cursor(*values)
+    decoded = decode_cursor(cursor, (date, str, int, UUID))
+
+    assert decoded == values
+    assert [type(v) for v in decoded] == [date, str, int, UUID]
+
+
+def test_cursor_keeps_nulls_and_untyped_columns():
+    cursor = encode_cursor(None, "raw")
+
+    assert decode_cursor(cursor, (datetime, None)) == (None, "raw")
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime(2024, 1, 1), uuid4())
+
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+def test_cursor_for_reads_keyset_columns():
+    row = Row(created_at=datetime(2024, 5, 6, 7, 8, 9), id=uuid4(), last_name="Smith")
+
+    assert decode_cursor(cursor_for(row)) == (row.created_at, row.id)
+    assert decode_cursor(cursor_for(row, ("last_name", "id")), (str, UUID)) == (row.last_name, row.id)
+    assert cursor_for(None) is None
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor("x"), encode_cursor("not-a-date", str(uuid4()))])
+def test_decode_cursor_rejects_malformed(cursor):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor(cursor)
+
+
+def test_cursor_page_behaves_like_a_list():
+    page = CursorPage([1, 2, 3], next_cursor="abc")
+
+    assert page == [1, 2, 3]
+    assert page.next_cursor == "abc"
+    assert CursorPage().next_cursor is None
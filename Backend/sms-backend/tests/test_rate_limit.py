@@ -0,0 +1,81 @@
+import pytest
+
+from src.services.base import rate_limit
+from src.services.base.rate_limit import LocalRateLimiter, RateLimitRule, SLIDING_WINDOW, TOKEN_BUCKET
+
+
+class FakeTime:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def test_sliding_window_allows_limit_then_blocks(clock):
+    limiter = LocalRateLimiter()
+    rule = RateLimitRule(limit=3, period=10, algorithm=SLIDING_WINDOW)
+
+    assert [limiter.hit("k", rule)[:2] for _ in range(3)] == [(True, 2), (True, 1), (True, 0)]
+
+    clock.now += 4
+    allowed, remaining, reset_ms = limiter.hit("k", rule)
+    assert (allowed, remaining) == (False, 0)
+    # The oldest hit leaves the window 6s from now
+    assert reset_ms == 6000
+
+
+def test_sliding_window_frees_slots_as_hits_expire(clock):
+    limiter = LocalRateLimiter()
+    rule = RateLimitRule(limit=2, period=10, algorithm=SLIDING_WINDOW)
+    limiter.hit("k", rule)
+    clock.now += 5
+    limiter.hit("k", rule)
+
+    clock.now += 5.001
+    assert limiter.hit("k", rule)[0] is True
+    assert limiter.hit("k", rule)[0] is False
+
+
+def test_token_bucket_refills_over_time(clock):
+    limiter = LocalRateLimiter()
+    rule = RateLimitRule(limit=2, period=10, algorithm=TOKEN_BUCKET)
+
+    assert limiter.hit("k", rule)[0] is True
+    assert limiter.hit("k", rule)[0] is True
+    allowed, _, reset_ms = limiter.hit("k", rule)
+    assert allowed is False
+    # One token every 5s
+    assert reset_ms == 5000
+
+    clock.now += 5
+    assert limiter.hit("k", rule)[0] is True
+    assert limiter.hit("k", rule)[0] is False
+
+
+def test_keys_are_limited_independently(clock):
+    limiter = LocalRateLimiter()
+    rule = RateLimitRule(limit=1, period=60)
+
+    assert limiter.hit("tenant-a", rule)[0] is True
+    assert limiter.hit("tenant-b", rule)[0] is True
+    assert limiter.hit("tenant-a", rule)[0] is False
+
+
+def test_least_recently_used_keys_are_evicted(clock):
+    limiter = LocalRateLimiter(max_keys=2)
+    rule = RateLimitRule(limit=1, period=60)
+    limiter.hit("a", rule)
+    limiter.hit("b", rule)
+    limiter.hit("c", rule)
+
+    # "a" was evicted, so it starts a fresh window; "c" is still limited
+    assert limiter.hit("a", rule)[0] is True
+    assert limiter.hit("c", rule)[0] is False
@@ -0,0 +1,81 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core import tenant_cache as tenant_cache_module
+from src.core.tenant_cache import TenantCache, TenantSnapshot
+
+
+class FakeTime:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(tenant_cache_module, "time", fake)
+    return fake
+
+
+def _snapshot(code="TSCH"):
+    return TenantSnapshot(id=uuid4(), name="Test School", code=code, domain=None, is_active=True, plan_type=None)
+
+
+def test_hit_and_miss(clock):
+    cache = TenantCache(max_entries=10, ttl=60, negative_ttl=5)
+    snapshot = _snapshot()
+    cache.set("code:TSCH", snapshot)
+
+    assert cache.get("code:TSCH") == (True, snapshot)
+    assert cache.get("code:OTHER") == (False, None)
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TenantCache(max_entries=10, ttl=60, negative_ttl=5)
+    cache.set("code:TSCH", _snapshot())
+
+    clock.now += 60.5
+    assert cache.get("code:TSCH") == (False, None)
+
+
+def test_misses_use_the_negative_ttl(clock):
+    cache = TenantCache(max_entries=10, ttl=60, negative_ttl=5)
+    cache.set("host:unknown.example.com", None)
+
+    # A cached miss is a hit with no snapshot
+    assert cache.get("host:unknown.example.com") == (True, None)
+    clock.now += 5.5
+    assert cache.get("host:unknown.example.com") == (False, None)
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TenantCache(max_entries=2, ttl=60, negative_ttl=5)
+    cache.set("a", _snapshot("A"))
+    cache.set("b", _snapshot("B"))
+    # Reading "a" makes "b" the least recently used
+    cache.get("a")
+    cache.set("c", _snapshot("C"))
+
+    assert cache.get("a")[0] is True
+    assert cache.get("b")[0] is False
+    assert cache.get("c")[0] is True
+
+
+def test_invalidate_tenant_drops_its_entries_and_all_misses(clock):
+    cache = TenantCache(max_entries=10, ttl=60, negative_ttl=5)
+    target, other = _snapshot("A"), _snapshot("B")
+    cache.set("code:A", target)
+    cache.set(f"id:{target.id}", target)
+    cache.set("code:B", other)
+    cache.set("host:unknown.example.com", None)
+
+    cache.invalidate_tenant(target.id)
+
+    assert cache.get("code:A")[0] is False
+    assert cache.get(f"id:{target.id}")[0] is False
+    assert cache.get("host:unknown.example.com")[0] is False
+    assert cache.get("code:B") == (True, other)